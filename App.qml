@@ -42,6 +42,18 @@ ApplicationWindow {
         }
     }
 
+    Connections {
+        target: documentManager
+        function onOpenFinished(success) {
+            if (success) {
+                var vp = documentManager.getViewport();
+                viewport.zoomLevel = vp.zoomLevel;
+                viewport.offsetX = vp.offsetX;
+                viewport.offsetY = vp.offsetY;
+            }
+        }
+    }
+
     header: HeaderBar {
         viewport: viewport
         canvas: canvas
@@ -153,12 +165,8 @@ ApplicationWindow {
         onAccepted: {
             if (documentManager) {
                 documentManager.setViewport(viewport.zoomLevel, viewport.offsetX, viewport.offsetY);
-                if (documentManager.openDocument(file)) {
-                    var vp = documentManager.getViewport();
-                    viewport.zoomLevel = vp.zoomLevel;
-                    viewport.offsetX = vp.offsetX;
-                    viewport.offsetY = vp.offsetY;
-                }
+                // Loads in the background; the viewport is applied in onOpenFinished
+                documentManager.openDocumentAsync(file);
             }
         }
     }
@@ -212,6 +220,9 @@ ApplicationWindow {
     onClosing: function (close) {
         if (root.forceClose) {
             close.accepted = true;
+            if (documentManager) {
+                documentManager.closeDocument();
+            }
             return;
         }
 
@@ -225,6 +236,9 @@ ApplicationWindow {
             unsavedDialog.open();
         } else {
             close.accepted = true;
+            if (documentManager) {
+                documentManager.closeDocument();
+            }
         }
     }
 
@@ -127,6 +127,27 @@ Item {
         pathEditController.unlockTransformAfterDrag();
     }
 
+    // Load lazily opened artboards once they scroll into view
+    Timer {
+        id: deferredLoadTimer
+        interval: 100
+        onTriggered: {
+            var topLeft = root.viewportToCanvas(0, 0);
+            canvasModel.loadArtboardsInRect(topLeft.x, topLeft.y, root.width / root.zoomLevel, root.height / root.zoomLevel);
+        }
+    }
+    onZoomLevelChanged: deferredLoadTimer.restart()
+    onOffsetXChanged: deferredLoadTimer.restart()
+    onOffsetYChanged: deferredLoadTimer.restart()
+    onWidthChanged: deferredLoadTimer.restart()
+    onHeightChanged: deferredLoadTimer.restart()
+    Connections {
+        target: canvasModel
+        function onModelReset() {
+            deferredLoadTimer.restart();
+        }
+    }
+
     // Tiled rendering layer
     TiledShapesLayer {
         id: shapesLayer
@@ -368,6 +389,11 @@ Item {
     }
 
     function updateSelectedItemPosition(canvasDx, canvasDy) {
+        // Mouse drags run inside a model drag session (see SelectTool)
+        if (canvasModel.isDragging()) {
+            canvasModel.updateDrag(canvasDx, canvasDy);
+            return;
+        }
         var indices = Lucent.SelectionManager.selectedIndices || [];
         if (indices.length === 0)
             return;
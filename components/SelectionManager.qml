@@ -138,13 +138,42 @@ QtObject {
     }
 
     Component.onCompleted: {
-        canvasModel.itemModified.connect(function (index, data) {
+        canvasModel.itemModified.connect(function (index, changes) {
+            // The payload only carries changed fields; re-read the full item
             if (index === selectedItemIndex) {
-                selectedItem = data;
+                selectedItem = canvasModel.getItemData(index);
                 refreshSelectionData();
             }
         });
 
+        canvasModel.itemsModified.connect(function (indices) {
+            if (indices.indexOf(selectedItemIndex) >= 0) {
+                selectedItem = canvasModel.getItemData(selectedItemIndex);
+                refreshSelectionData();
+            } else if (selectedIndices.length > 1) {
+                refreshSelectionData();
+            }
+        });
+
+        canvasModel.dragMoved.connect(function (dx, dy) {
+            // Shift cached bounds rather than re-querying every dragged item
+            if (geometryBounds && currentSelectionIndices().length > 1) {
+                geometryBounds = {
+                    x: geometryBounds.x + dx,
+                    y: geometryBounds.y + dy,
+                    width: geometryBounds.width,
+                    height: geometryBounds.height
+                };
+            } else {
+                refreshSelectionData();
+            }
+        });
+
+        canvasModel.itemsTransformed.connect(function (indices) {
+            selectedItem = selectedItemIndex >= 0 ? canvasModel.getItemData(selectedItemIndex) : null;
+            refreshSelectionData();
+        });
+
         canvasModel.itemTransformChanged.connect(function (index) {
             if (index === selectedItemIndex) {
                 refreshSelectionData();
@@ -178,6 +207,56 @@ QtObject {
             refreshSelectionData();
         });
 
+        canvasModel.itemsRemoved.connect(function (indices) {
+            // indices are sorted; shift survivors down by the rows removed below them
+            var removed = {};
+            for (var r = 0; r < indices.length; r++)
+                removed[indices[r]] = true;
+            function shift(val) {
+                var lo = 0, hi = indices.length;
+                while (lo < hi) {
+                    var mid = (lo + hi) >> 1;
+                    if (indices[mid] < val)
+                        lo = mid + 1;
+                    else
+                        hi = mid;
+                }
+                return val - lo;
+            }
+            var next = [];
+            for (var i = 0; i < selectedIndices.length; i++) {
+                if (!removed[selectedIndices[i]])
+                    next.push(shift(selectedIndices[i]));
+            }
+            selectedIndices = next;
+
+            if (selectedItemIndex >= 0) {
+                if (removed[selectedItemIndex])
+                    selectedItemIndex = next.length > 0 ? next[next.length - 1] : -1;
+                else
+                    selectedItemIndex = shift(selectedItemIndex);
+                selectedItem = selectedItemIndex >= 0 ? canvasModel.getItemData(selectedItemIndex) : null;
+            }
+            refreshSelectionData();
+        });
+
+        canvasModel.itemsMoved.connect(function (first, last, dest) {
+            // Follow selected rows through a block move (dest uses pre-move numbering)
+            var count = last - first + 1;
+            function remap(val) {
+                if (val >= first && val <= last)
+                    return dest > last ? val + dest - last - 1 : val - first + dest;
+                if (dest > last && val > last && val < dest)
+                    return val - count;
+                if (dest < first && val >= dest && val < first)
+                    return val + count;
+                return val;
+            }
+            selectedIndices = selectedIndices.map(remap);
+            if (selectedItemIndex >= 0)
+                selectedItemIndex = remap(selectedItemIndex);
+        });
+
         canvasModel.itemsCleared.connect(function () {
             selectedItemIndex = -1;
             selectedItem = null;
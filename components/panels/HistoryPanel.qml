@@ -10,6 +10,14 @@ Item {
     id: root
     readonly property SystemPalette themePalette: Lucent.Themed.palette
 
+    function formatBytes(bytes) {
+        if (bytes < 1024)
+            return bytes + " B";
+        if (bytes < 1024 * 1024)
+            return (bytes / 1024).toFixed(1) + " KB";
+        return (bytes / (1024 * 1024)).toFixed(1) + " MB";
+    }
+
     ColumnLayout {
         anchors.fill: parent
         spacing: 0
@@ -22,7 +30,7 @@ Item {
             ListView {
                 id: historyList
                 anchors.fill: parent
-                model: historyManager.undoDescriptions
+                model: historyManager.historyModel
 
                 // Auto-scroll to show newest item at bottom
                 onCountChanged: {
@@ -32,21 +40,37 @@ Item {
                 }
 
                 delegate: Column {
+                    id: entry
+                    required property int index
+                    required property string description
+                    required property bool undone
+                    required property bool current
+
                     width: historyList.width
 
                     Rectangle {
                         width: parent.width
                         height: 32
-                        color: "transparent"
+                        color: entry.current ? root.themePalette.highlight : entryHover.hovered ? root.themePalette.midlight : "transparent"
 
                         Label {
                             anchors.fill: parent
                             anchors.leftMargin: Lucent.Styles.pad.sm
                             verticalAlignment: Text.AlignVCenter
-                            text: modelData
-                            color: root.themePalette.text
+                            text: entry.description
+                            color: entry.current ? root.themePalette.highlightedText : root.themePalette.text
+                            opacity: entry.undone ? 0.5 : 1.0
                             font.pixelSize: 11
                         }
+
+                        HoverHandler {
+                            id: entryHover
+                        }
+
+                        // Clicking a row makes it the current state
+                        TapHandler {
+                            onTapped: historyManager.jumpTo(entry.index + 1)
+                        }
                     }
 
                     Rectangle {
@@ -65,5 +89,21 @@ Item {
                 color: themePalette.text
             }
         }
+
+        Rectangle {
+            Layout.fillWidth: true
+            height: 1
+            color: root.themePalette.mid
+        }
+
+        Label {
+            Layout.fillWidth: true
+            Layout.margins: Lucent.Styles.pad.sm
+            readonly property string usage: root.formatBytes(historyManager.memoryUsage)
+            text: historyManager.memoryBudget > 0 ? qsTr("Memory: %1 of %2").arg(usage).arg(root.formatBytes(historyManager.memoryBudget)) : qsTr("Memory: %1").arg(usage)
+            color: root.themePalette.text
+            font.pixelSize: 11
+            elide: Text.ElideRight
+        }
     }
 }
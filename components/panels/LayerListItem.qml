@@ -24,6 +24,7 @@ Item {
     required property var parentId
     required property bool modelVisible
     required property bool modelLocked
+    required property int deferredCount
 
     readonly property SystemPalette themePalette: Lucent.Themed.palette
 
@@ -414,6 +415,16 @@ Item {
                     Layout.minimumWidth: 40
                 }
 
+                // Placeholder for an artboard whose contents are not loaded yet
+                Label {
+                    visible: delegateRoot.deferredCount > 0 && !nameEditor.isEditing
+                    text: qsTr("%n item(s) not loaded", "", delegateRoot.deferredCount)
+                    font.pixelSize: 10
+                    font.italic: true
+                    color: delegateRoot.itemTextColor
+                    opacity: 0.6
+                }
+
                 TextField {
                     id: nameField
                     visible: nameEditor.isEditing
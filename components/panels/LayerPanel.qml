@@ -28,6 +28,10 @@ Item {
     property alias autoScrollTimer: autoScrollTimer
 
     function setSelectionFromDelegate(modelIndex, multi) {
+        // Selecting a lazily opened artboard loads its contents
+        var data = canvasModel.getItemData(modelIndex);
+        if (data && data.type === "artboard")
+            canvasModel.loadArtboard(data.id);
         Lucent.SelectionManager.toggleSelection(modelIndex, multi);
     }
 
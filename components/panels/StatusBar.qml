@@ -13,6 +13,7 @@ ToolBar {
     property real cursorY: 0
     property string activeTool: "select"
 
+    readonly property bool hasDocumentManager: typeof documentManager !== "undefined" && documentManager !== null
     readonly property bool hasUnitSettings: typeof unitSettings !== "undefined" && unitSettings !== null
     readonly property string displayUnitLabel: hasUnitSettings ? unitSettings.displayUnit : "px"
 
@@ -39,6 +40,52 @@ ToolBar {
             elide: Text.ElideRight
         }
 
+        // Background open progress
+        RowLayout {
+            Layout.alignment: Qt.AlignVCenter
+            visible: root.hasDocumentManager && documentManager.loading
+            spacing: 6
+
+            Label {
+                text: qsTr("Opening…")
+                font.pixelSize: 11
+            }
+            ProgressBar {
+                Layout.preferredWidth: 120
+                from: 0
+                to: 1
+                value: root.hasDocumentManager ? documentManager.loadProgress : 0
+            }
+            ToolButton {
+                text: qsTr("Cancel")
+                font.pixelSize: 11
+                onClicked: documentManager.cancelOpen()
+            }
+        }
+
+        // Batch export progress
+        RowLayout {
+            Layout.alignment: Qt.AlignVCenter
+            visible: root.hasDocumentManager && documentManager.exporting
+            spacing: 6
+
+            Label {
+                text: qsTr("Exporting…")
+                font.pixelSize: 11
+            }
+            ProgressBar {
+                Layout.preferredWidth: 120
+                from: 0
+                to: 1
+                value: root.hasDocumentManager ? documentManager.exportProgress : 0
+            }
+            ToolButton {
+                text: qsTr("Cancel")
+                font.pixelSize: 11
+                onClicked: documentManager.cancelExport()
+            }
+        }
+
         // Cursor readout (right side) - separate labels for efficient updates
         RowLayout {
             Layout.alignment: Qt.AlignVCenter
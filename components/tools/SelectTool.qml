@@ -223,7 +223,7 @@ Item {
 
         if (isSelecting && button === Qt.LeftButton) {
             if (isDraggingObject) {
-                canvasModel.endTransaction();
+                canvasModel.endDrag();
                 isDraggingObject = false;
                 isSelecting = false;
                 cursorShapeChanged(Qt.OpenHandCursor);
@@ -254,7 +254,7 @@ Item {
 
             if (!isDraggingObject && (dx >= clickThreshold || dy >= clickThreshold)) {
                 isDraggingObject = true;
-                canvasModel.beginTransaction();
+                canvasModel.beginDrag(Lucent.SelectionManager.currentSelectionIndices());
                 cursorShapeChanged(Qt.ClosedHandCursor);
             }
 
@@ -270,6 +270,8 @@ Item {
     }
 
     function reset() {
+        if (isDraggingObject)
+            canvasModel.endDrag();
         isSelecting = false;
         isDraggingObject = false;
         clickedOnSelectedObject = false;
@@ -0,0 +1,115 @@
+# Copyright (C) 2026 The Culture List, Inc.
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""Benchmark .lucent file size and load time, v1 JSON against v2 binary.
+
+Generates a document of rectangles and multi-point paths, writes it as v1
+(pretty-printed JSON) and as v2 with each codec, then reports file size,
+best-of-repeat load time through load_document, and the peak memory of
+streaming every item through open_document without keeping them.
+
+Usage:
+    python scripts/bench_file_io.py [--items N] [--points P] [--repeat R]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import tempfile
+import timeit
+import tracemalloc
+from pathlib import Path
+from typing import Any, Dict, List
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from lucent.file_io import load_document, open_document, save_document  # noqa: E402
+
+VIEWPORT = {"zoomLevel": 1.0, "offsetX": 0.0, "offsetY": 0.0}
+APPEARANCES = [
+    {"type": "fill", "color": "#3366ff", "opacity": 0.8, "visible": True},
+    {"type": "stroke", "color": "#000000", "width": 2.0, "opacity": 1.0},
+]
+
+
+def make_items(count: int, points: int) -> List[Dict[str, Any]]:
+    items: List[Dict[str, Any]] = []
+    for i in range(count):
+        if i % 2:
+            items.append(
+                {
+                    "type": "rectangle",
+                    "name": f"Rectangle {i}",
+                    "geometry": {"x": i * 1.5, "y": i * 0.5, "width": 40, "height": 20},
+                    "appearances": APPEARANCES,
+                }
+            )
+            continue
+        path_points = []
+        for j in range(points):
+            point: Dict[str, Any] = {"x": i + j * 3.25, "y": (j * 7.5) % 101}
+            if j % 3 == 0:
+                point["handleOut"] = {"x": point["x"] + 1.5, "y": point["y"] - 2.0}
+            path_points.append(point)
+        items.append(
+            {
+                "type": "path",
+                "name": f"Path {i}",
+                "geometry": {"points": path_points, "closed": bool(i % 4)},
+                "appearances": APPEARANCES,
+            }
+        )
+    return items
+
+
+def write_v1(path: Path, items: List[Dict[str, Any]]) -> None:
+    """Write the document the way version 1 of the format did."""
+    document = {"version": 1, "meta": {"name": "Bench"}, "viewport": VIEWPORT}
+    document["items"] = items
+    path.write_text(json.dumps(document, indent=2), encoding="utf-8")
+
+
+def stream_peak(path: Path) -> int:
+    """Peak bytes allocated while streaming all items of ``path``."""
+    tracemalloc.start()
+    with open_document(path) as document:
+        for _item in document.items():
+            pass
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--items", type=int, default=5000)
+    parser.add_argument("--points", type=int, default=64)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    items = make_items(args.items, args.points)
+    with tempfile.TemporaryDirectory() as tmp:
+        files = {"v1 json": Path(tmp) / "v1.lucent"}
+        write_v1(files["v1 json"], items)
+        for codec in ("none", "zlib", "lzma"):
+            path = Path(tmp) / f"v2-{codec}.lucent"
+            save_document(path, items, VIEWPORT, {"name": "Bench"}, compression=codec)
+            files[f"v2 {codec}"] = path
+
+        print(
+            f"{'format':<10} {'size (KiB)':>12} {'load (ms)':>12} "
+            f"{'stream peak (KiB)':>18}"
+        )
+        for name, path in files.items():
+            size = path.stat().st_size / 1024
+            best = min(
+                timeit.repeat(lambda: load_document(path), number=1, repeat=args.repeat)
+            )
+            peak = stream_peak(path) / 1024
+            print(f"{name:<10} {size:>12,.0f} {best * 1000:>12,.1f} {peak:>18,.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+# Copyright (C) 2026 The Culture List, Inc.
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""Micro-benchmark for item_schema parse throughput per item type.
+
+Reports items per second for validation alone (parse_item_data), trusted
+construction from validated data (build_item) and the full parse_item path.
+
+Usage:
+    python scripts/bench_item_schema.py [--number N] [--repeat R]
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import timeit
+from pathlib import Path
+from typing import Any, Callable, Dict
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from lucent.item_schema import build_item, parse_item, parse_item_data  # noqa: E402
+
+APPEARANCES = [
+    {"type": "fill", "color": "#3366ff", "opacity": 0.8, "visible": True},
+    {"type": "stroke", "color": "#000000", "width": 2.0, "opacity": 1.0},
+]
+
+SAMPLES: Dict[str, Dict[str, Any]] = {
+    "rectangle": {
+        "type": "rectangle",
+        "name": "Rectangle 1",
+        "geometry": {"x": 10, "y": 20, "width": 100, "height": 50},
+        "appearances": APPEARANCES,
+        "transform": {"translateX": 5, "translateY": 5, "rotate": 30},
+    },
+    "ellipse": {
+        "type": "ellipse",
+        "name": "Ellipse 1",
+        "geometry": {"centerX": 50, "centerY": 50, "radiusX": 40, "radiusY": 20},
+        "appearances": APPEARANCES,
+    },
+    "path": {
+        "type": "path",
+        "name": "Path 1",
+        "geometry": {
+            "points": [
+                {
+                    "x": float(i * 10),
+                    "y": float(i % 3),
+                    "handleOut": {"x": i * 10 + 3.0, "y": 1.0},
+                }
+                for i in range(16)
+            ],
+            "closed": True,
+        },
+        "appearances": APPEARANCES,
+    },
+    "text": {
+        "type": "text",
+        "name": "Text 1",
+        "text": "Hello",
+        "fontSize": 18,
+        "geometry": {"x": 0, "y": 0, "width": 120, "height": 24},
+    },
+    "artboard": {
+        "type": "artboard",
+        "name": "Artboard 1",
+        "id": "artboard-1",
+        "x": 0,
+        "y": 0,
+        "width": 800,
+        "height": 600,
+    },
+    "group": {"type": "group", "name": "Group 1", "id": "group-1"},
+}
+
+
+def _rate(func: Callable[[], Any], number: int, repeat: int) -> float:
+    """Best-of-repeat throughput in calls per second."""
+    best = min(timeit.repeat(func, number=number, repeat=repeat))
+    return number / best if best > 0 else float("inf")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--number", type=int, default=20000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    print(f"{'type':<10} {'validate/s':>12} {'build/s':>12} {'parse/s':>12}")
+    for name, sample in SAMPLES.items():
+        validated = parse_item_data(sample).data
+        validate = _rate(lambda: parse_item_data(sample), args.number, args.repeat)
+        build = _rate(lambda: build_item(validated), args.number, args.repeat)
+        full = _rate(lambda: parse_item(sample), args.number, args.repeat)
+        print(f"{name:<10} {validate:>12,.0f} {build:>12,.0f} {full:>12,.0f}")
+
+
+if __name__ == "__main__":
+    main()
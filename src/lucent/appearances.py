@@ -27,6 +27,8 @@ if TYPE_CHECKING:
 class Appearance(ABC):
     """Abstract base class for visual appearances applied to geometry."""
 
+    __slots__ = ("visible",)
+
     def __init__(self, visible: bool = True) -> None:
         self.visible = bool(visible)
 
@@ -78,6 +80,8 @@ class Appearance(ABC):
 class Fill(Appearance):
     """Fill appearance for shapes."""
 
+    __slots__ = ("color", "opacity")
+
     def __init__(
         self,
         color: str = "#ffffff",
@@ -144,6 +148,16 @@ class Fill(Appearance):
 class Stroke(Appearance):
     """Stroke appearance for shapes."""
 
+    __slots__ = (
+        "color",
+        "width",
+        "opacity",
+        "cap",
+        "align",
+        "order",
+        "scale_with_object",
+    )
+
     VALID_ALIGNS = ("center", "inner", "outer")
     VALID_CAPS = ("butt", "square", "round")
     VALID_ORDERS = ("top", "bottom")
@@ -0,0 +1,258 @@
+# Copyright (C) 2026 The Culture List, Inc.
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""Parallel batch export of artboards.
+
+Each (artboard, format, scale) combination is an ExportJob rendered in a
+pool of worker processes, one per core, so exports neither block the GUI
+thread nor contend for the interpreter lock. Workers run Qt on the
+offscreen platform; jobs carry item dicts rather than canvas items, and
+contents of lazily loaded artboards stay encoded until a worker decodes
+them.
+"""
+
+from __future__ import annotations
+
+import multiprocessing
+import os
+import re
+from concurrent.futures import Future, ProcessPoolExecutor
+from dataclasses import dataclass
+from functools import partial
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from PySide6.QtCore import QObject, QRectF, Signal
+from PySide6.QtGui import QGuiApplication
+
+from lucent.exporter import EXPORT_FORMATS, ExportOptions, export_file
+from lucent.file_io import DeferredArtboard
+from lucent.item_schema import ItemSchemaError, parse_item
+
+# Kept alive for the lifetime of a worker process
+_worker_app: Optional[QGuiApplication] = None
+
+
+@dataclass(frozen=True)
+class ExportJob:
+    """One artboard rendered to one file."""
+
+    artboard_id: str
+    path: str
+    # Canvas rectangle to render: (x, y, width, height)
+    bounds: Tuple[float, float, float, float]
+    options: ExportOptions
+    items: Tuple[Dict[str, Any], ...] = ()
+    # Contents not loaded into the model yet; decoded by the worker
+    deferred: Optional[DeferredArtboard] = None
+
+
+def normalize_format(name: str) -> Optional[str]:
+    """Export format for a user-supplied name like "PNG" or "jpeg", or None."""
+    export_format = name.strip().lower()
+    if export_format == "jpeg":
+        export_format = "jpg"
+    return export_format if export_format in EXPORT_FORMATS else None
+
+
+def unique_name(name: str, used: Dict[str, int]) -> str:
+    """Number repeated artboard names ("Home", "Home 2", ...) for file names."""
+    used[name] = used.get(name, 0) + 1
+    return name if used[name] == 1 else f"{name} {used[name]}"
+
+
+def export_file_name(name: str, scale: float, export_format: str) -> str:
+    """File name for an artboard export, e.g. ``"Home@2x.png"``.
+
+    Scale 1 has no suffix; SVG exports are never scaled.
+    """
+    stem = re.sub(r"[^\w\- .]", "_", name).strip(" .") or "Artboard"
+    if scale != 1 and export_format != "svg":
+        stem += f"@{scale:g}x"
+    return f"{stem}.{export_format}"
+
+
+def artboard_jobs(
+    artboard_id: str,
+    name: str,
+    bounds: Tuple[float, float, float, float],
+    directory: Path,
+    formats: Iterable[str],
+    scales: Iterable[float],
+    base_dpi: int,
+    padding: float = 0.0,
+    background: Optional[str] = None,
+    items: Tuple[Dict[str, Any], ...] = (),
+    deferred: Optional[DeferredArtboard] = None,
+) -> List[ExportJob]:
+    """Jobs exporting one artboard in every format and scale.
+
+    ``bounds`` already includes ``padding``; ``base_dpi`` is the DPI at
+    which the export is 1:1 with the canvas.
+    """
+    jobs = []
+    for export_format in formats:
+        # SVG output is resolution independent
+        for scale in [1.0] if export_format == "svg" else scales:
+            options = ExportOptions(
+                document_dpi=base_dpi,
+                target_dpi=round(base_dpi * scale),
+                padding=padding,
+                background=background or None,
+            )
+            jobs.append(
+                ExportJob(
+                    artboard_id=artboard_id,
+                    path=str(directory / export_file_name(name, scale, export_format)),
+                    bounds=bounds,
+                    options=options,
+                    items=items,
+                    deferred=deferred,
+                )
+            )
+    return jobs
+
+
+def render_job(job: ExportJob) -> bool:
+    """Render one export job; runs in a worker process."""
+    data = list(job.items)
+    if job.deferred is not None:
+        data.extend(
+            d for d in job.deferred.items() if d.get("parentId") == job.artboard_id
+        )
+    items = []
+    for item_data in data:
+        try:
+            items.append(parse_item(item_data))
+        except ItemSchemaError as exc:
+            print(f"Warning: Failed to export item: {exc}")
+    return export_file(items, QRectF(*job.bounds), job.path, job.options)
+
+
+def init_worker() -> None:
+    """Start a windowless Qt application for text and font rendering.
+
+    Runs in each worker process; call it before render_job() when
+    rendering in a process without a Qt application.
+    """
+    global _worker_app
+    os.environ["QT_QPA_PLATFORM"] = "offscreen"
+    if QGuiApplication.instance() is None:
+        _worker_app = QGuiApplication([])
+
+
+def create_export_pool(max_workers: Optional[int] = None) -> ProcessPoolExecutor:
+    """Process pool whose workers can run render_job()."""
+    # Spawned rather than forked: forking a process that runs Qt threads
+    # is unsafe
+    return ProcessPoolExecutor(
+        max_workers=max_workers or os.cpu_count() or 1,
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=init_worker,
+    )
+
+
+class BatchExporter(QObject):
+    """Renders export jobs in parallel without blocking the GUI thread.
+
+    ``start()`` queues a batch. ``fileExported`` is emitted as each file
+    completes, then exactly one of ``finished`` or ``cancelled``. Cancelling
+    drops queued jobs; jobs already rendering complete but are not
+    reported.
+    """
+
+    progressChanged = Signal(float)
+    # Output path and whether it was written
+    fileExported = Signal(str, bool)
+    # Number of files exported and failed
+    finished = Signal(int, int)
+    cancelled = Signal()
+
+    # Delivered from the pool's management thread; queued onto the GUI thread
+    _jobDone = Signal(int, str, bool)
+
+    def __init__(
+        self,
+        max_workers: Optional[int] = None,
+        parent: Optional[QObject] = None,
+    ) -> None:
+        super().__init__(parent)
+        self._max_workers = max_workers or os.cpu_count() or 1
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._ticket = 0
+        self._active = False
+        self._total = 0
+        self._exported = 0
+        self._failed = 0
+        self._jobDone.connect(self._on_job_done)
+
+    @property
+    def active(self) -> bool:
+        return self._active
+
+    @property
+    def progress(self) -> float:
+        """Fraction of the batch's files completed, from 0.0 to 1.0."""
+        if not self._total:
+            return 0.0
+        return (self._exported + self._failed) / self._total
+
+    def start(self, jobs: List[ExportJob]) -> None:
+        """Begin rendering ``jobs``, cancelling any batch in progress."""
+        if self._active:
+            self.cancel()
+        self._ticket += 1
+        self._total = len(jobs)
+        self._exported = 0
+        self._failed = 0
+        self.progressChanged.emit(0.0)
+        if not jobs:
+            self.finished.emit(0, 0)
+            return
+        self._active = True
+        self._pool = create_export_pool(min(self._max_workers, len(jobs)))
+        for job in jobs:
+            future = self._pool.submit(render_job, job)
+            future.add_done_callback(partial(self._job_done, self._ticket, job.path))
+
+    def cancel(self) -> None:
+        """Stop the batch in progress; queued jobs are not rendered."""
+        if not self._active:
+            return
+        self._active = False
+        self._ticket += 1
+        self._shutdown()
+        self.cancelled.emit()
+
+    def wait(self) -> None:
+        """Block until the worker processes have exited; for shutdown and tests."""
+        if self._pool is not None:
+            self._pool.shutdown(wait=True)
+
+    def _shutdown(self) -> None:
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+
+    def _job_done(self, ticket: int, path: str, future: Future[bool]) -> None:
+        if future.cancelled():
+            return
+        try:
+            ok = future.result()
+        except Exception as exc:
+            print(f"Error exporting {path}: {exc}")
+            ok = False
+        self._jobDone.emit(ticket, path, ok)
+
+    def _on_job_done(self, ticket: int, path: str, ok: bool) -> None:
+        if ticket != self._ticket:
+            return
+        if ok:
+            self._exported += 1
+        else:
+            self._failed += 1
+        self.fileExported.emit(path, ok)
+        self.progressChanged.emit(self.progress)
+        if self._exported + self._failed == self._total:
+            self._active = False
+            self._shutdown()
+            self.finished.emit(self._exported, self._failed)
@@ -18,7 +18,8 @@ All shape items use a geometry + appearances architecture for clean separation.
 """
 
 from abc import ABC, abstractmethod
-from typing import Dict, Any, Optional, List
+from functools import lru_cache
+from typing import Dict, Any, Optional, List, Tuple
 import uuid
 from PySide6.QtGui import (
     QPainter,
@@ -44,9 +45,39 @@ CANVAS_OFFSET_X = 5000
 CANVAS_OFFSET_Y = 5000
 
 
+@lru_cache(maxsize=None)
+def _slot_names(cls: type) -> Tuple[str, ...]:
+    """All slot attribute names declared along ``cls``'s MRO."""
+    names: List[str] = []
+    for klass in cls.__mro__:
+        slots = klass.__dict__.get("__slots__", ())
+        names.extend((slots,) if isinstance(slots, str) else slots)
+    return tuple(name for name in names if name not in ("__dict__", "__weakref__"))
+
+
 class CanvasItem(ABC):
     """Base class for all canvas items"""
 
+    __slots__ = ()
+
+    def snapshot(self) -> "CanvasItem":
+        """Return a shallow copy unaffected by later edits to this item.
+
+        Geometry, appearance and transform objects are shared, so the model
+        must replace them on the item rather than mutate them in place.
+        """
+        cls = type(self)
+        clone = cls.__new__(cls)
+        for name in _slot_names(cls):
+            try:
+                setattr(clone, name, getattr(self, name))
+            except AttributeError:
+                pass
+        state = getattr(self, "__dict__", None)
+        if state:
+            clone.__dict__.update(state)
+        return clone
+
     @abstractmethod
     def paint(
         self,
@@ -73,6 +104,16 @@ class CanvasItem(ABC):
 class ShapeItem(CanvasItem):
     """Base class for items with geometry + appearances."""
 
+    __slots__ = (
+        "geometry",
+        "appearances",
+        "transform",
+        "name",
+        "parent_id",
+        "visible",
+        "locked",
+    )
+
     def __init__(
         self,
         geometry: Geometry,
@@ -173,6 +214,8 @@ def _transform_from_data(
 class RectangleItem(ShapeItem):
     """Rectangle canvas item."""
 
+    __slots__ = ()
+
     def __init__(
         self,
         geometry: RectGeometry,
@@ -236,6 +279,8 @@ class RectangleItem(ShapeItem):
 class EllipseItem(ShapeItem):
     """Ellipse canvas item."""
 
+    __slots__ = ()
+
     def __init__(
         self,
         geometry: EllipseGeometry,
@@ -286,6 +331,8 @@ class EllipseItem(ShapeItem):
 class PathItem(ShapeItem):
     """Polyline/path canvas item."""
 
+    __slots__ = ()
+
     def __init__(
         self,
         geometry: PathGeometry,
@@ -334,6 +381,18 @@ class PathItem(ShapeItem):
 class ArtboardItem(CanvasItem):
     """Artboard - visible container with defined bounds for export."""
 
+    __slots__ = (
+        "x",
+        "y",
+        "width",
+        "height",
+        "name",
+        "background_color",
+        "visible",
+        "locked",
+        "id",
+    )
+
     def __init__(
         self,
         x: float = 0,
@@ -389,6 +448,8 @@ class ArtboardItem(CanvasItem):
 class GroupItem(CanvasItem):
     """Group item for nesting shapes."""
 
+    __slots__ = ("name", "visible", "locked", "parent_id", "id")
+
     def __init__(
         self,
         name: str = "",
@@ -432,6 +493,8 @@ class GroupItem(CanvasItem):
 class TextItem(ShapeItem):
     """Text canvas item using geometry+transform pattern."""
 
+    __slots__ = ("text", "font_family", "font_size", "text_color", "text_opacity")
+
     def __init__(
         self,
         geometry: TextGeometry,
@@ -3,11 +3,12 @@
 
 """Canvas model for Lucent - manages canvas items."""
 
-from typing import List, Optional, Dict, Any, Union
+from typing import List, Optional, Dict, Any, Iterable, Tuple, Union
 from PySide6.QtCore import (
     QAbstractListModel,
     QModelIndex,
     QPersistentModelIndex,
+    QRectF,
     Qt,
     Signal,
     Slot,
@@ -27,27 +28,41 @@ from lucent.commands import (
     Command,
     AddItemCommand,
     RemoveItemCommand,
+    RemoveItemsCommand,
     UpdateItemCommand,
+    PatchItemCommand,
+    PatchItemsCommand,
+    TranslateItemsCommand,
     ClearCommand,
     MoveItemCommand,
+    ReorderItemsCommand,
     TransactionCommand,
     GroupItemsCommand,
     DuplicateItemCommand,
+    InsertItemsCommand,
+    build_repeat_payloads,
 )
+from lucent.file_io import DeferredArtboard
 from lucent.history_manager import HistoryManager
 from lucent.edit_context import EditContext
 from lucent.transform_service import TransformService
 from lucent.item_schema import (
+    build_item,
     parse_item,
     parse_item_data,
+    parse_item_patch,
+    apply_item_patch,
     item_to_dict,
+    item_type_of,
     ItemSchemaError,
     ItemType,
 )
 from lucent.hierarchy import (
     get_container_by_id,
     get_direct_children_indices,
+    get_children_map,
     get_descendant_indices,
+    get_effective_lock_flags,
     is_descendant_of,
     is_effectively_visible,
     is_effectively_locked,
@@ -62,6 +77,21 @@ from lucent.render_query import get_render_items, get_hit_test_items
 from lucent.quadtree import SpatialIndex, Rect
 
 
+def _item_delta(
+    old: Dict[str, Any], new: Dict[str, Any]
+) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    """Split two serialized items into (before, after) dicts of changed fields."""
+    before: Dict[str, Any] = {}
+    after: Dict[str, Any] = {}
+    for key in old.keys() | new.keys():
+        if key in ("type", "bounds"):
+            continue
+        if old.get(key) != new.get(key):
+            before[key] = old.get(key)
+            after[key] = new.get(key)
+    return before, after
+
+
 class CanvasModel(QAbstractListModel):
     """Manages CanvasItem objects as a Qt list model."""
 
@@ -75,14 +105,23 @@ class CanvasModel(QAbstractListModel):
     EffectiveVisibleRole = Qt.UserRole + 7  # type: ignore[attr-defined]
     LockedRole = Qt.UserRole + 8  # type: ignore[attr-defined]
     EffectiveLockedRole = Qt.UserRole + 9  # type: ignore[attr-defined]
+    DeferredCountRole = Qt.UserRole + 10  # type: ignore[attr-defined]
 
     # Signals for canvas item changes
     itemAdded = Signal(int)
+    itemsInserted = Signal(int, int)  # first, last row of a bulk insert
     itemRemoved = Signal(int)
+    itemsRemoved = Signal(list)  # Sorted pre-removal indices of a bulk delete
     itemsCleared = Signal()
     itemModified = Signal(int, "QVariant")  # type: ignore[arg-type]
+    itemsModified = Signal(list)  # Sorted indices changed by one batch update
     itemsReordered = Signal()
+    itemsMoved = Signal(int, int, int)  # first, last, destination row
     itemTransformChanged = Signal(int)  # Emitted when item transform is updated
+    itemsTransformed = Signal(list)  # Indices translated without content changes
+    dragStarted = Signal(list)  # Indices live-translated by the drag session
+    dragMoved = Signal(float, float)  # Incremental drag delta
+    dragFinished = Signal()
 
     def __init__(
         self, history_manager: HistoryManager, parent: Optional[QObject] = None
@@ -92,7 +131,21 @@ class CanvasModel(QAbstractListModel):
         self._history = history_manager
         self._transaction_active: bool = False
         self._transaction_snapshot: Dict[int, Dict[str, Any]] = {}
+        self._modified_batch: Optional[List[int]] = None
+        self._spatial_pruned = False
+        self._drag_indices: Optional[List[int]] = None
+        self._drag_containers: List[int] = []
+        self._drag_dx = 0.0
+        self._drag_dy = 0.0
         self._type_counters: Dict[str, int] = {}
+        # (items, name counters, deferred) saved by beginLoad until the load ends
+        self._load_backup: Optional[
+            Tuple[List[CanvasItem], Dict[str, int], Dict[str, DeferredArtboard]]
+        ] = None
+        # Contents of lazily opened artboards, by artboard ID; an entry is
+        # dropped once loaded and ignored while its artboard is absent
+        self._deferred: Dict[str, DeferredArtboard] = {}
+        self._loading_artboard: Optional[str] = None
 
         # Spatial index for fast viewport queries
         self._spatial_index = SpatialIndex()
@@ -113,8 +166,11 @@ class CanvasModel(QAbstractListModel):
 
         # Connect signals to update spatial index
         self.itemAdded.connect(self._on_item_added_spatial)
+        self.itemsInserted.connect(self._on_items_inserted_spatial)
         self.itemRemoved.connect(self._on_item_removed_spatial)
         self.itemModified.connect(self._on_item_modified_spatial)
+        self.itemsModified.connect(self._on_items_modified_spatial)
+        self.itemsTransformed.connect(self._on_items_modified_spatial)
         self.itemsCleared.connect(self._on_items_cleared_spatial)
         self.itemsReordered.connect(self._rebuild_spatial_index)
 
@@ -171,6 +227,10 @@ class CanvasModel(QAbstractListModel):
             return getattr(item, "locked", False)
         elif role == self.EffectiveLockedRole:
             return self._is_effectively_locked(index.row())
+        elif role == self.DeferredCountRole:
+            if isinstance(item, ArtboardItem) and item.id in self._deferred:
+                return self._deferred[item.id].count
+            return 0
         return None
 
     def roleNames(self) -> Dict[int, QByteArray]:
@@ -184,6 +244,7 @@ class CanvasModel(QAbstractListModel):
             self.EffectiveVisibleRole: QByteArray(b"modelEffectiveVisible"),
             self.LockedRole: QByteArray(b"modelLocked"),
             self.EffectiveLockedRole: QByteArray(b"modelEffectiveLocked"),
+            self.DeferredCountRole: QByteArray(b"deferredCount"),
         }
 
     def _execute_command(self, command: Command, record: bool = True) -> None:
@@ -197,9 +258,7 @@ class CanvasModel(QAbstractListModel):
         if self._transaction_active:
             return
         self._transaction_active = True
-        self._transaction_snapshot = {
-            i: self._itemToDict(item) for i, item in enumerate(self._items)
-        }
+        self._transaction_snapshot = {}
 
     @Slot()
     def endTransaction(self) -> None:
@@ -207,23 +266,45 @@ class CanvasModel(QAbstractListModel):
             return
 
         commands: List[Command] = []
-        for index, old_data in self._transaction_snapshot.items():
+        for index, old_data in sorted(self._transaction_snapshot.items()):
             if index < len(self._items):
-                current_data = self._itemToDict(self._items[index])
-                if current_data != old_data:
+                item = self._items[index]
+                current_data = self._itemToDict(item)
+                if current_data.get("type") != old_data.get("type"):
                     commands.append(
                         UpdateItemCommand(self, index, old_data, current_data)
                     )
+                    continue
+                before, after = _item_delta(old_data, current_data)
+                if after:
+                    commands.append(
+                        PatchItemCommand(
+                            self,
+                            index,
+                            before,
+                            after,
+                            item.name,
+                            item_type_of(item).value,
+                        )
+                    )
 
         self._transaction_snapshot = {}
+        self._transaction_active = False
 
         if commands:
             # Use first command's description for the transaction label
             label = commands[0].description if len(commands) == 1 else "Edit Properties"
-            transaction = TransactionCommand(commands, label)
-            self._history.execute(transaction)
-
-        self._transaction_active = False
+            # Items already hold the final state; only record the step
+            self._history.record(PatchItemsCommand(self, commands, label))
+
+    def _snapshot_before_write(self, index: int) -> None:
+        """Capture an item's state on its first write inside a transaction."""
+        if (
+            self._transaction_active
+            and index not in self._transaction_snapshot
+            and 0 <= index < len(self._items)
+        ):
+            self._transaction_snapshot[index] = self._itemToDict(self._items[index])
 
     def _generate_name(self, item_type: str) -> str:
         type_name = item_type.capitalize()
@@ -263,7 +344,13 @@ class CanvasModel(QAbstractListModel):
         return get_direct_children_indices(self._items, container_id)
 
     def _get_descendant_indices(self, container_id: str) -> List[int]:
-        """Return indices of all descendants (any depth) of a container."""
+        """Return indices of all descendants (any depth) of a container.
+
+        A deferred artboard is loaded first, so anything acting on its
+        contents sees all of them.
+        """
+        if container_id in self._deferred:
+            self.loadArtboard(container_id)
         return get_descendant_indices(self._items, container_id, self._is_container)
 
     def _is_valid_index(self, index: int) -> bool:
@@ -298,26 +385,17 @@ class CanvasModel(QAbstractListModel):
         cmd = UpdateItemCommand(self, idx, old_data, new_data)
         return cmd
 
-    @Slot(list, float, float)
-    def moveItems(self, indices: List[int], dx: float, dy: float) -> None:
-        """Move multiple items by dx, dy, handling groups and avoiding double-moves.
+    def _collect_move_targets(self, indices: List[int]) -> Tuple[List[int], List[int]]:
+        """Resolve a selection into the item indices a move must translate.
 
-        This method:
-        - Moves all selected items by the given delta
-        - When a group/artboard is selected, moves all its descendants
-        - Avoids moving items twice when both container and child are selected
-        - Skips locked or effectively locked items
-        - Bundles all moves into a single undoable transaction
+        Returns ``(targets, containers)``: containers contribute all their
+        descendants, children of a selected container are not moved twice,
+        and locked or effectively locked items are skipped. ``containers``
+        lists the selected groups/artboards, whose derived bounds change.
         """
-        if not indices or (dx == 0 and dy == 0):
-            return
-
-        # Normalize indices
         valid_indices = sorted(
             {int(i) for i in indices if 0 <= int(i) < len(self._items)}
         )
-        if not valid_indices:
-            return
 
         # Identify selected containers to avoid double-moving their children
         selected_container_ids: set[str] = set()
@@ -326,10 +404,9 @@ class CanvasModel(QAbstractListModel):
             if isinstance(item, (GroupItem, ArtboardItem)):
                 selected_container_ids.add(item.id)
 
-        # Track which items we've already processed
+        targets: List[int] = []
         already_moved: set[int] = set()
-        commands: List[Command] = []
-        moved_container_indices: set[int] = set()
+        containers: List[int] = []
 
         for idx in valid_indices:
             if idx in already_moved:
@@ -341,31 +418,45 @@ class CanvasModel(QAbstractListModel):
 
             if isinstance(item, (GroupItem, ArtboardItem)):
                 # Move all descendants of this container
-                descendant_indices = self._get_descendant_indices(item.id)
-                for desc_idx in descendant_indices:
-                    if desc_idx in already_moved:
-                        continue
-                    cmd = self._move_single_item(desc_idx, dx, dy)
-                    if cmd:
-                        commands.append(cmd)
-                    already_moved.add(desc_idx)
+                for desc_idx in self._get_descendant_indices(item.id):
+                    if desc_idx not in already_moved:
+                        targets.append(desc_idx)
+                        already_moved.add(desc_idx)
                 # Also move the container itself (artboards have geometry)
-                cmd = self._move_single_item(idx, dx, dy)
-                if cmd:
-                    commands.append(cmd)
+                targets.append(idx)
                 already_moved.add(idx)
-                moved_container_indices.add(idx)
+                containers.append(idx)
             else:
                 # Regular shape - skip if parent container is in selection
                 parent_id = getattr(item, "parent_id", None)
                 if parent_id and parent_id in selected_container_ids:
                     continue
-
-                cmd = self._move_single_item(idx, dx, dy)
-                if cmd:
-                    commands.append(cmd)
+                targets.append(idx)
                 already_moved.add(idx)
 
+        return targets, containers
+
+    @Slot(list, float, float)
+    def moveItems(self, indices: List[int], dx: float, dy: float) -> None:
+        """Move multiple items by dx, dy, handling groups and avoiding double-moves.
+
+        This method:
+        - Moves all selected items by the given delta
+        - When a group/artboard is selected, moves all its descendants
+        - Avoids moving items twice when both container and child are selected
+        - Skips locked or effectively locked items
+        - Bundles all moves into a single undoable transaction
+        """
+        if not indices or (dx == 0 and dy == 0):
+            return
+
+        targets, moved_container_indices = self._collect_move_targets(indices)
+        commands: List[Command] = []
+        for idx in targets:
+            cmd = self._move_single_item(idx, dx, dy)
+            if cmd:
+                commands.append(cmd)
+
         if not commands:
             return
 
@@ -400,6 +491,79 @@ class CanvasModel(QAbstractListModel):
             return
         self.translateItems([index], dx, dy)
 
+    @Slot(list)
+    def beginDrag(self, indices: List[int]) -> None:
+        """Start an interactive move of the given selection.
+
+        Until endDrag, updateDrag only shifts the live items; views follow
+        via dragMoved instead of per-item change notifications.
+        """
+        if self._drag_indices is not None:
+            self.endDrag()
+        targets, containers = self._collect_move_targets(indices)
+        self._drag_indices = [
+            idx
+            for idx in targets
+            if isinstance(self._items[idx], ArtboardItem)
+            or hasattr(self._items[idx], "geometry")
+        ]
+        self._drag_containers = containers
+        self._drag_dx = 0.0
+        self._drag_dy = 0.0
+        self.dragStarted.emit(list(self._drag_indices))
+
+    @Slot(float, float)
+    def updateDrag(self, dx: float, dy: float) -> None:
+        """Translate the dragged items by an incremental delta."""
+        if self._drag_indices is None or (dx == 0 and dy == 0):
+            return
+        self._shift_items(self._drag_indices, dx, dy)
+        self._drag_dx += dx
+        self._drag_dy += dy
+        self.dragMoved.emit(dx, dy)
+
+    @Slot()
+    def endDrag(self) -> None:
+        """Finish the drag, recording the net move as one undo step."""
+        if self._drag_indices is None:
+            return
+        indices = self._drag_indices
+        dx, dy = self._drag_dx, self._drag_dy
+        self._drag_indices = None
+        self.dragFinished.emit()
+
+        if not indices or (dx == 0 and dy == 0):
+            return
+        self.itemsTransformed.emit(indices + self._drag_containers)
+        if not self._transaction_active:
+            name = self._items[indices[0]].name if len(indices) == 1 else ""
+            self._history.record(TranslateItemsCommand(self, indices, dx, dy, name))
+
+    @Slot(result=bool)
+    def isDragging(self) -> bool:
+        return self._drag_indices is not None
+
+    def _shift_items(self, indices: List[int], dx: float, dy: float) -> None:
+        """Offset item positions in place without notifying views."""
+        for idx in indices:
+            if not (0 <= idx < len(self._items)):
+                continue
+            self._snapshot_before_write(idx)
+            item = self._items[idx]
+            if isinstance(item, ArtboardItem):
+                item.x += dx
+                item.y += dy
+            else:
+                # Replace rather than mutate: snapshots share the transform
+                item.transform = item.transform.translated(  # type: ignore[attr-defined]
+                    dx, dy
+                )
+
+    def _translate_items(self, indices: List[int], dx: float, dy: float) -> None:
+        """Offset item positions in place and notify views once."""
+        self._shift_items(indices, dx, dy)
+        self.itemsTransformed.emit(list(indices))
+
     @Slot(int)
     def ungroup(self, group_index: int) -> None:
         """Ungroup a group: move its children to the group's parent and remove it."""
@@ -410,7 +574,20 @@ class CanvasModel(QAbstractListModel):
 
     @Slot(list, result=int)
     def groupItems(self, indices: list[int]) -> int:
-        """Group items in one undoable action; returns group index or -1."""
+        """Group items in one undoable action; returns group index or -1.
+
+        Artboards in the selection are left out since they cannot have a
+        parent.
+        """
+        indices = [
+            i
+            for i in indices
+            if i is not None
+            and 0 <= int(i) < len(self._items)
+            and not isinstance(self._items[int(i)], ArtboardItem)
+        ]
+        if not indices:
+            return -1
         command = GroupItemsCommand(self, indices)
         self._execute_command(command)
         return command.result_index if command.result_index is not None else -1
@@ -445,9 +622,198 @@ class CanvasModel(QAbstractListModel):
             print(f"Warning: Failed to add item: {exc}")
             return
 
-        command = AddItemCommand(self, parsed.data)
+        command = AddItemCommand(self, parsed.data, validated=True)
         self._execute_command(command)
 
+    @Slot(list, result=int)
+    def loadItems(self, items_data: Iterable[Dict[str, Any]]) -> int:
+        """Replace all items with a loaded document in one bulk operation.
+
+        Items are parsed up front and swapped in under a single model reset.
+        ``items_data`` may be a generator streaming from a file; if it raises,
+        the model is left unchanged. Invalid entries are skipped with a
+        warning, like addItem. Loading is not undoable and clears the undo
+        history. Listeners get one itemsCleared and the spatial index is
+        bulk-loaded.
+
+        Returns:
+            Number of items loaded.
+        """
+        previous_counters = dict(self._type_counters)
+        self._type_counters.clear()
+        loaded: List[CanvasItem] = []
+        try:
+            for item_data in items_data:
+                item_type = item_data.get("type", "")
+                working = dict(item_data)
+                if not working.get("name"):
+                    working["name"] = self._generate_name(item_type)
+                try:
+                    loaded.append(parse_item(working))
+                except ItemSchemaError as exc:
+                    print(f"Warning: Failed to load item: {exc}")
+        except BaseException:
+            self._type_counters = previous_counters
+            raise
+
+        self.beginResetModel()
+        self._items = loaded
+        self._deferred = {}
+        self.endResetModel()
+        self._history.clear()
+        self.itemsCleared.emit()
+        self._rebuild_spatial_index()
+        return len(loaded)
+
+    def beginLoad(self) -> None:
+        """Empty the model ahead of appendLoadedItems() batches.
+
+        The current items are kept aside until endLoad() drops them or
+        abortLoad() puts them back. Like loadItems, this is not undoable and
+        clears the undo history.
+        """
+        if self._load_backup is None:
+            self._load_backup = (
+                self._items,
+                dict(self._type_counters),
+                self._deferred,
+            )
+        self._type_counters.clear()
+        self.beginResetModel()
+        self._items = []
+        self._deferred = {}
+        self.endResetModel()
+        self._history.clear()
+        self.itemsCleared.emit()
+        self._spatial_index.clear()
+
+    def appendLoadedItems(self, items_data: List[Dict[str, Any]]) -> int:
+        """Append a batch of a document being loaded incrementally.
+
+        ``items_data`` must already be validated with parse_item_data (the
+        loader's worker thread does that), so items take the trusted build
+        path. Each batch is one row insertion and is not undoable.
+
+        Returns:
+            Number of items appended.
+        """
+        loaded: List[CanvasItem] = []
+        for data in items_data:
+            if not data.get("name"):
+                data["name"] = self._generate_name(data.get("type", ""))
+            try:
+                loaded.append(build_item(data))
+            except ItemSchemaError as exc:
+                print(f"Warning: Failed to load item: {exc}")
+        self._insert_rows(len(self._items), loaded)
+        return len(loaded)
+
+    def endLoad(self) -> None:
+        """Finish an incremental load, releasing the previous items."""
+        self._load_backup = None
+
+    def abortLoad(self) -> None:
+        """Discard a partial load and restore the items from before beginLoad."""
+        if self._load_backup is None:
+            return
+        items, counters, deferred = self._load_backup
+        self._load_backup = None
+        self._type_counters = counters
+        self.beginResetModel()
+        self._items = items
+        self._deferred = deferred
+        self.endResetModel()
+        self._history.clear()
+        self.itemsCleared.emit()
+        self._rebuild_spatial_index()
+
+    @property
+    def loading_artboard(self) -> Optional[str]:
+        """ID of the deferred artboard whose contents are being inserted."""
+        return self._loading_artboard
+
+    def deferredArtboards(self) -> Dict[str, DeferredArtboard]:
+        """Contents of artboards not loaded yet, by artboard ID."""
+        return dict(self._deferred)
+
+    def setDeferredArtboards(self, deferred: Dict[str, DeferredArtboard]) -> None:
+        """Attach the unloaded contents of a lazily opened document."""
+        self._deferred = dict(deferred)
+        self._emit_artboard_rows_changed(self._deferred)
+
+    @Slot(str, result=bool)
+    def isArtboardDeferred(self, artboard_id: str) -> bool:
+        return artboard_id in self._deferred
+
+    @Slot(str, result=int)
+    def loadArtboard(self, artboard_id: str) -> int:
+        """Decode a deferred artboard's contents into the model.
+
+        The items are appended to the end of the model, keeping their order,
+        so row indices held by the undo history stay valid. Loading is not
+        undoable and does not mark the document modified.
+
+        Returns:
+            Number of items loaded (0 if the artboard was not deferred)
+        """
+        deferred = self._deferred.get(artboard_id)
+        if deferred is None:
+            return 0
+        if not any(
+            isinstance(item, ArtboardItem) and item.id == artboard_id
+            for item in self._items
+        ):
+            # Keep the contents for when the artboard comes back (undo)
+            return 0
+        loaded: List[CanvasItem] = []
+        try:
+            for data in deferred.items():
+                if not data.get("name"):
+                    data["name"] = self._generate_name(data.get("type", ""))
+                try:
+                    loaded.append(parse_item(data))
+                except ItemSchemaError as exc:
+                    print(f"Warning: Failed to load item: {exc}")
+        except ValueError as exc:
+            print(f"Warning: Failed to load artboard contents: {exc}")
+            return 0
+        del self._deferred[artboard_id]
+        self._loading_artboard = artboard_id
+        try:
+            self._insert_rows(len(self._items), loaded)
+        finally:
+            self._loading_artboard = None
+        self._emit_artboard_rows_changed({artboard_id})
+        return len(loaded)
+
+    @Slot(float, float, float, float, result=int)
+    def loadArtboardsInRect(
+        self, x: float, y: float, width: float, height: float
+    ) -> int:
+        """Load every deferred artboard intersecting a canvas rectangle.
+
+        Returns:
+            Number of items loaded
+        """
+        if not self._deferred:
+            return 0
+        rect = QRectF(x, y, width, height)
+        hits = [
+            item.id
+            for item in self._items
+            if isinstance(item, ArtboardItem)
+            and item.id in self._deferred
+            and item.get_bounds().intersects(rect)
+        ]
+        return sum(self.loadArtboard(artboard_id) for artboard_id in hits)
+
+    def _emit_artboard_rows_changed(self, artboard_ids: Iterable[str]) -> None:
+        ids = set(artboard_ids)
+        for row, item in enumerate(self._items):
+            if isinstance(item, ArtboardItem) and item.id in ids:
+                index = self.index(row, 0)
+                self.dataChanged.emit(index, index, [self.DeferredCountRole])
+
     @Slot(int, result=int)
     def duplicateItem(self, index: int) -> int:
         """Duplicate an item (and its descendants) returning the new index."""
@@ -460,12 +826,8 @@ class CanvasModel(QAbstractListModel):
         self._execute_command(command)
         return command.result_index if command.result_index is not None else -1
 
-    @Slot(list, result="QVariant")  # type: ignore[arg-type]
-    def duplicateItems(self, indices: list[int]) -> List[int]:
-        """Duplicate multiple selected items; returns list of new top-level indices."""
-        if not indices:
-            return []
-
+    def _duplicable_roots(self, indices: List[int]) -> List[int]:
+        """Return sorted unlocked indices, minus descendants of selected containers."""
         # Normalize and validate indices
         unique_indices = sorted(
             {int(i) for i in indices if 0 <= int(i) < len(self._items)}
@@ -474,52 +836,82 @@ class CanvasModel(QAbstractListModel):
             return []
 
         # Skip locked or effectively locked items
-        unlocked_indices = [
-            i for i in unique_indices if not self._is_effectively_locked(i)
-        ]
+        locked = get_effective_lock_flags(self._items, self._is_container)
+        unlocked_indices = [i for i in unique_indices if not locked[i]]
         if not unlocked_indices:
             return []
 
         # Drop descendants when their ancestor container is selected to avoid
         # double duplication
-        selected_containers = {
-            getattr(self._items[i], "id", None)
-            for i in unlocked_indices
-            if isinstance(self._items[i], (ArtboardItem, GroupItem))
-        }
+        children = get_children_map(self._items)
         descendant_skip: set[int] = set()
-        for container_id in selected_containers:
-            if not container_id:
-                continue
-            descendant_skip.update(self._get_descendant_indices(container_id))
+        for i in unlocked_indices:
+            item = self._items[i]
+            if isinstance(item, (ArtboardItem, GroupItem)) and item.id:
+                descendant_skip.update(
+                    get_descendant_indices(
+                        self._items, item.id, self._is_container, children
+                    )
+                )
+
+        return [i for i in unlocked_indices if i not in descendant_skip]
 
-        filtered_indices = [i for i in unlocked_indices if i not in descendant_skip]
-        if not filtered_indices:
+    @Slot(list, result="QVariant")  # type: ignore[arg-type]
+    def duplicateItems(self, indices: list[int]) -> List[int]:
+        """Duplicate multiple selected items; returns list of new top-level indices.
+
+        All clones are appended with a single row insertion and one undo step.
+        """
+        if not indices:
+            return []
+        roots = self._duplicable_roots(indices)
+        if not roots:
             return []
 
-        # Execute duplications in one transaction, from highest index down to
-        # keep positions stable
-        commands: List[DuplicateItemCommand] = []
-        index_to_command: Dict[int, DuplicateItemCommand] = {}
-        for idx in sorted(filtered_indices):
-            cmd = DuplicateItemCommand(self, idx)
-            commands.append(cmd)
-            index_to_command[idx] = cmd
-
-        transaction = TransactionCommand(commands, "Duplicate Items")
-        self._execute_command(transaction)
-
-        # Consume recorded insertion indices per command; order results by
-        # original selection order.
-        new_indices: List[int] = []
-        for idx in sorted(filtered_indices):
-            cmd = index_to_command.get(idx)
-            if not cmd:
-                continue
-            parent_idx = cmd.inserted_parent_index
-            if parent_idx is not None:
-                new_indices.append(parent_idx)
-        return new_indices
+        payloads: List[Dict[str, Any]] = []
+        root_offsets: List[int] = []
+        for idx in roots:
+            source = DuplicateItemCommand(self, idx)
+            clones = source.clone_payloads
+            if clones:
+                root_offsets.append(len(payloads) + source.parent_offset)
+                payloads.extend(clones)
+        if not payloads:
+            return []
+
+        command = InsertItemsCommand(self, payloads, root_offsets)
+        self._execute_command(command)
+        return command.result_indices
+
+    @Slot(list, int, float, float, float, result="QVariant")  # type: ignore[arg-type]
+    def repeatItems(
+        self, indices: list[int], count: int, dx: float, dy: float, rotate: float
+    ) -> List[int]:
+        """Create ``count`` stepped copies of the selection in one undo step.
+
+        Each copy is the previous one rotated by ``rotate`` degrees about the
+        selection centre and then offset by (dx, dy): a zero angle lays out a
+        row, an angle plus an offset a radial array. Repeating a row builds a
+        grid.
+
+        Returns:
+            Indices of the new top-level copies, in creation order.
+        """
+        if count < 1 or not indices:
+            return []
+        roots = self._duplicable_roots(indices)
+        if not roots:
+            return []
+
+        payloads, root_offsets = build_repeat_payloads(
+            self, roots, int(count), float(dx), float(dy), float(rotate)
+        )
+        if not payloads:
+            return []
+
+        command = InsertItemsCommand(self, payloads, root_offsets, "Repeat Items")
+        self._execute_command(command)
+        return command.result_indices
 
     @Slot(int)
     def removeItem(self, index: int) -> None:
@@ -534,9 +926,10 @@ class CanvasModel(QAbstractListModel):
     def deleteItems(self, indices: List[int]) -> int:
         """Delete multiple items, skipping locked items and removing container children.
 
-        Items are deleted in reverse index order to maintain valid indices.
-        Containers (groups/artboards) have their descendants deleted automatically.
-        All deletions are bundled into a single undoable transaction.
+        Rows are removed in contiguous runs in a single pass, with one
+        itemsRemoved notification. Containers (groups/artboards) have their
+        descendants deleted automatically. All deletions are bundled into a
+        single undoable command.
 
         Args:
             indices: List of item indices to delete.
@@ -555,10 +948,13 @@ class CanvasModel(QAbstractListModel):
         if not valid_indices:
             return 0
 
-        # Expand containers to include their descendants
+        # Expand containers to include their descendants. Lock state and the
+        # child lists are resolved once up front so this stays linear.
+        locked = get_effective_lock_flags(self._items, self._is_container)
+        children = get_children_map(self._items)
         indices_to_delete: set[int] = set()
         for idx in valid_indices:
-            if self._is_effectively_locked(idx):
+            if locked[idx]:
                 continue
 
             item = self._items[idx]
@@ -566,26 +962,23 @@ class CanvasModel(QAbstractListModel):
 
             # If it's a container, include all descendants
             if isinstance(item, (GroupItem, ArtboardItem)):
-                descendant_indices = self._get_descendant_indices(item.id)
+                descendant_indices = get_descendant_indices(
+                    self._items, item.id, self._is_container, children
+                )
                 for desc_idx in descendant_indices:
-                    if not self._is_effectively_locked(desc_idx):
+                    if not locked[desc_idx]:
                         indices_to_delete.add(desc_idx)
 
         if not indices_to_delete:
             return 0
 
-        # Create removal commands in reverse order (highest index first)
-        commands: List[Command] = []
-        for idx in sorted(indices_to_delete, reverse=True):
-            commands.append(RemoveItemCommand(self, idx))
-
-        # Execute as single transaction for undo/redo
-        if len(commands) == 1:
-            self._execute_command(commands[0])
-        else:
-            transaction = TransactionCommand(commands, "Delete Items")
-            self._execute_command(transaction)
+        if len(indices_to_delete) == 1:
+            command: Command = RemoveItemCommand(self, indices_to_delete.pop())
+            self._execute_command(command)
+            return 1
 
+        # Remove every row in one pass as a single undoable step
+        self._execute_command(RemoveItemsCommand(self, sorted(indices_to_delete)))
         return len(indices_to_delete)
 
     @Slot()
@@ -679,30 +1072,18 @@ class CanvasModel(QAbstractListModel):
         self, container_from: int, container_to: int, descendant_indices: List[int]
     ) -> None:
         """Move a container and its descendants as one contiguous block."""
-        all_indices = sorted([container_from] + descendant_indices, reverse=True)
-
-        extracted_items = []
-        for idx in all_indices:
-            extracted_items.append(self._items.pop(idx))
-        extracted_items.reverse()
-
-        remaining_count = len(self._items)
+        all_indices = sorted([container_from] + descendant_indices)
+        remaining_count = len(self._items) - len(all_indices)
         if container_to < container_from:
-            insert_at = container_to
+            slot = container_to
         else:
             items_removed_before_target = sum(
                 1 for idx in all_indices if idx < container_to
             )
-            insert_at = min(
-                container_to - items_removed_before_target + 1, remaining_count
-            )
+            slot = min(container_to - items_removed_before_target + 1, remaining_count)
 
-        for i, item in enumerate(extracted_items):
-            self._items.insert(insert_at + i, item)
-
-        self.beginResetModel()
-        self.endResetModel()
-        self.itemsReordered.emit()
+        command = ReorderItemsCommand(self, all_indices, slot)
+        self._execute_command(command)
 
     @Slot(int, str, int)
     @Slot(int, str)
@@ -803,30 +1184,212 @@ class CanvasModel(QAbstractListModel):
             return
 
         item = self._items[index]
-        old_props = self._itemToDict(item)
-
-        # Merge incoming properties onto existing canonical dict for validation
-        merged_props = dict(old_props)
-        merged_props.update(properties)
-        merged_props["type"] = old_props.get("type")
-
         try:
-            parsed = parse_item_data(merged_props)
-            new_item = parse_item(parsed.data)
+            patch = parse_item_patch(item_type_of(item), properties)
         except ItemSchemaError as exc:
             print(f"Warning: Failed to update item: {exc}")
             return
 
-        self._items[index] = new_item
-        new_props = parsed.data
+        before, after = self._apply_patch(index, patch.changes)
+        if not after or self._transaction_active:
+            return
 
-        if not self._transaction_active:
-            command = UpdateItemCommand(self, index, old_props, new_props)
-            self._history.execute(command)
+        command = PatchItemCommand(
+            self, index, before, after, item.name, patch.type.value
+        )
+        self._history.record(command)
 
-        model_index = self.index(index, 0)
-        self.dataChanged.emit(model_index, model_index, [])
-        self.itemModified.emit(index, self._itemToDict(new_item))
+    def _apply_patch(
+        self, index: int, changes: Dict[str, Any]
+    ) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        """Patch an item in place and notify views of the changed fields."""
+        if not (0 <= index < len(self._items)):
+            return {}, {}
+        self._snapshot_before_write(index)
+        before, after = apply_item_patch(self._items[index], changes)
+        if not after:
+            return before, after
+        if self._modified_batch is not None:
+            self._modified_batch.append(index)
+        else:
+            model_index = self.index(index, 0)
+            self.dataChanged.emit(model_index, model_index, [])
+            self.itemModified.emit(index, after)
+        return before, after
+
+    @Slot(list)
+    def updateItems(self, updates: List[Any]) -> None:
+        """Patch many items as one undoable step with one change notification.
+
+        Each entry is an ``(index, properties)`` pair. All patches are
+        validated before any item is touched, so an invalid entry rejects
+        the whole batch.
+        """
+        patches = []
+        for entry in updates:
+            try:
+                index, properties = entry
+                index = int(index)
+            except (TypeError, ValueError):
+                print(f"Warning: Invalid update entry {entry!r}")
+                return
+            if not (0 <= index < len(self._items)):
+                print(f"Warning: Cannot update item at invalid index {index}")
+                return
+            item = self._items[index]
+            try:
+                patch = parse_item_patch(item_type_of(item), properties)
+            except ItemSchemaError as exc:
+                print(f"Warning: Failed to update item: {exc}")
+                return
+            patches.append((index, patch))
+
+        commands: List[Command] = []
+        self._begin_modification_batch()
+        try:
+            for index, patch in patches:
+                item = self._items[index]
+                name = item.name
+                before, after = self._apply_patch(index, patch.changes)
+                if after:
+                    commands.append(
+                        PatchItemCommand(
+                            self, index, before, after, name, patch.type.value
+                        )
+                    )
+        finally:
+            self._end_modification_batch()
+
+        if not commands or self._transaction_active:
+            return
+        if len(commands) == 1:
+            self._history.record(commands[0])
+        else:
+            self._history.record(PatchItemsCommand(self, commands))
+
+    def _begin_modification_batch(self) -> None:
+        """Collect patched indices instead of emitting per-item signals."""
+        if self._modified_batch is None:
+            self._modified_batch = []
+
+    def _end_modification_batch(self) -> None:
+        """Emit coalesced dataChanged ranges and one itemsModified."""
+        if self._modified_batch is None:
+            return
+        indices = sorted(set(self._modified_batch))
+        self._modified_batch = None
+        if not indices:
+            return
+
+        start = prev = indices[0]
+        for index in indices[1:] + [None]:
+            if index is not None and index == prev + 1:
+                prev = index
+                continue
+            self.dataChanged.emit(self.index(start, 0), self.index(prev, 0), [])
+            if index is not None:
+                start = prev = index
+        self.itemsModified.emit(indices)
+
+    def _insert_rows(self, row: int, new_items: List[CanvasItem]) -> None:
+        """Insert a block of items with one row insertion and itemsInserted."""
+        if not new_items:
+            return
+        last = row + len(new_items) - 1
+        self.beginInsertRows(QModelIndex(), row, last)
+        self._items[row:row] = new_items
+        self.endInsertRows()
+        self.itemsInserted.emit(row, last)
+
+    def _remove_rows(self, first: int, last: int) -> List[CanvasItem]:
+        """Remove a block of rows with one row removal and itemsRemoved."""
+        self.beginRemoveRows(QModelIndex(), first, last)
+        removed = self._items[first : last + 1]
+        del self._items[first : last + 1]
+        self.endRemoveRows()
+        for item in removed:
+            self._spatial_index.remove(id(item))
+        self.itemsRemoved.emit(list(range(first, last + 1)))
+        return removed
+
+    def _emit_rows_changed(self, first: int, last: int) -> None:
+        """Notify views that rows changed without touching rendered content."""
+        self.dataChanged.emit(self.index(first, 0), self.index(last, 0), [])
+
+    def _move_rows(self, first: int, last: int, dest: int) -> bool:
+        """Move rows first..last so they sit before ``dest`` (pre-move numbering).
+
+        Item objects are kept, so cached textures and spatial entries survive.
+        Returns False when the move is a no-op or rejected by Qt.
+        """
+        if first > last or first <= dest <= last + 1:
+            return False
+        if not self.beginMoveRows(QModelIndex(), first, last, QModelIndex(), dest):
+            return False
+        block = self._items[first : last + 1]
+        del self._items[first : last + 1]
+        insert_at = dest if dest < first else dest - len(block)
+        self._items[insert_at:insert_at] = block
+        self.endMoveRows()
+        self.itemsMoved.emit(first, last, dest)
+        return True
+
+    def _gather_rows(
+        self, indices: List[int], slot: int
+    ) -> Tuple[int, List[Tuple[int, int, int]]]:
+        """Move sorted rows into one block placed after ``slot`` other rows.
+
+        Rows keep their relative order. Returns the block's first row and the
+        (first, last, dest) moves performed, for _revert_row_moves.
+        """
+        moves: List[Tuple[int, int, int]] = []
+        selected = set(indices)
+        start = len(self._items)
+        if slot == 0:
+            start = 0
+        else:
+            seen = 0
+            for idx in range(len(self._items)):
+                if idx not in selected:
+                    seen += 1
+                    if seen == slot:
+                        start = idx + 1
+                        break
+
+        runs: List[List[int]] = []
+        for idx in indices:
+            if runs and idx == runs[-1][1] + 1:
+                runs[-1][1] = idx
+            else:
+                runs.append([idx, idx])
+
+        # Runs above the anchor slide down to it, nearest run first
+        anchor = start
+        for first, last in reversed([r for r in runs if r[1] < start]):
+            if self._move_rows(first, last, anchor):
+                moves.append((first, last, anchor))
+            anchor -= last - first + 1
+        # Runs below it slide up behind them, in order
+        insert_at = start
+        for first, last in (r for r in runs if r[0] >= start):
+            if self._move_rows(first, last, insert_at):
+                moves.append((first, last, insert_at))
+            insert_at += last - first + 1
+        return anchor, moves
+
+    def _revert_row_moves(self, moves: List[Tuple[int, int, int]]) -> None:
+        """Undo moves recorded by _gather_rows, newest first."""
+        for first, last, dest in reversed(moves):
+            length = last - first + 1
+            if dest > last:
+                self._move_rows(dest - length, dest - 1, first)
+            else:
+                self._move_rows(dest, dest + length - 1, last + 1)
+
+    def _forget_spatial(self, item: CanvasItem) -> None:
+        """Drop a row's spatial entry ahead of its itemRemoved signal."""
+        self._spatial_index.remove(id(item))
+        self._spatial_pruned = True
 
     @Slot(int, str)
     def renameItem(self, index: int, name: str) -> None:
@@ -1280,11 +1843,12 @@ class CanvasModel(QAbstractListModel):
 
         try:
             parsed = parse_item_data(new_data)
-            new_item = parse_item(parsed.data)
+            new_item = build_item(parsed.data)
         except ItemSchemaError as exc:
             print(f"Warning: Failed to replace item: {exc}")
             return
 
+        self._snapshot_before_write(index)
         self._items[index] = new_item
 
         if not self._transaction_active:
@@ -1435,23 +1999,50 @@ class CanvasModel(QAbstractListModel):
             if bounds:
                 self._spatial_index.insert(id(item), bounds)
 
+    def _on_items_inserted_spatial(self, first: int, last: int) -> None:
+        """Bulk-load spatial entries for a block of inserted rows."""
+        entries = []
+        for item in self._items[first : last + 1]:
+            bounds = self._get_item_bounds_for_index(item)
+            if bounds:
+                entries.append((id(item), bounds))
+        self._spatial_index.insert_many(entries)
+
     def _on_item_removed_spatial(self, index: int) -> None:
         """Update spatial index when an item is removed.
 
         Note: The item is already removed from _items when this is called,
-        so we need to rebuild the index to handle this case correctly.
+        so we need to rebuild the index unless the remover already dropped
+        its entry via _forget_spatial.
         """
+        if self._spatial_pruned:
+            self._spatial_pruned = False
+            return
         # Since we don't have the removed item, rebuild the index
         self._rebuild_spatial_index()
 
     def _on_item_modified_spatial(self, index: int, _data: Any) -> None:
         """Update spatial index when an item is modified.
 
-        We rebuild the entire index because updateItem creates a new item
-        object (with a different id), so we can't just update the old entry.
+        Items patched in place keep their id, so only their entry moves. Paths
+        that replace the item object fall back to a full rebuild.
         """
+        if 0 <= index < len(self._items):
+            item = self._items[index]
+            if id(item) in self._spatial_index:
+                bounds = self._get_item_bounds_for_index(item)
+                if bounds:
+                    self._spatial_index.update(id(item), bounds)
+                else:
+                    self._spatial_index.remove(id(item))
+                return
         self._rebuild_spatial_index()
 
+    def _on_items_modified_spatial(self, indices: List[int]) -> None:
+        """Update spatial index entries for a batch of patched items."""
+        for index in indices:
+            self._on_item_modified_spatial(index, None)
+
     def _on_items_cleared_spatial(self) -> None:
         """Clear spatial index when all items are cleared."""
         self._spatial_index.clear()
@@ -1459,7 +2050,5 @@ class CanvasModel(QAbstractListModel):
     def _rebuild_spatial_index(self) -> None:
         """Rebuild the entire spatial index from current items."""
         self._spatial_index.clear()
-        for item in self._items:
-            bounds = self._get_item_bounds_for_index(item)
-            if bounds:
-                self._spatial_index.insert(id(item), bounds)
+        if self._items:
+            self._on_items_inserted_spatial(0, len(self._items) - 1)
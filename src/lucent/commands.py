@@ -3,16 +3,33 @@
 
 """Command pattern classes for undo/redo functionality."""
 
+import math
+import sys
 from abc import ABC, abstractmethod
-from typing import TYPE_CHECKING, Any, Dict, List, Optional, Mapping, Tuple
-from PySide6.QtCore import QModelIndex
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    Hashable,
+    List,
+    Optional,
+    Mapping,
+    Set,
+    Tuple,
+    Union,
+)
+from PySide6.QtCore import QModelIndex, QObject
 
 if TYPE_CHECKING:
     from lucent.canvas_model import CanvasModel
 
-from lucent.canvas_items import ArtboardItem, CanvasItem, GroupItem
+from lucent.canvas_items import ArtboardItem, CanvasItem, GroupItem, ShapeItem
 from lucent.item_schema import (
-    item_to_dict,
+    DataPatch,
+    apply_data_patch,
+    build_item,
+    compose_data_patches,
+    diff_item_data,
     parse_item,
     parse_item_data,
     ItemSchemaError,
@@ -28,6 +45,143 @@ def _create_item(item_data: Dict[str, Any]) -> CanvasItem:
     return parse_item(item_data)
 
 
+def describe_item_change(old: Mapping[str, Any], new: Mapping[str, Any]) -> str:
+    """Describe the action performed between two item property dicts.
+
+    Either dict may hold only a subset of the item's properties.
+    """
+    # Check name change
+    if old.get("name") != new.get("name"):
+        return "Rename"
+
+    # Check visibility/lock toggles
+    if old.get("visible") != new.get("visible"):
+        visible = new.get("visible", True)
+        return "Show" if visible else "Hide"
+    if old.get("locked") != new.get("locked"):
+        locked = new.get("locked", False)
+        return "Lock" if locked else "Unlock"
+
+    # Check transform changes
+    old_transform = old.get("transform") or {}
+    new_transform = new.get("transform") or {}
+    if old_transform != new_transform:
+        if old_transform.get("rotate") != new_transform.get("rotate"):
+            return "Rotate"
+        if old_transform.get("scaleX") != new_transform.get(
+            "scaleX"
+        ) or old_transform.get("scaleY") != new_transform.get("scaleY"):
+            return "Scale"
+        if old_transform.get("pivotX") != new_transform.get(
+            "pivotX"
+        ) or old_transform.get("pivotY") != new_transform.get("pivotY"):
+            return "Move Origin"
+        if old_transform.get("translateX") != new_transform.get(
+            "translateX"
+        ) or old_transform.get("translateY") != new_transform.get("translateY"):
+            return "Transform"
+
+    # Check geometry changes
+    old_geom = old.get("geometry") or {}
+    new_geom = new.get("geometry") or {}
+    if old_geom != new_geom:
+        pos_keys = ("x", "y", "centerX", "centerY")
+        size_keys = ("width", "height", "radiusX", "radiusY")
+
+        pos_changed = any(old_geom.get(k) != new_geom.get(k) for k in pos_keys)
+        size_changed = any(old_geom.get(k) != new_geom.get(k) for k in size_keys)
+
+        if pos_changed and size_changed:
+            return "Resize"
+        if size_changed:
+            return "Resize"
+        if pos_changed:
+            return "Move"
+        if old_geom.get("points") != new_geom.get("points"):
+            return "Edit Path"
+
+    # Check appearance changes - be specific about what changed
+    old_apps = old.get("appearances") or []
+    new_apps = new.get("appearances") or []
+    if old_apps != new_apps:
+        return _describe_appearance_change(old_apps, new_apps)
+
+    # Check text-specific changes
+    if old.get("text") != new.get("text"):
+        return "Edit Text"
+    if old.get("fontFamily") != new.get("fontFamily"):
+        return "Change Font"
+    if old.get("fontSize") != new.get("fontSize"):
+        return "Change Font Size"
+    if old.get("textColor") != new.get("textColor"):
+        return "Change Text Color"
+
+    return "Edit"
+
+
+def _describe_appearance_change(
+    old_apps: List[Dict[str, Any]], new_apps: List[Dict[str, Any]]
+) -> str:
+    """Describe what changed in appearances."""
+    # Build lookup by type for comparison
+    old_by_type = {app.get("type"): app for app in old_apps}
+    new_by_type = {app.get("type"): app for app in new_apps}
+
+    changes: List[str] = []
+
+    for app_type in ("stroke", "fill"):
+        old_app = old_by_type.get(app_type, {})
+        new_app = new_by_type.get(app_type, {})
+
+        if old_app != new_app:
+            # Determine what specifically changed
+            if old_app.get("color") != new_app.get("color"):
+                changes.append(f"{app_type.capitalize()} Color")
+            elif old_app.get("opacity") != new_app.get("opacity"):
+                changes.append(f"{app_type.capitalize()} Opacity")
+            elif old_app.get("width") != new_app.get("width"):
+                changes.append("Stroke Width")
+            else:
+                changes.append(f"{app_type.capitalize()}")
+
+    if changes:
+        return f"Change {', '.join(changes)}"
+    return "Edit Appearance"
+
+
+_ATOMIC_TYPES = (str, bytes, int, float, bool, type(None))
+
+
+def estimate_size(value: Any, _seen: Optional[Set[int]] = None) -> int:
+    """Approximate the bytes retained by plain data and slotted objects.
+
+    Walks dicts, sequences, instance dicts and ``__slots__``. QObjects such
+    as the canvas model are shared with the application and count as zero.
+    Each object is counted once even when referenced from several places.
+    """
+    seen: Set[int] = set() if _seen is None else _seen
+    if id(value) in seen or isinstance(value, QObject):
+        return 0
+    seen.add(id(value))
+    size = sys.getsizeof(value)
+    if isinstance(value, _ATOMIC_TYPES):
+        return size
+    if isinstance(value, dict):
+        for key, item in value.items():
+            size += estimate_size(key, seen) + estimate_size(item, seen)
+    elif isinstance(value, (list, tuple, set, frozenset)):
+        for item in value:
+            size += estimate_size(item, seen)
+    else:
+        if hasattr(value, "__dict__"):
+            size += estimate_size(vars(value), seen)
+        for cls in type(value).__mro__:
+            for name in cls.__dict__.get("__slots__", ()):
+                if hasattr(value, name):
+                    size += estimate_size(getattr(value, name), seen)
+    return size
+
+
 class Command(ABC):
     """Abstract base class for undoable commands."""
 
@@ -47,15 +201,62 @@ class Command(ABC):
         """Reverse the command."""
         pass
 
+    def size_estimate(self) -> int:
+        """Approximate bytes held by this command for history accounting."""
+        return estimate_size(self)
+
+    def merge_with(self, other: "Command") -> bool:
+        """Fold an already executed follow-up command into this one.
+
+        Keeps this command's original state and takes ``other``'s final
+        state. Returns False, leaving both untouched, when they don't match.
+        Only MergeableCommand subclasses ever merge.
+        """
+        return False
+
+
+class MergeableCommand(Command):
+    """Command whose consecutive edits can coalesce into one history entry."""
+
+    @abstractmethod
+    def merge_key(self) -> Optional[Hashable]:
+        """Key identifying edits that may coalesce, or None if this one can't.
+
+        Consecutive commands of the same class with equal keys are folded
+        into one history entry by merge_with.
+        """
+
+    @abstractmethod
+    def _absorb(self, other: "MergeableCommand") -> None:
+        """Take over ``other``'s end state; only called with a matching key."""
+
+    def merge_with(self, other: "Command") -> bool:
+        if type(other) is not type(self):
+            return False
+        assert isinstance(other, MergeableCommand)
+        key = self.merge_key()
+        if key is None or key != other.merge_key():
+            return False
+        self._absorb(other)
+        return True
+
 
 class AddItemCommand(Command):
     """Command to add an item to the canvas."""
 
-    def __init__(self, model: "CanvasModel", item_data: Mapping[str, Any]) -> None:
+    def __init__(
+        self,
+        model: "CanvasModel",
+        item_data: Mapping[str, Any],
+        validated: bool = False,
+    ) -> None:
         self._model = model
-        # Validate immediately so construction fails fast for bad payloads
-        parsed = parse_item_data(dict(item_data))
-        self._item_data = parsed.data
+        if validated:
+            # Caller already holds parse_item_data output; skip a second pass
+            self._item_data = dict(item_data)
+        else:
+            # Validate immediately so construction fails fast for bad payloads
+            self._item_data = parse_item_data(dict(item_data)).data
         self._index: Optional[int] = None
 
     @property
@@ -66,7 +267,7 @@ class AddItemCommand(Command):
     def execute(self) -> None:
         self._index = len(self._model._items)
         self._model.beginInsertRows(QModelIndex(), self._index, self._index)
-        self._model._items.append(_create_item(self._item_data))
+        self._model._items.append(build_item(self._item_data))
         self._model.endInsertRows()
         self._model.itemAdded.emit(self._index)
 
@@ -152,8 +353,67 @@ class RemoveItemCommand(Command):
                 self._model.itemAdded.emit(insert_at)
 
 
-class UpdateItemCommand(Command):
-    """Command to update item properties."""
+class RemoveItemsCommand(Command):
+    """Command to remove many rows in one pass.
+
+    Rows are removed one contiguous run at a time and the removed item objects
+    are kept for undo, so no per-item snapshots are taken.
+    """
+
+    def __init__(
+        self,
+        model: "CanvasModel",
+        indices: List[int],
+        description: str = "Delete Items",
+    ) -> None:
+        self._model = model
+        self._indices = sorted(set(indices))
+        self._description = description
+        self._runs: List[Tuple[int, List[CanvasItem]]] = []
+
+    @property
+    def description(self) -> str:
+        return self._description
+
+    def execute(self) -> None:
+        items = self._model._items
+        indices = [i for i in self._indices if 0 <= i < len(items)]
+        if not indices:
+            return
+        spans: List[List[int]] = []
+        for idx in indices:
+            if spans and idx == spans[-1][1] + 1:
+                spans[-1][1] = idx
+            else:
+                spans.append([idx, idx])
+
+        self._runs = []
+        # Remove from the bottom up so earlier run indices stay valid
+        for first, last in reversed(spans):
+            self._model.beginRemoveRows(QModelIndex(), first, last)
+            removed = items[first : last + 1]
+            del items[first : last + 1]
+            self._model.endRemoveRows()
+            self._runs.append((first, removed))
+            for item in removed:
+                self._model._spatial_index.remove(id(item))
+        self._runs.reverse()
+        self._model.itemsRemoved.emit(indices)
+
+    def undo(self) -> None:
+        for first, removed in self._runs:
+            self._model._insert_rows(first, removed)
+        self._runs = []
+
+
+class UpdateItemCommand(MergeableCommand):
+    """Command to update item properties.
+
+    Only the paths that differ between the old and new props are kept, so
+    undo memory follows the size of the change rather than the item. When
+    the item type changes the full payloads are kept instead. Applying a
+    side patches the current item's data and rebuilds the item from it.
+    """
 
     def __init__(
         self,
@@ -165,136 +425,142 @@ class UpdateItemCommand(Command):
         self._model = model
         self._index = index
         # Validate both payloads eagerly; they should represent valid items
-        self._old_props = parse_item_data(dict(old_props)).data
-        self._new_props = parse_item_data(dict(new_props)).data
+        old_data = parse_item_data(dict(old_props)).data
+        new_data = parse_item_data(dict(new_props)).data
+        self._item_type = str(new_data.get("type", "item"))
+        self._name = str(new_data.get("name", ""))
+        self._action = describe_item_change(old_data, new_data)
+        self._replace = old_data.get("type") != new_data.get("type")
+        if self._replace:
+            self._before: DataPatch = [((), old_data)]
+            self._after: DataPatch = [((), new_data)]
+        else:
+            self._before, self._after = diff_item_data(old_data, new_data)
 
     @property
     def description(self) -> str:
-        item_name = self._new_props.get("name", "")
-        item_type = self._new_props.get("type", "item").capitalize()
-        action = self._describe_action()
         # Include item name for context if available
-        if item_name:
-            return f"{action} '{item_name}'"
-        return f"{action} {item_type}"
-
-    def _describe_action(self) -> str:
-        """Analyze old vs new props to describe the action performed."""
-        old = self._old_props
-        new = self._new_props
-
-        # Check name change
-        if old.get("name") != new.get("name"):
-            return "Rename"
-
-        # Check visibility/lock toggles
-        if old.get("visible") != new.get("visible"):
-            visible = new.get("visible", True)
-            return "Show" if visible else "Hide"
-        if old.get("locked") != new.get("locked"):
-            locked = new.get("locked", False)
-            return "Lock" if locked else "Unlock"
-
-        # Check transform changes
-        old_transform = old.get("transform", {})
-        new_transform = new.get("transform", {})
-        if old_transform != new_transform:
-            if old_transform.get("rotate") != new_transform.get("rotate"):
-                return "Rotate"
-            if old_transform.get("scaleX") != new_transform.get(
-                "scaleX"
-            ) or old_transform.get("scaleY") != new_transform.get("scaleY"):
-                return "Scale"
-            if old_transform.get("pivotX") != new_transform.get(
-                "pivotX"
-            ) or old_transform.get("pivotY") != new_transform.get("pivotY"):
-                return "Move Origin"
-            if old_transform.get("translateX") != new_transform.get(
-                "translateX"
-            ) or old_transform.get("translateY") != new_transform.get("translateY"):
-                return "Transform"
-
-        # Check geometry changes
-        old_geom = old.get("geometry", {})
-        new_geom = new.get("geometry", {})
-        if old_geom != new_geom:
-            pos_keys = ("x", "y", "centerX", "centerY")
-            size_keys = ("width", "height", "radiusX", "radiusY")
-
-            pos_changed = any(old_geom.get(k) != new_geom.get(k) for k in pos_keys)
-            size_changed = any(old_geom.get(k) != new_geom.get(k) for k in size_keys)
-
-            if pos_changed and size_changed:
-                return "Resize"
-            if size_changed:
-                return "Resize"
-            if pos_changed:
-                return "Move"
-            if old_geom.get("points") != new_geom.get("points"):
-                return "Edit Path"
-
-        # Check appearance changes - be specific about what changed
-        old_apps = old.get("appearances", [])
-        new_apps = new.get("appearances", [])
-        if old_apps != new_apps:
-            return self._describe_appearance_change(old_apps, new_apps)
-
-        # Check text-specific changes
-        if old.get("text") != new.get("text"):
-            return "Edit Text"
-        if old.get("fontFamily") != new.get("fontFamily"):
-            return "Change Font"
-        if old.get("fontSize") != new.get("fontSize"):
-            return "Change Font Size"
-        if old.get("textColor") != new.get("textColor"):
-            return "Change Text Color"
-
-        return "Edit"
-
-    def _describe_appearance_change(
-        self, old_apps: List[Dict[str, Any]], new_apps: List[Dict[str, Any]]
-    ) -> str:
-        """Describe what changed in appearances."""
-        # Build lookup by type for comparison
-        old_by_type = {app.get("type"): app for app in old_apps}
-        new_by_type = {app.get("type"): app for app in new_apps}
-
-        changes: List[str] = []
-
-        for app_type in ("stroke", "fill"):
-            old_app = old_by_type.get(app_type, {})
-            new_app = new_by_type.get(app_type, {})
-
-            if old_app != new_app:
-                # Determine what specifically changed
-                if old_app.get("color") != new_app.get("color"):
-                    changes.append(f"{app_type.capitalize()} Color")
-                elif old_app.get("opacity") != new_app.get("opacity"):
-                    changes.append(f"{app_type.capitalize()} Opacity")
-                elif old_app.get("width") != new_app.get("width"):
-                    changes.append("Stroke Width")
-                else:
-                    changes.append(f"{app_type.capitalize()}")
-
-        if changes:
-            return f"Change {', '.join(changes)}"
-        return "Edit Appearance"
+        if self._name:
+            return f"{self._action} '{self._name}'"
+        return f"{self._action} {self._item_type.capitalize()}"
 
     def execute(self) -> None:
-        self._apply_props(self._new_props)
+        self._apply_patch(self._after)
 
     def undo(self) -> None:
-        self._apply_props(self._old_props)
+        self._apply_patch(self._before)
+
+    def merge_key(self) -> Optional[Hashable]:
+        if self._replace:
+            return None
+        return (self._index, frozenset(path[0] for path, _ in self._after))
+
+    def _absorb(self, other: "MergeableCommand") -> None:
+        assert isinstance(other, UpdateItemCommand)
+        self._after = compose_data_patches(self._after, other._after)
+        self._before = compose_data_patches(other._before, self._before)
+        self._name = other._name
 
-    def _apply_props(self, props: Dict[str, Any]) -> None:
+    def _apply_patch(self, patch: DataPatch) -> None:
         if not (0 <= self._index < len(self._model._items)):
             return
-        self._model._items[self._index] = _create_item(props)
+        if self._replace:
+            props = patch[0][1]
+        else:
+            current = self._model._itemToDict(self._model._items[self._index])
+            props = apply_data_patch(parse_item_data(current).data, patch)
+        self._model._snapshot_before_write(self._index)
+        self._model._items[self._index] = build_item(props)
         index = self._model.index(self._index, 0)
         self._model.dataChanged.emit(index, index, [])
         self._model.itemModified.emit(self._index, props)
 
 
+class PatchItemCommand(MergeableCommand):
+    """Command recording an in-place property patch of a single item.
+
+    Holds only the changed fields, so undo and redo re-apply small deltas
+    instead of rebuilding the item from a full property dict.
+    """
+
+    def __init__(
+        self,
+        model: "CanvasModel",
+        index: int,
+        before: Mapping[str, Any],
+        after: Mapping[str, Any],
+        name: str = "",
+        item_type: str = "item",
+    ) -> None:
+        self._model = model
+        self._index = index
+        self._before = dict(before)
+        self._after = dict(after)
+        self._name = str(after.get("name", name))
+        self._item_type = item_type
+
+    @property
+    def description(self) -> str:
+        action = describe_item_change(self._before, self._after)
+        if self._name:
+            return f"{action} '{self._name}'"
+        return f"{action} {self._item_type.capitalize()}"
+
+    def execute(self) -> None:
+        self._model._apply_patch(self._index, self._after)
+
+    def undo(self) -> None:
+        self._model._apply_patch(self._index, self._before)
+
+    def merge_key(self) -> Optional[Hashable]:
+        return (self._index, frozenset(self._after))
+
+    def _absorb(self, other: "MergeableCommand") -> None:
+        assert isinstance(other, PatchItemCommand)
+        self._after = other._after
+        self._name = other._name
+
+
+class TranslateItemsCommand(MergeableCommand):
+    """Command recording one translation applied to many items."""
+
+    def __init__(
+        self,
+        model: "CanvasModel",
+        indices: List[int],
+        dx: float,
+        dy: float,
+        name: str = "",
+    ) -> None:
+        self._model = model
+        self._indices = list(indices)
+        self._dx = dx
+        self._dy = dy
+        self._name = name
+
+    @property
+    def description(self) -> str:
+        if len(self._indices) > 1:
+            return "Move Items"
+        if self._name:
+            return f"Move '{self._name}'"
+        return "Move Item"
+
+    def execute(self) -> None:
+        self._model._translate_items(self._indices, self._dx, self._dy)
+
+    def undo(self) -> None:
+        self._model._translate_items(self._indices, -self._dx, -self._dy)
+
+    def merge_key(self) -> Optional[Hashable]:
+        return tuple(self._indices)
+
+    def _absorb(self, other: "MergeableCommand") -> None:
+        assert isinstance(other, TranslateItemsCommand)
+        self._dx += other._dx
+        self._dy += other._dy
+
+
 class ClearCommand(Command):
     """Command to clear all items from the canvas."""
 
@@ -335,33 +601,44 @@ class MoveItemCommand(Command):
         return "Reorder Item"
 
     def execute(self) -> None:
-        items = self._model._items
         # For beginMoveRows, destRow is the index BEFORE which the item will be inserted
         dest_row = (
             self._to_index + 1 if self._to_index > self._from_index else self._to_index
         )
-        self._model.beginMoveRows(
-            QModelIndex(), self._from_index, self._from_index, QModelIndex(), dest_row
-        )
-        item = items.pop(self._from_index)
-        items.insert(self._to_index, item)
-        self._model.endMoveRows()
-        self._model.itemsReordered.emit()
+        self._model._move_rows(self._from_index, self._from_index, dest_row)
 
     def undo(self) -> None:
-        items = self._model._items
         dest_row = (
             self._from_index + 1
             if self._from_index > self._to_index
             else self._from_index
         )
-        self._model.beginMoveRows(
-            QModelIndex(), self._to_index, self._to_index, QModelIndex(), dest_row
-        )
-        item = items.pop(self._to_index)
-        items.insert(self._from_index, item)
-        self._model.endMoveRows()
-        self._model.itemsReordered.emit()
+        self._model._move_rows(self._to_index, self._to_index, dest_row)
+
+
+class ReorderItemsCommand(Command):
+    """Command to move several rows as one contiguous block.
+
+    Used to move a container together with its descendants; the block lands
+    after ``slot`` of the rows that are not being moved.
+    """
+
+    def __init__(self, model: "CanvasModel", indices: List[int], slot: int) -> None:
+        self._model = model
+        self._indices = sorted(set(indices))
+        self._slot = slot
+        self._moves: List[Tuple[int, int, int]] = []
+
+    @property
+    def description(self) -> str:
+        return "Reorder Item"
+
+    def execute(self) -> None:
+        _, self._moves = self._model._gather_rows(self._indices, self._slot)
+
+    def undo(self) -> None:
+        self._model._revert_row_moves(self._moves)
+        self._moves = []
 
 
 class DuplicateItemCommand(Command):
@@ -408,6 +685,11 @@ class DuplicateItemCommand(Command):
     def inserted_indices(self) -> List[int]:
         return list(self._inserted_indices)
 
+    @property
+    def parent_offset(self) -> int:
+        """Position of the top-level clone within clone_payloads."""
+        return self._parent_relative_index if self._parent_last else 0
+
     @property
     def inserted_parent_index(self) -> Optional[int]:
         if not self._inserted_indices:
@@ -536,7 +818,7 @@ class DuplicateItemCommand(Command):
         count = len(self._clones)
         self._model.beginInsertRows(QModelIndex(), insert_at, insert_at + count - 1)
         for i, data in enumerate(self._clones):
-            self._model._items.insert(insert_at + i, _create_item(data))
+            self._model._items.insert(insert_at + i, build_item(data))
         self._model.endInsertRows()
         for i in range(count):
             self._model.itemAdded.emit(insert_at + i)
@@ -562,15 +844,180 @@ class DuplicateItemCommand(Command):
         self._inserted_indices = []
 
 
+class InsertItemsCommand(Command):
+    """Command to append prepared item payloads with one row insertion.
+
+    ``payloads`` must already be normalized by parse_item_data. ``root_offsets``
+    mark the top-level items within ``payloads``; their rows are reported by
+    ``result_indices`` after execution.
+    """
+
+    def __init__(
+        self,
+        model: "CanvasModel",
+        payloads: List[Dict[str, Any]],
+        root_offsets: List[int],
+        description: str = "Duplicate Items",
+    ) -> None:
+        self._model = model
+        self._payloads = payloads
+        self._root_offsets = root_offsets
+        self._description = description
+        self._insert_index: Optional[int] = None
+
+    @property
+    def description(self) -> str:
+        return self._description
+
+    @property
+    def result_indices(self) -> List[int]:
+        if self._insert_index is None:
+            return []
+        return [self._insert_index + offset for offset in self._root_offsets]
+
+    def execute(self) -> None:
+        if not self._payloads:
+            return
+        # Append to the end so the new items appear on top
+        self._insert_index = len(self._model._items)
+        new_items = [build_item(data) for data in self._payloads]
+        self._model._insert_rows(self._insert_index, new_items)
+
+    def undo(self) -> None:
+        if self._insert_index is None:
+            return
+        last = self._insert_index + len(self._payloads) - 1
+        if last < len(self._model._items):
+            self._model._remove_rows(self._insert_index, last)
+        self._insert_index = None
+
+
+def _step_position(
+    x: float, y: float, step: Tuple[float, float, float, float, float, float]
+) -> Tuple[float, float]:
+    """Rotate a point about the step centre, then translate it."""
+    cx, cy, dx, dy, cos_a, sin_a = step
+    rx, ry = x - cx, y - cy
+    return cx + rx * cos_a - ry * sin_a + dx, cy + rx * sin_a + ry * cos_a + dy
+
+
+def build_repeat_payloads(
+    model: "CanvasModel",
+    roots: List[int],
+    count: int,
+    dx: float,
+    dy: float,
+    rotate: float,
+) -> Tuple[List[Dict[str, Any]], List[int]]:
+    """Build payloads for ``count`` stepped copies of the given root items.
+
+    Each copy applies the step to the previous one: rotate by ``rotate``
+    degrees about the centre of the roots' union bounds, then translate by
+    (dx, dy). A zero angle gives a straight row; an angle plus an offset walks
+    the copies around a circle. Containers are copied with their descendants and
+    fresh ids. Returns the payloads and the offsets of each copied root.
+    """
+    items = model._items
+    bounds = model.getUnionBoundingBox(roots)
+    if not bounds:
+        return [], []
+    radians = math.radians(rotate)
+    step = (
+        bounds["x"] + bounds["width"] / 2,
+        bounds["y"] + bounds["height"] / 2,
+        dx,
+        dy,
+        math.cos(radians),
+        math.sin(radians),
+    )
+
+    blocks: List[List[int]] = []
+    for root in roots:
+        block = [root]
+        source = items[root]
+        if isinstance(source, (ArtboardItem, GroupItem)):
+            block.extend(model._get_descendant_indices(source.id))
+        blocks.append(sorted(block))
+    sources = {idx: model._itemToDict(items[idx]) for block in blocks for idx in block}
+    # Running placement per source item, advanced one step per copy
+    placement: Dict[int, Tuple[float, ...]] = {}
+    for idx in sources:
+        item = items[idx]
+        if isinstance(item, ArtboardItem):
+            placement[idx] = (item.x, item.y)
+        elif isinstance(item, ShapeItem):
+            t = item.transform
+            placement[idx] = (t.translate_x, t.translate_y, t.rotate)
+
+    payloads: List[Dict[str, Any]] = []
+    root_offsets: List[int] = []
+    for _ in range(count):
+        for block, root in zip(blocks, roots):
+            # Assign container ids up front; children may precede their parent
+            id_map = {
+                items[idx].id: str(uuid.uuid4())  # type: ignore[attr-defined]
+                for idx in block
+                if isinstance(items[idx], (ArtboardItem, GroupItem))
+            }
+            for idx in block:
+                item = items[idx]
+                clone = dict(sources[idx])
+                base_name = str(clone.get("name", "") or "")
+                clone["name"] = (
+                    f"{base_name} Copy"
+                    if base_name
+                    else model._generate_name(str(clone.get("type", "")))
+                )
+                if isinstance(item, (ArtboardItem, GroupItem)):
+                    clone["id"] = id_map[item.id]
+                parent_id = clone.get("parentId")
+                if parent_id in id_map:
+                    clone["parentId"] = id_map[parent_id]
+
+                if isinstance(item, ArtboardItem):
+                    x, y = placement[idx]
+                    cx, cy = x + item.width / 2, y + item.height / 2
+                    nx, ny = _step_position(cx, cy, step)
+                    placement[idx] = (x + nx - cx, y + ny - cy)
+                    clone["x"], clone["y"] = placement[idx]
+                elif isinstance(item, ShapeItem):
+                    tx, ty, angle = placement[idx]
+                    pivot_x = item.transform.pivot_x
+                    pivot_y = item.transform.pivot_y
+                    wx, wy = _step_position(tx + pivot_x, ty + pivot_y, step)
+                    placement[idx] = (
+                        wx - pivot_x,
+                        wy - pivot_y,
+                        (angle + rotate) % 360,
+                    )
+                    transform = item.transform.to_dict()
+                    transform["translateX"], transform["translateY"] = placement[idx][
+                        :2
+                    ]
+                    transform["rotate"] = placement[idx][2]
+                    clone["transform"] = transform
+
+                if idx == root:
+                    root_offsets.append(len(payloads))
+                payloads.append(parse_item_data(clone).data)
+    return payloads, root_offsets
+
+
 class GroupItemsCommand(Command):
-    """Group a set of items into a new group in a single undoable action."""
+    """Group a set of items into a new group in a single undoable action.
+
+    The selected rows are moved next to each other with row moves, the group
+    row is inserted after them and only the moved items' parent ids change,
+    so views keep their delegates and cached textures.
+    """
 
     def __init__(self, model: "CanvasModel", indices: List[int]) -> None:
         self._model = model
         self._indices = sorted(
             set(int(i) for i in indices if i is not None and int(i) >= 0)
         )
-        self._snapshot: List[Dict[str, Any]] = []
+        self._old_parent_ids: List[Optional[str]] = []
+        self._moves: List[Tuple[int, int, int]] = []
         self._group_id = str(uuid.uuid4())
         self._result_index: Optional[int] = None
 
@@ -580,129 +1027,132 @@ class GroupItemsCommand(Command):
 
     def execute(self) -> None:
         self._result_index = None
+        self._moves = []
         if not self._indices:
             return
-        if any(i >= len(self._model._items) for i in self._indices):
+        items = self._model._items
+        if any(i >= len(items) for i in self._indices):
             return
-
-        self._snapshot = [item_to_dict(item) for item in self._model._items]
-
-        grouped_items: List[Dict[str, Any]] = []
-        for idx in self._indices:
-            grouped_items.append(item_to_dict(self._model._items[idx]))
-
-        parent_id = grouped_items[0].get("parentId") or None
+        # Validate before any row moves; artboards cannot have a parent
+        selected: List[Union[ShapeItem, GroupItem]] = []
+        for i in self._indices:
+            item = items[i]
+            if not isinstance(item, (ShapeItem, GroupItem)):
+                return
+            selected.append(item)
+        self._old_parent_ids = [item.parent_id for item in selected]
         group_data: Dict[str, Any] = {
             "type": "group",
             "id": self._group_id,
             "name": "Group",
-            "parentId": parent_id,
+            "parentId": self._old_parent_ids[0] or None,
             "visible": True,
             "locked": False,
         }
 
-        insert_at = max(self._indices)
-        new_items: List[Dict[str, Any]] = []
-
-        def append_group_and_children() -> None:
-            for child in grouped_items:
-                child_copy = dict(child)
-                child_copy["parentId"] = self._group_id
-                new_items.append(child_copy)
-            new_items.append(group_data)
-
-        appended = False
-        current_pos = 0
-        for idx, item in enumerate(self._model._items):
-            if idx in self._indices:
-                continue
-            if not appended and current_pos >= insert_at:
-                append_group_and_children()
-                appended = True
-            new_items.append(item_to_dict(item))
-            current_pos += 1
-        if not appended:
-            append_group_and_children()
-
-        self._reset_model_from_dicts(new_items)
-        # Locate new group index
-        for idx, item in enumerate(self._model._items):
-            if (
-                isinstance(item, GroupItem)
-                and getattr(item, "id", None) == self._group_id
-            ):
-                self._result_index = idx
-                break
+        # The block lands after the first `slot` unselected rows, matching
+        # the previous rebuild-from-scratch ordering.
+        slot = min(max(self._indices), len(items) - len(self._indices))
+        start, self._moves = self._model._gather_rows(self._indices, slot)
+
+        block_end = start + len(selected)
+        for item in selected:
+            item.parent_id = self._group_id
+        self._model._emit_rows_changed(start, block_end - 1)
+
+        self._model.beginInsertRows(QModelIndex(), block_end, block_end)
+        items.insert(block_end, _create_item(group_data))
+        self._model.endInsertRows()
+        self._model.itemAdded.emit(block_end)
+        self._result_index = block_end
 
     def undo(self) -> None:
-        if not self._snapshot:
+        if self._result_index is None:
             return
-        self._reset_model_from_dicts(self._snapshot)
+        items = self._model._items
+        group_index = self._result_index
+        self._model.beginRemoveRows(QModelIndex(), group_index, group_index)
+        removed = items.pop(group_index)
+        self._model.endRemoveRows()
+        self._model._forget_spatial(removed)
+        self._model.itemRemoved.emit(group_index)
+
+        count = len(self._indices)
+        start = group_index - count
+        for item, parent_id in zip(items[start:group_index], self._old_parent_ids):
+            assert isinstance(item, (ShapeItem, GroupItem))
+            item.parent_id = parent_id
+        self._model._emit_rows_changed(start, group_index - 1)
+
+        self._model._revert_row_moves(self._moves)
+        self._moves = []
         self._result_index = None
 
-    def _reset_model_from_dicts(self, items_data: List[Dict[str, Any]]) -> None:
-        self._model.beginResetModel()
-        self._model._items = [parse_item(data) for data in items_data]
-        self._model.endResetModel()
-        self._model.itemsReordered.emit()
-
     @property
     def result_index(self) -> Optional[int]:
         return self._result_index
 
 
 class UngroupItemsCommand(Command):
-    """Ungroup a group: move children to group's parent and remove the group."""
+    """Ungroup a group: move children to group's parent and remove the group.
+
+    Children keep their rows; only their parent ids and the group row change.
+    """
 
     def __init__(self, model: "CanvasModel", group_index: int) -> None:
         self._model = model
         self._group_index = group_index
-        self._snapshot: List[Dict[str, Any]] = []
+        self._group: Optional[GroupItem] = None
+        self._child_indices: List[int] = []
 
     @property
     def description(self) -> str:
         return "Ungroup"
 
     def execute(self) -> None:
-        if not (0 <= self._group_index < len(self._model._items)):
+        items = self._model._items
+        if not (0 <= self._group_index < len(items)):
             return
-        group = self._model._items[self._group_index]
+        group = items[self._group_index]
         if not isinstance(group, GroupItem):
             return
 
-        # Snapshot before modification
-        self._snapshot = [item_to_dict(item) for item in self._model._items]
-
-        parent_id = getattr(group, "parent_id", None) or ""
-        group_id = group.id
+        parent_id = getattr(group, "parent_id", None) or None
+        children = self._model._get_direct_children_indices(group.id)
+        for idx in children:
+            items[idx].parent_id = parent_id  # type: ignore[attr-defined]
+        for idx in children:
+            self._model._emit_rows_changed(idx, idx)
 
-        # Build new items list with children reparented and group removed
-        new_items: List[Dict[str, Any]] = []
-        for item in self._model._items:
-            item_dict = item_to_dict(item)
-            if item_dict.get("id") == group_id:
-                # Skip the group itself (remove it)
-                continue
-            if item_dict.get("parentId") == group_id:
-                # Reparent child to group's parent
-                item_dict["parentId"] = parent_id if parent_id else None
-            new_items.append(item_dict)
+        self._model.beginRemoveRows(QModelIndex(), self._group_index, self._group_index)
+        items.pop(self._group_index)
+        self._model.endRemoveRows()
+        self._model._forget_spatial(group)
+        self._model.itemRemoved.emit(self._group_index)
 
-        self._reset_model_from_dicts(new_items)
+        self._group = group
+        # Child rows after the group shift up by one once it is removed
+        self._child_indices = [
+            idx - 1 if idx > self._group_index else idx for idx in children
+        ]
 
     def undo(self) -> None:
-        if not self._snapshot:
+        if self._group is None:
             return
-        self._reset_model_from_dicts(self._snapshot)
+        group = self._group
+        self._group = None
+        self._model.beginInsertRows(QModelIndex(), self._group_index, self._group_index)
+        self._model._items.insert(self._group_index, group)
+        self._model.endInsertRows()
+        self._model.itemAdded.emit(self._group_index)
 
-    def _reset_model_from_dicts(self, items_data: List[Dict[str, Any]]) -> None:
-        self._model.beginResetModel()
-        self._model._items = [parse_item(data) for data in items_data]
-        self._model.endResetModel()
-        self._model.itemsReordered.emit()
+        for idx in self._child_indices:
+            row = idx + 1 if idx >= self._group_index else idx
+            self._model._items[row].parent_id = group.id  # type: ignore[attr-defined]
+            self._model._emit_rows_changed(row, row)
 
 
-class TransactionCommand(Command):
+class TransactionCommand(MergeableCommand):
     """Command that groups multiple commands into a single undoable unit."""
 
     def __init__(
@@ -722,3 +1172,54 @@ class TransactionCommand(Command):
     def undo(self) -> None:
         for cmd in reversed(self._commands):
             cmd.undo()
+
+    def merge_key(self) -> Optional[Hashable]:
+        keys = []
+        for cmd in self._commands:
+            if not isinstance(cmd, MergeableCommand):
+                return None
+            key = cmd.merge_key()
+            if key is None:
+                return None
+            keys.append((type(cmd), key))
+        return (self._description, tuple(keys))
+
+    def _absorb(self, other: "MergeableCommand") -> None:
+        assert isinstance(other, TransactionCommand)
+        # Equal keys mean the children pair up as mergeable commands of the
+        # same class with matching keys
+        for cmd, follow_up in zip(self._commands, other._commands):
+            assert isinstance(cmd, MergeableCommand)
+            assert isinstance(follow_up, MergeableCommand)
+            cmd._absorb(follow_up)
+
+
+class PatchItemsCommand(TransactionCommand):
+    """Transaction of item patches whose change signals are coalesced.
+
+    Undo and redo report all touched items through one ``itemsModified``
+    notification instead of one ``itemModified`` per item.
+    """
+
+    def __init__(
+        self,
+        model: "CanvasModel",
+        commands: List[Command],
+        description: str = "Edit Properties",
+    ) -> None:
+        super().__init__(commands, description)
+        self._model = model
+
+    def execute(self) -> None:
+        self._model._begin_modification_batch()
+        try:
+            super().execute()
+        finally:
+            self._model._end_modification_batch()
+
+    def undo(self) -> None:
+        self._model._begin_modification_batch()
+        try:
+            super().undo()
+        finally:
+            self._model._end_modification_batch()
@@ -0,0 +1,517 @@
+# Copyright (C) 2026 The Culture List, Inc.
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""Binary container for .lucent v2 documents.
+
+Layout::
+
+    header   MAGIC (8 bytes) + format version (uint32)
+    sections each independently compressed
+    toc      JSON table of contents: name -> offset, length, codec, size
+    trailer  toc offset (uint64) + toc length (uint64) + END_MARKER
+
+The trailer sits at a fixed distance from the end of the file, so a reader
+memory-maps the file, reads the table of contents and decodes only the
+sections it needs. Sections are written and read incrementally, so neither
+side holds a whole section in memory.
+
+The ``items`` section is a stream of item records. Each record is a compact
+JSON item dict followed by the item's path points packed as float64 values,
+six per point (x, y, handleIn x/y, handleOut x/y, NaN for a missing handle),
+the same layout PathGeometry keeps in memory.
+"""
+
+from __future__ import annotations
+
+import json
+import lzma
+import math
+import mmap
+import struct
+import zlib
+from array import array
+from dataclasses import dataclass
+from pathlib import Path
+from typing import (
+    IO,
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Protocol,
+    Tuple,
+    Union,
+)
+
+MAGIC = b"\x89LUCENT\n"
+END_MARKER = b"LTOC"
+POINT_STRIDE = 6
+# Bytes read from the file, or produced by a decompressor, per step
+CHUNK_SIZE = 64 * 1024
+
+_HEADER = struct.Struct("<8sI")
+_TRAILER = struct.Struct("<QQ4s")
+# Record header: JSON byte length, packed point count
+_RECORD = struct.Struct("<II")
+_PACKED_KEY = "packedPoints"
+
+
+class _Compressor(Protocol):
+    def compress(self, data: bytes, /) -> bytes: ...
+
+    def flush(self) -> bytes: ...
+
+
+class _Uncompressed:
+    """Pass-through compressor for the "none" codec."""
+
+    def compress(self, data: bytes, /) -> bytes:
+        return data
+
+    def flush(self) -> bytes:
+        return b""
+
+
+CODECS: Dict[str, Callable[[], _Compressor]] = {
+    "none": _Uncompressed,
+    "zlib": zlib.compressobj,
+    "lzma": lzma.LZMACompressor,
+}
+
+
+class ContainerError(ValueError):
+    """Raised when a binary document is malformed."""
+
+
+def is_container(head: bytes) -> bool:
+    """Return True if ``head`` starts with the binary container magic."""
+    return head[: len(MAGIC)] == MAGIC
+
+
+def _dumps(value: Any) -> bytes:
+    return json.dumps(value, separators=(",", ":")).encode("utf-8")
+
+
+# --- Item records ---
+
+
+def _number(value: Any) -> Optional[float]:
+    if type(value) not in (int, float) or not math.isfinite(value):
+        return None
+    return float(value)
+
+
+def _pack_points(points: Any) -> Optional[array]:
+    """Pack path points into a float array, or None if they don't fit."""
+    if not isinstance(points, list):
+        return None
+    coords = array("d")
+    for point in points:
+        if not isinstance(point, dict) or not point.keys() <= {
+            "x",
+            "y",
+            "handleIn",
+            "handleOut",
+        }:
+            return None
+        x, y = _number(point.get("x")), _number(point.get("y"))
+        if x is None or y is None:
+            return None
+        coords.append(x)
+        coords.append(y)
+        for key in ("handleIn", "handleOut"):
+            handle = point.get(key)
+            if handle is None:
+                if key in point:
+                    return None
+                coords.append(math.nan)
+                coords.append(math.nan)
+                continue
+            if not isinstance(handle, dict) or handle.keys() != {"x", "y"}:
+                return None
+            hx, hy = _number(handle["x"]), _number(handle["y"])
+            if hx is None or hy is None:
+                return None
+            coords.append(hx)
+            coords.append(hy)
+    return coords
+
+
+def _unpack_points(coords: array) -> List[Dict[str, Any]]:
+    columns = [coords[i::POINT_STRIDE] for i in range(POINT_STRIDE)]
+    points: List[Dict[str, Any]] = []
+    append = points.append
+    isnan = math.isnan
+    for x, y, ix, iy, ox, oy in zip(*columns):
+        point: Dict[str, Any] = {"x": x, "y": y}
+        if not isnan(ix):
+            point["handleIn"] = {"x": ix, "y": iy}
+        if not isnan(ox):
+            point["handleOut"] = {"x": ox, "y": oy}
+        append(point)
+    return points
+
+
+def pack_item(item: Dict[str, Any]) -> bytes:
+    """Encode one item dict as an item record."""
+    coords: Optional[array] = None
+    geometry = item.get("geometry")
+    if isinstance(geometry, dict) and "points" in geometry:
+        coords = _pack_points(geometry["points"])
+        if coords is not None:
+            geometry = dict(geometry)
+            del geometry["points"]
+            geometry[_PACKED_KEY] = True
+            item = dict(item, geometry=geometry)
+    encoded = _dumps(item)
+    count = len(coords) // POINT_STRIDE if coords is not None else 0
+    packed = coords.tobytes() if coords is not None else b""
+    return _RECORD.pack(len(encoded), count) + encoded + packed
+
+
+def iter_records(chunks: Iterable[bytes]) -> Iterator[Dict[str, Any]]:
+    """Decode item records from a stream of byte chunks.
+
+    Only the current chunk and one partial record are buffered.
+    """
+    buffer = bytearray()
+    pos = 0
+    for chunk in chunks:
+        if pos:
+            del buffer[:pos]
+            pos = 0
+        buffer += chunk
+        end = len(buffer)
+        while pos + _RECORD.size <= end:
+            length, count = _RECORD.unpack_from(buffer, pos)
+            start = pos + _RECORD.size
+            coords_end = start + length + count * POINT_STRIDE * 8
+            if coords_end > end:
+                break
+            try:
+                item = json.loads(bytes(buffer[start : start + length]))
+            except ValueError as exc:
+                raise ContainerError(f"Invalid item record: {exc}") from exc
+            geometry = item.get("geometry")
+            if isinstance(geometry, dict) and geometry.pop(_PACKED_KEY, False):
+                coords = array("d")
+                coords.frombytes(buffer[start + length : coords_end])
+                geometry["points"] = _unpack_points(coords)
+            pos = coords_end
+            yield item
+    if pos < len(buffer):
+        raise ContainerError("Truncated item record")
+
+
+def unpack_items(data: bytes) -> Iterator[Dict[str, Any]]:
+    """Decode a buffer of item records."""
+    return iter_records((data,))
+
+
+# --- Sections and table of contents ---
+
+
+class ContainerWriter:
+    """Writes a container to a binary stream one section at a time.
+
+    Section data is compressed as it is written, so a section can be
+    streamed without building it in memory first.
+    """
+
+    def __init__(self, stream: IO[bytes], version: int, codec: str = "zlib") -> None:
+        if codec not in CODECS:
+            raise ValueError(f"Unknown codec: {codec}")
+        self._stream = stream
+        self._version = version
+        self._codec = codec
+        self._toc: Dict[str, Dict[str, Any]] = {}
+        self._offset = _HEADER.size
+        self._section: Optional[Dict[str, Any]] = None
+        self._compressor: Optional[_Compressor] = None
+        stream.write(_HEADER.pack(MAGIC, version))
+
+    def begin_section(self, name: str, codec: Optional[str] = None) -> None:
+        """Open section ``name``, compressed with ``codec`` or the default."""
+        if self._section is not None:
+            raise RuntimeError("Previous section is still open")
+        codec = codec or self._codec
+        if codec not in CODECS:
+            raise ValueError(f"Unknown codec: {codec}")
+        self._section = {
+            "offset": self._offset,
+            "length": 0,
+            "codec": codec,
+            "size": 0,
+        }
+        self._toc[name] = self._section
+        self._compressor = CODECS[codec]()
+
+    def write(self, data: bytes) -> None:
+        """Append raw bytes to the open section."""
+        if self._section is None or self._compressor is None:
+            raise RuntimeError("No open section")
+        self._section["size"] += len(data)
+        self._emit(self._compressor.compress(data))
+
+    def end_section(self) -> None:
+        if self._section is None or self._compressor is None:
+            raise RuntimeError("No open section")
+        self._emit(self._compressor.flush())
+        self._section = None
+        self._compressor = None
+
+    def add_section(self, name: str, data: bytes, codec: Optional[str] = None) -> None:
+        self.begin_section(name, codec)
+        self.write(data)
+        self.end_section()
+
+    def add_encoded_section(self, name: str, section: EncodedSection) -> None:
+        """Write an already compressed section as is."""
+        if self._section is not None:
+            raise RuntimeError("Previous section is still open")
+        self._toc[name] = {
+            "offset": self._offset,
+            "length": len(section.data),
+            "codec": section.codec,
+            "size": section.size,
+        }
+        self._stream.write(section.data)
+        self._offset += len(section.data)
+
+    def close(self) -> None:
+        """Write the table of contents and trailer."""
+        if self._section is not None:
+            self.end_section()
+        encoded = _dumps({"version": self._version, "sections": self._toc})
+        self._stream.write(encoded)
+        self._stream.write(_TRAILER.pack(self._offset, len(encoded), END_MARKER))
+
+    def _emit(self, data: bytes) -> None:
+        if data and self._section is not None:
+            self._stream.write(data)
+            self._section["length"] += len(data)
+            self._offset += len(data)
+
+
+def write_container(
+    stream: IO[bytes],
+    sections: List[Tuple[str, bytes]],
+    version: int,
+    codec: str = "zlib",
+) -> None:
+    """Write ``sections`` as a container to a binary stream."""
+    writer = ContainerWriter(stream, version, codec)
+    for name, data in sections:
+        writer.add_section(name, data)
+    writer.close()
+
+
+def _decode(
+    buffer: Any,
+    pos: int,
+    end: int,
+    codec: str,
+    chunk_size: int,
+    consumed: Optional[Callable[[int], None]] = None,
+) -> Iterator[bytes]:
+    """Decompress ``buffer[pos:end]`` in bounded chunks.
+
+    ``consumed`` is called with the number of stored bytes read per step.
+    """
+    if codec == "none":
+        for start in range(pos, end, chunk_size):
+            chunk = buffer[start : min(start + chunk_size, end)]
+            if consumed:
+                consumed(len(chunk))
+            yield chunk
+        return
+    try:
+        if codec == "zlib":
+            yield from _inflate(buffer, pos, end, chunk_size, consumed)
+        else:
+            yield from _unxz(buffer, pos, end, chunk_size, consumed)
+    except (zlib.error, lzma.LZMAError) as exc:
+        raise ContainerError(f"Corrupt section: {exc}") from exc
+
+
+def _inflate(
+    buffer: Any,
+    pos: int,
+    end: int,
+    chunk_size: int,
+    consumed: Optional[Callable[[int], None]],
+) -> Iterator[bytes]:
+    decompressor = zlib.decompressobj()
+    while not decompressor.eof:
+        data = decompressor.unconsumed_tail
+        if not data and pos < end:
+            data = buffer[pos : min(pos + chunk_size, end)]
+            pos += len(data)
+            if consumed:
+                consumed(len(data))
+        out = decompressor.decompress(data, chunk_size)
+        if out:
+            yield out
+        elif not data:
+            raise ContainerError("Truncated section")
+
+
+def _unxz(
+    buffer: Any,
+    pos: int,
+    end: int,
+    chunk_size: int,
+    consumed: Optional[Callable[[int], None]],
+) -> Iterator[bytes]:
+    decompressor = lzma.LZMADecompressor()
+    while not decompressor.eof:
+        data = b""
+        if decompressor.needs_input:
+            if pos >= end:
+                raise ContainerError("Truncated section")
+            data = buffer[pos : min(pos + chunk_size, end)]
+            pos += len(data)
+            if consumed:
+                consumed(len(data))
+        out = decompressor.decompress(data, chunk_size)
+        if out:
+            yield out
+
+
+@dataclass(frozen=True)
+class EncodedSection:
+    """Stored (compressed) bytes of a section, held outside any container.
+
+    Lets a section be copied between files, or decoded later, without
+    recompressing it.
+    """
+
+    codec: str
+    data: bytes
+    # Decompressed size in bytes
+    size: int
+
+    def iter_chunks(self, chunk_size: int = CHUNK_SIZE) -> Iterator[bytes]:
+        return _decode(self.data, 0, len(self.data), self.codec, chunk_size)
+
+
+class SectionEncoder:
+    """Compresses a section in memory, for sections written out of order."""
+
+    def __init__(self, codec: str = "zlib") -> None:
+        if codec not in CODECS:
+            raise ValueError(f"Unknown codec: {codec}")
+        self._codec = codec
+        self._compressor = CODECS[codec]()
+        self._parts: List[bytes] = []
+        self._size = 0
+
+    def write(self, data: bytes) -> None:
+        self._size += len(data)
+        self._parts.append(self._compressor.compress(data))
+
+    def finish(self) -> EncodedSection:
+        self._parts.append(self._compressor.flush())
+        return EncodedSection(self._codec, b"".join(self._parts), self._size)
+
+
+class ContainerReader:
+    """Memory-mapped reader that decodes sections on demand."""
+
+    def __init__(self, path: Union[str, Path]) -> None:
+        self._file = open(path, "rb")
+        try:
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError as exc:
+            # Empty files cannot be mapped
+            self._file.close()
+            raise ContainerError("File is empty") from exc
+        # Stored bytes consumed by iter_section() since the file was opened
+        self.bytes_read = 0
+        try:
+            self.version, self._toc = self._read_toc()
+        except Exception:
+            self.close()
+            raise
+
+    def _read_toc(self) -> Tuple[int, Dict[str, Dict[str, Any]]]:
+        data = self._map
+        if len(data) < _HEADER.size + _TRAILER.size:
+            raise ContainerError("File is too short")
+        magic, version = _HEADER.unpack_from(data, 0)
+        if magic != MAGIC:
+            raise ContainerError("Not a binary Lucent document")
+        toc_offset, toc_length, marker = _TRAILER.unpack_from(
+            data, len(data) - _TRAILER.size
+        )
+        if marker != END_MARKER or toc_offset + toc_length > len(data):
+            raise ContainerError("Missing table of contents; file may be truncated")
+        try:
+            toc = json.loads(data[toc_offset : toc_offset + toc_length])
+            sections = toc["sections"]
+        except (ValueError, KeyError, TypeError) as exc:
+            raise ContainerError(f"Invalid table of contents: {exc}") from exc
+        return version, sections
+
+    @property
+    def section_names(self) -> List[str]:
+        return list(self._toc)
+
+    def has_section(self, name: str) -> bool:
+        return name in self._toc
+
+    def section_length(self, name: str) -> int:
+        """Stored (compressed) size of section ``name`` in bytes."""
+        return self._entry(name)[1]
+
+    def _entry(self, name: str) -> Tuple[int, int, str]:
+        try:
+            entry = self._toc[name]
+            offset, length, codec = entry["offset"], entry["length"], entry["codec"]
+        except (KeyError, TypeError) as exc:
+            raise ContainerError(f"Missing or invalid section: {name}") from exc
+        if codec not in CODECS or offset + length > len(self._map):
+            raise ContainerError(f"Missing or invalid section: {name}")
+        return offset, length, codec
+
+    def iter_section(self, name: str, chunk_size: int = CHUNK_SIZE) -> Iterator[bytes]:
+        """Yield the decompressed bytes of section ``name`` in bounded chunks."""
+        offset, length, codec = self._entry(name)
+
+        def consumed(count: int) -> None:
+            self.bytes_read += count
+
+        return _decode(self._map, offset, offset + length, codec, chunk_size, consumed)
+
+    def read_encoded(self, name: str) -> EncodedSection:
+        """Copy section ``name`` out of the file without decompressing it."""
+        offset, length, codec = self._entry(name)
+        size = self._toc[name].get("size", 0)
+        return EncodedSection(codec, bytes(self._map[offset : offset + length]), size)
+
+    def read_section(self, name: str) -> bytes:
+        """Decompress and return the raw bytes of section ``name``."""
+        return b"".join(self.iter_section(name))
+
+    def iter_items(self, name: str = "items") -> Iterator[Dict[str, Any]]:
+        """Yield item dicts from an item record section as it is decoded."""
+        return iter_records(self.iter_section(name))
+
+    def read_json(self, name: str) -> Any:
+        try:
+            return json.loads(self.read_section(name))
+        except ValueError as exc:
+            raise ContainerError(f"Invalid JSON in section {name}: {exc}") from exc
+
+    def close(self) -> None:
+        self._map.close()
+        self._file.close()
+
+    def __enter__(self) -> "ContainerReader":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
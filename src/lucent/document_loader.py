@@ -0,0 +1,193 @@
+# Copyright (C) 2026 The Culture List, Inc.
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""Background document loading.
+
+A worker thread streams items from the file and validates them; the GUI
+thread receives them in batches and appends them to the CanvasModel, so the
+window stays responsive and partially loaded content is drawn as it arrives.
+"""
+
+from __future__ import annotations
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
+
+from PySide6.QtCore import QObject, Signal
+
+from lucent.file_io import FileVersionError, open_document
+from lucent.item_schema import ItemSchemaError, parse_item_data
+
+if TYPE_CHECKING:
+    from lucent.canvas_model import CanvasModel
+
+DEFAULT_BATCH_SIZE = 256
+# Batches handed to the GUI thread but not yet inserted; bounds memory when
+# the worker decodes faster than the model can take items
+MAX_PENDING_BATCHES = 4
+
+
+class DocumentLoader(QObject):
+    """Loads a document into a CanvasModel without blocking the GUI thread.
+
+    ``start()`` empties the model and begins loading. Exactly one of
+    ``finished``, ``failed`` or ``cancelled`` is emitted per load; on
+    ``failed`` or ``cancelled`` the model is back to the items it held
+    before ``start()``.
+    """
+
+    progressChanged = Signal(float)
+    # Document header: {"meta": ..., "viewport": ..., "deferred": ...}
+    finished = Signal(object)
+    failed = Signal(str)
+    cancelled = Signal()
+
+    # Delivered from the worker thread; queued onto the GUI thread
+    _batchReady = Signal(int, object, float)
+    _streamEnded = Signal(int, str, object)
+
+    def __init__(
+        self,
+        canvas_model: "CanvasModel",
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        parent: Optional[QObject] = None,
+    ) -> None:
+        super().__init__(parent)
+        self._model = canvas_model
+        self._batch_size = batch_size
+        self._executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="lucent-open"
+        )
+        self._ticket = 0
+        self._active = False
+        self._progress = 0.0
+        self._cancel_event = threading.Event()
+        self._pending = threading.Semaphore(MAX_PENDING_BATCHES)
+        self._batchReady.connect(self._on_batch_ready)
+        self._streamEnded.connect(self._on_stream_ended)
+
+    @property
+    def active(self) -> bool:
+        return self._active
+
+    @property
+    def progress(self) -> float:
+        """Fraction of the file read so far, from 0.0 to 1.0."""
+        return self._progress
+
+    def start(self, path: str, lazy_threshold: Optional[int] = None) -> None:
+        """Begin loading ``path``, cancelling any load in progress.
+
+        Documents with at least ``lazy_threshold`` deferred artboards are
+        opened lazily; their contents are delivered, still encoded, in the
+        ``"deferred"`` entry of the ``finished`` header.
+        """
+        if self._active:
+            self.cancel()
+        self._ticket += 1
+        self._active = True
+        self._cancel_event = threading.Event()
+        self._pending = threading.Semaphore(MAX_PENDING_BATCHES)
+        self._set_progress(0.0)
+        self._model.beginLoad()
+        self._executor.submit(
+            self._read,
+            self._ticket,
+            path,
+            lazy_threshold,
+            self._cancel_event,
+            self._pending,
+        )
+
+    def cancel(self) -> None:
+        """Stop the load in progress; batches still in flight are dropped."""
+        if not self._active:
+            return
+        self._active = False
+        self._ticket += 1
+        self._cancel_event.set()
+        # Wake the worker if it is waiting for the GUI to catch up
+        self._pending.release()
+        self._model.abortLoad()
+        self.cancelled.emit()
+
+    def wait(self) -> None:
+        """Block until the worker has stopped; for shutdown and tests."""
+        self._executor.submit(lambda: None).result()
+
+    def _set_progress(self, value: float) -> None:
+        if self._progress != value:
+            self._progress = value
+            self.progressChanged.emit(value)
+
+    # --- Worker thread ---
+
+    def _read(
+        self,
+        ticket: int,
+        path: str,
+        lazy_threshold: Optional[int],
+        cancel: threading.Event,
+        pending: threading.Semaphore,
+    ) -> None:
+        header: Dict[str, Any] = {}
+        try:
+            with open_document(path) as document:
+                lazy = (
+                    lazy_threshold is not None
+                    and document.deferred_count >= lazy_threshold
+                )
+                batch: List[Dict[str, Any]] = []
+                for data in document.items(lazy=lazy):
+                    if cancel.is_set():
+                        return
+                    try:
+                        batch.append(parse_item_data(data).data)
+                    except ItemSchemaError as exc:
+                        print(f"Warning: Failed to load item: {exc}")
+                    if len(batch) >= self._batch_size:
+                        pending.acquire()
+                        if cancel.is_set():
+                            return
+                        self._batchReady.emit(ticket, batch, document.progress)
+                        batch = []
+                if batch:
+                    pending.acquire()
+                    if cancel.is_set():
+                        return
+                    self._batchReady.emit(ticket, batch, 1.0)
+                header = {
+                    "meta": document.meta,
+                    "viewport": document.viewport,
+                    "deferred": document.deferred_artboards() if lazy else {},
+                }
+        except (OSError, ValueError, FileVersionError) as exc:
+            self._streamEnded.emit(ticket, str(exc) or type(exc).__name__, None)
+            return
+        self._streamEnded.emit(ticket, "", header)
+
+    # --- GUI thread ---
+
+    def _on_batch_ready(
+        self, ticket: int, batch: List[Dict[str, Any]], progress: float
+    ) -> None:
+        if ticket != self._ticket:
+            return
+        self._model.appendLoadedItems(batch)
+        self._set_progress(progress)
+        self._pending.release()
+
+    def _on_stream_ended(
+        self, ticket: int, error: str, header: Optional[Dict[str, Any]]
+    ) -> None:
+        if ticket != self._ticket:
+            return
+        self._active = False
+        if error or header is None:
+            self._model.abortLoad()
+            self.failed.emit(error)
+            return
+        self._model.endLoad()
+        self._set_progress(1.0)
+        self.finished.emit(header)
@@ -5,18 +5,67 @@
 
 from __future__ import annotations
 
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, Dict, List, Optional
-
-from PySide6.QtCore import QObject, Property, Signal, Slot, QUrl
-
-from lucent.file_io import save_document, load_document, FileVersionError
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
+
+from PySide6.QtCore import QObject, Property, QRectF, QTimer, Signal, Slot, QUrl
+
+from lucent.batch_export import (
+    BatchExporter,
+    ExportJob,
+    artboard_jobs,
+    normalize_format,
+    unique_name,
+)
+from lucent.document_loader import DocumentLoader
+from lucent.exporter import ExportOptions, export_file
+from lucent.file_io import (
+    LAZY_ARTBOARD_THRESHOLD,
+    DeferredArtboard,
+    FileVersionError,
+    open_document,
+    save_document,
+)
 from lucent.item_schema import item_to_dict
+from lucent.journal import (
+    AUTOSAVE_BASE_KEY,
+    JOURNAL_SUFFIX,
+    EditJournal,
+    autosave_path_for,
+    file_stamp,
+    journal_path_for,
+    read_journal,
+    remove_journal,
+    replay_journal,
+)
+from lucent.preview import build_preview
 from lucent.unit_settings import UnitSettings
 
 if TYPE_CHECKING:
+    from lucent.canvas_items import CanvasItem
     from lucent.canvas_model import CanvasModel
 
+DEFAULT_AUTOSAVE_INTERVAL = 60  # seconds
+
+
+def _write_snapshot(
+    path: str,
+    items: List["CanvasItem"],
+    viewport: Dict[str, Any],
+    meta: Dict[str, Any],
+    deferred: Dict[str, DeferredArtboard],
+) -> None:
+    """Serialize and write an item snapshot; runs on the autosave thread."""
+    save_document(
+        path=path,
+        items=(item_to_dict(item) for item in items),
+        viewport=viewport,
+        meta=meta,
+        preview=build_preview(items, deferred),
+        deferred=deferred,
+    )
+
 
 class DocumentManager(QObject):
     """Manages document state including file path, dirty flag, and file operations.
@@ -30,6 +79,23 @@ class DocumentManager(QObject):
     documentTitleChanged = Signal()
     viewportChanged = Signal()
     documentDPIChanged = Signal()
+    # Emitted after a crash when an autosave or journal was recovered, with
+    # the number of replayed journal records
+    sessionRecovered = Signal(int)
+    autosaveIntervalChanged = Signal()
+    # Emitted on the GUI thread when a background autosave finishes
+    autosaved = Signal(bool)
+    # Delivered from the autosave thread; queued onto the GUI thread
+    _autosaveFinished = Signal(int, str)
+    loadingChanged = Signal()
+    loadProgressChanged = Signal()
+    # Emitted when an openDocumentAsync() completes, fails or is cancelled
+    openFinished = Signal(bool)
+    exportingChanged = Signal()
+    exportProgressChanged = Signal()
+    # Emitted with the number of files exported and failed when an
+    # exportArtboards() batch completes
+    batchExportFinished = Signal(int, int)
 
     def __init__(
         self,
@@ -56,29 +122,84 @@ class DocumentManager(QObject):
         # Call startTracking() from QML after Component.onCompleted
         self._tracking_enabled = False
 
+        # Files with this many deferred artboards open lazily
+        self._lazy_artboard_threshold = LAZY_ARTBOARD_THRESHOLD
+
+        # Crash-recovery journal, active only for documents saved to disk
+        self._journal = EditJournal(canvas_model, parent=self)
+
+        # Background autosave to a sidecar next to the document: snapshots
+        # are taken on the GUI thread and written by a single worker, so
+        # writes never overlap or reorder
+        self._edit_generation = 0
+        # Edit generation held by the latest autosave
+        self._autosaved_generation = 0
+        self._autosave_executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="lucent-autosave"
+        )
+        self._autosave_future: Optional[Future[None]] = None
+        self._autosave_ticket = 0
+        # (ticket, autosave path, edit generation, journal position) of the
+        # pending save
+        self._autosave_state: Optional[Tuple[int, str, int, int]] = None
+        self._autosave_interval = DEFAULT_AUTOSAVE_INTERVAL
+        self._autosave_timer = QTimer(self)
+        self._autosave_timer.setInterval(self._autosave_interval * 1000)
+        self._autosave_timer.timeout.connect(self.autosave)
+        self._autosaveFinished.connect(self._on_autosave_finished)
+
+        # Background open; (path, previous journal) while a load is running
+        self._loader = DocumentLoader(canvas_model, parent=self)
+        self._loading = False
+        self._pending_open: Optional[Tuple[str, str]] = None
+        self._loader.progressChanged.connect(self._on_load_progress)
+        self._loader.finished.connect(self._on_load_finished)
+        self._loader.failed.connect(self._on_load_failed)
+        self._loader.cancelled.connect(self._on_load_cancelled)
+
+        # Background batch export
+        self._exporter = BatchExporter(parent=self)
+        self._exporter.progressChanged.connect(self._on_export_progress)
+        self._exporter.finished.connect(self._on_export_finished)
+        self._exporter.cancelled.connect(self._on_export_cancelled)
+
     def _connect_model_signals(self) -> None:
         """Connect to CanvasModel signals for dirty tracking."""
         self._canvas_model.itemAdded.connect(self._on_model_changed)
+        self._canvas_model.itemsInserted.connect(self._on_model_changed)
         self._canvas_model.itemRemoved.connect(self._on_model_changed)
+        self._canvas_model.itemsRemoved.connect(self._on_model_changed)
         self._canvas_model.itemModified.connect(self._on_model_changed)
+        self._canvas_model.itemsModified.connect(self._on_model_changed)
+        self._canvas_model.itemsTransformed.connect(self._on_model_changed)
         self._canvas_model.itemsCleared.connect(self._on_model_changed)
         self._canvas_model.itemsReordered.connect(self._on_model_changed)
+        self._canvas_model.itemsMoved.connect(self._on_model_changed)
 
     def _disconnect_model_signals(self) -> None:
         """Disconnect from CanvasModel signals temporarily."""
         try:
             self._canvas_model.itemAdded.disconnect(self._on_model_changed)
+            self._canvas_model.itemsInserted.disconnect(self._on_model_changed)
             self._canvas_model.itemRemoved.disconnect(self._on_model_changed)
+            self._canvas_model.itemsRemoved.disconnect(self._on_model_changed)
             self._canvas_model.itemModified.disconnect(self._on_model_changed)
+            self._canvas_model.itemsModified.disconnect(self._on_model_changed)
+            self._canvas_model.itemsTransformed.disconnect(self._on_model_changed)
             self._canvas_model.itemsCleared.disconnect(self._on_model_changed)
             self._canvas_model.itemsReordered.disconnect(self._on_model_changed)
+            self._canvas_model.itemsMoved.disconnect(self._on_model_changed)
         except RuntimeError:
             # Signals may not be connected
             pass
 
     def _on_model_changed(self, *args: Any) -> None:
         """Handle any change to the canvas model."""
+        if self._canvas_model.loading_artboard is not None:
+            # Loading a deferred artboard does not modify the document
+            return
         if self._tracking_enabled:
+            self._edit_generation += 1
             self._set_dirty(True)
 
     def _set_dirty(self, value: bool) -> None:
@@ -135,6 +256,29 @@ class DocumentManager(QObject):
 
     documentDPI = Property(int, _get_document_dpi, notify=documentDPIChanged)
 
+    def _get_autosave_interval(self) -> int:
+        return self._autosave_interval
+
+    def _set_autosave_interval(self, seconds: int) -> None:
+        if self._autosave_interval == seconds:
+            return
+        self._autosave_interval = seconds
+        if seconds > 0:
+            self._autosave_timer.setInterval(seconds * 1000)
+            if self._tracking_enabled:
+                self._autosave_timer.start()
+        else:
+            self._autosave_timer.stop()
+        self.autosaveIntervalChanged.emit()
+
+    # Seconds between background autosaves of a saved, dirty document; 0 disables
+    autosaveInterval = Property(
+        int,
+        _get_autosave_interval,
+        _set_autosave_interval,
+        notify=autosaveIntervalChanged,
+    )
+
     @Slot(int)
     def setDocumentDPI(self, dpi: int) -> None:
         """Set document DPI for export scaling.
@@ -151,6 +295,34 @@ class DocumentManager(QObject):
         """Check if document has unsaved changes."""
         return self._dirty
 
+    def _get_loading(self) -> bool:
+        return self._loading
+
+    loading = Property(bool, _get_loading, notify=loadingChanged)
+
+    def _get_load_progress(self) -> float:
+        return self._loader.progress
+
+    loadProgress = Property(float, _get_load_progress, notify=loadProgressChanged)
+
+    def _get_exporting(self) -> bool:
+        return self._exporter.active
+
+    exporting = Property(bool, _get_exporting, notify=exportingChanged)
+
+    def _get_export_progress(self) -> float:
+        return self._exporter.progress
+
+    exportProgress = Property(float, _get_export_progress, notify=exportProgressChanged)
+
+    @Slot()
+    def closeDocument(self) -> None:
+        """Stop journaling and delete recovery files on a clean close or discard."""
+        self._loader.cancel()
+        self._cancel_autosave()
+        self._journal.stop(discard=True)
+        self._remove_autosave(self._file_path)
+
     @Slot()
     def startTracking(self) -> None:
         """Enable dirty tracking after app initialization.
@@ -161,6 +333,8 @@ class DocumentManager(QObject):
         if not self._tracking_enabled:
             self._connect_model_signals()
             self._tracking_enabled = True
+            if self._autosave_interval > 0:
+                self._autosave_timer.start()
 
     @Slot(result=bool)
     def newDocument(self) -> bool:
@@ -171,10 +345,15 @@ class DocumentManager(QObject):
         Returns:
             True always (operation cannot fail)
         """
+        self._loader.cancel()
         # Disconnect signals to avoid dirty flag during clear
         self._disconnect_model_signals()
+        self._cancel_autosave()
+        self._journal.stop(discard=True)
+        self._remove_autosave(self._file_path)
 
         self._canvas_model.clear()
+        self._canvas_model.setDeferredArtboards({})
         self._connect_model_signals()
         self._set_file_path("")
         self._set_dirty(False)
@@ -191,6 +370,10 @@ class DocumentManager(QObject):
     def openDocument(self, path: str) -> bool:
         """Open a document from the specified file path.
 
+        If a journal left by a crashed session exists next to the file, its
+        edits are replayed on top of the saved items and the document is
+        marked dirty.
+
         Args:
             path: Path or file URL to the .lucent file to open
 
@@ -200,26 +383,115 @@ class DocumentManager(QObject):
         local_path = self._url_to_path(path)
 
         try:
-            data = load_document(local_path)
+            document = open_document(local_path)
         except (FileNotFoundError, ValueError, FileVersionError) as e:
             print(f"Error opening document: {e}")
             return False
 
+        self._loader.cancel()
+        previous_journal = self._begin_open()
+        try:
+            with document:
+                # Huge multi-artboard files keep artboard contents encoded
+                # until they scroll into view, are selected or exported
+                lazy = document.deferred_count >= self._lazy_artboard_threshold
+                # Items stream from the file straight into the bulk loader,
+                # which leaves the model untouched if the file turns out bad
+                self._canvas_model.loadItems(document.items(lazy=lazy))
+                deferred = document.deferred_artboards() if lazy else {}
+                viewport = document.viewport
+                meta = document.meta
+        except (ValueError, FileVersionError) as e:
+            print(f"Error opening document: {e}")
+            self._abort_open(previous_journal)
+            return False
+        self._finish_open(local_path, viewport, meta, previous_journal, deferred)
+        return True
+
+    @Slot(str, result=bool)
+    def openDocumentAsync(self, path: str) -> bool:
+        """Open a document on a background thread.
+
+        The canvas fills in batch by batch while ``loadProgress`` advances;
+        ``openFinished`` reports the outcome. A failed or cancelled open
+        puts the previous document back.
+
+        Args:
+            path: Path or file URL to the .lucent file to open
+
+        Returns:
+            True if loading started, False if the file does not exist
+        """
+        local_path = self._url_to_path(path)
+        if not Path(local_path).is_file():
+            print(f"Error opening document: No such file: {local_path}")
+            return False
+        if self._loader.active:
+            self._loader.cancel()
+
+        self._pending_open = (local_path, self._begin_open())
+        self._loader.start(local_path, self._lazy_artboard_threshold)
+        self._set_loading(True)
+        return True
+
+    @Slot()
+    def cancelOpen(self) -> None:
+        """Cancel an openDocumentAsync() in progress."""
+        self._loader.cancel()
+
+    def _begin_open(self) -> str:
+        """Detach tracking, autosave and journal before replacing the items.
+
+        Returns:
+            Path of the journal that was active, to restore or delete later
+        """
         # Disconnect during load to avoid marking document dirty
         self._disconnect_model_signals()
-        self._canvas_model.clear()
+        self._cancel_autosave()
+        previous_journal = self._journal.path
+        self._journal.stop()
+        return previous_journal
 
-        for item_data in data.get("items", []):
-            self._canvas_model.addItem(item_data)
+    def _abort_open(self, previous_journal: str) -> None:
+        """Resume the previous document after a failed open."""
+        self._connect_model_signals()
+        if previous_journal:
+            self._journal.start(previous_journal, truncate=False)
+
+    def _finish_open(
+        self,
+        local_path: str,
+        viewport: Dict[str, Any],
+        meta: Dict[str, Any],
+        previous_journal: str,
+        deferred: Dict[str, DeferredArtboard],
+    ) -> None:
+        """Recover autosaved and journaled edits and adopt an opened file."""
+        if previous_journal:
+            remove_journal(previous_journal)
+            self._remove_autosave(previous_journal.removesuffix(JOURNAL_SUFFIX))
+
+        journal_path = journal_path_for(local_path)
+        base = file_stamp(local_path)
+        autosave = self._read_autosave(local_path, base)
+        if autosave is not None:
+            items, deferred, base = autosave
+            self._canvas_model.loadItems(items)
+        records = read_journal(journal_path, base)
+        deferred = dict(deferred)
+        if records:
+            # Replay on normalized dicts so records match what was journaled;
+            # artboards loaded before the crash are taken out of deferred
+            saved = [item_to_dict(item) for item in self._canvas_model.getItems()]
+            self._canvas_model.loadItems(replay_journal(saved, records, deferred))
+        self._canvas_model.setDeferredArtboards(deferred)
 
-        viewport = data.get("viewport", {})
         self._viewport_zoom = viewport.get("zoomLevel", 1.0)
         self._viewport_offset_x = viewport.get("offsetX", 0.0)
         self._viewport_offset_y = viewport.get("offsetY", 0.0)
         self.viewportChanged.emit()
 
         # Load document metadata (DPI and unit-related)
-        meta = data.get("meta", {})
         dpi_value = meta.get("documentDPI", self._document_dpi)
         self.setDocumentDPI(
             int(dpi_value)
@@ -231,10 +503,79 @@ class DocumentManager(QObject):
 
         self._connect_model_signals()
 
+        recovered = autosave is not None or bool(records)
         self._set_file_path(local_path)
-        self._set_dirty(False)
-
-        return True
+        self._set_dirty(recovered)
+        self._autosaved_generation = self._edit_generation
+        self._journal.start(journal_path, truncate=not records, base=base)
+        if recovered:
+            self.sessionRecovered.emit(len(records))
+
+    def _read_autosave(
+        self, local_path: str, base: Optional[List[int]]
+    ) -> Optional[
+        Tuple[List[Dict[str, Any]], Dict[str, DeferredArtboard], Optional[List[int]]]
+    ]:
+        """Items, deferred contents and file stamp of a document's autosave.
+
+        Returns None when there is no autosave; one taken from a different
+        saved state of the document is deleted.
+        """
+        path = autosave_path_for(local_path)
+        if not Path(path).is_file():
+            return None
+        try:
+            with open_document(path) as document:
+                if document.meta.get(AUTOSAVE_BASE_KEY) != base:
+                    remove_journal(path)
+                    return None
+                lazy = document.deferred_count >= self._lazy_artboard_threshold
+                items = list(document.items(lazy=lazy))
+                deferred = document.deferred_artboards() if lazy else {}
+        except (OSError, ValueError, FileVersionError) as e:
+            print(f"Warning: Failed to read autosave: {e}")
+            return None
+        return items, deferred, file_stamp(path)
+
+    def _remove_autosave(self, document_path: str) -> None:
+        if document_path:
+            remove_journal(autosave_path_for(document_path))
+
+    def _on_load_finished(self, header: Dict[str, Any]) -> None:
+        if self._pending_open is None:
+            return
+        local_path, previous_journal = self._pending_open
+        self._pending_open = None
+        self._finish_open(
+            local_path,
+            header["viewport"],
+            header["meta"],
+            previous_journal,
+            header["deferred"],
+        )
+        self._set_loading(False)
+        self.openFinished.emit(True)
+
+    def _on_load_failed(self, error: str) -> None:
+        print(f"Error opening document: {error}")
+        self._on_load_cancelled()
+
+    def _on_load_cancelled(self) -> None:
+        if self._pending_open is None:
+            return
+        _, previous_journal = self._pending_open
+        self._pending_open = None
+        self._abort_open(previous_journal)
+        self._set_loading(False)
+        self.openFinished.emit(False)
+
+    def _set_loading(self, value: bool) -> None:
+        if self._loading != value:
+            self._loading = value
+            self.loadingChanged.emit()
+
+    def _on_load_progress(self, value: float) -> None:
+        self.loadProgressChanged.emit()
 
     @Slot(result=bool)
     def saveDocument(self) -> bool:
@@ -259,27 +600,36 @@ class DocumentManager(QObject):
             True if saved successfully, False on error
         """
         local_path = self._url_to_path(path)
+        if self._loading:
+            print("Error saving document: a document is still loading")
+            return False
+        # A pending autosave must not land on top of this newer save
+        self._cancel_autosave()
 
         try:
-            items: List[Dict[str, Any]] = []
-            for item in self._canvas_model.getItems():
-                items.append(item_to_dict(item))
-
-            viewport = {
-                "zoomLevel": self._viewport_zoom,
-                "offsetX": self._viewport_offset_x,
-                "offsetY": self._viewport_offset_y,
-            }
-
-            meta: Dict[str, Any] = {
-                "name": Path(local_path).stem,
-                "documentDPI": self._document_dpi,
-            }
-
-            if self._unit_settings:
-                meta.update(self._unit_settings.to_meta())
-
-            save_document(path=local_path, items=items, viewport=viewport, meta=meta)
+            # Items are serialized one at a time as the writer consumes them
+            canvas_items = self._canvas_model.getItems()
+            deferred = self._canvas_model.deferredArtboards()
+            items = (item_to_dict(item) for item in canvas_items)
+            viewport, meta = self._document_state(local_path)
+            save_document(
+                path=local_path,
+                items=items,
+                viewport=viewport,
+                meta=meta,
+                preview=build_preview(canvas_items, deferred),
+                deferred=deferred,
+            )
+
+            # The saved file now holds every autosaved and journaled edit
+            journal_path = journal_path_for(local_path)
+            if self._journal.path != journal_path:
+                self._journal.stop(discard=True)
+                self._remove_autosave(self._file_path)
+            self._journal.start(
+                journal_path, truncate=True, base=file_stamp(local_path)
+            )
+            self._remove_autosave(local_path)
 
             self._set_file_path(local_path)
             self._set_dirty(False)
@@ -289,6 +639,98 @@ class DocumentManager(QObject):
             print(f"Error saving document: {e}")
             return False
 
+    def _document_state(self, local_path: str) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        """Viewport and metadata sections for a save to ``local_path``."""
+        viewport = {
+            "zoomLevel": self._viewport_zoom,
+            "offsetX": self._viewport_offset_x,
+            "offsetY": self._viewport_offset_y,
+        }
+
+        meta: Dict[str, Any] = {
+            "name": Path(local_path).stem,
+            "documentDPI": self._document_dpi,
+        }
+
+        if self._unit_settings:
+            meta.update(self._unit_settings.to_meta())
+
+        return viewport, meta
+
+    @Slot(result=bool)
+    def autosave(self) -> bool:
+        """Save the document to its autosave sidecar in the background.
+
+        The document itself is only written by an explicit save, so it stays
+        dirty. Only a copy-on-write snapshot of the items is taken here;
+        serializing and the atomic write happen on a worker thread. Opening
+        the document after a crash restores the autosave.
+
+        Returns:
+            True if an autosave was started
+        """
+        if not self._file_path or not self._dirty or self._loading:
+            return False
+        if self._edit_generation == self._autosaved_generation:
+            return False
+        if self._autosave_future is not None and not self._autosave_future.done():
+            return False
+
+        items = [item.snapshot() for item in self._canvas_model.getItems()]
+        # Deferred contents are immutable, so the mapping is a safe snapshot
+        deferred = self._canvas_model.deferredArtboards()
+        viewport, meta = self._document_state(self._file_path)
+        meta[AUTOSAVE_BASE_KEY] = file_stamp(self._file_path)
+        path = autosave_path_for(self._file_path)
+
+        self._autosave_ticket += 1
+        ticket = self._autosave_ticket
+        self._autosave_state = (
+            ticket,
+            path,
+            self._edit_generation,
+            self._journal.position,
+        )
+        future = self._autosave_executor.submit(
+            _write_snapshot, path, items, viewport, meta, deferred
+        )
+        self._autosave_future = future
+
+        def finished(done: "Future[None]") -> None:
+            error = done.exception()
+            self._autosaveFinished.emit(ticket, str(error) if error else "")
+
+        future.add_done_callback(finished)
+        return True
+
+    def _cancel_autosave(self) -> None:
+        """Wait for a pending autosave and ignore its completion."""
+        future = self._autosave_future
+        if future is None:
+            return
+        self._autosave_future = None
+        self._autosave_state = None
+        self._autosave_ticket += 1
+        future.exception()
+
+    def _on_autosave_finished(self, ticket: int, error: str) -> None:
+        state = self._autosave_state
+        if state is None or state[0] != ticket:
+            return
+        self._autosave_state = None
+        self._autosave_future = None
+        _, path, generation, journal_position = state
+
+        if error:
+            print(f"Warning: Autosave failed: {error}")
+            self.autosaved.emit(False)
+            return
+
+        # Keep only journal records for edits made after the snapshot
+        self._journal.rebase(journal_position, file_stamp(path))
+        self._autosaved_generation = generation
+        self.autosaved.emit(True)
+
     @Slot(float, float, float)
     def setViewport(self, zoom: float, offset_x: float, offset_y: float) -> None:
         """Set viewport state for saving with document.
@@ -315,6 +757,36 @@ class DocumentManager(QObject):
             "offsetY": self._viewport_offset_y,
         }
 
+    def _export_base_dpi(self) -> int:
+        """DPI at which exports are 1:1 with the canvas."""
+        if self._unit_settings and self._unit_settings.displayUnit != "px":
+            return int(self._unit_settings.previewDPI)
+        return self._document_dpi
+
+    def _export_options(
+        self, target_dpi: int, padding: float, background: str
+    ) -> ExportOptions:
+        # Empty string means transparent, otherwise use specified color
+        return ExportOptions(
+            document_dpi=self._export_base_dpi(),
+            target_dpi=target_dpi,
+            padding=padding,
+            background=background if background else None,
+        )
+
+    def _export_bounds(self, artboard_id: str, padding: float) -> Optional[QRectF]:
+        """Artboard geometry plus padding; None for missing or empty artboards."""
+        # Use artboard's defined bounds (not computed from children)
+        artboard_bounds = self._canvas_model.getArtboardBounds(artboard_id)
+        if artboard_bounds["width"] <= 0 or artboard_bounds["height"] <= 0:
+            return None
+        return QRectF(
+            artboard_bounds["x"] - padding,
+            artboard_bounds["y"] - padding,
+            artboard_bounds["width"] + 2 * padding,
+            artboard_bounds["height"] + 2 * padding,
+        )
+
     @Slot(str, str, int, float, str, result=bool)
     def exportArtboard(
         self,
@@ -324,7 +796,7 @@ class DocumentManager(QObject):
         padding: float,
         background: str,
     ) -> bool:
-        """Export an artboard to PNG or SVG.
+        """Export an artboard to PNG, JPG, SVG or PDF.
 
         Args:
             artboard_id: ID of the artboard to export
@@ -336,54 +808,114 @@ class DocumentManager(QObject):
         Returns:
             True if export succeeded, False on error
         """
-        from PySide6.QtCore import QRectF
-
-        from lucent.exporter import (
-            ExportOptions,
-            export_jpg,
-            export_pdf,
-            export_png,
-            export_svg,
-        )
-
         local_path = self._url_to_path(path)
 
-        # Get artboard bounds from its geometry
-        artboard_bounds = self._canvas_model.getArtboardBounds(artboard_id)
-        if artboard_bounds["width"] <= 0 or artboard_bounds["height"] <= 0:
+        bounds = self._export_bounds(artboard_id, padding)
+        if bounds is None:
             return False
 
-        # Get child items for rendering
+        # Get child items for rendering, loading them if still deferred
+        self._canvas_model.loadArtboard(artboard_id)
         items = self._canvas_model.getArtboardItems(artboard_id)
 
-        # Empty string means transparent, otherwise use specified color
-        effective_bg = background if background else None
+        options = self._export_options(target_dpi, padding, background)
+        return export_file(items, bounds, local_path, options)
 
-        base_dpi = self._document_dpi
-        if self._unit_settings and self._unit_settings.displayUnit != "px":
-            base_dpi = int(self._unit_settings.previewDPI)
+    @Slot(list, list, list, str, float, str, result=int)
+    def exportArtboards(
+        self,
+        artboard_ids: List[str],
+        formats: List[str],
+        scales: List[float],
+        directory: str,
+        padding: float,
+        background: str,
+    ) -> int:
+        """Export artboards in every format and scale in the background.
 
-        options = ExportOptions(
-            document_dpi=base_dpi,
-            target_dpi=target_dpi,
-            padding=padding,
-            background=effective_bg,
-        )
+        Files are named after the artboard, e.g. ``Home@2x.png``, and
+        rendered in parallel; progress is reported through
+        exportProgress and completion through batchExportFinished.
+        Artboards that are not loaded yet are exported without loading
+        them into the document.
 
-        # Use artboard's defined bounds (not computed from children)
-        bounds = QRectF(
-            artboard_bounds["x"] - padding,
-            artboard_bounds["y"] - padding,
-            artboard_bounds["width"] + 2 * padding,
-            artboard_bounds["height"] + 2 * padding,
-        )
+        Args:
+            artboard_ids: IDs of the artboards to export
+            formats: File formats ("png", "jpg", "svg" or "pdf")
+            scales: Scale factors relative to 1x screen export
+            directory: Output directory path or URL
+            padding: Padding in canvas units
+            background: Background color (empty for transparent)
+
+        Returns:
+            Number of files queued, 0 if there is nothing to export
+        """
+        if self._loading:
+            print("Error exporting artboards: a document is still loading")
+            return 0
+        local_dir = Path(self._url_to_path(directory))
+        export_formats = []
+        for name in formats:
+            export_format = normalize_format(name)
+            if export_format is None:
+                print(f"Warning: Unknown export format: {name}")
+            elif export_format not in export_formats:
+                export_formats.append(export_format)
+
+        deferred = self._canvas_model.deferredArtboards()
+        jobs: List[ExportJob] = []
+        used_names: Dict[str, int] = {}
+        for artboard_id in artboard_ids:
+            bounds = self._export_bounds(artboard_id, padding)
+            if bounds is None:
+                print(f"Warning: Cannot export artboard: {artboard_id}")
+                continue
+            artboard = self._canvas_model.getItem(
+                self._canvas_model.getArtboardIndex(artboard_id)
+            )
+            name = getattr(artboard, "name", "") or artboard_id
+            items = tuple(
+                item_to_dict(item)
+                for item in self._canvas_model.getArtboardItems(artboard_id)
+            )
+            jobs.extend(
+                artboard_jobs(
+                    artboard_id,
+                    unique_name(name, used_names),
+                    (bounds.x(), bounds.y(), bounds.width(), bounds.height()),
+                    local_dir,
+                    export_formats,
+                    scales,
+                    self._export_base_dpi(),
+                    padding,
+                    background,
+                    items=items,
+                    deferred=deferred.get(artboard_id),
+                )
+            )
+        if not jobs:
+            return 0
+
+        try:
+            local_dir.mkdir(parents=True, exist_ok=True)
+        except OSError as e:
+            print(f"Error exporting artboards: {e}")
+            return 0
+        self._exporter.start(jobs)
+        self.exportingChanged.emit()
+        return len(jobs)
+
+    @Slot()
+    def cancelExport(self) -> None:
+        """Cancel an exportArtboards() batch in progress."""
+        self._exporter.cancel()
+
+    def _on_export_progress(self, value: float) -> None:
+        self.exportProgressChanged.emit()
+
+    def _on_export_finished(self, exported: int, failed: int) -> None:
+        self.exportingChanged.emit()
+        self.batchExportFinished.emit(exported, failed)
 
-        # Determine format from extension
-        lower_path = local_path.lower()
-        if lower_path.endswith(".svg"):
-            return export_svg(items, bounds, local_path, options)
-        if lower_path.endswith(".pdf"):
-            return export_pdf(items, bounds, local_path, options)
-        if lower_path.endswith(".jpg") or lower_path.endswith(".jpeg"):
-            return export_jpg(items, bounds, local_path, options)
-        return export_png(items, bounds, local_path, options)
+    def _on_export_cancelled(self) -> None:
+        self.exportingChanged.emit()
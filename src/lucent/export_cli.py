@@ -0,0 +1,303 @@
+# Copyright (C) 2026 The Culture List, Inc.
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""Headless command-line export: ``lucent-export``.
+
+Exports artboards of .lucent documents without starting the GUI or QML::
+
+    lucent-export -o assets -f png,pdf -s 1,2 designs/*.lucent
+
+Documents are read in this process; rendering runs in a pool of worker
+processes on the offscreen Qt platform. Pass many documents to one
+invocation to pay the worker start-up cost once.
+
+Exit status is 0 when every file was exported, 1 when a document could
+not be read, had no matching artboards or an export failed, and 2 for
+invalid arguments.
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+from concurrent.futures import FIRST_COMPLETED, Future, wait
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Set
+
+from lucent.batch_export import (
+    ExportJob,
+    artboard_jobs,
+    create_export_pool,
+    init_worker,
+    normalize_format,
+    render_job,
+    unique_name,
+)
+from lucent.file_io import FileVersionError, load_document
+
+EXIT_OK = 0
+EXIT_FAILED = 1
+
+# Jobs queued per worker; keeps memory flat over thousands of documents
+QUEUED_JOBS_PER_WORKER = 4
+
+
+def _formats(value: str) -> List[str]:
+    formats = []
+    for name in value.split(","):
+        export_format = normalize_format(name)
+        if export_format is None:
+            raise argparse.ArgumentTypeError(f"unknown export format: {name}")
+        formats.append(export_format)
+    return formats
+
+
+def _scales(value: str) -> List[float]:
+    scales = []
+    for text in value.split(","):
+        try:
+            scale = float(text.strip().removesuffix("x"))
+        except ValueError:
+            raise argparse.ArgumentTypeError(f"invalid scale: {text}") from None
+        if scale <= 0:
+            raise argparse.ArgumentTypeError(f"scale must be positive: {text}")
+        scales.append(scale)
+    return scales
+
+
+def _positive_int(value: str) -> int:
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid number: {value}") from None
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1: {value}")
+    return number
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="lucent-export",
+        description="Export artboards of Lucent documents to image files.",
+    )
+    parser.add_argument("documents", nargs="+", type=Path, help=".lucent files")
+    parser.add_argument(
+        "-o",
+        "--output",
+        type=Path,
+        default=Path("."),
+        help="output directory; with several documents, each gets a "
+        "subdirectory named after it, numbered when names repeat "
+        "(default: current directory)",
+    )
+    parser.add_argument(
+        "-a",
+        "--artboard",
+        action="append",
+        default=[],
+        help="artboard name or ID to export; repeatable (default: all)",
+    )
+    parser.add_argument(
+        "-f",
+        "--format",
+        type=_formats,
+        action="append",
+        help="comma-separated formats: png, jpg, svg, pdf (default: png)",
+    )
+    parser.add_argument(
+        "-s",
+        "--scale",
+        type=_scales,
+        action="append",
+        help="comma-separated scales such as 1,2x,3x (default: 1)",
+    )
+    parser.add_argument(
+        "--padding", type=float, default=0.0, help="padding in canvas units"
+    )
+    parser.add_argument(
+        "--background", default="", help="background color (default: transparent)"
+    )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=_positive_int,
+        default=os.cpu_count() or 1,
+        help="parallel export processes (default: one per core)",
+    )
+    parser.add_argument("-q", "--quiet", action="store_true", help="only report errors")
+    return parser
+
+
+def _flatten(values: Optional[List[List[Any]]], default: List[Any]) -> List[Any]:
+    if not values:
+        return default
+    unique: List[Any] = []
+    for value in (v for group in values for v in group):
+        if value not in unique:
+            unique.append(value)
+    return unique
+
+
+def document_jobs(
+    path: Path,
+    directory: Path,
+    artboards: Sequence[str],
+    formats: Sequence[str],
+    scales: Sequence[float],
+    padding: float = 0.0,
+    background: str = "",
+) -> List[ExportJob]:
+    """Export jobs for the selected artboards of one document.
+
+    Raises:
+        OSError, ValueError, FileVersionError: if the document cannot be read
+        LookupError: if none of ``artboards`` is in the document, or the
+            document has no artboards
+    """
+    document = load_document(path)
+    items: List[Dict[str, Any]] = document["items"]
+    dpi_value = document["meta"].get("documentDPI", 300)
+    base_dpi = int(dpi_value) if isinstance(dpi_value, (int, float)) else 300
+
+    children: Dict[str, List[Dict[str, Any]]] = {}
+    for data in items:
+        parent_id = data.get("parentId")
+        if parent_id:
+            children.setdefault(parent_id, []).append(data)
+
+    jobs: List[ExportJob] = []
+    used_names: Dict[str, int] = {}
+    selected = set(artboards)
+    for data in items:
+        if data.get("type") != "artboard":
+            continue
+        artboard_id = str(data.get("id", ""))
+        name = str(data.get("name") or artboard_id)
+        if selected and artboard_id not in selected and name not in selected:
+            continue
+        width = float(data.get("width", 0))
+        height = float(data.get("height", 0))
+        if width <= 0 or height <= 0:
+            continue
+        bounds = (
+            float(data.get("x", 0)) - padding,
+            float(data.get("y", 0)) - padding,
+            width + 2 * padding,
+            height + 2 * padding,
+        )
+        jobs.extend(
+            artboard_jobs(
+                artboard_id,
+                unique_name(name, used_names),
+                bounds,
+                directory,
+                formats,
+                scales,
+                base_dpi,
+                padding,
+                background,
+                items=tuple(children.get(artboard_id, [])),
+            )
+        )
+    if not jobs:
+        raise LookupError("no matching artboards")
+    return jobs
+
+
+class _Run:
+    """Tallies results and reports them as the export proceeds."""
+
+    def __init__(self, quiet: bool) -> None:
+        self.quiet = quiet
+        self.failed = False
+
+    def report(self, path: str, ok: bool, error: str = "") -> None:
+        if ok:
+            if not self.quiet:
+                print(path)
+        else:
+            self.failed = True
+            print(
+                f"Error exporting {path}: {error or 'export failed'}", file=sys.stderr
+            )
+
+
+def _jobs(args: argparse.Namespace, run: _Run) -> Iterator[ExportJob]:
+    """Yield export jobs document by document, reporting unreadable ones."""
+    formats = _flatten(args.format, ["png"])
+    scales = _flatten(args.scale, [1.0])
+    several = len(args.documents) > 1
+    # Documents from different folders may share a name; number repeats so
+    # their exports don't overwrite each other
+    used_names: Dict[str, int] = {}
+    for path in args.documents:
+        directory = args.output
+        if several:
+            directory /= unique_name(path.stem, used_names)
+        try:
+            jobs = document_jobs(
+                path,
+                directory,
+                args.artboard,
+                formats,
+                scales,
+                args.padding,
+                args.background,
+            )
+            directory.mkdir(parents=True, exist_ok=True)
+        except (OSError, ValueError, FileVersionError, LookupError) as exc:
+            run.report(str(path), False, str(exc) or type(exc).__name__)
+            continue
+        yield from jobs
+
+
+def _export_serial(jobs: Iterator[ExportJob], run: _Run) -> None:
+    init_worker()
+    for job in jobs:
+        try:
+            ok = render_job(job)
+        except Exception as exc:
+            run.report(job.path, False, str(exc))
+            continue
+        run.report(job.path, ok)
+
+
+def _export_parallel(jobs: Iterator[ExportJob], run: _Run, workers: int) -> None:
+    def collect(done: Set[Future[bool]]) -> None:
+        for future in done:
+            path = paths.pop(future)
+            try:
+                run.report(path, future.result())
+            except Exception as exc:
+                run.report(path, False, str(exc) or type(exc).__name__)
+
+    paths: Dict[Future[bool], str] = {}
+    with create_export_pool(workers) as pool:
+        pending: Set[Future[bool]] = set()
+        for job in jobs:
+            if len(pending) >= workers * QUEUED_JOBS_PER_WORKER:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                collect(done)
+            future = pool.submit(render_job, job)
+            paths[future] = job.path
+            pending.add(future)
+        collect(wait(pending).done)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """Run the exporter; returns the process exit status."""
+    args = build_parser().parse_args(argv)
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+    run = _Run(args.quiet)
+    jobs = _jobs(args, run)
+    if args.jobs == 1:
+        _export_serial(jobs, run)
+    else:
+        _export_parallel(jobs, run, args.jobs)
+    return EXIT_FAILED if run.failed else EXIT_OK
+
+
+if __name__ == "__main__":
+    sys.exit(main())
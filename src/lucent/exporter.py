@@ -1,7 +1,7 @@
 # Copyright (C) 2026 The Culture List, Inc.
 # SPDX-License-Identifier: GPL-3.0-or-later
 
-"""Export functionality for Lucent - exports artboards to PNG and SVG."""
+"""Export functionality for Lucent - exports artboards to PNG, JPG, SVG and PDF."""
 
 from __future__ import annotations
 
@@ -21,9 +21,15 @@ from PySide6.QtGui import (
 )
 from PySide6.QtSvg import QSvgGenerator
 
+from lucent.png_writer import PngWriter
+
 if TYPE_CHECKING:
     from lucent.canvas_items import CanvasItem
 
+# Pixel memory for one band of a raster export; bounds peak memory for
+# large outputs
+RASTER_BAND_BYTES = 32 * 1024 * 1024
+
 
 @dataclass
 class ExportOptions:
@@ -73,14 +79,20 @@ def export_png(
     bounds: QRectF,
     path: Union[str, Path],
     options: ExportOptions,
+    band_bytes: int = RASTER_BAND_BYTES,
 ) -> bool:
     """Export items to a PNG file.
 
+    The image is rendered in horizontal bands that are encoded as they are
+    finished, so memory use is bounded by ``band_bytes`` rather than the
+    output size.
+
     Args:
         items: List of canvas items to render
         bounds: Bounding rectangle in canvas coordinates
         path: Output file path
         options: Export options (scale, background, etc.)
+        band_bytes: Pixel memory for one band
 
     Returns:
         True if export succeeded, False on error
@@ -93,28 +105,38 @@ def export_png(
     if width <= 0 or height <= 0:
         return False
 
-    image = QImage(width, height, QImage.Format.Format_ARGB32)
-    if options.background:
-        image.fill(QColor(options.background))
-    else:
-        image.fill(QColor(0, 0, 0, 0))
-
-    painter = QPainter(image)
-    painter.setRenderHint(QPainter.RenderHint.Antialiasing, True)
-    painter.scale(options.scale, options.scale)
-    painter.translate(-bounds.x(), -bounds.y())
-
-    for item in items:
-        try:
-            item.paint(painter, zoom_level=1.0, offset_x=0, offset_y=0)
-        except Exception:
-            pass
-
-    painter.end()
+    band_height = max(1, min(height, band_bytes // (width * 4)))
+    band = QImage(width, band_height, QImage.Format.Format_RGBA8888_Premultiplied)
+    if band.isNull():
+        return False
+    background = QColor(options.background) if options.background else None
 
     try:
-        return image.save(str(path))
-    except Exception:
+        with PngWriter(path, width, height, dpi=options.target_dpi) as writer:
+            for top in range(0, height, band_height):
+                rows = min(band_height, height - top)
+                band.fill(background if background else QColor(0, 0, 0, 0))
+
+                painter = QPainter(band)
+                painter.setRenderHint(QPainter.RenderHint.Antialiasing, True)
+                # Shift by whole device pixels so bands line up exactly
+                painter.translate(0, -top)
+                painter.scale(options.scale, options.scale)
+                painter.translate(-bounds.x(), -bounds.y())
+
+                for item in items:
+                    try:
+                        item.paint(painter, zoom_level=1.0, offset_x=0, offset_y=0)
+                    except Exception:
+                        pass
+
+                painter.end()
+
+                # PNG stores straight (non-premultiplied) alpha
+                rgba = band.convertToFormat(QImage.Format.Format_RGBA8888)
+                writer.write_rows(rgba.constBits(), rgba.bytesPerLine(), rows)
+        return True
+    except (OSError, ValueError):
         return False
 
 
@@ -243,3 +265,32 @@ def export_svg(
 
     painter.end()
     return True
+
+
+# Formats export_file() can write, by file extension
+EXPORT_FORMATS = ("png", "jpg", "svg", "pdf")
+
+
+def export_format_for(path: Union[str, Path]) -> str:
+    """Export format for a file path, from its extension (PNG by default)."""
+    suffix = Path(path).suffix.lower().lstrip(".")
+    if suffix == "jpeg":
+        return "jpg"
+    return suffix if suffix in EXPORT_FORMATS else "png"
+
+
+def export_file(
+    items: List["CanvasItem"],
+    bounds: QRectF,
+    path: Union[str, Path],
+    options: ExportOptions,
+) -> bool:
+    """Export items in the format given by the file extension."""
+    export_format = export_format_for(path)
+    if export_format == "svg":
+        return export_svg(items, bounds, path, options)
+    if export_format == "pdf":
+        return export_pdf(items, bounds, path, options)
+    if export_format == "jpg":
+        return export_jpg(items, bounds, path, options)
+    return export_png(items, bounds, path, options)
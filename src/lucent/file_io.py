@@ -3,17 +3,84 @@
 
 """File I/O for .lucent document format.
 
-Handles saving and loading Lucent documents to/from JSON files.
+Documents are saved as version 2 binary containers (see ``lucent.container``)
+with compressed sections and packed path coordinates. Version 1 JSON files
+are still loaded.
+
+Saving and loading both stream items one at a time, so memory overhead is
+bounded by the largest item rather than the size of the document.
+
+Containers may also carry a PNG thumbnail and summary stats, which
+``read_preview`` returns without touching the items.
+
+The items of each artboard that directly follow it are stored in a section
+of their own, listed in the ``deferred`` section. A reader can then skip an
+artboard's contents and decode them later (see ``DeferredArtboard``).
 """
 
 from __future__ import annotations
 
+import codecs
+import io
 import json
+import os
+import stat
+import tempfile
+from contextlib import contextmanager
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Dict, List, Union
+from typing import IO, Any, Dict, Iterable, Iterator, List, Mapping, Optional, Set
+from typing import Tuple, Union
+
+from lucent.container import (
+    CHUNK_SIZE,
+    MAGIC,
+    ContainerReader,
+    ContainerWriter,
+    EncodedSection,
+    SectionEncoder,
+    is_container,
+    iter_records,
+    pack_item,
+)
 
 # Current file format version - increment when format changes
-LUCENT_VERSION = 1
+LUCENT_VERSION = 2
+
+# Documents with at least this many deferred artboards are opened lazily
+LAZY_ARTBOARD_THRESHOLD = 16
+
+
+@dataclass
+class DocumentPreview:
+    """Thumbnail and summary of a document, stored apart from its items.
+
+    ``thumbnail`` holds PNG bytes (empty when the document has nothing to
+    draw). ``stats`` has ``itemCount``, ``counts`` per item type, content
+    ``bounds`` (or None) and an ``artboards`` list with id, name, bounds
+    and ``itemCount``.
+    """
+
+    thumbnail: bytes = b""
+    stats: Dict[str, Any] = field(default_factory=dict)
+
+
+@dataclass(frozen=True)
+class DeferredArtboard:
+    """Contents of an artboard kept encoded until they are needed.
+
+    Holds the compressed item records, so it is cheap to keep around, to
+    snapshot for autosave, and to write back unchanged on save.
+    """
+
+    count: int
+    section: EncodedSection
+    # Item count per type, for document stats
+    counts: Dict[str, int] = field(default_factory=dict)
+
+    def items(self) -> Iterator[Dict[str, Any]]:
+        """Decode the artboard's item dicts, in stacking order."""
+        return iter_records(self.section.iter_chunks())
 
 
 class FileVersionError(Exception):
@@ -29,33 +96,340 @@ class FileVersionError(Exception):
         )
 
 
+@contextmanager
+def atomic_open(path: Union[str, Path]) -> Iterator[IO[bytes]]:
+    """Open a binary file whose contents replace ``path`` only on success.
+
+    Data goes to a temporary file in the same directory, which is fsynced
+    and renamed over the destination when the block exits normally, so
+    readers never see a partial file. On error the temporary file is removed
+    and ``path`` is left untouched.
+
+    Raises:
+        OSError: If file cannot be written
+    """
+    file_path = Path(path)
+    fd, temp_path = tempfile.mkstemp(
+        dir=file_path.parent, prefix=f".{file_path.name}.", suffix=".tmp"
+    )
+    try:
+        # mkstemp creates owner-only files; keep the permissions of the original
+        try:
+            mode = stat.S_IMODE(os.stat(file_path).st_mode)
+        except FileNotFoundError:
+            mode = 0o644
+        os.chmod(temp_path, mode)
+        with os.fdopen(fd, "wb") as f:
+            yield f
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_path, file_path)
+    except BaseException:
+        try:
+            os.remove(temp_path)
+        except OSError:
+            pass
+        raise
+
+
+def write_atomic(path: Union[str, Path], data: bytes) -> None:
+    """Write ``data`` to ``path`` so readers never see a partial file.
+
+    Raises:
+        OSError: If file cannot be written
+    """
+    with atomic_open(path) as f:
+        f.write(data)
+
+
 def save_document(
     path: Union[str, Path],
-    items: List[Dict[str, Any]],
+    items: Iterable[Dict[str, Any]],
     viewport: Dict[str, Any],
     meta: Dict[str, Any],
+    compression: str = "zlib",
+    preview: Optional[DocumentPreview] = None,
+    deferred: Optional[Mapping[str, DeferredArtboard]] = None,
 ) -> None:
-    """Save a Lucent document to disk.
+    """Save a Lucent document to disk atomically.
+
+    Items are encoded and compressed one at a time as they are consumed, so
+    ``items`` may be a generator. The run of descendants directly following
+    each artboard is written to a section of its own so it can be loaded
+    lazily.
 
     Args:
         path: File path to save to (string or Path object)
-        items: List of canvas item dictionaries
+        items: Iterable of canvas item dictionaries
         viewport: Viewport state (zoomLevel, offsetX, offsetY)
         meta: Document metadata (name, created, modified timestamps)
+        compression: Section codec: "zlib", "lzma" or "none"
+        preview: Optional thumbnail and stats for read_preview
+        deferred: Contents of artboards that were never loaded, by artboard
+            ID; written back as is after their artboard
 
     Raises:
         OSError: If file cannot be written
     """
-    file_path = Path(path)
+    document = json.dumps({"meta": meta, "viewport": viewport}).encode("utf-8")
+
+    with atomic_open(path) as f:
+        writer = ContainerWriter(f, LUCENT_VERSION, compression)
+        writer.add_section("document", document)
+        if preview is not None:
+            writer.add_section("stats", json.dumps(preview.stats).encode("utf-8"))
+            # PNG data is already compressed
+            writer.add_section("thumbnail", preview.thumbnail, codec="none")
+        writer.begin_section("items")
+        runs: List[Tuple[str, DeferredArtboard]] = []
+        run: Optional[_ArtboardRun] = None
+        for item in items:
+            if run is not None:
+                if run.add(item):
+                    continue
+                runs.append((run.artboard_id, run.finish()))
+                run = None
+            writer.write(pack_item(item))
+            artboard_id = item.get("id") if item.get("type") == "artboard" else None
+            if isinstance(artboard_id, str):
+                if deferred and artboard_id in deferred:
+                    runs.append((artboard_id, deferred[artboard_id]))
+                else:
+                    run = _ArtboardRun(artboard_id, compression)
+        if run is not None:
+            runs.append((run.artboard_id, run.finish()))
+        writer.end_section()
+
+        index: Dict[str, Dict[str, Any]] = {}
+        for number, (artboard_id, contents) in enumerate(runs):
+            if artboard_id in index or not contents.count:
+                continue
+            name = f"artboard-{number}"
+            writer.add_encoded_section(name, contents.section)
+            index[artboard_id] = {
+                "section": name,
+                "count": contents.count,
+                "counts": contents.counts,
+            }
+        if index:
+            writer.add_section("deferred", json.dumps(index).encode("utf-8"))
+        writer.close()
+
+
+class _ArtboardRun:
+    """Collects the descendants that directly follow an artboard."""
+
+    def __init__(self, artboard_id: str, codec: str) -> None:
+        self.artboard_id = artboard_id
+        self._ids: Set[str] = {artboard_id}
+        self._encoder = SectionEncoder(codec)
+        self._count = 0
+        self._counts: Dict[str, int] = {}
+
+    def add(self, item: Dict[str, Any]) -> bool:
+        """Take ``item`` if it belongs to the artboard; False ends the run."""
+        if item.get("parentId") not in self._ids:
+            return False
+        if item.get("type") == "group" and isinstance(item.get("id"), str):
+            self._ids.add(item["id"])
+        self._encoder.write(pack_item(item))
+        self._count += 1
+        item_type = str(item.get("type"))
+        self._counts[item_type] = self._counts.get(item_type, 0) + 1
+        return True
+
+    def finish(self) -> DeferredArtboard:
+        return DeferredArtboard(self._count, self._encoder.finish(), self._counts)
+
+
+def read_preview(path: Union[str, Path]) -> Optional[DocumentPreview]:
+    """Read the embedded thumbnail and stats of a document.
+
+    Only the table of contents and the two preview sections are read, so
+    this is fast regardless of document size.
+
+    Args:
+        path: File path to read from
+
+    Returns:
+        The preview, or None for files saved without one (including
+        version 1 JSON files)
+
+    Raises:
+        FileNotFoundError: If file doesn't exist
+        FileVersionError: If file version is newer than supported
+        ValueError: If the container is damaged
+    """
+    with open(path, "rb") as f:
+        head = f.read(len(MAGIC))
+    if not is_container(head):
+        return None
+    with ContainerReader(path) as reader:
+        if reader.version > LUCENT_VERSION:
+            raise FileVersionError(reader.version, LUCENT_VERSION)
+        if not reader.has_section("stats"):
+            return None
+        stats = reader.read_json("stats")
+        thumbnail = b""
+        if reader.has_section("thumbnail"):
+            thumbnail = reader.read_section("thumbnail")
+    return DocumentPreview(thumbnail=thumbnail, stats=stats)
+
+
+class DocumentStream:
+    """Incremental reader for a .lucent document.
+
+    ``items()`` yields item dicts as they are decoded. ``meta`` and
+    ``viewport`` are complete once the items have been read; for files
+    written by Lucent they are available immediately.
+
+    Use as a context manager, or call ``close()``.
+    """
+
+    def __init__(self, path: Union[str, Path]) -> None:
+        file_path = Path(path)
+        if not file_path.exists():
+            raise FileNotFoundError(f"File not found: {path}")
+
+        self._reader: Optional[ContainerReader] = None
+        self._parser: Optional[_JsonDocumentParser] = None
+        self._fields: Dict[str, Any] = {}
+        # Artboard ID -> {"section", "count"} for contents stored separately
+        self._deferred: Dict[str, Dict[str, Any]] = {}
+        self._read_base = 0
+        self._read_total = 0
+
+        with open(file_path, "rb") as f:
+            head = f.read(len(MAGIC))
+        if is_container(head):
+            self._reader = ContainerReader(file_path)
+            try:
+                if self._reader.version > LUCENT_VERSION:
+                    raise FileVersionError(self._reader.version, LUCENT_VERSION)
+                document = self._reader.read_json("document")
+                if not isinstance(document, dict):
+                    raise ValueError("Invalid document section")
+            except Exception:
+                self.close()
+                raise
+            self._fields = document
+            self.version = self._reader.version
+            if self._reader.has_section("deferred"):
+                try:
+                    self._deferred = _check_deferred(self._reader.read_json("deferred"))
+                except Exception:
+                    self.close()
+                    raise
+            self._read_base = self._reader.bytes_read
+        else:
+            self._parser = _JsonDocumentParser(open(file_path, "rb"))
+            try:
+                self._fields = self._parser.fields
+                self._parser.read_header()
+                self.version = _check_json_version(self._fields, final=False)
+            except Exception:
+                self.close()
+                raise
+
+    @property
+    def meta(self) -> Dict[str, Any]:
+        meta = self._fields.get("meta", {"name": "Untitled"})
+        # Default documentDPI to 72 if not present
+        if "documentDPI" not in meta:
+            meta["documentDPI"] = 72
+        return meta
+
+    @property
+    def viewport(self) -> Dict[str, Any]:
+        return self._fields.get(
+            "viewport", {"zoomLevel": 1.0, "offsetX": 0, "offsetY": 0}
+        )
+
+    @property
+    def deferred_count(self) -> int:
+        """Number of artboards whose contents are stored separately."""
+        return len(self._deferred)
+
+    def items(self, lazy: bool = False) -> Iterator[Dict[str, Any]]:
+        """Yield item dicts one at a time, in stacking order.
+
+        Args:
+            lazy: Skip the contents of deferred artboards; fetch them with
+                deferred_artboards() instead
+
+        Can be consumed once.
+        """
+        if self._reader is not None:
+            reader = self._reader
+            expand = {} if lazy else self._deferred
+            sections = ["items"] + [entry["section"] for entry in expand.values()]
+            self._read_total = sum(reader.section_length(name) for name in sections)
+            for item in reader.iter_items():
+                yield item
+                if item.get("type") == "artboard" and item.get("id") in expand:
+                    yield from reader.iter_items(expand[item["id"]]["section"])
+        elif self._parser is not None:
+            yield from self._parser.items()
+            self.version = _check_json_version(self._fields, final=True)
+
+    def deferred_artboards(self) -> Dict[str, DeferredArtboard]:
+        """Encoded contents of the deferred artboards, by artboard ID."""
+        if self._reader is None:
+            return {}
+        return {
+            artboard_id: DeferredArtboard(
+                entry["count"],
+                self._reader.read_encoded(entry["section"]),
+                dict(entry.get("counts") or {}),
+            )
+            for artboard_id, entry in self._deferred.items()
+        }
+
+    @property
+    def progress(self) -> float:
+        """Fraction of the items read so far, by bytes, from 0.0 to 1.0."""
+        if self._reader is not None:
+            total = self._read_total
+            read = self._reader.bytes_read - self._read_base
+            return min(read / total, 1.0) if total else 1.0
+        if self._parser is not None:
+            return self._parser.progress
+        return 1.0
+
+    def close(self) -> None:
+        if self._reader is not None:
+            self._reader.close()
+        if self._parser is not None:
+            self._parser.close()
+
+    def __enter__(self) -> "DocumentStream":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
 
-    document = {
-        "version": LUCENT_VERSION,
-        "meta": meta,
-        "viewport": viewport,
-        "items": items,
-    }
 
-    file_path.write_text(json.dumps(document, indent=2), encoding="utf-8")
+def _check_deferred(index: Any) -> Dict[str, Dict[str, Any]]:
+    """Validate the ``deferred`` section of a container."""
+    if not isinstance(index, dict) or not all(
+        isinstance(entry, dict)
+        and isinstance(entry.get("section"), str)
+        and isinstance(entry.get("count"), int)
+        for entry in index.values()
+    ):
+        raise ValueError("Invalid deferred artboard index")
+    return index
+
+
+def open_document(path: Union[str, Path]) -> DocumentStream:
+    """Open a document for streaming reads.
+
+    Raises:
+        FileNotFoundError: If file does not exist
+        ValueError: If the header is invalid JSON or a malformed container
+        FileVersionError: If file version is newer than supported
+    """
+    return DocumentStream(path)
 
 
 def load_document(path: Union[str, Path]) -> Dict[str, Any]:
@@ -72,40 +446,158 @@ def load_document(path: Union[str, Path]) -> Dict[str, Any]:
 
     Raises:
         FileNotFoundError: If file does not exist
-        ValueError: If file contains invalid JSON or missing required fields
+        ValueError: If file contains invalid JSON, a malformed container,
+            or missing required fields
         FileVersionError: If file version is newer than supported
     """
-    file_path = Path(path)
+    with open_document(path) as document:
+        items = list(document.items())
+        return {
+            "items": items,
+            "viewport": document.viewport,
+            "meta": document.meta,
+        }
 
-    if not file_path.exists():
-        raise FileNotFoundError(f"File not found: {path}")
 
-    try:
-        content = file_path.read_text(encoding="utf-8")
-        data = json.loads(content)
-    except json.JSONDecodeError as e:
-        raise ValueError(f"Invalid JSON in file: {e}") from e
+def _check_json_version(fields: Dict[str, Any], final: bool) -> int:
+    """Validate the version field of a JSON document.
 
-    # Validate version
-    if "version" not in data:
-        raise ValueError("Missing version field in document")
+    A missing field is only an error once the whole document was read.
+    """
+    if "version" not in fields:
+        if final:
+            raise ValueError("Missing version field in document")
+        return 0
 
-    file_version = data["version"]
+    file_version = fields["version"]
     if not isinstance(file_version, int):
         raise ValueError(f"Invalid version field: {file_version}")
 
     if file_version > LUCENT_VERSION:
         raise FileVersionError(file_version, LUCENT_VERSION)
+    return file_version
 
-    meta = data.get("meta", {"name": "Untitled"})
-    # Default documentDPI to 72 if not present
-    if "documentDPI" not in meta:
-        meta["documentDPI"] = 72
 
-    return {
-        "items": data.get("items", []),
-        "viewport": data.get(
-            "viewport", {"zoomLevel": 1.0, "offsetX": 0, "offsetY": 0}
-        ),
-        "meta": meta,
-    }
+class _JsonDocumentParser:
+    """Incremental parser for the top-level object of a JSON document.
+
+    Top-level fields are decoded whole, except ``items``, whose elements are
+    decoded one at a time from a rolling buffer.
+    """
+
+    _WHITESPACE = " \t\n\r"
+
+    def __init__(self, stream: IO[bytes], chunk_size: int = CHUNK_SIZE) -> None:
+        self._stream = stream
+        self._chunk_size = chunk_size
+        self._text = codecs.getincrementaldecoder("utf-8")()
+        self._decoder = json.JSONDecoder()
+        self._buffer = ""
+        self._pos = 0
+        self._eof = False
+        self._need_comma = False
+        self._at_items = False
+        self._bytes_read = 0
+        try:
+            self._size = os.fstat(stream.fileno()).st_size
+        except (OSError, AttributeError, io.UnsupportedOperation):
+            self._size = 0
+        self.fields: Dict[str, Any] = {}
+
+    def close(self) -> None:
+        self._stream.close()
+
+    @property
+    def progress(self) -> float:
+        return min(self._bytes_read / self._size, 1.0) if self._size else 0.0
+
+    def _fill(self) -> bool:
+        """Read more text; returns False at end of file."""
+        if self._eof:
+            return False
+        # Read at least as much as is pending so retries stay linear
+        size = max(self._chunk_size, len(self._buffer) - self._pos)
+        data = self._stream.read(size)
+        self._bytes_read += len(data)
+        try:
+            text = self._text.decode(data, final=not data)
+        except UnicodeDecodeError as exc:
+            raise ValueError(f"Invalid JSON in file: {exc}") from exc
+        self._buffer = self._buffer[self._pos :] + text
+        self._pos = 0
+        if not data:
+            self._eof = True
+        return True
+
+    def _peek(self) -> str:
+        while True:
+            buffer = self._buffer
+            pos = self._pos
+            while pos < len(buffer) and buffer[pos] in self._WHITESPACE:
+                pos += 1
+            self._pos = pos
+            if pos < len(buffer):
+                return buffer[pos]
+            if not self._fill():
+                return ""
+
+    def _expect(self, char: str) -> None:
+        if self._peek() != char:
+            raise ValueError(f"Invalid JSON in file: expected {char!r}")
+        self._pos += 1
+
+    def _value(self) -> Any:
+        self._peek()
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self._buffer, self._pos)
+            except json.JSONDecodeError as exc:
+                if self._fill():
+                    continue
+                raise ValueError(f"Invalid JSON in file: {exc}") from exc
+            # A number at the end of the buffer may continue in the next chunk
+            if end == len(self._buffer) and self._fill():
+                continue
+            self._pos = end
+            return value
+
+    def read_header(self) -> None:
+        """Read top-level fields up to the start of the items array."""
+        self._expect("{")
+        self._read_fields()
+
+    def _read_fields(self) -> None:
+        while True:
+            char = self._peek()
+            if char == "}":
+                self._pos += 1
+                return
+            if self._need_comma:
+                self._expect(",")
+            key = self._value()
+            if not isinstance(key, str):
+                raise ValueError("Invalid JSON in file: expected a key")
+            self._expect(":")
+            self._need_comma = True
+            if key == "items" and not self._at_items:
+                self._expect("[")
+                self._at_items = True
+                return
+            self.fields[key] = self._value()
+
+    def items(self) -> Iterator[Dict[str, Any]]:
+        if not self._at_items:
+            return
+        if self._peek() == "]":
+            self._pos += 1
+        else:
+            while True:
+                yield self._value()
+                char = self._peek()
+                self._pos += 1
+                if char == "]":
+                    break
+                if char != ",":
+                    raise ValueError("Invalid JSON in file: expected ',' or ']'")
+        # Fields after the items array
+        self._read_fields()
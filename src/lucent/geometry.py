@@ -9,6 +9,7 @@ of their visual appearance (fill, stroke, etc.).
 """
 
 from abc import ABC, abstractmethod
+from array import array
 from typing import Dict, Any, List, Tuple, Optional
 import math
 
@@ -23,6 +24,8 @@ VertexList = List[Tuple[float, float]]
 class Geometry(ABC):
     """Abstract base class for all geometry types."""
 
+    __slots__ = ()
+
     @abstractmethod
     def to_painter_path(self) -> QPainterPath:
         """Convert geometry to QPainterPath for rendering."""
@@ -71,6 +74,18 @@ class Geometry(ABC):
 class RectGeometry(Geometry):
     """Rectangle geometry defined by position and dimensions."""
 
+    __slots__ = (
+        "x",
+        "y",
+        "width",
+        "height",
+        "corner_radius",
+        "corner_radius_tl",
+        "corner_radius_tr",
+        "corner_radius_br",
+        "corner_radius_bl",
+    )
+
     def __init__(
         self,
         x: float,
@@ -284,6 +299,8 @@ class RectGeometry(Geometry):
 class EllipseGeometry(Geometry):
     """Ellipse geometry defined by center and radii."""
 
+    __slots__ = ("center_x", "center_y", "radius_x", "radius_y")
+
     def __init__(
         self,
         center_x: float,
@@ -397,100 +414,125 @@ class PathGeometry(Geometry):
 
     Each point can optionally have handleIn and handleOut control points
     for cubic bezier curves. Points without handles render as straight lines.
+
+    Anchors are stored as flat x, y pairs in an ``array('d')``. Handle
+    coordinates live in parallel arrays that are only allocated once some
+    point has that handle, with NaN marking a point without one. ``points``
+    converts to and from the dict form at the edges.
     """
 
+    __slots__ = ("_anchors", "_handles_in", "_handles_out", "closed")
+
     def __init__(self, points: List[Dict[str, Any]], closed: bool = False) -> None:
         if len(points) < 2:
             raise ValueError("PathGeometry requires at least two points")
 
-        self.points: List[Dict[str, Any]] = []
-        for p in points:
-            normalized: Dict[str, Any] = {
-                "x": float(p.get("x", 0)),
-                "y": float(p.get("y", 0)),
-            }
-            if p.get("handleIn") is not None:
-                h = p["handleIn"]
-                normalized["handleIn"] = {
-                    "x": float(h.get("x", 0)),
-                    "y": float(h.get("y", 0)),
-                }
-            if p.get("handleOut") is not None:
-                h = p["handleOut"]
-                normalized["handleOut"] = {
-                    "x": float(h.get("x", 0)),
-                    "y": float(h.get("y", 0)),
-                }
-            self.points.append(normalized)
-
+        self.points = points
         self.closed = bool(closed)
 
-    def _has_handles(
-        self, prev_point: Dict[str, Any], curr_point: Dict[str, Any]
-    ) -> bool:
-        """Check if a segment between two points should use bezier curve."""
-        return (
-            prev_point.get("handleOut") is not None
-            or curr_point.get("handleIn") is not None
-        )
+    @property
+    def points(self) -> List[Dict[str, Any]]:
+        """Points as dicts with optional handleIn/handleOut (a fresh copy)."""
+        anchors = self._anchors
+        handles_in = self._handles_in
+        handles_out = self._handles_out
+        result: List[Dict[str, Any]] = []
+        for i in range(0, len(anchors), 2):
+            point: Dict[str, Any] = {"x": anchors[i], "y": anchors[i + 1]}
+            if handles_in is not None and not math.isnan(handles_in[i]):
+                point["handleIn"] = {"x": handles_in[i], "y": handles_in[i + 1]}
+            if handles_out is not None and not math.isnan(handles_out[i]):
+                point["handleOut"] = {"x": handles_out[i], "y": handles_out[i + 1]}
+            result.append(point)
+        return result
+
+    @points.setter
+    def points(self, points: List[Dict[str, Any]]) -> None:
+        anchors = array("d")
+        handles: Dict[str, Optional[array]] = {"handleIn": None, "handleOut": None}
+        for i, p in enumerate(points):
+            anchors.append(float(p.get("x", 0)))
+            anchors.append(float(p.get("y", 0)))
+            for key in ("handleIn", "handleOut"):
+                h = p.get(key)
+                if h is None:
+                    continue
+                store = handles[key]
+                if store is None:
+                    store = handles[key] = array("d", [math.nan]) * (2 * len(points))
+                store[2 * i] = float(h.get("x", 0))
+                store[2 * i + 1] = float(h.get("y", 0))
+        self._anchors = anchors
+        self._handles_in = handles["handleIn"]
+        self._handles_out = handles["handleOut"]
+
+    @property
+    def point_count(self) -> int:
+        """Number of anchor points."""
+        return len(self._anchors) // 2
+
+    def _anchor(self, index: int) -> Tuple[float, float]:
+        return (self._anchors[2 * index], self._anchors[2 * index + 1])
 
     def _get_control_points(
-        self, prev_point: Dict[str, Any], curr_point: Dict[str, Any]
-    ) -> tuple[float, float, float, float]:
-        """Get control points for cubic bezier between two points.
+        self, prev: int, curr: int
+    ) -> Optional[Tuple[float, float, float, float]]:
+        """Get control points for the cubic bezier between two point indices.
 
         Returns (cp1_x, cp1_y, cp2_x, cp2_y) where:
-        - cp1 is the outgoing handle from prev_point (or prev anchor if none)
-        - cp2 is the incoming handle to curr_point (or curr anchor if none)
+        - cp1 is the outgoing handle from prev (or prev anchor if none)
+        - cp2 is the incoming handle to curr (or curr anchor if none)
+        Returns None when neither handle exists and the segment is a line.
         """
-        if prev_point.get("handleOut"):
-            cp1_x = prev_point["handleOut"]["x"]
-            cp1_y = prev_point["handleOut"]["y"]
+        handles_out = self._handles_out
+        handles_in = self._handles_in
+        po, pc = 2 * prev, 2 * curr
+        has_out = handles_out is not None and not math.isnan(handles_out[po])
+        has_in = handles_in is not None and not math.isnan(handles_in[pc])
+        if not (has_out or has_in):
+            return None
+
+        anchors = self._anchors
+        if has_out:
+            cp1_x, cp1_y = handles_out[po], handles_out[po + 1]  # type: ignore[index]
         else:
-            cp1_x = prev_point["x"]
-            cp1_y = prev_point["y"]
-
-        if curr_point.get("handleIn"):
-            cp2_x = curr_point["handleIn"]["x"]
-            cp2_y = curr_point["handleIn"]["y"]
+            cp1_x, cp1_y = anchors[po], anchors[po + 1]
+        if has_in:
+            cp2_x, cp2_y = handles_in[pc], handles_in[pc + 1]  # type: ignore[index]
         else:
-            cp2_x = curr_point["x"]
-            cp2_y = curr_point["y"]
-
+            cp2_x, cp2_y = anchors[pc], anchors[pc + 1]
         return (cp1_x, cp1_y, cp2_x, cp2_y)
 
     def to_painter_path(self) -> QPainterPath:
         """Convert to QPainterPath using cubicTo for segments with handles."""
-        if not self.points:
+        count = self.point_count
+        if not count:
             return QPainterPath()
 
-        first = self.points[0]
-        path = QPainterPath(QPointF(first["x"], first["y"]))
-
-        for i in range(1, len(self.points)):
-            prev = self.points[i - 1]
-            curr = self.points[i]
+        first_x, first_y = self._anchor(0)
+        path = QPainterPath(QPointF(first_x, first_y))
 
-            if self._has_handles(prev, curr):
-                cp1_x, cp1_y, cp2_x, cp2_y = self._get_control_points(prev, curr)
-                path.cubicTo(cp1_x, cp1_y, cp2_x, cp2_y, curr["x"], curr["y"])
+        for i in range(1, count):
+            x, y = self._anchor(i)
+            controls = self._get_control_points(i - 1, i)
+            if controls:
+                cp1_x, cp1_y, cp2_x, cp2_y = controls
+                path.cubicTo(cp1_x, cp1_y, cp2_x, cp2_y, x, y)
             else:
-                path.lineTo(curr["x"], curr["y"])
+                path.lineTo(x, y)
 
-        if self.closed and len(self.points) >= 2:
-            last = self.points[-1]
-            first = self.points[0]
-
-            if self._has_handles(last, first):
-                cp1_x, cp1_y, cp2_x, cp2_y = self._get_control_points(last, first)
-                path.cubicTo(cp1_x, cp1_y, cp2_x, cp2_y, first["x"], first["y"])
+        if self.closed and count >= 2:
+            controls = self._get_control_points(count - 1, 0)
+            if controls:
+                cp1_x, cp1_y, cp2_x, cp2_y = controls
+                path.cubicTo(cp1_x, cp1_y, cp2_x, cp2_y, first_x, first_y)
             path.closeSubpath()
 
         return path
 
     def get_bounds(self) -> QRectF:
         """Return bounding rectangle using QPainterPath for accurate bezier bounds."""
-        if not self.points:
+        if not self.point_count:
             return QRectF()
 
         # Use QPainterPath.boundingRect() for accurate bounds including curves
@@ -577,35 +619,39 @@ class PathGeometry(Geometry):
 
     def _get_flattened_points(self) -> VertexList:
         """Get all points with bezier curves flattened to line segments."""
-        if not self.points:
+        count = self.point_count
+        if not count:
             return []
 
-        result: VertexList = [(self.points[0]["x"], self.points[0]["y"])]
-
-        for i in range(1, len(self.points)):
-            prev = self.points[i - 1]
-            curr = self.points[i]
-
-            if self._has_handles(prev, curr):
-                p0 = (prev["x"], prev["y"])
-                cp1_x, cp1_y, cp2_x, cp2_y = self._get_control_points(prev, curr)
-                p1 = (cp1_x, cp1_y)
-                p2 = (cp2_x, cp2_y)
-                p3 = (curr["x"], curr["y"])
-                result.extend(self._flatten_bezier(p0, p1, p2, p3))
+        result: VertexList = [self._anchor(0)]
+
+        for i in range(1, count):
+            controls = self._get_control_points(i - 1, i)
+            if controls:
+                cp1_x, cp1_y, cp2_x, cp2_y = controls
+                result.extend(
+                    self._flatten_bezier(
+                        self._anchor(i - 1),
+                        (cp1_x, cp1_y),
+                        (cp2_x, cp2_y),
+                        self._anchor(i),
+                    )
+                )
             else:
-                result.append((curr["x"], curr["y"]))
-
-        if self.closed and len(self.points) >= 2:
-            last = self.points[-1]
-            first = self.points[0]
-            if self._has_handles(last, first):
-                p0 = (last["x"], last["y"])
-                cp1_x, cp1_y, cp2_x, cp2_y = self._get_control_points(last, first)
-                p1 = (cp1_x, cp1_y)
-                p2 = (cp2_x, cp2_y)
-                p3 = (first["x"], first["y"])
-                result.extend(self._flatten_bezier(p0, p1, p2, p3))
+                result.append(self._anchor(i))
+
+        if self.closed and count >= 2:
+            controls = self._get_control_points(count - 1, 0)
+            if controls:
+                cp1_x, cp1_y, cp2_x, cp2_y = controls
+                result.extend(
+                    self._flatten_bezier(
+                        self._anchor(count - 1),
+                        (cp1_x, cp1_y),
+                        (cp2_x, cp2_y),
+                        self._anchor(0),
+                    )
+                )
 
         return result
 
@@ -684,21 +730,23 @@ class PathGeometry(Geometry):
 
     def translated(self, dx: float, dy: float) -> "PathGeometry":
         """Return a new path translated by dx, dy, preserving all handles."""
-        new_points: List[Dict[str, Any]] = []
-        for p in self.points:
-            new_point: Dict[str, Any] = {"x": p["x"] + dx, "y": p["y"] + dy}
-            if "handleIn" in p:
-                new_point["handleIn"] = {
-                    "x": p["handleIn"]["x"] + dx,
-                    "y": p["handleIn"]["y"] + dy,
-                }
-            if "handleOut" in p:
-                new_point["handleOut"] = {
-                    "x": p["handleOut"]["x"] + dx,
-                    "y": p["handleOut"]["y"] + dy,
-                }
-            new_points.append(new_point)
-        return PathGeometry(new_points, self.closed)
+
+        def shift(values: array) -> array:
+            # NaN placeholders stay NaN, so missing handles stay missing
+            return array(
+                "d", (v + (dx if i % 2 == 0 else dy) for i, v in enumerate(values))
+            )
+
+        result = PathGeometry.__new__(PathGeometry)
+        result._anchors = shift(self._anchors)
+        result._handles_in = (
+            shift(self._handles_in) if self._handles_in is not None else None
+        )
+        result._handles_out = (
+            shift(self._handles_out) if self._handles_out is not None else None
+        )
+        result.closed = self.closed
+        return result
 
 
 # Alias for backward compatibility during transition
@@ -708,6 +756,8 @@ PolylineGeometry = PathGeometry
 class TextGeometry(Geometry):
     """Text geometry defined by position and dimensions."""
 
+    __slots__ = ("x", "y", "width", "height")
+
     def __init__(self, x: float, y: float, width: float, height: float) -> None:
         self.x = float(x)
         self.y = float(y)
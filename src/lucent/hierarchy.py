@@ -8,7 +8,7 @@ This module provides pure functions for working with container hierarchies
 (artboards, groups) without Qt dependencies, making them easily testable.
 """
 
-from typing import List, Optional, Callable, Any
+from typing import Dict, List, Optional, Callable, Any
 
 from lucent.canvas_items import ArtboardItem
 
@@ -56,10 +56,28 @@ def get_direct_children_indices(
     ]
 
 
+def get_children_map(items: List[Any]) -> Dict[str, List[int]]:
+    """Map each parent ID to the indices of its direct children.
+
+    Args:
+        items: List of canvas items.
+
+    Returns:
+        Dict of parent ID to child indices, in item order.
+    """
+    children: Dict[str, List[int]] = {}
+    for i, item in enumerate(items):
+        parent_id = getattr(item, "parent_id", None)
+        if parent_id:
+            children.setdefault(parent_id, []).append(i)
+    return children
+
+
 def get_descendant_indices(
     items: List[Any],
     container_id: str,
     is_container: Callable[[Any], bool],
+    children: Optional[Dict[str, List[int]]] = None,
 ) -> List[int]:
     """Get indices of all descendants (any depth) of a container.
 
@@ -67,19 +85,29 @@ def get_descendant_indices(
         items: List of canvas items.
         container_id: The ancestor container ID.
         is_container: Predicate to check if an item is a container.
+        children: Optional result of get_children_map, to avoid rescanning
+            items when resolving many containers.
 
     Returns:
         List of indices of all descendants.
     """
+
+    def direct(parent_id: str) -> List[int]:
+        if children is not None:
+            return children.get(parent_id, [])
+        return get_direct_children_indices(items, parent_id)
+
     result: List[int] = []
-    queue = list(get_direct_children_indices(items, container_id))
-    while queue:
-        idx = queue.pop(0)
+    queue = list(direct(container_id))
+    head = 0
+    while head < len(queue):
+        idx = queue[head]
+        head += 1
         result.append(idx)
         child = items[idx]
         child_id = getattr(child, "id", None)
         if is_container(child) and child_id:
-            queue.extend(get_direct_children_indices(items, child_id))
+            queue.extend(direct(child_id))
     return result
 
 
@@ -183,3 +211,48 @@ def is_effectively_locked(
     except ValueError:
         return False
     return is_effectively_locked(items, parent_index, is_container)
+
+
+def get_effective_lock_flags(
+    items: List[Any],
+    is_container: Callable[[Any], bool],
+) -> List[bool]:
+    """Compute is_effectively_locked for every item in a single pass.
+
+    Args:
+        items: List of canvas items.
+        is_container: Predicate to check if an item is a container.
+
+    Returns:
+        List of flags parallel to items.
+    """
+    container_indices: Dict[str, int] = {}
+    for i, item in enumerate(items):
+        item_id = getattr(item, "id", None)
+        if item_id and is_container(item):
+            container_indices.setdefault(item_id, i)
+
+    flags: List[Optional[bool]] = [None] * len(items)
+    for start in range(len(items)):
+        chain: List[int] = []
+        index: Optional[int] = start
+        result = False
+        while index is not None:
+            known = flags[index]
+            if known is not None:
+                result = known
+                break
+            if index in chain:
+                break
+            chain.append(index)
+            item = items[index]
+            if getattr(item, "locked", False):
+                result = True
+                break
+            parent_index = container_indices.get(getattr(item, "parent_id", None) or "")
+            if parent_index is None or isinstance(items[parent_index], ArtboardItem):
+                break
+            index = parent_index
+        for idx in chain:
+            flags[idx] = result
+    return [bool(flag) for flag in flags]
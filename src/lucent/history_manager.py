@@ -5,25 +5,59 @@
 
 from __future__ import annotations
 
+import time
 from typing import List, Optional
 
 from PySide6.QtCore import QObject, Signal, Slot, Property
 
 from lucent.commands import Command, TransactionCommand
+from lucent.history_model import HistoryListModel
+
+
+DEFAULT_MAX_DEPTH = 500
+DEFAULT_MEMORY_BUDGET = 256 * 1024 * 1024
+DEFAULT_MERGE_WINDOW = 0.75  # seconds
 
 
 class HistoryManager(QObject):
-    """Maintains undo/redo stacks and transaction grouping."""
+    """Maintains undo/redo stacks and transaction grouping.
+
+    History is bounded by a depth limit and a memory budget covering both
+    stacks. Each command's size is estimated once when it is recorded; when
+    either limit is exceeded the oldest undo entries are dropped, always
+    keeping the most recent one. A limit of zero or less disables it.
+
+    Commands recorded within ``merge_window`` seconds of the previous one
+    are coalesced into the top entry when Command.merge_with accepts them,
+    so nudges and scrubbed values become a single undo step.
+    """
 
     undoStackChanged = Signal()
     redoStackChanged = Signal()
-
-    def __init__(self, parent: Optional[QObject] = None) -> None:
+    memoryUsageChanged = Signal()
+    limitsChanged = Signal()
+
+    def __init__(
+        self,
+        parent: Optional[QObject] = None,
+        max_depth: int = DEFAULT_MAX_DEPTH,
+        memory_budget: int = DEFAULT_MEMORY_BUDGET,
+        merge_window: float = DEFAULT_MERGE_WINDOW,
+    ) -> None:
         super().__init__(parent)
         self._undo_stack: List[Command] = []
         self._redo_stack: List[Command] = []
+        # Size estimates parallel to the stacks, moved along with commands
+        self._undo_sizes: List[int] = []
+        self._redo_sizes: List[int] = []
+        self._memory_usage = 0
+        self._max_depth = int(max_depth)
+        self._memory_budget = int(memory_budget)
+        self.merge_window = float(merge_window)
+        self._last_record_time: Optional[float] = None
         self._transaction_commands: Optional[List[Command]] = None
         self._transaction_label: str = "Edit"
+        self._model = HistoryListModel(self)
 
     # --- Python properties (for internal/test use) ---
 
@@ -47,8 +81,13 @@ class HistoryManager(QObject):
 
     canRedo = Property(bool, _canRedo, notify=redoStackChanged)
 
+    def _getModel(self) -> HistoryListModel:
+        return self._model
+
+    historyModel = Property(QObject, _getModel, constant=True)
+
     def _undoDescriptions(self) -> list:
-        return [cmd.description for cmd in self._undo_stack]
+        return self._model.descriptions[: self._model.position]
 
     undoDescriptions = Property(
         "QVariantList",  # type: ignore[arg-type]
@@ -57,7 +96,8 @@ class HistoryManager(QObject):
     )
 
     def _redoDescriptions(self) -> list:
-        return [cmd.description for cmd in self._redo_stack]
+        # The redo stack is ordered with the next redo last
+        return self._model.descriptions[self._model.position :][::-1]
 
     redoDescriptions = Property(
         "QVariantList",  # type: ignore[arg-type]
@@ -65,32 +105,60 @@ class HistoryManager(QObject):
         notify=redoStackChanged,
     )
 
+    def _getMemoryUsage(self) -> int:
+        return self._memory_usage
+
+    memoryUsage = Property(int, _getMemoryUsage, notify=memoryUsageChanged)
+
+    def _getMaxDepth(self) -> int:
+        return self._max_depth
+
+    def _setMaxDepth(self, value: int) -> None:
+        value = int(value)
+        if value == self._max_depth:
+            return
+        self._max_depth = value
+        self.limitsChanged.emit()
+        self._enforce_limits()
+
+    maxDepth = Property(int, _getMaxDepth, _setMaxDepth, notify=limitsChanged)
+
+    def _getMemoryBudget(self) -> int:
+        return self._memory_budget
+
+    def _setMemoryBudget(self, value: int) -> None:
+        value = int(value)
+        if value == self._memory_budget:
+            return
+        self._memory_budget = value
+        self.limitsChanged.emit()
+        self._enforce_limits()
+
+    memoryBudget = Property(
+        int, _getMemoryBudget, _setMemoryBudget, notify=limitsChanged
+    )
+
     # --- Command execution ---
 
     def execute(self, command: Command) -> None:
         """Execute a command, recording it for undo unless inside a transaction."""
         command.execute()
+        self.record(command)
 
+    def record(self, command: Command) -> None:
+        """Record a command whose effect has already been applied."""
         if self._transaction_commands is not None:
             self._transaction_commands.append(command)
             return
 
-        self._undo_stack.append(command)
-        if self._redo_stack:
-            self._redo_stack.clear()
-            self.redoStackChanged.emit()
-        self.undoStackChanged.emit()
+        self._push_new(command)
 
     @Slot(result=bool)
     def undo(self) -> bool:
         """Undo the most recent command."""
         if not self._undo_stack:
             return False
-        command = self._undo_stack.pop()
-        command.undo()
-        self._redo_stack.append(command)
-        self.undoStackChanged.emit()
-        self.redoStackChanged.emit()
+        self._step(-1)
         return True
 
     @Slot(result=bool)
@@ -98,12 +166,57 @@ class HistoryManager(QObject):
         """Redo the most recently undone command."""
         if not self._redo_stack:
             return False
-        command = self._redo_stack.pop()
-        command.execute()
-        self._undo_stack.append(command)
+        self._step(1)
+        return True
+
+    @Slot(int, result=bool)
+    def jumpTo(self, position: int) -> bool:
+        """Undo or redo until exactly ``position`` entries are applied.
+
+        ``position`` counts rows of the history model, so jumping to a row's
+        index + 1 makes that row the current state. Runs only the undos or
+        redos needed and notifies once.
+        """
+        total = len(self._undo_stack) + len(self._redo_stack)
+        if not 0 <= position <= total:
+            return False
+        delta = position - len(self._undo_stack)
+        if delta:
+            self._step(delta)
+        return True
+
+    def _step(self, delta: int) -> None:
+        """Undo (negative) or redo (positive) ``abs(delta)`` commands."""
+        self._last_record_time = None
+        for _ in range(-delta):
+            command = self._undo_stack.pop()
+            command.undo()
+            self._redo_stack.append(command)
+            self._redo_sizes.append(self._undo_sizes.pop())
+        for _ in range(delta):
+            command = self._redo_stack.pop()
+            command.execute()
+            self._undo_stack.append(command)
+            self._undo_sizes.append(self._redo_sizes.pop())
+        self._model.set_position(len(self._undo_stack))
         self.undoStackChanged.emit()
         self.redoStackChanged.emit()
-        return True
+
+    def clear(self) -> None:
+        """Drop all undo/redo history, e.g. after a document is replaced."""
+        self._transaction_commands = None
+        self._last_record_time = None
+        had_undo, had_redo = bool(self._undo_stack), bool(self._redo_stack)
+        self._undo_stack.clear()
+        self._redo_stack.clear()
+        self._undo_sizes.clear()
+        self._redo_sizes.clear()
+        self._set_memory_usage(0)
+        self._model.reset()
+        if had_undo:
+            self.undoStackChanged.emit()
+        if had_redo:
+            self.redoStackChanged.emit()
 
     # --- Transaction support ---
 
@@ -126,9 +239,64 @@ class HistoryManager(QObject):
 
         txn = TransactionCommand(self._transaction_commands, self._transaction_label)
         self._transaction_commands = None
+        self._push_new(txn)
+
+    # --- Memory accounting ---
+
+    def _push_new(self, command: Command) -> None:
+        """Push a freshly recorded command, dropping redo and enforcing limits."""
+        now = time.monotonic()
+        last, self._last_record_time = self._last_record_time, now
+        if (
+            last is not None
+            and now - last <= self.merge_window
+            and self._undo_stack
+            and not self._redo_stack
+            and self._undo_stack[-1].merge_with(command)
+        ):
+            top = self._undo_stack[-1]
+            size = top.size_estimate()
+            usage = self._memory_usage + size - self._undo_sizes[-1]
+            self._undo_sizes[-1] = size
+            self._model.replace_top(top.description)
+            self._enforce_limits(usage, notify_undo=True)
+            return
 
-        self._undo_stack.append(txn)
+        size = command.size_estimate()
+        usage = self._memory_usage + size
+        self._undo_stack.append(command)
+        self._undo_sizes.append(size)
+        self._model.push(command.description)
         if self._redo_stack:
+            usage -= sum(self._redo_sizes)
             self._redo_stack.clear()
+            self._redo_sizes.clear()
             self.redoStackChanged.emit()
-        self.undoStackChanged.emit()
+        self._enforce_limits(usage, notify_undo=True)
+
+    def _enforce_limits(
+        self, usage: Optional[int] = None, notify_undo: bool = False
+    ) -> None:
+        """Drop the oldest undo entries until depth and memory fit the limits."""
+        if usage is None:
+            usage = self._memory_usage
+        drop = 0
+        remaining = len(self._undo_stack)
+        while remaining - drop > 1 and (
+            (self._max_depth > 0 and remaining - drop > self._max_depth)
+            or (self._memory_budget > 0 and usage > self._memory_budget)
+        ):
+            usage -= self._undo_sizes[drop]
+            drop += 1
+        if drop:
+            del self._undo_stack[:drop]
+            del self._undo_sizes[:drop]
+            self._model.trim_front(drop)
+        if drop or notify_undo:
+            self.undoStackChanged.emit()
+        self._set_memory_usage(usage)
+
+    def _set_memory_usage(self, usage: int) -> None:
+        if usage != self._memory_usage:
+            self._memory_usage = usage
+            self.memoryUsageChanged.emit()
@@ -0,0 +1,138 @@
+# Copyright (C) 2026 The Culture List, Inc.
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""List model of undo history entries for QML views."""
+
+from __future__ import annotations
+
+from typing import Any, Dict, List, Optional, Union
+
+from PySide6.QtCore import (
+    QAbstractListModel,
+    QByteArray,
+    QModelIndex,
+    QObject,
+    QPersistentModelIndex,
+    Qt,
+)
+
+
+class HistoryListModel(QAbstractListModel):
+    """Rows for every applied and undone command, oldest first.
+
+    Rows ``[0, position)`` are applied (the undo stack, bottom to top) and
+    rows ``[position, count)`` are undone, with the next redo first.
+    Descriptions are cached when a command is recorded. The owning
+    HistoryManager drives the model with row-level updates so views never
+    re-marshal the whole history.
+    """
+
+    DescriptionRole = Qt.UserRole + 1  # type: ignore[attr-defined]
+    UndoneRole = Qt.UserRole + 2  # type: ignore[attr-defined]
+    CurrentRole = Qt.UserRole + 3  # type: ignore[attr-defined]
+
+    def __init__(self, parent: Optional[QObject] = None) -> None:
+        super().__init__(parent)
+        self._descriptions: List[str] = []
+        self._position = 0
+
+    @property
+    def position(self) -> int:
+        """Number of applied entries."""
+        return self._position
+
+    @property
+    def descriptions(self) -> List[str]:
+        return list(self._descriptions)
+
+    def rowCount(
+        self, parent: Union[QModelIndex, QPersistentModelIndex] = QModelIndex()
+    ) -> int:
+        if parent.isValid():
+            return 0
+        return len(self._descriptions)
+
+    def data(
+        self,
+        index: Union[QModelIndex, QPersistentModelIndex],
+        role: int = Qt.DisplayRole,  # type: ignore[attr-defined]
+    ) -> Any:
+        if not index.isValid() or not (0 <= index.row() < len(self._descriptions)):
+            return None
+        row = index.row()
+        if role in (self.DescriptionRole, Qt.DisplayRole):  # type: ignore[attr-defined]
+            return self._descriptions[row]
+        if role == self.UndoneRole:
+            return row >= self._position
+        if role == self.CurrentRole:
+            return row == self._position - 1
+        return None
+
+    def roleNames(self) -> Dict[int, QByteArray]:
+        return {
+            self.DescriptionRole: QByteArray(b"description"),
+            self.UndoneRole: QByteArray(b"undone"),
+            self.CurrentRole: QByteArray(b"current"),
+        }
+
+    # --- Updates driven by HistoryManager ---
+
+    def push(self, description: str) -> None:
+        """Append an applied entry, discarding any undone rows first."""
+        self._drop_undone()
+        row = self._position
+        self.beginInsertRows(QModelIndex(), row, row)
+        self._descriptions.append(description)
+        self._position += 1
+        self.endInsertRows()
+        if row > 0:
+            self._emit_state_changed(row - 1, row - 1)
+
+    def replace_top(self, description: str) -> None:
+        """Refresh the newest applied entry after a merge."""
+        row = self._position - 1
+        if row < 0 or self._descriptions[row] == description:
+            return
+        self._descriptions[row] = description
+        index = self.index(row, 0)
+        self.dataChanged.emit(index, index, [self.DescriptionRole])
+
+    def trim_front(self, count: int) -> None:
+        """Remove the ``count`` oldest entries."""
+        if count <= 0:
+            return
+        self.beginRemoveRows(QModelIndex(), 0, count - 1)
+        del self._descriptions[:count]
+        self._position -= count
+        self.endRemoveRows()
+
+    def set_position(self, position: int) -> None:
+        """Mark the first ``position`` entries applied and the rest undone."""
+        old = self._position
+        if position == old:
+            return
+        self._position = position
+        # Rows whose undone state flips, plus both "current" rows
+        first = max(min(old, position) - 1, 0)
+        last = max(old, position) - 1
+        self._emit_state_changed(first, last)
+
+    def reset(self) -> None:
+        self.beginResetModel()
+        self._descriptions.clear()
+        self._position = 0
+        self.endResetModel()
+
+    def _drop_undone(self) -> None:
+        count = len(self._descriptions)
+        if self._position < count:
+            self.beginRemoveRows(QModelIndex(), self._position, count - 1)
+            del self._descriptions[self._position :]
+            self.endRemoveRows()
+
+    def _emit_state_changed(self, first: int, last: int) -> None:
+        self.dataChanged.emit(
+            self.index(first, 0),
+            self.index(last, 0),
+            [self.UndoneRole, self.CurrentRole],
+        )
@@ -5,9 +5,10 @@
 
 from __future__ import annotations
 
+import uuid
 from dataclasses import dataclass
 from enum import Enum
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 from lucent.canvas_items import (
     CanvasItem,
@@ -19,12 +20,13 @@ from lucent.canvas_items import (
     TextItem,
 )
 from lucent.geometry import (
+    Geometry,
     RectGeometry,
     EllipseGeometry,
     PathGeometry,
     TextGeometry,
 )
-from lucent.appearances import Fill, Stroke
+from lucent.appearances import Appearance, Fill, Stroke
 from lucent.transforms import Transform
 
 
@@ -60,9 +62,18 @@ def _clamp_range(value: float, minimum: float, maximum: float) -> float:
     return value
 
 
+_ITEM_TYPES: Dict[str, ItemType] = {t.value: t for t in ItemType}
+_STROKE_CAPS = frozenset(("butt", "square", "round"))
+_STROKE_ALIGNS = frozenset(("center", "inner", "outer"))
+_STROKE_ORDERS = frozenset(("top", "bottom"))
+
+
 def _parse_type(type_value: Any) -> ItemType:
     if not type_value:
         raise ItemSchemaError("Missing item type")
+    fast = _ITEM_TYPES.get(type_value) if isinstance(type_value, str) else None
+    if fast is not None:
+        return fast
     try:
         normalized = str(type_value).lower()
         return ItemType(normalized)
@@ -104,13 +115,13 @@ def _parse_appearances(data: Dict[str, Any]) -> List[Dict[str, Any]]:
             )
         elif app_type == "stroke":
             cap = a.get("cap", "butt")
-            if cap not in ("butt", "square", "round"):
+            if cap not in _STROKE_CAPS:
                 cap = "butt"
             align = a.get("align", "center")
-            if align not in ("center", "inner", "outer"):
+            if align not in _STROKE_ALIGNS:
                 align = "center"
             order = a.get("order", "top")
-            if order not in ("top", "bottom"):
+            if order not in _STROKE_ORDERS:
                 order = "top"
             result.append(
                 {
@@ -179,10 +190,8 @@ def _parse_optional_corner_radius(geom: Dict[str, Any], key: str) -> Optional[fl
     return max(0.0, min(50.0, float(val)))
 
 
-def validate_rectangle(data: Dict[str, Any]) -> Dict[str, Any]:
-    """Validate rectangle data."""
+def _parse_rect_geometry(geom: Dict[str, Any]) -> Dict[str, Any]:
     try:
-        geom = data.get("geometry", {})
         x = float(geom.get("x", 0))
         y = float(geom.get("y", 0))
         width = _clamp_min(float(geom.get("width", 0)), 0.0)
@@ -195,13 +204,6 @@ def validate_rectangle(data: Dict[str, Any]) -> Dict[str, Any]:
     except (TypeError, ValueError) as exc:
         raise ItemSchemaError(f"Invalid rectangle numeric field: {exc}") from exc
 
-    appearances = _parse_appearances(data)
-    transform = _parse_transform(data)
-    name = str(data.get("name", ""))
-    parent_id = data.get("parentId") or None
-    visible = bool(data.get("visible", True))
-    locked = bool(data.get("locked", False))
-
     geometry: Dict[str, Any] = {
         "x": x,
         "y": y,
@@ -217,6 +219,18 @@ def validate_rectangle(data: Dict[str, Any]) -> Dict[str, Any]:
         geometry["cornerRadiusBR"] = corner_radius_br
     if corner_radius_bl is not None:
         geometry["cornerRadiusBL"] = corner_radius_bl
+    return geometry
+
+
+def validate_rectangle(data: Dict[str, Any]) -> Dict[str, Any]:
+    """Validate rectangle data."""
+    geometry = _parse_rect_geometry(data.get("geometry", {}))
+    appearances = _parse_appearances(data)
+    transform = _parse_transform(data)
+    name = str(data.get("name", ""))
+    parent_id = data.get("parentId") or None
+    visible = bool(data.get("visible", True))
+    locked = bool(data.get("locked", False))
 
     result: Dict[str, Any] = {
         "type": ItemType.RECTANGLE.value,
@@ -232,17 +246,21 @@ def validate_rectangle(data: Dict[str, Any]) -> Dict[str, Any]:
     return result
 
 
-def validate_ellipse(data: Dict[str, Any]) -> Dict[str, Any]:
-    """Validate ellipse data."""
+def _parse_ellipse_geometry(geom: Dict[str, Any]) -> Dict[str, Any]:
     try:
-        geom = data.get("geometry", {})
-        center_x = float(geom.get("centerX", 0))
-        center_y = float(geom.get("centerY", 0))
-        radius_x = _clamp_min(float(geom.get("radiusX", 0)), 0.0)
-        radius_y = _clamp_min(float(geom.get("radiusY", 0)), 0.0)
+        return {
+            "centerX": float(geom.get("centerX", 0)),
+            "centerY": float(geom.get("centerY", 0)),
+            "radiusX": _clamp_min(float(geom.get("radiusX", 0)), 0.0),
+            "radiusY": _clamp_min(float(geom.get("radiusY", 0)), 0.0),
+        }
     except (TypeError, ValueError) as exc:
         raise ItemSchemaError(f"Invalid ellipse numeric field: {exc}") from exc
 
+
+def validate_ellipse(data: Dict[str, Any]) -> Dict[str, Any]:
+    """Validate ellipse data."""
+    geometry = _parse_ellipse_geometry(data.get("geometry", {}))
     appearances = _parse_appearances(data)
     transform = _parse_transform(data)
     name = str(data.get("name", ""))
@@ -256,12 +274,7 @@ def validate_ellipse(data: Dict[str, Any]) -> Dict[str, Any]:
         "parentId": parent_id,
         "visible": visible,
         "locked": locked,
-        "geometry": {
-            "centerX": center_x,
-            "centerY": center_y,
-            "radiusX": radius_x,
-            "radiusY": radius_y,
-        },
+        "geometry": geometry,
         "appearances": appearances,
     }
     if transform is not None:
@@ -278,10 +291,8 @@ def _parse_handle(handle_data: Any) -> Dict[str, float] | None:
     return {"x": float(handle_data.get("x", 0)), "y": float(handle_data.get("y", 0))}
 
 
-def validate_path(data: Dict[str, Any]) -> Dict[str, Any]:
-    """Validate path data, preserving bezier handles."""
+def _parse_path_geometry(geom: Dict[str, Any]) -> Dict[str, Any]:
     try:
-        geom = data.get("geometry", {})
         points_raw = geom.get("points") or []
         closed = bool(geom.get("closed", False))
 
@@ -306,7 +317,12 @@ def validate_path(data: Dict[str, Any]) -> Dict[str, Any]:
             points.append(point)
     except (TypeError, ValueError, AttributeError) as exc:
         raise ItemSchemaError(f"Invalid path field: {exc}") from exc
+    return {"points": points, "closed": closed}
+
 
+def validate_path(data: Dict[str, Any]) -> Dict[str, Any]:
+    """Validate path data, preserving bezier handles."""
+    geometry = _parse_path_geometry(data.get("geometry", {}))
     appearances = _parse_appearances(data)
     transform = _parse_transform(data)
     name = str(data.get("name", ""))
@@ -320,7 +336,7 @@ def validate_path(data: Dict[str, Any]) -> Dict[str, Any]:
         "parentId": parent_id,
         "visible": visible,
         "locked": locked,
-        "geometry": {"points": points, "closed": closed},
+        "geometry": geometry,
         "appearances": appearances,
     }
     if transform is not None:
@@ -373,19 +389,40 @@ def validate_group(data: Dict[str, Any]) -> Dict[str, Any]:
     }
 
 
-def validate_text(data: Dict[str, Any]) -> Dict[str, Any]:
-    """Validate text item data."""
+def _parse_text_geometry(
+    geom: Dict[str, Any], legacy: Dict[str, Any] | None = None
+) -> Dict[str, Any]:
+    # Support both new geometry format and legacy top-level x/y format
+    fallback = legacy or {}
     try:
-        # Support both new geometry format and legacy x/y format
-        geom = data.get("geometry", {})
-        x = float(geom.get("x", data.get("x", 0)))
-        y = float(geom.get("y", data.get("y", 0)))
-        width = _clamp_min(float(geom.get("width", data.get("width", 100))), 1.0)
-        height = _clamp_min(float(geom.get("height", data.get("height", 0))), 0.0)
-        font_size = _clamp_range(float(data.get("fontSize", 16)), 8.0, 200.0)
-        text_opacity = _clamp_range(float(data.get("textOpacity", 1.0)), 0.0, 1.0)
+        x = float(geom.get("x", fallback.get("x", 0)))
+        y = float(geom.get("y", fallback.get("y", 0)))
+        width = _clamp_min(float(geom.get("width", fallback.get("width", 100))), 1.0)
+        height = _clamp_min(float(geom.get("height", fallback.get("height", 0))), 0.0)
     except (TypeError, ValueError) as exc:
         raise ItemSchemaError(f"Invalid text numeric field: {exc}") from exc
+    return {"x": x, "y": y, "width": width, "height": height}
+
+
+def _parse_font_size(value: Any) -> float:
+    try:
+        return _clamp_range(float(value), 8.0, 200.0)
+    except (TypeError, ValueError) as exc:
+        raise ItemSchemaError(f"Invalid text numeric field: {exc}") from exc
+
+
+def _parse_text_opacity(value: Any) -> float:
+    try:
+        return _clamp_range(float(value), 0.0, 1.0)
+    except (TypeError, ValueError) as exc:
+        raise ItemSchemaError(f"Invalid text numeric field: {exc}") from exc
+
+
+def validate_text(data: Dict[str, Any]) -> Dict[str, Any]:
+    """Validate text item data."""
+    geometry = _parse_text_geometry(data.get("geometry", {}), data)
+    font_size = _parse_font_size(data.get("fontSize", 16))
+    text_opacity = _parse_text_opacity(data.get("textOpacity", 1.0))
 
     transform = _parse_transform(data)
     text = str(data.get("text", ""))
@@ -402,7 +439,7 @@ def validate_text(data: Dict[str, Any]) -> Dict[str, Any]:
         "parentId": parent_id,
         "visible": visible,
         "locked": locked,
-        "geometry": {"x": x, "y": y, "width": width, "height": height},
+        "geometry": geometry,
         "text": text,
         "fontFamily": font_family,
         "fontSize": font_size,
@@ -414,24 +451,20 @@ def validate_text(data: Dict[str, Any]) -> Dict[str, Any]:
     return result
 
 
+_VALIDATORS: Dict[ItemType, Callable[[Dict[str, Any]], Dict[str, Any]]] = {
+    ItemType.RECTANGLE: validate_rectangle,
+    ItemType.ELLIPSE: validate_ellipse,
+    ItemType.ARTBOARD: validate_artboard,
+    ItemType.GROUP: validate_group,
+    ItemType.PATH: validate_path,
+    ItemType.TEXT: validate_text,
+}
+
+
 def parse_item_data(data: Dict[str, Any]) -> ParsedItem:
     item_type = _parse_type(data.get("type"))
-    if item_type is ItemType.RECTANGLE:
-        validated = validate_rectangle(data)
-    elif item_type is ItemType.ELLIPSE:
-        validated = validate_ellipse(data)
-    elif item_type is ItemType.ARTBOARD:
-        validated = validate_artboard(data)
-    elif item_type is ItemType.GROUP:
-        validated = validate_group(data)
-    elif item_type is ItemType.PATH:
-        validated = validate_path(data)
-    elif item_type is ItemType.TEXT:
-        validated = validate_text(data)
-    else:  # pragma: no cover - exhaustive Enum
-        raise ItemSchemaError(f"Unsupported item type: {item_type}")
-
-    return ParsedItem(type=item_type, name=validated.get("name", ""), data=validated)
+    validated = _VALIDATORS[item_type](data)
+    return ParsedItem(type=item_type, name=validated["name"], data=validated)
 
 
 def _create_transform(data: Dict[str, Any], geometry: Any) -> Transform | None:
@@ -459,13 +492,29 @@ def _create_transform(data: Dict[str, Any], geometry: Any) -> Transform | None:
     )
 
 
-def parse_item(data: Dict[str, Any]) -> CanvasItem:
-    parsed = parse_item_data(data)
-    t = parsed.type
-    d = parsed.data
-    if t is ItemType.RECTANGLE:
-        geom = d["geometry"]
-        geometry = RectGeometry(
+def _build_appearances(appearances: List[Dict[str, Any]]) -> List[Appearance]:
+    """Create appearance objects from validated appearance dicts."""
+    return [
+        Fill(a["color"], a["opacity"], a["visible"])
+        if a["type"] == "fill"
+        else Stroke(
+            a["color"],
+            a["width"],
+            a["opacity"],
+            a["visible"],
+            a.get("cap", "butt"),
+            a.get("align", "center"),
+            a.get("order", "top"),
+            a.get("scaleWithObject", False),
+        )
+        for a in appearances
+    ]
+
+
+def _build_geometry(item_type: ItemType, geom: Dict[str, Any]) -> Geometry:
+    """Create a geometry object from a validated geometry dict."""
+    if item_type is ItemType.RECTANGLE:
+        return RectGeometry(
             x=geom["x"],
             y=geom["y"],
             width=geom["width"],
@@ -476,122 +525,115 @@ def parse_item(data: Dict[str, Any]) -> CanvasItem:
             corner_radius_br=geom.get("cornerRadiusBR"),
             corner_radius_bl=geom.get("cornerRadiusBL"),
         )
-        return RectangleItem(
-            geometry=geometry,
-            appearances=[
-                Fill(a["color"], a["opacity"], a["visible"])
-                if a["type"] == "fill"
-                else Stroke(
-                    a["color"],
-                    a["width"],
-                    a["opacity"],
-                    a["visible"],
-                    a.get("cap", "butt"),
-                    a.get("align", "center"),
-                    a.get("order", "top"),
-                )
-                for a in d["appearances"]
-            ],
-            transform=_create_transform(d, geometry),
-            name=d["name"],
-            parent_id=d["parentId"],
-            visible=d.get("visible", True),
-            locked=d.get("locked", False),
-        )
-    if t is ItemType.ELLIPSE:
-        geom = d["geometry"]
-        geometry = EllipseGeometry(
+    if item_type is ItemType.ELLIPSE:
+        return EllipseGeometry(
             center_x=geom["centerX"],
             center_y=geom["centerY"],
             radius_x=geom["radiusX"],
             radius_y=geom["radiusY"],
         )
-        return EllipseItem(
-            geometry=geometry,
-            appearances=[
-                Fill(a["color"], a["opacity"], a["visible"])
-                if a["type"] == "fill"
-                else Stroke(
-                    a["color"],
-                    a["width"],
-                    a["opacity"],
-                    a["visible"],
-                    a.get("cap", "butt"),
-                    a.get("align", "center"),
-                    a.get("order", "top"),
-                )
-                for a in d["appearances"]
-            ],
-            transform=_create_transform(d, geometry),
-            name=d["name"],
-            parent_id=d["parentId"],
-            visible=d.get("visible", True),
-            locked=d.get("locked", False),
-        )
-    if t is ItemType.PATH:
-        geom = d["geometry"]
-        geometry = PathGeometry(points=geom["points"], closed=geom["closed"])
-        return PathItem(
-            geometry=geometry,
-            appearances=[
-                Fill(a["color"], a["opacity"], a["visible"])
-                if a["type"] == "fill"
-                else Stroke(
-                    a["color"],
-                    a["width"],
-                    a["opacity"],
-                    a["visible"],
-                    a.get("cap", "butt"),
-                    a.get("align", "center"),
-                    a.get("order", "top"),
-                )
-                for a in d["appearances"]
-            ],
-            transform=_create_transform(d, geometry),
-            name=d.get("name", ""),
-            parent_id=d.get("parentId"),
-            visible=d.get("visible", True),
-            locked=d.get("locked", False),
-        )
-    if t is ItemType.ARTBOARD:
-        return ArtboardItem(
-            x=d["x"],
-            y=d["y"],
-            width=d["width"],
-            height=d["height"],
-            name=d["name"],
-            artboard_id=d.get("id"),
-            background_color=d.get("backgroundColor", "#ffffff"),
-            visible=d.get("visible", True),
-            locked=d.get("locked", False),
-        )
-    if t is ItemType.GROUP:
-        return GroupItem(
-            name=d["name"],
-            group_id=d.get("id"),
-            parent_id=d.get("parentId"),
-            visible=d.get("visible", True),
-            locked=d.get("locked", False),
-        )
-    if t is ItemType.TEXT:
-        geom = d["geometry"]
-        geometry = TextGeometry(
+    if item_type is ItemType.PATH:
+        return PathGeometry(points=geom["points"], closed=geom["closed"])
+    if item_type is ItemType.TEXT:
+        return TextGeometry(
             x=geom["x"], y=geom["y"], width=geom["width"], height=geom["height"]
         )
-        return TextItem(
-            geometry=geometry,
-            text=d["text"],
-            font_family=d["fontFamily"],
-            font_size=d["fontSize"],
-            text_color=d["textColor"],
-            text_opacity=d["textOpacity"],
-            transform=_create_transform(d, geometry),
-            name=d["name"],
-            parent_id=d["parentId"],
-            visible=d.get("visible", True),
-            locked=d.get("locked", False),
-        )
-    raise ItemSchemaError(f"Unsupported item type: {parsed.type}")
+    raise ItemSchemaError(f"Item type has no geometry: {item_type.value}")
+
+
+def _build_shape_fields(item_type: ItemType, d: Dict[str, Any]) -> Dict[str, Any]:
+    """Keyword arguments shared by the geometry + appearance item classes."""
+    geometry = _build_geometry(item_type, d["geometry"])
+    return {
+        "geometry": geometry,
+        "appearances": _build_appearances(d["appearances"]),
+        "transform": _create_transform(d, geometry),
+        "name": d["name"],
+        "parent_id": d["parentId"],
+        "visible": d["visible"],
+        "locked": d["locked"],
+    }
+
+
+def _build_rectangle(d: Dict[str, Any]) -> CanvasItem:
+    return RectangleItem(**_build_shape_fields(ItemType.RECTANGLE, d))
+
+
+def _build_ellipse(d: Dict[str, Any]) -> CanvasItem:
+    return EllipseItem(**_build_shape_fields(ItemType.ELLIPSE, d))
+
+
+def _build_path(d: Dict[str, Any]) -> CanvasItem:
+    return PathItem(**_build_shape_fields(ItemType.PATH, d))
+
+
+def _build_artboard(d: Dict[str, Any]) -> CanvasItem:
+    return ArtboardItem(
+        x=d["x"],
+        y=d["y"],
+        width=d["width"],
+        height=d["height"],
+        name=d["name"],
+        artboard_id=d["id"],
+        background_color=d["backgroundColor"],
+        visible=d["visible"],
+        locked=d["locked"],
+    )
+
+
+def _build_group(d: Dict[str, Any]) -> CanvasItem:
+    return GroupItem(
+        name=d["name"],
+        group_id=d["id"],
+        parent_id=d["parentId"],
+        visible=d["visible"],
+        locked=d["locked"],
+    )
+
+
+def _build_text(d: Dict[str, Any]) -> CanvasItem:
+    geometry = _build_geometry(ItemType.TEXT, d["geometry"])
+    return TextItem(
+        geometry=geometry,  # type: ignore[arg-type]
+        text=d["text"],
+        font_family=d["fontFamily"],
+        font_size=d["fontSize"],
+        text_color=d["textColor"],
+        text_opacity=d["textOpacity"],
+        transform=_create_transform(d, geometry),
+        name=d["name"],
+        parent_id=d["parentId"],
+        visible=d["visible"],
+        locked=d["locked"],
+    )
+
+
+_BUILDERS: Dict[ItemType, Callable[[Dict[str, Any]], CanvasItem]] = {
+    ItemType.RECTANGLE: _build_rectangle,
+    ItemType.ELLIPSE: _build_ellipse,
+    ItemType.ARTBOARD: _build_artboard,
+    ItemType.GROUP: _build_group,
+    ItemType.PATH: _build_path,
+    ItemType.TEXT: _build_text,
+}
+
+
+def build_item(data: Dict[str, Any]) -> CanvasItem:
+    """Construct an item from data already normalized by parse_item_data.
+
+    This is the trusted path: the data is not validated again, so callers
+    must only pass ``ParsedItem.data`` (or an unmodified copy of it). Use
+    parse_item for anything that came from outside.
+    """
+    item_type = _ITEM_TYPES.get(data.get("type"))  # type: ignore[arg-type]
+    if item_type is None:
+        raise ItemSchemaError(f"Unsupported item type: {data.get('type')}")
+    return _BUILDERS[item_type](data)
+
+
+def parse_item(data: Dict[str, Any]) -> CanvasItem:
+    """Validate raw item data and construct the item."""
+    return build_item(parse_item_data(data).data)
 
 
 def _geometry_bounds_dict(geom: Any) -> Dict[str, float]:
@@ -708,3 +750,274 @@ def item_to_dict(item: CanvasItem) -> Dict[str, Any]:
             result["transform"] = item.transform.to_dict()
         return result
     raise ItemSchemaError(f"Cannot serialize unknown item type: {type(item).__name__}")
+
+
+_ITEM_CLASS_TYPES = {
+    RectangleItem: ItemType.RECTANGLE,
+    EllipseItem: ItemType.ELLIPSE,
+    ArtboardItem: ItemType.ARTBOARD,
+    GroupItem: ItemType.GROUP,
+    PathItem: ItemType.PATH,
+    TextItem: ItemType.TEXT,
+}
+
+
+def item_type_of(item: CanvasItem) -> ItemType:
+    """Return the schema type of a CanvasItem instance."""
+    item_type = _ITEM_CLASS_TYPES.get(type(item))
+    if item_type is None:
+        raise ItemSchemaError(f"Unknown item type: {type(item).__name__}")
+    return item_type
+
+
+@dataclass
+class ItemPatch:
+    """Validated subset of item properties for an in-place update."""
+
+    type: ItemType
+    changes: Dict[str, Any]
+
+
+def _parse_float(value: Any, item_type: ItemType) -> float:
+    try:
+        return float(value)
+    except (TypeError, ValueError) as exc:
+        raise ItemSchemaError(
+            f"Invalid {item_type.value} numeric field: {exc}"
+        ) from exc
+
+
+_COMMON_FIELD_PARSERS: Dict[str, Callable[[Any], Any]] = {
+    "name": str,
+    "parentId": lambda v: v or None,
+    "visible": bool,
+    "locked": bool,
+}
+
+_SHAPE_FIELD_PARSERS: Dict[str, Callable[[Any], Any]] = {
+    **_COMMON_FIELD_PARSERS,
+    "appearances": lambda v: _parse_appearances({"appearances": v}),
+    "transform": lambda v: _parse_transform({"transform": v}),
+}
+
+_PATCH_FIELD_PARSERS: Dict[ItemType, Dict[str, Callable[[Any], Any]]] = {
+    ItemType.RECTANGLE: {**_SHAPE_FIELD_PARSERS, "geometry": _parse_rect_geometry},
+    ItemType.ELLIPSE: {**_SHAPE_FIELD_PARSERS, "geometry": _parse_ellipse_geometry},
+    ItemType.PATH: {**_SHAPE_FIELD_PARSERS, "geometry": _parse_path_geometry},
+    ItemType.TEXT: {
+        **_COMMON_FIELD_PARSERS,
+        "transform": _SHAPE_FIELD_PARSERS["transform"],
+        "geometry": _parse_text_geometry,
+        "text": str,
+        "fontFamily": str,
+        "fontSize": _parse_font_size,
+        "textColor": str,
+        "textOpacity": _parse_text_opacity,
+    },
+    ItemType.ARTBOARD: {
+        "id": lambda v: v or None,
+        "name": str,
+        "visible": bool,
+        "locked": bool,
+        "x": lambda v: _parse_float(v, ItemType.ARTBOARD),
+        "y": lambda v: _parse_float(v, ItemType.ARTBOARD),
+        "width": lambda v: _clamp_min(_parse_float(v, ItemType.ARTBOARD), 1.0),
+        "height": lambda v: _clamp_min(_parse_float(v, ItemType.ARTBOARD), 1.0),
+        "backgroundColor": str,
+    },
+    ItemType.GROUP: {**_COMMON_FIELD_PARSERS, "id": lambda v: v or None},
+}
+
+# Item attribute backing each camelCase schema field
+_PATCH_ATTRIBUTES = {
+    "name": "name",
+    "parentId": "parent_id",
+    "visible": "visible",
+    "locked": "locked",
+    "id": "id",
+    "text": "text",
+    "fontFamily": "font_family",
+    "fontSize": "font_size",
+    "textColor": "text_color",
+    "textOpacity": "text_opacity",
+    "x": "x",
+    "y": "y",
+    "width": "width",
+    "height": "height",
+    "backgroundColor": "background_color",
+}
+
+
+def parse_item_patch(item_type: ItemType, properties: Dict[str, Any]) -> ItemPatch:
+    """Validate only the given properties for an item of ``item_type``.
+
+    Keys the item type does not carry (including derived ``bounds`` and the
+    immutable ``type``) are dropped, mirroring how a full re-parse of the
+    merged item would ignore them.
+    """
+    parsers = _PATCH_FIELD_PARSERS[item_type]
+    changes: Dict[str, Any] = {}
+    for key, value in properties.items():
+        parser = parsers.get(key)
+        if parser is not None:
+            changes[key] = parser(value)
+    return ItemPatch(type=item_type, changes=changes)
+
+
+def _read_patch_field(item: Any, key: str) -> Any:
+    if key == "geometry":
+        return item.geometry.to_dict()
+    if key == "appearances":
+        return [a.to_dict() for a in item.appearances]
+    if key == "transform":
+        return item.transform.to_dict() if _should_serialize_transform(item) else None
+    return getattr(item, _PATCH_ATTRIBUTES[key])
+
+
+def _default_transform(geometry: Geometry) -> Transform:
+    bounds = geometry.get_bounds()
+    return Transform(
+        pivot_x=bounds.x() + bounds.width() * 0.5,
+        pivot_y=bounds.y() + bounds.height() * 0.5,
+    )
+
+
+def _write_patch_field(item: Any, item_type: ItemType, key: str, value: Any) -> None:
+    if key == "geometry":
+        item.geometry = _build_geometry(item_type, value)
+    elif key == "appearances":
+        item.appearances = _build_appearances(value)
+    elif key == "transform":
+        transform = _create_transform({"transform": value}, item.geometry)
+        item.transform = transform or _default_transform(item.geometry)
+    elif key == "id":
+        item.id = value or str(uuid.uuid4())
+    else:
+        setattr(item, _PATCH_ATTRIBUTES[key], value)
+
+
+def apply_item_patch(
+    item: CanvasItem, changes: Dict[str, Any]
+) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    """Apply validated field changes to ``item`` in place.
+
+    Returns ``(before, after)`` dicts holding only the fields whose value
+    actually changed, suitable for undo and change notification.
+    """
+    item_type = item_type_of(item)
+    keys = sorted(changes, key=lambda k: k != "geometry")
+    before = {key: _read_patch_field(item, key) for key in keys}
+
+    # An implicit (centered) pivot follows the geometry, as a full re-parse would
+    follow_geometry = "geometry" in changes and "transform" not in changes
+    if follow_geometry:
+        old_transform = item.transform.to_dict()
+        was_explicit = _should_serialize_transform(item)
+
+    # Geometry first so transform pivots resolve against the new bounds
+    for key in keys:
+        _write_patch_field(item, item_type, key, changes[key])
+
+    after = {key: _read_patch_field(item, key) for key in keys}
+    if follow_geometry:
+        if not was_explicit:
+            item.transform = _default_transform(item.geometry)
+        elif not _should_serialize_transform(item):
+            # Explicit pivot now happens to be the default; keep it on undo
+            before["transform"] = old_transform
+            after["transform"] = item.transform.to_dict()
+
+    for key in keys:
+        if after[key] == before[key]:
+            del before[key]
+            del after[key]
+    return before, after
+
+
+# A data patch is a list of (path, value) pairs. A path is a tuple of dict
+# keys and list indices into validated item data; ABSENT as the value means
+# the key is removed.
+DataPatch = List[Tuple[Tuple[Any, ...], Any]]
+
+
+class _Absent:
+    """Marker for a key missing on one side of a data diff."""
+
+    __slots__ = ()
+
+    def __repr__(self) -> str:
+        return "ABSENT"
+
+
+ABSENT: Any = _Absent()
+
+
+def _diff_into(
+    old: Any, new: Any, path: Tuple[Any, ...], before: DataPatch, after: DataPatch
+) -> None:
+    if isinstance(old, dict) and isinstance(new, dict):
+        for key in old.keys() | new.keys():
+            _diff_into(
+                old.get(key, ABSENT), new.get(key, ABSENT), path + (key,), before, after
+            )
+        return
+    if isinstance(old, list) and isinstance(new, list) and len(old) == len(new):
+        for i, (old_value, new_value) in enumerate(zip(old, new)):
+            _diff_into(old_value, new_value, path + (i,), before, after)
+        return
+    if old != new:
+        before.append((path, old))
+        after.append((path, new))
+
+
+def diff_item_data(
+    old: Dict[str, Any], new: Dict[str, Any]
+) -> Tuple[DataPatch, DataPatch]:
+    """Diff two validated item dicts into minimal (before, after) patches.
+
+    Dicts and equal-length lists are compared element by element, so a rename
+    or a single moved point records only that leaf. Lists that change length
+    are recorded whole.
+    """
+    before: DataPatch = []
+    after: DataPatch = []
+    _diff_into(old, new, (), before, after)
+    return before, after
+
+
+def apply_data_patch(data: Dict[str, Any], patch: DataPatch) -> Dict[str, Any]:
+    """Return a copy of ``data`` with ``patch`` applied.
+
+    Only containers along patched paths are copied; the rest is shared with
+    the input.
+    """
+    result = dict(data)
+    copied: Dict[Tuple[Any, ...], Any] = {(): result}
+    for path, value in patch:
+        container: Any = result
+        for depth, key in enumerate(path[:-1]):
+            prefix = path[: depth + 1]
+            child = copied.get(prefix)
+            if child is None:
+                child = container[key]
+                child = dict(child) if isinstance(child, dict) else list(child)
+                container[key] = child
+                copied[prefix] = child
+            container = child
+        key = path[-1]
+        if value is ABSENT:
+            if isinstance(container, dict):
+                container.pop(key, None)
+        else:
+            container[key] = value
+    return result
+
+
+def compose_data_patches(first: DataPatch, second: DataPatch) -> DataPatch:
+    """Combine two patches into one with the effect of applying both in order.
+
+    An op is dropped when a later op writes the same path, so repeatedly
+    composing edits of the same fields stays the size of a single edit.
+    """
+    last_write = {path: i for i, (path, _) in enumerate(first + second)}
+    return [op for i, op in enumerate(first + second) if last_write[op[0]] == i]
@@ -0,0 +1,435 @@
+# Copyright (C) 2026 The Culture List, Inc.
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""Append-only edit journal for crash recovery.
+
+While a saved document is open, every change to the CanvasModel is appended
+to a sidecar file next to it as one compact JSON line. Lines are buffered and
+written with a single fsync per flush interval, so an edit costs a small
+append instead of a full save. After a crash the last saved document plus a
+replay of the journal restores the session.
+
+Autosaves go to a second sidecar rather than over the document. Once one is
+written the journal is rebased onto it, so recovery loads the autosave and
+replays only the edits made since.
+
+Records mirror the model's row signals, so undo, redo and plain edits are all
+captured without serializing commands:
+
+- ``{"op": "insert", "at": i, "items": [...]}``
+- ``{"op": "remove", "at": i, "count": n}``
+- ``{"op": "move", "first": f, "last": l, "dest": d}`` (beginMoveRows semantics)
+- ``{"op": "patch", "at": i, "changes": [[path, value], ...], "removed": [path,
+  ...]}`` (only the fields that changed; see diff_item_data)
+- ``{"op": "load", "artboard": id, "at": i}`` (a deferred artboard's contents
+  were inserted; they are read back from the document, not the journal)
+
+Only inserts carry whole items. A model reset is recorded as patches of the
+rows it kept plus a remove or insert for the difference in length.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+from typing import IO, TYPE_CHECKING, Any, Dict, List, Optional, Union
+
+from PySide6.QtCore import QModelIndex, QObject, QTimer
+
+from lucent.file_io import DeferredArtboard, write_atomic
+from lucent.item_schema import (
+    ABSENT,
+    DataPatch,
+    ItemSchemaError,
+    apply_data_patch,
+    diff_item_data,
+    item_to_dict,
+    parse_item,
+)
+
+if TYPE_CHECKING:
+    from lucent.canvas_items import CanvasItem
+    from lucent.canvas_model import CanvasModel
+
+JOURNAL_SUFFIX = ".journal"
+AUTOSAVE_SUFFIX = ".autosave"
+# Meta key of an autosave holding the file_stamp of the document it extends
+AUTOSAVE_BASE_KEY = "autosaveBase"
+JOURNAL_VERSION = 1
+DEFAULT_FLUSH_INTERVAL_MS = 200
+# Flush early once this much is buffered, regardless of the timer
+MAX_BUFFERED_BYTES = 1024 * 1024
+
+
+def journal_path_for(document_path: str) -> str:
+    """Return the sidecar journal path for a document."""
+    return document_path + JOURNAL_SUFFIX
+
+
+def autosave_path_for(document_path: str) -> str:
+    """Return the sidecar autosave path for a document."""
+    return document_path + AUTOSAVE_SUFFIX
+
+
+def file_stamp(path: str) -> Optional[List[int]]:
+    """Identify the saved state of a file by modification time and size.
+
+    A journal header carries the stamp of the document it extends, so a
+    journal left behind by an interrupted save is never replayed onto a
+    newer file.
+    """
+    try:
+        info = os.stat(path)
+    except OSError:
+        return None
+    return [info.st_mtime_ns, info.st_size]
+
+
+def remove_journal(path: str) -> None:
+    """Delete a journal or autosave file if it exists."""
+    try:
+        os.remove(path)
+    except OSError:
+        pass
+
+
+def _encode(record: Dict[str, Any]) -> bytes:
+    return json.dumps(record, separators=(",", ":")).encode("utf-8") + b"\n"
+
+
+def _patch_record(at: int, patch: DataPatch) -> Dict[str, Any]:
+    record: Dict[str, Any] = {
+        "op": "patch",
+        "at": at,
+        "changes": [
+            [list(path), value] for path, value in patch if value is not ABSENT
+        ],
+    }
+    removed = [list(path) for path, value in patch if value is ABSENT]
+    if removed:
+        record["removed"] = removed
+    return record
+
+
+def _loaded_items(contents: DeferredArtboard) -> List[Dict[str, Any]]:
+    """Normalize a deferred artboard's contents the way the model loads them."""
+    items = []
+    for data in contents.items():
+        try:
+            items.append(item_to_dict(parse_item(data)))
+        except ItemSchemaError as exc:
+            print(f"Warning: Failed to load item: {exc}")
+    return items
+
+
+def read_journal(path: str, base: Optional[List[int]] = None) -> List[Dict[str, Any]]:
+    """Read the records of a journal file.
+
+    Returns an empty list when the file is missing, has a foreign header, or
+    when ``base`` is given and differs from the stamp the journal was started
+    against. Reading stops at the first incomplete or corrupt line, which is where a
+    crash interrupted the last write.
+    """
+    try:
+        with open(path, "rb") as f:
+            lines = f.read().split(b"\n")
+    except FileNotFoundError:
+        return []
+    except OSError as exc:
+        print(f"Warning: Failed to read journal: {exc}")
+        return []
+
+    records: List[Dict[str, Any]] = []
+    for number, line in enumerate(lines):
+        try:
+            record = json.loads(line)
+        except ValueError:
+            break
+        if not isinstance(record, dict):
+            break
+        if number == 0:
+            if record.get("journal") != JOURNAL_VERSION:
+                return []
+            if base is not None and record.get("base") != base:
+                return []
+            continue
+        records.append(record)
+    return records
+
+
+def replay_journal(
+    items: List[Dict[str, Any]],
+    records: List[Dict[str, Any]],
+    deferred: Optional[Dict[str, DeferredArtboard]] = None,
+) -> List[Dict[str, Any]]:
+    """Apply journal records to a list of item dicts and return the result.
+
+    ``deferred`` holds the artboard contents of a lazily opened document;
+    entries consumed by ``load`` records are removed from it, so afterwards
+    it holds the artboards that are still deferred.
+
+    A record that does not fit the list (a journal for a different file)
+    stops the replay with a warning; earlier records are kept.
+    """
+    result = list(items)
+    for record in records:
+        try:
+            op = record["op"]
+            if op == "insert":
+                at = record["at"]
+                if not 0 <= at <= len(result):
+                    raise IndexError(at)
+                result[at:at] = record["items"]
+            elif op == "remove":
+                at, count = record["at"], record["count"]
+                if at < 0 or at + count > len(result):
+                    raise IndexError(at)
+                del result[at : at + count]
+            elif op == "move":
+                first, last, dest = record["first"], record["last"], record["dest"]
+                if not (0 <= first <= last < len(result)):
+                    raise IndexError(first)
+                block = result[first : last + 1]
+                del result[first : last + 1]
+                # dest is a row before the move; rows after the block shift up
+                if dest > last:
+                    dest -= len(block)
+                result[dest:dest] = block
+            elif op == "patch":
+                at = record["at"]
+                if not 0 <= at < len(result):
+                    raise IndexError(at)
+                patch: DataPatch = [
+                    (tuple(path), value) for path, value in record["changes"]
+                ]
+                patch += [(tuple(path), ABSENT) for path in record.get("removed", [])]
+                result[at] = apply_data_patch(result[at], patch)
+            elif op == "load":
+                at = record["at"]
+                if deferred is None or not 0 <= at <= len(result):
+                    raise IndexError(at)
+                contents = deferred.pop(record["artboard"])
+                result[at:at] = _loaded_items(contents)
+            else:
+                raise KeyError(op)
+        except (KeyError, IndexError, TypeError, ValueError) as exc:
+            print(f"Warning: Journal replay stopped at invalid record: {exc}")
+            break
+    return result
+
+
+class EditJournal(QObject):
+    """Records CanvasModel changes to a sidecar journal file."""
+
+    def __init__(
+        self,
+        canvas_model: "CanvasModel",
+        flush_interval_ms: int = DEFAULT_FLUSH_INTERVAL_MS,
+        parent: Optional[QObject] = None,
+    ) -> None:
+        super().__init__(parent)
+        self._model = canvas_model
+        self._path = ""
+        self._file: Optional[IO[bytes]] = None
+        self._buffer: List[bytes] = []
+        self._buffered_bytes = 0
+        # Each row as last recorded, to diff changes against: a cheap item
+        # snapshot until the row is first serialized, then its item dict, so
+        # later edits serialize only the live item
+        self._recorded: List[Union["CanvasItem", Dict[str, Any]]] = []
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(flush_interval_ms)
+        self._timer.timeout.connect(self.flush)
+
+    @property
+    def path(self) -> str:
+        """Path of the active journal, or empty when stopped."""
+        return self._path
+
+    @property
+    def active(self) -> bool:
+        return self._file is not None
+
+    @property
+    def position(self) -> int:
+        """Byte length of the journal once buffered records are flushed."""
+        self.flush()
+        return self._file.tell() if self._file is not None else 0
+
+    def start(
+        self, path: str, truncate: bool = True, base: Optional[List[int]] = None
+    ) -> bool:
+        """Begin journaling to ``path``.
+
+        With ``truncate`` the journal starts empty, matching a freshly saved
+        or opened document, and its header records ``base`` (see
+        ``file_stamp``); otherwise new records follow the existing ones.
+        """
+        self.stop()
+        try:
+            exists = os.path.exists(path) and os.path.getsize(path) > 0
+            self._file = open(path, "wb" if truncate or not exists else "ab")
+        except OSError as exc:
+            print(f"Warning: Failed to open journal: {exc}")
+            return False
+        self._path = path
+        if truncate or not exists:
+            self._append({"journal": JOURNAL_VERSION, "base": base})
+            self.flush()
+        self._recorded = [item.snapshot() for item in self._model.getItems()]
+        self._connect_model_signals()
+        return True
+
+    def stop(self, discard: bool = False) -> None:
+        """Flush and close the journal, deleting the file when ``discard``."""
+        if self._file is None:
+            return
+        self._disconnect_model_signals()
+        self.flush()
+        self._file.close()
+        self._file = None
+        self._recorded = []
+        if discard:
+            remove_journal(self._path)
+        self._path = ""
+
+    def rebase(self, position: int, base: Optional[List[int]]) -> None:
+        """Drop records before byte ``position`` after the document was saved.
+
+        Records written after ``position`` were not part of the save and are
+        kept, under a new header stamped with ``base``.
+        """
+        if self._file is None:
+            return
+        path = self._path
+        self.flush()
+        try:
+            with open(path, "rb") as f:
+                f.seek(position)
+                tail = f.read()
+            self.stop()
+            write_atomic(
+                path, _encode({"journal": JOURNAL_VERSION, "base": base}) + tail
+            )
+        except OSError as exc:
+            print(f"Warning: Failed to rebase journal: {exc}")
+        self.start(path, truncate=False)
+
+    def flush(self) -> None:
+        """Write buffered records and fsync them in one batch."""
+        self._timer.stop()
+        if self._file is None or not self._buffer:
+            return
+        try:
+            self._file.write(b"".join(self._buffer))
+            self._file.flush()
+            os.fsync(self._file.fileno())
+        except OSError as exc:
+            print(f"Warning: Failed to write journal: {exc}")
+        self._buffer.clear()
+        self._buffered_bytes = 0
+
+    def _append(self, record: Dict[str, Any]) -> None:
+        line = _encode(record)
+        self._buffer.append(line)
+        self._buffered_bytes += len(line)
+        if self._buffered_bytes >= MAX_BUFFERED_BYTES:
+            self.flush()
+        elif not self._timer.isActive():
+            self._timer.start()
+
+    def _item_dicts(self, first: int, last: int) -> List[Dict[str, Any]]:
+        items = self._model.getItems()
+        return [item_to_dict(items[row]) for row in range(first, last + 1)]
+
+    # --- Model signal handlers ---
+
+    def _connect_model_signals(self) -> None:
+        self._model.rowsInserted.connect(self._on_rows_inserted)
+        self._model.rowsRemoved.connect(self._on_rows_removed)
+        self._model.rowsMoved.connect(self._on_rows_moved)
+        self._model.dataChanged.connect(self._on_data_changed)
+        self._model.modelReset.connect(self._on_model_reset)
+        # Drags and translations shift items without dataChanged
+        self._model.itemsTransformed.connect(self._on_items_transformed)
+
+    def _disconnect_model_signals(self) -> None:
+        try:
+            self._model.rowsInserted.disconnect(self._on_rows_inserted)
+            self._model.rowsRemoved.disconnect(self._on_rows_removed)
+            self._model.rowsMoved.disconnect(self._on_rows_moved)
+            self._model.dataChanged.disconnect(self._on_data_changed)
+            self._model.modelReset.disconnect(self._on_model_reset)
+            self._model.itemsTransformed.disconnect(self._on_items_transformed)
+        except RuntimeError:
+            pass
+
+    def _on_rows_inserted(self, parent: QModelIndex, first: int, last: int) -> None:
+        artboard = self._model.loading_artboard
+        if artboard is not None:
+            items = self._model.getItems()
+            self._recorded[first:first] = [
+                items[row].snapshot() for row in range(first, last + 1)
+            ]
+            self._append({"op": "load", "artboard": artboard, "at": first})
+            return
+        self._insert_rows(first, last)
+
+    def _insert_rows(self, first: int, last: int) -> None:
+        data = self._item_dicts(first, last)
+        self._recorded[first:first] = data
+        self._append({"op": "insert", "at": first, "items": data})
+
+    def _on_rows_removed(self, parent: QModelIndex, first: int, last: int) -> None:
+        del self._recorded[first : last + 1]
+        self._append({"op": "remove", "at": first, "count": last - first + 1})
+
+    def _on_rows_moved(
+        self,
+        parent: QModelIndex,
+        first: int,
+        last: int,
+        destination: QModelIndex,
+        dest: int,
+    ) -> None:
+        block = self._recorded[first : last + 1]
+        del self._recorded[first : last + 1]
+        at = dest - len(block) if dest > last else dest
+        self._recorded[at:at] = block
+        self._append({"op": "move", "first": first, "last": last, "dest": dest})
+
+    def _on_data_changed(
+        self, top_left: QModelIndex, bottom_right: QModelIndex, roles: Any = None
+    ) -> None:
+        self._record_rows(range(top_left.row(), bottom_right.row() + 1))
+
+    def _on_items_transformed(self, indices: List[int]) -> None:
+        self._record_rows(sorted(set(indices)))
+
+    def _record_rows(self, rows: Any) -> None:
+        """Record the fields of ``rows`` that changed since they were recorded."""
+        items = self._model.getItems()
+        for row in rows:
+            if not (0 <= row < len(items) and row < len(self._recorded)):
+                continue
+            recorded = self._recorded[row]
+            if not isinstance(recorded, dict):
+                recorded = item_to_dict(recorded)
+            data = item_to_dict(items[row])
+            _, after = diff_item_data(recorded, data)
+            self._recorded[row] = data
+            if after:
+                self._append(_patch_record(row, after))
+
+    def _on_model_reset(self) -> None:
+        items = self._model.getItems()
+        kept = min(len(items), len(self._recorded))
+        if len(self._recorded) > kept:
+            self._append(
+                {"op": "remove", "at": kept, "count": len(self._recorded) - kept}
+            )
+            del self._recorded[kept:]
+        self._record_rows(range(kept))
+        if len(items) > kept:
+            self._insert_rows(kept, len(items) - 1)
@@ -0,0 +1,146 @@
+# Copyright (C) 2026 The Culture List, Inc.
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""Incremental PNG encoder.
+
+Rows are compressed and written as they arrive, so an image can be encoded
+band by band without ever holding all of its pixels in memory. Only 8-bit
+RGBA (PNG color type 6) is written, which matches QImage's RGBA8888
+format byte for byte.
+
+The image is written to a temporary file that replaces the destination only
+once it is complete, so a failed export never leaves a truncated PNG or
+overwrites an existing file.
+"""
+
+from __future__ import annotations
+
+import struct
+import zlib
+from pathlib import Path
+from typing import IO, Any, ContextManager, Optional, Union
+
+from lucent.file_io import atomic_open
+
+PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+
+# Compressed bytes collected before an IDAT chunk is written
+IDAT_CHUNK_SIZE = 256 * 1024
+
+_METERS_PER_INCH = 0.0254
+
+
+class PngWriter:
+    """Writes an RGBA PNG file row by row.
+
+    Usage::
+
+        with PngWriter(path, width, height) as writer:
+            writer.write_rows(band_bytes, stride, rows)
+
+    The file at ``path`` is replaced when the writer is closed after all
+    rows were written; on any error it is left untouched.
+
+    Raises:
+        ValueError: if more rows are written than the image has, or fewer
+            by the time the writer is closed
+        OSError: if the file cannot be written
+    """
+
+    def __init__(
+        self,
+        path: Union[str, Path],
+        width: int,
+        height: int,
+        dpi: Optional[float] = None,
+        compression: int = 6,
+    ) -> None:
+        if width <= 0 or height <= 0:
+            raise ValueError(f"Invalid PNG size: {width}x{height}")
+        self._width = width
+        self._height = height
+        self._rows_written = 0
+        self._compressor = zlib.compressobj(compression)
+        self._pending = bytearray()
+        self._closed = False
+        self._target: ContextManager[IO[bytes]] = atomic_open(path)
+        self._file = self._target.__enter__()
+        try:
+            self._file.write(PNG_SIGNATURE)
+            # 8 bits per channel, RGBA, no interlacing
+            self._write_chunk(
+                b"IHDR", struct.pack(">IIBBBBB", width, height, 8, 6, 0, 0, 0)
+            )
+            if dpi:
+                per_meter = round(dpi / _METERS_PER_INCH)
+                self._write_chunk(b"pHYs", struct.pack(">IIB", per_meter, per_meter, 1))
+        except BaseException as exc:
+            self._discard(exc)
+            raise
+
+    @property
+    def rows_written(self) -> int:
+        return self._rows_written
+
+    def write_rows(
+        self, data: Union[bytes, memoryview], stride: int, rows: int
+    ) -> None:
+        """Append ``rows`` rows of RGBA pixels, ``stride`` bytes apart in ``data``."""
+        if self._rows_written + rows > self._height:
+            raise ValueError(
+                f"PNG has {self._height} rows; cannot write {self._rows_written + rows}"
+            )
+        view = memoryview(data).cast("B")
+        row_bytes = self._width * 4
+        for row in range(rows):
+            start = row * stride
+            # Filter type 0: the row is stored unfiltered
+            self._pending += self._compressor.compress(b"\x00")
+            self._pending += self._compressor.compress(view[start : start + row_bytes])
+            if len(self._pending) >= IDAT_CHUNK_SIZE:
+                self._flush_idat()
+        self._rows_written += rows
+
+    def close(self) -> None:
+        """Finish the image and move it into place."""
+        if self._closed:
+            return
+        try:
+            if self._rows_written != self._height:
+                raise ValueError(
+                    f"PNG has {self._height} rows; only {self._rows_written} written"
+                )
+            self._pending += self._compressor.flush()
+            self._flush_idat()
+            self._write_chunk(b"IEND", b"")
+        except BaseException as exc:
+            self._discard(exc)
+            raise
+        self._closed = True
+        self._target.__exit__(None, None, None)
+
+    def __enter__(self) -> "PngWriter":
+        return self
+
+    def __exit__(self, exc_type: Any, exc: Any, tb: Any) -> None:
+        if exc_type is None:
+            self.close()
+        elif not self._closed:
+            self._discard(exc)
+
+    def _discard(self, exc: BaseException) -> None:
+        """Delete the unfinished image, leaving the destination untouched."""
+        self._closed = True
+        self._target.__exit__(type(exc), exc, exc.__traceback__)
+
+    def _flush_idat(self) -> None:
+        if self._pending:
+            self._write_chunk(b"IDAT", bytes(self._pending))
+            self._pending.clear()
+
+    def _write_chunk(self, chunk_type: bytes, data: bytes) -> None:
+        crc = zlib.crc32(data, zlib.crc32(chunk_type))
+        self._file.write(struct.pack(">I", len(data)))
+        self._file.write(chunk_type)
+        self._file.write(data)
+        self._file.write(struct.pack(">I", crc))
@@ -0,0 +1,162 @@
+# Copyright (C) 2026 The Culture List, Inc.
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""Document previews embedded in saved files for fast browsing.
+
+The thumbnail shows the first artboard, or all content when the document
+has no artboards. Rendering uses QImage only, so previews can be built on
+the autosave thread from item snapshots.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Dict, List, Optional
+
+from PySide6.QtCore import QBuffer, QByteArray, QIODevice, QRectF
+from PySide6.QtGui import QColor, QImage, QImageWriter, QPainter
+
+from lucent.canvas_items import ArtboardItem, CanvasItem, GroupItem
+from lucent.exporter import compute_bounds
+from lucent.file_io import DeferredArtboard, DocumentPreview
+from lucent.hierarchy import get_children_map, get_descendant_indices
+from lucent.item_schema import ItemSchemaError, item_type_of
+
+# Longest side of the thumbnail in pixels
+THUMBNAIL_SIZE = 256
+
+
+def _rect_dict(rect: QRectF) -> Dict[str, float]:
+    return {
+        "x": rect.x(),
+        "y": rect.y(),
+        "width": rect.width(),
+        "height": rect.height(),
+    }
+
+
+def _is_group(item: CanvasItem) -> bool:
+    return isinstance(item, GroupItem)
+
+
+def _visible_descendants(
+    items: List[CanvasItem],
+    container_id: str,
+    children: Dict[str, List[int]],
+) -> List[CanvasItem]:
+    """Visible descendants of a container in paint (model) order."""
+    indices: List[int] = []
+    queue = list(children.get(container_id, []))
+    while queue:
+        index = queue.pop()
+        item = items[index]
+        if not getattr(item, "visible", True):
+            continue
+        indices.append(index)
+        if isinstance(item, GroupItem):
+            queue.extend(children.get(item.id, []))
+    return [items[i] for i in sorted(indices)]
+
+
+def document_stats(
+    items: List[CanvasItem],
+    deferred: Optional[Dict[str, DeferredArtboard]] = None,
+) -> Dict[str, Any]:
+    """Summarize item counts, content bounds and artboards.
+
+    Contents of ``deferred`` artboards are counted without decoding them.
+    """
+    deferred = deferred or {}
+    counts: Dict[str, int] = {}
+    total = len(items)
+    for item in items:
+        try:
+            item_type = item_type_of(item).value
+        except ItemSchemaError:
+            continue
+        counts[item_type] = counts.get(item_type, 0) + 1
+        if isinstance(item, ArtboardItem) and item.id in deferred:
+            contents = deferred[item.id]
+            total += contents.count
+            for name, count in contents.counts.items():
+                counts[name] = counts.get(name, 0) + count
+
+    children = get_children_map(items)
+    artboards = []
+    for item in items:
+        if isinstance(item, ArtboardItem):
+            entry: Dict[str, Any] = {"id": item.id, "name": item.name}
+            entry.update(_rect_dict(item.get_bounds()))
+            descendants = get_descendant_indices(items, item.id, _is_group, children)
+            entry["itemCount"] = len(descendants)
+            if item.id in deferred:
+                entry["itemCount"] += deferred[item.id].count
+            artboards.append(entry)
+
+    bounds = compute_bounds(items)
+    return {
+        "itemCount": total,
+        "counts": counts,
+        "bounds": None if bounds.isEmpty() else _rect_dict(bounds),
+        "artboards": artboards,
+    }
+
+
+def render_thumbnail(items: List[CanvasItem], size: int = THUMBNAIL_SIZE) -> bytes:
+    """Render a PNG thumbnail whose longest side is at most ``size`` pixels.
+
+    Returns:
+        PNG bytes, or b"" when there is nothing to draw
+    """
+    artboard: Optional[ArtboardItem] = next(
+        (
+            item
+            for item in items
+            if isinstance(item, ArtboardItem) and item.width > 0 and item.height > 0
+        ),
+        None,
+    )
+    if artboard is not None:
+        bounds = artboard.get_bounds()
+        content = _visible_descendants(items, artboard.id, get_children_map(items))
+        background: Optional[str] = artboard.background_color
+    else:
+        content = [item for item in items if getattr(item, "visible", True)]
+        bounds = compute_bounds(content)
+        background = None
+    if bounds.isEmpty():
+        return b""
+
+    # Never upscale: small documents keep their natural size
+    scale = min(size / max(bounds.width(), bounds.height()), 1.0)
+    width = max(int(round(bounds.width() * scale)), 1)
+    height = max(int(round(bounds.height() * scale)), 1)
+
+    image = QImage(width, height, QImage.Format.Format_ARGB32_Premultiplied)
+    image.fill(QColor(background) if background else QColor(0, 0, 0, 0))
+    painter = QPainter(image)
+    painter.setRenderHint(QPainter.RenderHint.Antialiasing, True)
+    painter.scale(scale, scale)
+    painter.translate(-bounds.x(), -bounds.y())
+    for item in content:
+        try:
+            item.paint(painter, zoom_level=1.0, offset_x=0, offset_y=0)
+        except Exception:
+            pass
+    painter.end()
+
+    data = QByteArray()
+    buffer = QBuffer(data)
+    buffer.open(QIODevice.OpenModeFlag.WriteOnly)
+    QImageWriter(buffer, b"png").write(image)
+    buffer.close()
+    return bytes(data.data())
+
+
+def build_preview(
+    items: List[CanvasItem],
+    deferred: Optional[Dict[str, DeferredArtboard]] = None,
+) -> DocumentPreview:
+    """Build the thumbnail and stats to embed when saving ``items``."""
+    return DocumentPreview(
+        thumbnail=render_thumbnail(items), stats=document_stats(items, deferred)
+    )
@@ -10,7 +10,7 @@ a given rectangle (e.g., viewport or tile bounds).
 """
 
 from dataclasses import dataclass, field
-from typing import List, Set, Optional, Any, Dict
+from typing import List, Set, Optional, Any, Dict, Tuple
 
 
 @dataclass
@@ -145,8 +145,34 @@ class QuadTreeNode:
                 if child.bounds.intersects(item_bounds):
                     child.insert(item_id, item_bounds)
 
-    def remove(self, item_id: Any) -> bool:
-        """Remove an item from the quadtree. Returns True if found."""
+    def insert_many(self, entries: List[Tuple[Any, Rect]]) -> None:
+        """Insert many items, partitioning them top-down in one pass.
+
+        Avoids the repeated subdivide-and-redistribute of one-by-one inserts.
+        """
+        entries = [entry for entry in entries if self.bounds.intersects(entry[1])]
+        if not entries:
+            return
+
+        if self.is_leaf():
+            if (
+                len(self.items) + len(entries) <= self.max_items
+                or self.depth >= self.max_depth
+            ):
+                self.items.update(entries)
+                return
+            self.subdivide()
+
+        for child in self.children:  # type: ignore
+            child.insert_many(entries)
+
+    def remove(self, item_id: Any, item_bounds: Optional[Rect] = None) -> bool:
+        """Remove an item from the quadtree. Returns True if found.
+
+        When the item's bounds are known, only intersecting nodes are visited.
+        """
+        if item_bounds is not None and not self.bounds.intersects(item_bounds):
+            return False
         if self.is_leaf():
             if item_id in self.items:
                 del self.items[item_id]
@@ -155,7 +181,7 @@ class QuadTreeNode:
         else:
             found = False
             for child in self.children:  # type: ignore
-                if child.remove(item_id):
+                if child.remove(item_id, item_bounds):
                     found = True
             return found
 
@@ -229,16 +255,28 @@ class SpatialIndex:
         self._item_bounds[item_id] = bounds
         self._root.insert(item_id, bounds)
 
+    def insert_many(self, entries: List[Tuple[Any, Rect]]) -> None:
+        """Bulk-load (item_id, bounds) pairs, replacing any existing entries."""
+        fresh: Dict[Any, Rect] = {}
+        for item_id, bounds in entries:
+            if item_id in self._item_bounds:
+                self.remove(item_id)
+            fresh[item_id] = bounds
+        self._item_bounds.update(fresh)
+        self._root.insert_many(list(fresh.items()))
+
     def remove(self, item_id: Any) -> bool:
         """Remove an item by its ID. Returns True if found."""
         if item_id not in self._item_bounds:
             return False
 
-        del self._item_bounds[item_id]
-        return self._root.remove(item_id)
+        bounds = self._item_bounds.pop(item_id)
+        return self._root.remove(item_id, bounds)
 
     def update(self, item_id: Any, new_bounds: Rect) -> None:
         """Update an item's bounds (remove + reinsert)."""
+        if self._item_bounds.get(item_id) == new_bounds:
+            return
         self.remove(item_id)
         self.insert(item_id, new_bounds)
 
@@ -14,8 +14,9 @@ Key benefits:
 - All shape types supported (anything that can paint to QPainter)
 """
 
-from typing import Any, Optional, List, TYPE_CHECKING
+from typing import Any, Optional, List, Set, TYPE_CHECKING
 from PySide6.QtCore import Property, Signal, Slot, QObject, QRectF
+from PySide6.QtGui import QMatrix4x4
 from PySide6.QtQuick import (
     QQuickItem,
     QSGNode,
@@ -64,6 +65,20 @@ class SceneGraphRenderer(QQuickItem):
         self._texture_nodes: List[QSGSimpleTextureNode] = []
         self._transform_nodes: List[QSGTransformNode] = []
 
+        # Active drag: dragged items sit under translation nodes whose matrix
+        # carries the offset accumulated since the last rebuild
+        self._drag_indices: Set[int] = set()
+        self._drag_nodes: List[QSGTransformNode] = []
+        self._drag_dx: float = 0.0
+        self._drag_dy: float = 0.0
+        self._drag_dirty: bool = False
+
+        # Top-level nodes per model row, so row moves can reorder them in place
+        self._background_row_nodes: List[Optional[QSGNode]] = []
+        self._item_row_nodes: List[Optional[QSGNode]] = []
+        self._preview_node: Optional[QSGNode] = None
+        self._order_dirty: bool = False
+
     @Slot(QObject)
     def setModel(self, model: QObject) -> None:
         """Connect to canvas model for rendering."""
@@ -73,9 +88,17 @@ class SceneGraphRenderer(QQuickItem):
             self._model = model
             model.itemAdded.connect(self._on_structure_changed)
             model.itemRemoved.connect(self._on_structure_changed)
+            model.itemsRemoved.connect(self._on_items_removed)
+            model.itemsInserted.connect(self._on_items_inserted)
             model.itemsCleared.connect(self._on_items_cleared)
             model.itemsReordered.connect(self._on_structure_changed)
+            model.itemsMoved.connect(self._on_items_moved)
             model.itemModified.connect(self._on_item_modified)
+            model.itemsModified.connect(self._on_items_modified)
+            model.itemsTransformed.connect(self._on_structure_changed)
+            model.dragStarted.connect(self._on_drag_started)
+            model.dragMoved.connect(self._on_drag_moved)
+            model.dragFinished.connect(self._on_drag_finished)
             self._needs_full_rebuild = True
             self.update()
 
@@ -84,6 +107,37 @@ class SceneGraphRenderer(QQuickItem):
         self._needs_full_rebuild = True
         self.update()
 
+    @Slot(int, int)
+    def _on_items_inserted(self, first: int, last: int) -> None:
+        self._needs_full_rebuild = True
+        self.update()
+
+    @Slot(list)
+    def _on_items_removed(self, indices: list) -> None:
+        self._needs_full_rebuild = True
+        self.update()
+
+    @Slot(int, int, int)
+    def _on_items_moved(self, first: int, last: int, dest: int) -> None:
+        # Moved items keep their identity, so their nodes can simply be reordered
+        rows = len(self._item_row_nodes)
+        if (
+            self._needs_full_rebuild
+            or self._drag_indices
+            or not self._model
+            or rows != self._model.count()
+            or not (0 <= first <= last < rows and 0 <= dest <= rows)
+        ):
+            self._needs_full_rebuild = True
+        else:
+            for nodes in (self._background_row_nodes, self._item_row_nodes):
+                block = nodes[first : last + 1]
+                del nodes[first : last + 1]
+                insert_at = dest if dest < first else dest - len(block)
+                nodes[insert_at:insert_at] = block
+            self._order_dirty = True
+        self.update()
+
     @Slot()
     def _on_items_cleared(self) -> None:
         self._texture_cache.clear()
@@ -92,13 +146,44 @@ class SceneGraphRenderer(QQuickItem):
 
     @Slot(int, "QVariant")  # type: ignore[arg-type]
     def _on_item_modified(self, index: int, changed_props: object = None) -> None:
-        if self._model:
-            item = self._model.getItem(index)
-            if item and hasattr(item, "id"):
-                self._texture_cache.invalidate(item.id)
+        self._invalidate_item_texture(index)
         self._needs_full_rebuild = True
         self.update()
 
+    @Slot(list)
+    def _on_items_modified(self, indices: list) -> None:
+        for index in indices:
+            self._invalidate_item_texture(index)
+        self._needs_full_rebuild = True
+        self.update()
+
+    @Slot(list)
+    def _on_drag_started(self, indices: list) -> None:
+        self._drag_indices = set(indices)
+        self._needs_full_rebuild = True
+        self.update()
+
+    @Slot(float, float)
+    def _on_drag_moved(self, dx: float, dy: float) -> None:
+        self._drag_dx += dx
+        self._drag_dy += dy
+        self._drag_dirty = True
+        self.update()
+
+    @Slot()
+    def _on_drag_finished(self) -> None:
+        self._drag_indices = set()
+        self._needs_full_rebuild = True
+        self.update()
+
+    def _invalidate_item_texture(self, index: int) -> None:
+        if self._model:
+            item = self._model.getItem(index)
+            if item is not None:
+                # Same key as _create_node_for_item; items are patched in place
+                item_id = item.id if hasattr(item, "id") else str(id(item))
+                self._texture_cache.invalidate(item_id)
+
     @Slot("QVariant")  # type: ignore[arg-type]
     def setPreviewItem(self, item_data: Any) -> None:
         """Set preview item for tool drawing. Rendered on top of all items."""
@@ -142,6 +227,16 @@ class SceneGraphRenderer(QQuickItem):
         if self._needs_full_rebuild:
             self._rebuild_nodes(old_node)
             self._needs_full_rebuild = False
+        else:
+            if self._order_dirty:
+                self._reorder_nodes(old_node)
+            if self._drag_dirty:
+                matrix = QMatrix4x4()
+                matrix.translate(self._drag_dx, self._drag_dy, 0)
+                for node in self._drag_nodes:
+                    node.setMatrix(matrix)
+        self._drag_dirty = False
+        self._order_dirty = False
 
         return old_node
 
@@ -153,6 +248,13 @@ class SceneGraphRenderer(QQuickItem):
         self._textures.clear()
         self._texture_nodes.clear()
         self._transform_nodes.clear()
+        self._drag_nodes.clear()
+        self._background_row_nodes = []
+        self._item_row_nodes = []
+        self._preview_node = None
+        # Live items already include the drag offset applied so far
+        self._drag_dx = 0.0
+        self._drag_dy = 0.0
 
         offset_x = self.width() / 2.0 - self._tile_origin_x
         offset_y = self.height() / 2.0 - self._tile_origin_y
@@ -163,32 +265,54 @@ class SceneGraphRenderer(QQuickItem):
 
         if self._model:
             count = self._model.count()
-            for i in range(count):
-                item = self._model.getItem(i)
-                if item is None:
-                    continue
-                background_node = self._create_artboard_background_node(
-                    item, offset_x, offset_y, window
-                )
+            items = [self._model.getItem(i) for i in range(count)]
+            for i, item in enumerate(items):
+                background_node: Optional[QSGNode] = None
+                if item is not None:
+                    background_node = self._create_artboard_background_node(
+                        item, offset_x, offset_y, window
+                    )
                 if background_node:
+                    background_node = self._wrap_if_dragged(i, background_node)
                     root.appendChildNode(background_node)
-            for i in range(count):
-                item = self._model.getItem(i)
-                if item is None:
-                    continue
-
-                node = self._create_node_for_item(
-                    item, offset_x, offset_y, window, self._texture_cache
-                )
+                self._background_row_nodes.append(background_node)
+            for i, item in enumerate(items):
+                node: Optional[QSGNode] = None
+                if item is not None:
+                    node = self._create_node_for_item(
+                        item, offset_x, offset_y, window, self._texture_cache
+                    )
                 if node:
+                    node = self._wrap_if_dragged(i, node)
                     root.appendChildNode(node)
+                self._item_row_nodes.append(node)
 
         if self._preview_item:
-            preview_node = self._create_node_for_item(
+            self._preview_node = self._create_node_for_item(
                 self._preview_item, offset_x, offset_y, window, self._preview_cache
             )
-            if preview_node:
-                root.appendChildNode(preview_node)
+            if self._preview_node:
+                root.appendChildNode(self._preview_node)
+
+    def _reorder_nodes(self, root: QSGNode) -> None:
+        """Re-append existing top-level nodes in the current row order."""
+        while root.childCount() > 0:
+            root.removeChildNode(root.firstChild())
+        for nodes in (self._background_row_nodes, self._item_row_nodes):
+            for node in nodes:
+                if node is not None:
+                    root.appendChildNode(node)
+        if self._preview_node is not None:
+            root.appendChildNode(self._preview_node)
+
+    def _wrap_if_dragged(self, index: int, node: QSGNode) -> QSGNode:
+        """Parent a dragged item's node under a drag translation node."""
+        if index not in self._drag_indices:
+            return node
+        drag_node = QSGTransformNode()
+        drag_node.appendChildNode(node)
+        self._drag_nodes.append(drag_node)
+        return drag_node
 
     def _create_artboard_background_node(
         self,
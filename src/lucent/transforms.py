@@ -19,6 +19,16 @@ class Transform:
     Transforms are applied in this order: translate, rotate, scale.
     """
 
+    __slots__ = (
+        "translate_x",
+        "translate_y",
+        "rotate",
+        "scale_x",
+        "scale_y",
+        "pivot_x",
+        "pivot_y",
+    )
+
     def __init__(
         self,
         translate_x: float = 0,
@@ -37,6 +47,18 @@ class Transform:
         self.pivot_x = float(pivot_x)
         self.pivot_y = float(pivot_y)
 
+    def translated(self, dx: float, dy: float) -> "Transform":
+        """Return a new transform with the translation offset by dx, dy."""
+        return Transform(
+            self.translate_x + dx,
+            self.translate_y + dy,
+            self.rotate,
+            self.scale_x,
+            self.scale_y,
+            self.pivot_x,
+            self.pivot_y,
+        )
+
     def is_identity(self) -> bool:
         """Check if this transform is the identity transform."""
         return (
@@ -0,0 +1,240 @@
+# Copyright (C) 2026 The Culture List, Inc.
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""Tests for parallel batch export."""
+
+from pathlib import Path
+
+import pytest
+from PySide6.QtGui import QColor, QImage
+
+from lucent.batch_export import (
+    BatchExporter,
+    ExportJob,
+    export_file_name,
+    render_job,
+)
+from lucent.document_manager import DocumentManager
+from lucent.exporter import ExportOptions, export_format_for
+from lucent.file_io import open_document, save_document
+from test_helpers import make_artboard, make_artboard_with_children, make_rectangle
+
+TIMEOUT = 60000
+
+
+def _red_square(artboard_id: str = "ab") -> dict:
+    data = make_rectangle(width=100, height=100, fill_color="#ff0000", fill_opacity=1.0)
+    data["parentId"] = artboard_id
+    return data
+
+
+def _job(path: Path, **kwargs) -> ExportJob:
+    defaults = dict(
+        artboard_id="ab",
+        path=str(path),
+        bounds=(0.0, 0.0, 100.0, 100.0),
+        options=ExportOptions(),
+        items=(_red_square(),),
+    )
+    defaults.update(kwargs)
+    return ExportJob(**defaults)
+
+
+class TestFileNames:
+    """Export files are named after the artboard, format and scale."""
+
+    def test_names(self):
+        assert export_file_name("Home", 1, "png") == "Home.png"
+        assert export_file_name("Home", 2, "jpg") == "Home@2x.jpg"
+        assert export_file_name("Home", 1.5, "png") == "Home@1.5x.png"
+        assert export_file_name("Home", 3, "svg") == "Home.svg"
+        assert export_file_name("a/b:c", 1, "pdf") == "a_b_c.pdf"
+        assert export_file_name("..", 1, "png") == "Artboard.png"
+
+    def test_format_from_extension(self):
+        assert export_format_for("x.JPEG") == "jpg"
+        assert export_format_for("x.pdf") == "pdf"
+        assert export_format_for("x") == "png"
+
+
+class TestRenderJob:
+    """render_job renders item dicts without a CanvasModel."""
+
+    def test_renders_items_at_scale(self, qapp, tmp_path):
+        path = tmp_path / "out.png"
+        options = ExportOptions(document_dpi=72, target_dpi=144)
+
+        assert render_job(_job(path, options=options)) is True
+
+        image = QImage(str(path))
+        assert (image.width(), image.height()) == (200, 200)
+        assert image.pixelColor(100, 100) == QColor("#ff0000")
+
+    def test_decodes_deferred_contents(self, qapp, tmp_path):
+        file_path = tmp_path / "doc.lucent"
+        save_document(
+            file_path,
+            make_artboard_with_children(
+                [
+                    make_rectangle(
+                        width=100, height=100, fill_color="#ff0000", fill_opacity=1.0
+                    )
+                ],
+                width=100,
+                height=100,
+                artboard_id="ab",
+            ),
+            {},
+            {},
+        )
+        with open_document(file_path) as document:
+            deferred = document.deferred_artboards()["ab"]
+        path = tmp_path / "out.png"
+
+        assert render_job(_job(path, items=(), deferred=deferred)) is True
+
+        assert QImage(str(path)).pixelColor(50, 50) == QColor("#ff0000")
+
+
+class TestBatchExporter:
+    """BatchExporter renders jobs in worker processes."""
+
+    def test_exports_all_jobs(self, qtbot, tmp_path):
+        exporter = BatchExporter(max_workers=2)
+        jobs = [
+            _job(tmp_path / f"out{i}.{ext}")
+            for i, ext in enumerate(["png", "jpg", "svg", "pdf"])
+        ]
+        exported = []
+        progress = []
+        exporter.fileExported.connect(lambda path, ok: exported.append((path, ok)))
+        exporter.progressChanged.connect(progress.append)
+
+        with qtbot.waitSignal(exporter.finished, timeout=TIMEOUT) as blocker:
+            exporter.start(jobs)
+        exporter.wait()
+
+        assert blocker.args == [4, 0]
+        assert sorted(exported) == sorted((job.path, True) for job in jobs)
+        assert all(Path(job.path).stat().st_size > 0 for job in jobs)
+        assert progress == sorted(progress)
+        assert progress[-1] == 1.0
+        assert exporter.active is False
+
+    def test_failed_jobs_are_counted(self, qtbot, tmp_path):
+        exporter = BatchExporter(max_workers=1)
+        jobs = [
+            _job(tmp_path / "ok.png"),
+            _job(tmp_path / "empty.png", bounds=(0.0, 0.0, 0.0, 0.0)),
+        ]
+
+        with qtbot.waitSignal(exporter.finished, timeout=TIMEOUT) as blocker:
+            exporter.start(jobs)
+        exporter.wait()
+
+        assert blocker.args == [1, 1]
+
+    def test_empty_batch_finishes_at_once(self, qtbot):
+        exporter = BatchExporter()
+
+        with qtbot.waitSignal(exporter.finished) as blocker:
+            exporter.start([])
+
+        assert blocker.args == [0, 0]
+        assert exporter.active is False
+
+    def test_cancel(self, qtbot, tmp_path):
+        exporter = BatchExporter(max_workers=1)
+        jobs = [_job(tmp_path / f"out{i}.png") for i in range(50)]
+        finished = []
+        exporter.finished.connect(lambda *args: finished.append(args))
+
+        with qtbot.waitSignal(exporter.cancelled, timeout=TIMEOUT):
+            exporter.start(jobs)
+            exporter.cancel()
+        exporter.wait()
+        qtbot.wait(50)
+
+        assert exporter.active is False
+        assert finished == []
+        assert len(list(tmp_path.glob("*.png"))) < 50
+
+
+class TestExportArtboards:
+    """DocumentManager.exportArtboards exports many artboards at once."""
+
+    @pytest.fixture
+    def manager(self, canvas_model):
+        manager = DocumentManager(canvas_model)
+        manager._exporter._max_workers = 2
+        manager.setDocumentDPI(72)
+        manager.startTracking()
+        return manager
+
+    def test_formats_and_scales(self, qtbot, manager, canvas_model, tmp_path):
+        canvas_model.addItem(make_artboard(width=40, height=20, name="Home"))
+        canvas_model.addItem(
+            make_artboard(x=100, width=10, height=10, name="Home", artboard_id="b")
+        )
+        ids = [item.id for item in canvas_model.getItems()]
+        exporting = []
+        manager.exportingChanged.connect(lambda: exporting.append(manager.exporting))
+
+        with qtbot.waitSignal(manager.batchExportFinished, timeout=TIMEOUT) as blocker:
+            queued = manager.exportArtboards(
+                ids, ["png", "svg", "bogus"], [1, 2], str(tmp_path), 0.0, ""
+            )
+        manager._exporter.wait()
+
+        assert queued == 6
+        assert blocker.args == [6, 0]
+        assert exporting == [True, False]
+        assert manager.exportProgress == 1.0
+        assert sorted(p.name for p in tmp_path.iterdir()) == [
+            "Home 2.png",
+            "Home 2.svg",
+            "Home 2@2x.png",
+            "Home.png",
+            "Home.svg",
+            "Home@2x.png",
+        ]
+        assert QImage(str(tmp_path / "Home@2x.png")).width() == 80
+
+    def test_deferred_artboards_stay_unloaded(
+        self, qtbot, manager, canvas_model, tmp_path
+    ):
+        file_path = tmp_path / "doc.lucent"
+        save_document(
+            file_path,
+            make_artboard_with_children(
+                [
+                    make_rectangle(
+                        width=10, height=10, fill_color="#ff0000", fill_opacity=1.0
+                    )
+                ],
+                width=10,
+                height=10,
+                name="Lazy",
+                artboard_id="ab",
+            ),
+            {},
+            {},
+        )
+        manager._lazy_artboard_threshold = 1
+        manager.openDocument(str(file_path))
+        out = tmp_path / "out"
+
+        with qtbot.waitSignal(manager.batchExportFinished, timeout=TIMEOUT):
+            manager.exportArtboards(["ab"], ["png"], [1], str(out), 0.0, "")
+        manager._exporter.wait()
+
+        assert canvas_model.isArtboardDeferred("ab") is True
+        assert QImage(str(out / "Lazy.png")).pixelColor(5, 5) == QColor("#ff0000")
+
+    def test_nothing_to_export(self, manager, tmp_path):
+        queued = manager.exportArtboards(
+            ["missing"], ["png"], [1], str(tmp_path), 0, ""
+        )
+
+        assert queued == 0
+        assert manager.exporting is False
@@ -26,6 +26,7 @@ from lucent.appearances import Fill, Stroke
 from lucent.transforms import Transform
 from PySide6.QtGui import QImage
 from PySide6.QtCore import QSize, QRectF
+from test_helpers import make_rectangle
 
 
 # Helper to create default appearances
@@ -769,3 +770,75 @@ class TestShapeItemWithTransform:
         bounds_center = rect_center.get_bounds()
         assert abs(bounds_center.x()) < 0.01  # Stays at origin
         assert abs(bounds_center.y()) < 0.01
+
+
+class TestItemSlots:
+    """Items and their components use __slots__ to stay compact."""
+
+    @pytest.mark.parametrize(
+        "obj",
+        [
+            RectangleItem(RectGeometry(0, 0, 10, 10), [Fill()]),
+            EllipseItem(EllipseGeometry(0, 0, 5, 5), [Stroke()]),
+            TextItem(TextGeometry(0, 0, 10, 10), "Hi"),
+            ArtboardItem(),
+            GroupItem(),
+            Fill(),
+            Stroke(),
+            Transform(),
+        ],
+    )
+    def test_no_instance_dict(self, obj):
+        assert not hasattr(obj, "__dict__")
+        with pytest.raises(AttributeError):
+            obj.unexpected = 1
+
+
+class TestItemSnapshot:
+    """snapshot() gives a copy isolated from later in-place edits."""
+
+    def test_snapshot_copies_fields(self):
+        item = RectangleItem(RectGeometry(1, 2, 3, 4), [Fill()], name="R")
+
+        clone = item.snapshot()
+
+        assert type(clone) is RectangleItem
+        assert clone is not item
+        assert clone.name == "R"
+        assert clone.geometry is item.geometry
+        assert clone.appearances is item.appearances
+
+    def test_snapshot_isolated_from_field_assignment(self):
+        group = GroupItem(name="G")
+        clone = group.snapshot()
+
+        group.name = "Renamed"
+        group.parent_id = "other"
+
+        assert clone.name == "G"
+        assert clone.parent_id is None
+
+    def test_snapshot_isolated_from_drag_and_undo(self, canvas_model):
+        canvas_model.addItem(make_rectangle(x=0, y=0, width=10, height=10))
+        item = canvas_model.getItems()[0]
+        before = item.snapshot()
+
+        canvas_model.beginDrag([0])
+        canvas_model.updateDrag(10, 0)
+        during = item.snapshot()
+        canvas_model.updateDrag(25, 5)
+        canvas_model.endDrag()
+        canvas_model.undo()
+
+        assert before.transform.translate_x == 0
+        assert (during.transform.translate_x, during.transform.translate_y) == (10, 0)
+        assert canvas_model.getItems()[0].transform.translate_x == 0
+
+    def test_snapshot_keeps_subclass_dict(self):
+        class Tagged(ArtboardItem):
+            pass
+
+        item = Tagged()
+        item.tag = "x"
+
+        assert item.snapshot().tag == "x"
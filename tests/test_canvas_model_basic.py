@@ -139,6 +139,120 @@ class TestCanvasModelUpdate:
         assert item.geometry.x == 50
         assert item.name == "Updated"
 
+    def test_update_item_patches_in_place(self, canvas_model):
+        """Partial updates keep the same item object."""
+        canvas_model.addItem(make_rectangle(name="Original"))
+        item = canvas_model.getItems()[0]
+
+        canvas_model.updateItem(0, {"name": "Renamed"})
+
+        assert canvas_model.getItems()[0] is item
+        assert item.name == "Renamed"
+
+    def test_update_item_emits_changed_fields_only(self, canvas_model, qtbot):
+        """itemModified carries only the fields that changed."""
+        canvas_model.addItem(make_rectangle(name="A", visible=True))
+
+        with qtbot.waitSignal(canvas_model.itemModified, timeout=1000) as blocker:
+            canvas_model.updateItem(0, {"name": "B", "visible": True})
+
+        assert blocker.args == [0, {"name": "B"}]
+
+    def test_update_item_no_op_records_nothing(self, canvas_model):
+        """Updating with current values adds no undo entry."""
+        canvas_model.addItem(make_rectangle(name="Same"))
+        depth = len(canvas_model._history._undo_stack)
+
+        canvas_model.updateItem(0, {"name": "Same"})
+
+        assert len(canvas_model._history._undo_stack) == depth
+
+    def test_update_item_invalid_patch_is_rejected(self, canvas_model):
+        """Invalid values leave the item untouched."""
+        canvas_model.addItem(make_text(font_size=20))
+
+        canvas_model.updateItem(0, {"fontSize": "huge"})
+
+        assert canvas_model.getItems()[0].font_size == 20
+
+    def test_update_item_undo_redo_patch(self, canvas_model):
+        """Undo and redo re-apply the recorded delta on the same object."""
+        canvas_model.addItem(make_rectangle(x=0, y=0, width=10, height=10))
+        item = canvas_model.getItems()[0]
+
+        canvas_model.updateItem(
+            0, {"geometry": {"x": 30, "y": 0, "width": 10, "height": 10}}
+        )
+        assert canvas_model.undo()
+        assert canvas_model.getItems()[0] is item
+        assert item.geometry.x == 0
+        assert canvas_model.redo()
+        assert item.geometry.x == 30
+
+
+class TestCanvasModelBulkUpdate:
+    """Tests for updateItems batch patching."""
+
+    def test_update_items_applies_all(self, canvas_model):
+        for i in range(3):
+            canvas_model.addItem(make_rectangle(name=f"R{i}"))
+
+        canvas_model.updateItems([(0, {"name": "A"}), [2, {"visible": False}]])
+
+        items = canvas_model.getItems()
+        assert items[0].name == "A"
+        assert items[1].name == "R1"
+        assert items[2].visible is False
+
+    def test_update_items_emits_single_batch(self, canvas_model, qtbot):
+        for i in range(4):
+            canvas_model.addItem(make_rectangle(name=f"R{i}"))
+        per_item = []
+        ranges = []
+        canvas_model.itemModified.connect(lambda *args: per_item.append(args))
+        canvas_model.dataChanged.connect(
+            lambda top, bottom, _roles: ranges.append((top.row(), bottom.row()))
+        )
+
+        with qtbot.waitSignal(canvas_model.itemsModified, timeout=1000) as blocker:
+            canvas_model.updateItems([(i, {"locked": True}) for i in (3, 0, 1)])
+
+        assert blocker.args == [[0, 1, 3]]
+        assert per_item == []
+        assert ranges == [(0, 1), (3, 3)]
+
+    def test_update_items_single_undo_step(self, canvas_model):
+        for i in range(3):
+            canvas_model.addItem(make_rectangle(name=f"R{i}"))
+        depth = len(canvas_model._history._undo_stack)
+
+        canvas_model.updateItems([(i, {"name": f"N{i}"}) for i in range(3)])
+
+        assert len(canvas_model._history._undo_stack) == depth + 1
+        assert canvas_model.undo()
+        assert [item.name for item in canvas_model.getItems()] == ["R0", "R1", "R2"]
+        assert canvas_model.redo()
+        assert [item.name for item in canvas_model.getItems()] == ["N0", "N1", "N2"]
+
+    def test_update_items_invalid_entry_rejects_batch(self, canvas_model):
+        canvas_model.addItem(make_text(name="T", font_size=20))
+        canvas_model.addItem(make_rectangle(name="R"))
+
+        canvas_model.updateItems([(1, {"name": "S"}), (0, {"fontSize": "huge"})])
+        canvas_model.updateItems([(5, {"name": "S"})])
+
+        assert canvas_model.getItems()[1].name == "R"
+
+    def test_update_items_undo_emits_single_batch(self, canvas_model, qtbot):
+        for i in range(3):
+            canvas_model.addItem(make_rectangle(name=f"R{i}"))
+        canvas_model.updateItems([(i, {"name": f"N{i}"}) for i in range(3)])
+
+        with qtbot.waitSignal(canvas_model.itemsModified, timeout=1000) as blocker:
+            canvas_model.undo()
+
+        assert blocker.args == [[0, 1, 2]]
+
 
 class TestCanvasModelDataRoles:
     """Tests for data roles in CanvasModel."""
@@ -220,8 +334,9 @@ class TestCanvasModelDataRolesExtended:
                 lambda: [make_rectangle(x=0, y=0, width=50, height=50)],
                 0,
                 "item_id_none",
-                lambda model, idx: model.data(model.index(idx, 0), model.ItemIdRole)
-                is None,
+                lambda model, idx: (
+                    model.data(model.index(idx, 0), model.ItemIdRole) is None
+                ),
             ),
             (
                 lambda: [
@@ -230,8 +345,9 @@ class TestCanvasModelDataRolesExtended:
                 ],
                 1,
                 "parent_none",
-                lambda model, idx: model.data(model.index(idx, 0), model.ParentIdRole)
-                is None,
+                lambda model, idx: (
+                    model.data(model.index(idx, 0), model.ParentIdRole) is None
+                ),
             ),
         ],
     )
@@ -296,6 +412,120 @@ class TestCanvasModelMoveItems:
         assert items[1].name == "A"
         assert items[2].name == "B"
 
+    def test_move_item_emits_moved_range(self, canvas_model, qtbot):
+        """Reordering uses row moves and reports the moved range."""
+        for name in ("A", "B", "C"):
+            canvas_model.addItem(make_rectangle(name=name))
+        resets = []
+        canvas_model.modelReset.connect(lambda: resets.append(True))
+
+        with qtbot.waitSignal(canvas_model.itemsMoved) as blocker:
+            canvas_model.moveItem(0, 2)
+
+        assert blocker.args == [0, 0, 3]
+        assert resets == []
+
+    def test_move_container_moves_block_without_reset(self, canvas_model, qtbot):
+        """A container and its descendants move as one row block."""
+        canvas_model.addItem(make_rectangle(name="A"))
+        canvas_model.addItem(make_artboard(name="Board", artboard_id="ab1"))
+        canvas_model.addItem(make_rectangle(name="Child", parent_id="ab1"))
+        canvas_model.addItem(make_rectangle(name="B"))
+        spatial_size = len(canvas_model._spatial_index)
+        resets = []
+        canvas_model.modelReset.connect(lambda: resets.append(True))
+
+        with qtbot.waitSignal(canvas_model.itemsMoved) as blocker:
+            canvas_model.moveItem(1, 0)
+
+        assert blocker.args == [1, 2, 0]
+        names = [item.name for item in canvas_model.getItems()]
+        assert names == ["Board", "Child", "A", "B"]
+        assert resets == []
+        assert len(canvas_model._spatial_index) == spatial_size
+
+    def test_move_container_is_undoable(self, canvas_model, history_manager):
+        """Container reorders are recorded and undo restores the order."""
+        canvas_model.addItem(make_artboard(name="Board", artboard_id="ab1"))
+        canvas_model.addItem(make_rectangle(name="Child", parent_id="ab1"))
+        canvas_model.addItem(make_rectangle(name="A"))
+        canvas_model.addItem(make_rectangle(name="B"))
+        before = list(canvas_model.getItems())
+
+        canvas_model.moveItem(0, 3)
+        assert [item.name for item in canvas_model.getItems()] == [
+            "A",
+            "B",
+            "Board",
+            "Child",
+        ]
+
+        history_manager.undo()
+        assert canvas_model.getItems() == before
+
+
+class TestCanvasModelLoadItems:
+    """Tests for the bulk document load path."""
+
+    def test_load_items_replaces_contents_with_one_reset(self, canvas_model, qtbot):
+        """loadItems swaps in all items under a single model reset."""
+        canvas_model.addItem(make_rectangle(name="Old"))
+        added = []
+        canvas_model.itemAdded.connect(added.append)
+
+        with qtbot.waitSignal(canvas_model.modelReset):
+            count = canvas_model.loadItems(
+                [make_rectangle(name=f"R{i}", x=i * 20) for i in range(50)]
+            )
+
+        assert count == 50
+        assert canvas_model.count() == 50
+        assert canvas_model.getItems()[0].name == "R0"
+        assert added == []
+        assert len(canvas_model._spatial_index) == 50
+
+    def test_load_items_skips_history(self, canvas_model, history_manager):
+        """Loading is not undoable and drops the previous history."""
+        canvas_model.addItem(make_rectangle(name="Old"))
+
+        canvas_model.loadItems([make_rectangle(name="New")])
+
+        assert not history_manager.can_undo
+        assert canvas_model.getItems()[0].name == "New"
+
+    def test_load_items_skips_invalid_entries(self, canvas_model):
+        """Invalid entries are skipped instead of aborting the load."""
+        count = canvas_model.loadItems(
+            [make_rectangle(name="Good"), {"type": "bogus"}, make_ellipse()]
+        )
+
+        assert count == 2
+        assert canvas_model.getItems()[1].name == "Ellipse 1"
+
+    def test_load_items_consumes_generator(self, canvas_model):
+        """Items can stream in from a generator."""
+        count = canvas_model.loadItems(make_rectangle(name=f"R{i}") for i in range(3))
+
+        assert count == 3
+
+    def test_failed_stream_leaves_model_unchanged(self, canvas_model, qtbot):
+        """An error from the item stream aborts the load before any reset."""
+        canvas_model.addItem(make_rectangle())
+        resets = []
+        canvas_model.modelReset.connect(lambda: resets.append(True))
+
+        def broken():
+            yield make_ellipse()
+            raise ValueError("truncated")
+
+        with pytest.raises(ValueError):
+            canvas_model.loadItems(broken())
+
+        assert resets == []
+        assert canvas_model.count() == 1
+        canvas_model.addItem(make_rectangle())
+        assert canvas_model.getItems()[1].name == "Rectangle 2"
+
 
 class TestCanvasModelText:
     """Tests for text items in the model."""
@@ -408,6 +638,57 @@ class TestCanvasModelUndoRedo:
         assert history_manager.canRedo is True
 
 
+class TestCanvasModelCoalescing:
+    """Rapid repeated edits of the same target share one history entry."""
+
+    def test_scrubbed_property_is_one_step(self, canvas_model, history_manager):
+        canvas_model.addItem(make_rectangle(name="Box"))
+        for opacity in (0.2, 0.4, 0.6):
+            canvas_model.updateItem(
+                0,
+                {
+                    "appearances": [
+                        {"type": "fill", "color": "#fff", "opacity": opacity}
+                    ]
+                },
+            )
+
+        assert len(history_manager.undoDescriptions) == 2
+        history_manager.undo()
+        assert canvas_model.getItems()[0].appearances[0].opacity == 0.0
+
+    def test_different_keys_stay_separate(self, canvas_model, history_manager):
+        canvas_model.addItem(make_rectangle(name="Box"))
+        canvas_model.updateItem(0, {"name": "Renamed"})
+        canvas_model.updateItem(0, {"visible": False})
+
+        assert len(history_manager.undoDescriptions) == 3
+
+    def test_nudges_coalesce_and_undo_together(self, canvas_model, history_manager):
+        canvas_model.addItem(make_rectangle(x=0, y=0))
+        for _ in range(4):
+            canvas_model.moveItems([0], 1, 0)
+
+        assert len(history_manager.undoDescriptions) == 2
+        assert canvas_model.getItems()[0].transform.translate_x == 4
+        history_manager.undo()
+        assert canvas_model.getItems()[0].transform.translate_x == 0
+        history_manager.redo()
+        assert canvas_model.getItems()[0].transform.translate_x == 4
+
+    def test_repeated_multi_nudges_coalesce(self, canvas_model, history_manager):
+        canvas_model.addItem(make_rectangle(x=0, y=0))
+        canvas_model.addItem(make_ellipse(center_x=0, center_y=0))
+        for _ in range(4):
+            canvas_model.moveItems([0, 1], 2, 0)
+
+        assert history_manager.undoDescriptions[-1] == "Move Items"
+        assert len(history_manager.undoDescriptions) == 3
+        history_manager.undo()
+        assert canvas_model.getItems()[0].transform.translate_x == 0
+        assert canvas_model.getItems()[1].transform.translate_x == 0
+
+
 class TestCanvasModelTransaction:
     """Tests for transaction batching."""
 
@@ -437,6 +718,48 @@ class TestCanvasModelTransaction:
         assert items[0].geometry.x == 0
         assert items[1].geometry.x == 10
 
+    def test_transaction_snapshots_only_touched_items(self, canvas_model):
+        for i in range(5):
+            canvas_model.addItem(make_rectangle(name=f"R{i}"))
+
+        canvas_model.beginTransaction()
+        assert canvas_model._transaction_snapshot == {}
+        canvas_model.updateItem(3, {"name": "X"})
+        canvas_model.updateItem(3, {"name": "Y"})
+
+        assert list(canvas_model._transaction_snapshot) == [3]
+        assert canvas_model._transaction_snapshot[3]["name"] == "R3"
+        canvas_model.endTransaction()
+
+        assert canvas_model._history.undoDescriptions[-1] == "Rename 'Y'"
+        canvas_model.undo()
+        assert canvas_model.getItems()[3].name == "R3"
+
+    def test_transaction_without_changes_records_nothing(self, canvas_model):
+        canvas_model.addItem(make_rectangle(name="A"))
+        depth = len(canvas_model._history._undo_stack)
+
+        canvas_model.beginTransaction()
+        canvas_model.updateItem(0, {"name": "B"})
+        canvas_model.updateItem(0, {"name": "A"})
+        canvas_model.endTransaction()
+
+        assert len(canvas_model._history._undo_stack) == depth
+
+    def test_transaction_captures_moves(self, canvas_model):
+        canvas_model.addItem(make_rectangle(x=0, y=0))
+
+        canvas_model.beginTransaction()
+        canvas_model.moveItems([0], 5, 5)
+        canvas_model.moveItems([0], 5, 5)
+        canvas_model.endTransaction()
+
+        assert canvas_model.getItems()[0].transform.translate_x == 10
+        canvas_model.undo()
+        assert canvas_model.getItems()[0].transform.translate_x == 0
+        canvas_model.redo()
+        assert canvas_model.getItems()[0].transform.translate_x == 10
+
 
 class TestCanvasModelRoleNames:
     """Tests for roleNames method."""
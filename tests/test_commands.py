@@ -108,6 +108,21 @@ class TestAddItemCommand:
         cmd.undo()  # Should not raise
         assert canvas_model.count() == 0
 
+    def test_validated_payload_skips_second_parse(self, canvas_model, monkeypatch):
+        """Pre-validated data is stored as-is rather than parsed again."""
+        import lucent.commands as commands
+        from lucent.item_schema import parse_item_data
+
+        data = parse_item_data(make_rectangle(name="Checked")).data
+        monkeypatch.setattr(
+            commands, "parse_item_data", lambda _d: pytest.fail("parsed twice")
+        )
+
+        cmd = AddItemCommand(canvas_model, data, validated=True)
+        cmd.execute()
+
+        assert canvas_model.getItems()[0].name == "Checked"
+
 
 class TestRemoveItemCommand:
     """Tests for RemoveItemCommand."""
@@ -179,6 +194,66 @@ class TestUpdateItemCommand:
         # Position changed, so description should reflect that
         assert "Move" in cmd.description or "Rectangle" in cmd.description
 
+    def _long_path(self, name="Path"):
+        points = [{"x": float(i), "y": float(i % 7)} for i in range(200)]
+        return make_path(points, name=name)
+
+    def test_rename_stores_only_changed_key(self, canvas_model):
+        """A rename of a large path records just the name in both directions."""
+        old_data = self._long_path("Before")
+        canvas_model.addItem(old_data)
+        new_data = self._long_path("After")
+
+        cmd = UpdateItemCommand(canvas_model, 0, old_data, new_data)
+
+        assert cmd._before == [(("name",), "Before")]
+        assert cmd._after == [(("name",), "After")]
+        assert cmd.size_estimate() < 2000
+
+    def test_point_edit_records_leaf_paths(self, canvas_model):
+        """Moving one path point records only that point's coordinates."""
+        old_data = self._long_path()
+        canvas_model.addItem(old_data)
+        new_data = self._long_path()
+        new_data["geometry"]["points"][42] = {"x": 500.0, "y": -5.0}
+        cmd = UpdateItemCommand(canvas_model, 0, old_data, new_data)
+
+        assert sorted(path for path, _ in cmd._after) == [
+            ("geometry", "points", 42, "x"),
+            ("geometry", "points", 42, "y"),
+        ]
+        cmd.execute()
+        assert canvas_model.getItems()[0].geometry.points[42] == {
+            "x": 500.0,
+            "y": -5.0,
+        }
+        cmd.undo()
+        assert canvas_model.getItems()[0].geometry.points[42] == {"x": 42.0, "y": 0.0}
+
+    def test_added_and_removed_keys_round_trip(self, canvas_model):
+        """Keys present on only one side are removed again on undo."""
+        old_data = make_rectangle(name="Box")
+        canvas_model.addItem(old_data)
+        new_data = dict(old_data, transform={"rotate": 30})
+        cmd = UpdateItemCommand(canvas_model, 0, old_data, new_data)
+
+        cmd.execute()
+        assert canvas_model.getItems()[0].transform.rotate == 30
+        cmd.undo()
+        assert "transform" not in canvas_model.getItemData(0)
+
+    def test_type_change_keeps_full_payloads(self, canvas_model):
+        """Changing the item type replaces the whole item both ways."""
+        old_data = make_rectangle(name="Shape")
+        canvas_model.addItem(old_data)
+        new_data = make_ellipse(name="Shape")
+        cmd = UpdateItemCommand(canvas_model, 0, old_data, new_data)
+
+        cmd.execute()
+        assert isinstance(canvas_model.getItems()[0], EllipseItem)
+        cmd.undo()
+        assert isinstance(canvas_model.getItems()[0], RectangleItem)
+
 
 class TestClearCommand:
     """Tests for ClearCommand."""
@@ -482,6 +557,139 @@ class TestGroupItemsCommand:
 
         assert canvas_model.count() == 1
 
+    def test_artboard_in_selection_does_nothing(self, canvas_model):
+        """An artboard cannot be parented, so the command moves no rows."""
+        canvas_model.addItem(make_rectangle(name="Rect1"))
+        canvas_model.addItem(make_artboard(name="Board"))
+        canvas_model.addItem(make_rectangle(name="Rect2"))
+        cmd = GroupItemsCommand(canvas_model, [0, 1])
+
+        cmd.execute()
+
+        assert cmd.result_index is None
+        assert [item.name for item in canvas_model.getItems()] == [
+            "Rect1",
+            "Board",
+            "Rect2",
+        ]
+
+    def test_group_items_skips_artboards(self, canvas_model):
+        """groupItems groups the rest of a selection containing an artboard."""
+        canvas_model.addItem(make_rectangle(name="Rect1"))
+        canvas_model.addItem(make_artboard(name="Board"))
+        canvas_model.addItem(make_rectangle(name="Rect2"))
+        before = [canvas_model.getItemData(i) for i in range(3)]
+
+        group_idx = canvas_model.groupItems([0, 1, 2])
+
+        items = canvas_model.getItems()
+        group = items[group_idx]
+        assert isinstance(group, GroupItem)
+        children = [i.name for i in items if getattr(i, "parent_id", None) == group.id]
+        assert children == [
+            "Rect1",
+            "Rect2",
+        ]
+        assert [item.name for item in items] == ["Board", "Rect1", "Rect2", "Group"]
+
+        canvas_model.undo()
+
+        assert [canvas_model.getItemData(i) for i in range(3)] == before
+        assert canvas_model.count() == 3
+
+    def test_group_items_with_only_artboards_records_nothing(self, canvas_model):
+        """Grouping nothing but artboards leaves no undo entry."""
+        canvas_model.addItem(make_artboard(name="Board"))
+        history = canvas_model._history
+        depth = len(history.undoDescriptions)
+
+        assert canvas_model.groupItems([0]) == -1
+        assert len(history.undoDescriptions) == depth
+
+    def _expected_group_order(self, names, selected):
+        """Reference ordering: unselected rows with the block spliced in."""
+        remaining = [n for i, n in enumerate(names) if i not in selected]
+        picked = [names[i] for i in sorted(selected)]
+        slot = min(max(selected), len(remaining))
+        return remaining[:slot] + picked + ["Group"] + remaining[slot:]
+
+    @pytest.mark.parametrize(
+        "selected", [[0, 1], [1, 4], [0, 2, 5], [3, 4, 5], [0, 5], [2]]
+    )
+    def test_scattered_selection_order(self, canvas_model, selected):
+        """Grouping gathers the selection into the same order as before."""
+        names = [f"R{i}" for i in range(6)]
+        for name in names:
+            canvas_model.addItem(make_rectangle(name=name))
+        cmd = GroupItemsCommand(canvas_model, selected)
+        cmd.execute()
+
+        order = [item.name for item in canvas_model.getItems()]
+        assert order == self._expected_group_order(names, selected)
+        assert order[cmd.result_index] == "Group"
+
+    def test_execute_does_not_reset_model(self, canvas_model, qtbot):
+        """Grouping uses row moves and one insert instead of a model reset."""
+        for i in range(5):
+            canvas_model.addItem(make_rectangle(name=f"R{i}"))
+        resets = []
+        canvas_model.modelReset.connect(lambda: resets.append(True))
+        moves = []
+        canvas_model.itemsMoved.connect(lambda *args: moves.append(args))
+
+        cmd = GroupItemsCommand(canvas_model, [0, 3])
+        cmd.execute()
+        cmd.undo()
+
+        assert resets == []
+        assert moves
+
+    def test_undo_restores_exact_order_and_parents(self, canvas_model):
+        """Undo puts the same item objects back in place with their parents."""
+        canvas_model.addItem(make_artboard(name="Board", artboard_id="ab1"))
+        for i in range(5):
+            canvas_model.addItem(make_rectangle(name=f"R{i}", parent_id="ab1"))
+        canvas_model.addItem(make_rectangle(name="Loose"))
+        before = list(canvas_model.getItems())
+        parents = [getattr(item, "parent_id", None) for item in before]
+
+        cmd = GroupItemsCommand(canvas_model, [1, 3, 6])
+        cmd.execute()
+        cmd.undo()
+
+        after = canvas_model.getItems()
+        assert [id(item) for item in after] == [id(item) for item in before]
+        assert [getattr(item, "parent_id", None) for item in after] == parents
+
+    def test_execute_preserves_item_identity(self, canvas_model):
+        """Grouped items are reparented in place, not rebuilt."""
+        canvas_model.addItem(make_rectangle(name="Rect1"))
+        canvas_model.addItem(make_rectangle(name="Rect2"))
+        originals = {id(item) for item in canvas_model.getItems()}
+
+        cmd = GroupItemsCommand(canvas_model, [0, 1])
+        cmd.execute()
+
+        group = canvas_model.getItems()[cmd.result_index]
+        children = [
+            item
+            for item in canvas_model.getItems()
+            if getattr(item, "parent_id", None) == group.id
+        ]
+        assert {id(item) for item in children} == originals
+
+    def test_redo_after_undo_regroups(self, canvas_model):
+        """Executing again after undo reproduces the grouped order."""
+        for i in range(4):
+            canvas_model.addItem(make_rectangle(name=f"R{i}"))
+        cmd = GroupItemsCommand(canvas_model, [0, 2])
+        cmd.execute()
+        grouped = [item.name for item in canvas_model.getItems()]
+        cmd.undo()
+        cmd.execute()
+
+        assert [item.name for item in canvas_model.getItems()] == grouped
+
 
 class TestUngroupItemsCommand:
     """Tests for UngroupItemsCommand."""
@@ -547,6 +755,40 @@ class TestUngroupItemsCommand:
         cmd = UngroupItemsCommand(canvas_model, 999)
         cmd.execute()  # Should not raise
 
+    def test_ungroup_keeps_children_in_place(self, canvas_model):
+        """Ungrouping removes only the group row and reparents its children."""
+        canvas_model.addItem(make_artboard(name="Board", artboard_id="ab1"))
+        canvas_model.addItem(make_group(name="G", group_id="g1", parent_id="ab1"))
+        canvas_model.addItem(make_rectangle(name="A", parent_id="g1"))
+        canvas_model.addItem(make_rectangle(name="B", parent_id="g1"))
+        children = canvas_model.getItems()[2:]
+        resets = []
+        canvas_model.modelReset.connect(lambda: resets.append(True))
+
+        cmd = UngroupItemsCommand(canvas_model, 1)
+        cmd.execute()
+
+        items = canvas_model.getItems()
+        assert [item.name for item in items] == ["Board", "A", "B"]
+        assert items[1:] == children
+        assert all(item.parent_id == "ab1" for item in children)
+        assert resets == []
+
+    def test_undo_restores_group_object_and_parents(self, canvas_model):
+        """Undo reinserts the original group and restores child parents."""
+        canvas_model.addItem(make_rectangle(name="A"))
+        canvas_model.addItem(make_group(name="G", group_id="g1"))
+        canvas_model.addItem(make_rectangle(name="B", parent_id="g1"))
+        before = list(canvas_model.getItems())
+
+        cmd = UngroupItemsCommand(canvas_model, 1)
+        cmd.execute()
+        cmd.undo()
+
+        after = canvas_model.getItems()
+        assert after == before
+        assert after[2].parent_id == "g1"
+
 
 class TestRemoveItemCommandWithContainers:
     """Tests for RemoveItemCommand with container items."""
@@ -0,0 +1,206 @@
+# Copyright (C) 2026 The Culture List, Inc.
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""Tests for the binary .lucent v2 container."""
+
+import io
+import json
+from pathlib import Path
+
+import pytest
+
+from lucent.container import (
+    MAGIC,
+    ContainerError,
+    ContainerReader,
+    ContainerWriter,
+    iter_records,
+    pack_item,
+    unpack_items,
+    write_container,
+)
+from lucent.file_io import (
+    LUCENT_VERSION,
+    FileVersionError,
+    load_document,
+    save_document,
+)
+from test_helpers import make_path, make_rectangle
+
+VIEWPORT = {"zoomLevel": 1.0, "offsetX": 0, "offsetY": 0}
+
+
+def _round_trip(item):
+    return list(unpack_items(pack_item(item)))
+
+
+class TestItemRecords:
+    """Item records pack path points into float arrays."""
+
+    def test_path_points_round_trip(self):
+        points = [
+            {"x": 0.0, "y": 1.5},
+            {"x": 10.0, "y": 2.0, "handleIn": {"x": 8.0, "y": 2.0}},
+            {"x": 20.0, "y": 0.0, "handleOut": {"x": 25.0, "y": -3.0}},
+        ]
+        item = make_path(points=points, closed=True, name="P")
+
+        assert _round_trip(item) == [item]
+
+    def test_path_points_are_not_json(self):
+        item = make_path(points=[{"x": 123456.5, "y": 0}, {"x": 1, "y": 654321.5}])
+
+        record = pack_item(item)
+
+        assert b"123456.5" not in record
+        assert b"packedPoints" in record
+
+    def test_unusual_points_stay_json(self):
+        points = [{"x": 0, "y": 0, "extra": 1}, {"x": "1", "y": 2}]
+        item = make_path(points=points)
+
+        assert b'"extra"' in pack_item(item)
+        assert _round_trip(item) == [item]
+
+    def test_non_path_items_round_trip(self):
+        items = [make_rectangle(name="A"), {"type": "group", "name": "G"}]
+        data = b"".join(pack_item(item) for item in items)
+
+        assert list(unpack_items(data)) == items
+
+    def test_records_split_across_chunks(self):
+        items = [make_rectangle(name=f"R{i}") for i in range(5)]
+        items.append(make_path(points=[{"x": 0, "y": 0}, {"x": 1, "y": 1}]))
+        data = b"".join(pack_item(item) for item in items)
+        chunks = [data[i : i + 7] for i in range(0, len(data), 7)]
+
+        assert list(iter_records(chunks)) == items
+
+    def test_truncated_record_raises(self):
+        record = pack_item(make_rectangle())
+
+        with pytest.raises(ContainerError):
+            list(unpack_items(record[:-3]))
+
+
+class TestContainer:
+    """Sections, table of contents and codecs."""
+
+    @pytest.mark.parametrize("codec", ["zlib", "lzma", "none"])
+    def test_sections_round_trip(self, tmp_path: Path, codec):
+        file_path = tmp_path / "c.lucent"
+        with open(file_path, "wb") as f:
+            write_container(f, [("a", b"alpha"), ("b", b"beta" * 100)], 2, codec)
+
+        with ContainerReader(file_path) as reader:
+            assert reader.version == 2
+            assert reader.section_names == ["a", "b"]
+            assert reader.read_section("b") == b"beta" * 100
+            assert reader.read_section("a") == b"alpha"
+
+    @pytest.mark.parametrize("codec", ["zlib", "lzma", "none"])
+    def test_streamed_section_in_bounded_chunks(self, tmp_path: Path, codec):
+        file_path = tmp_path / "s.lucent"
+        payload = bytes(range(256)) * 400
+        with open(file_path, "wb") as f:
+            writer = ContainerWriter(f, 2, codec)
+            writer.begin_section("data")
+            for i in range(0, len(payload), 1000):
+                writer.write(payload[i : i + 1000])
+            writer.end_section()
+            writer.close()
+
+        with ContainerReader(file_path) as reader:
+            chunks = list(reader.iter_section("data", chunk_size=4096))
+
+        assert b"".join(chunks) == payload
+        assert max(len(chunk) for chunk in chunks) <= 4096
+
+    def test_unknown_codec_rejected(self):
+        with pytest.raises(ValueError):
+            write_container(io.BytesIO(), [("a", b"")], 2, "brotli")
+
+    def test_truncated_file_raises(self, tmp_path: Path):
+        file_path = tmp_path / "t.lucent"
+        save_document(file_path, [make_rectangle()], VIEWPORT, {"name": "T"})
+        data = file_path.read_bytes()
+        file_path.write_bytes(data[: len(data) // 2])
+
+        with pytest.raises(ValueError):
+            load_document(file_path)
+
+    def test_missing_section_raises(self, tmp_path: Path):
+        file_path = tmp_path / "m.lucent"
+        with open(file_path, "wb") as f:
+            write_container(f, [("document", b"{}")], 2)
+
+        with pytest.raises(ContainerError):
+            load_document(file_path)
+
+
+class TestDocumentFormat:
+    """save_document writes v2 containers; v1 JSON still loads."""
+
+    def test_save_writes_binary_container(self, tmp_path: Path):
+        file_path = tmp_path / "doc.lucent"
+        save_document(file_path, [], VIEWPORT, {"name": "Doc"})
+
+        assert file_path.read_bytes().startswith(MAGIC)
+        with ContainerReader(file_path) as reader:
+            assert reader.version == LUCENT_VERSION
+            assert set(reader.section_names) >= {"document", "items"}
+
+    @pytest.mark.parametrize("compression", ["zlib", "lzma", "none"])
+    def test_round_trip(self, tmp_path: Path, compression):
+        file_path = tmp_path / "doc.lucent"
+        items = [
+            make_rectangle(name="R"),
+            make_path(points=[{"x": 0, "y": 0}, {"x": 5, "y": 5}], name="P"),
+        ]
+        meta = {"name": "Doc", "documentDPI": 144}
+
+        save_document(file_path, items, VIEWPORT, meta, compression=compression)
+        data = load_document(file_path)
+
+        assert data["items"] == items
+        assert data["viewport"] == VIEWPORT
+        assert data["meta"] == meta
+
+    def test_save_consumes_generator(self, tmp_path: Path):
+        file_path = tmp_path / "gen.lucent"
+        items = [make_rectangle(name=f"R{i}") for i in range(10)]
+
+        save_document(file_path, (dict(item) for item in items), VIEWPORT, {})
+
+        assert load_document(file_path)["items"] == items
+
+    def test_failed_save_keeps_previous_file(self, tmp_path: Path):
+        file_path = tmp_path / "keep.lucent"
+        save_document(file_path, [make_rectangle(name="Old")], VIEWPORT, {})
+
+        def broken():
+            yield make_rectangle(name="New")
+            raise RuntimeError("serialization failed")
+
+        with pytest.raises(RuntimeError):
+            save_document(file_path, broken(), VIEWPORT, {})
+
+        assert load_document(file_path)["items"][0]["name"] == "Old"
+        assert [p.name for p in tmp_path.iterdir()] == ["keep.lucent"]
+
+    def test_v1_json_still_loads(self, tmp_path: Path):
+        file_path = tmp_path / "old.lucent"
+        item = make_rectangle(name="Old")
+        file_path.write_text(
+            json.dumps({"version": 1, "items": [item], "viewport": VIEWPORT})
+        )
+
+        assert load_document(file_path)["items"] == [item]
+
+    def test_newer_container_version_rejected(self, tmp_path: Path):
+        file_path = tmp_path / "future.lucent"
+        with open(file_path, "wb") as f:
+            write_container(f, [("document", b"{}"), ("items", b"")], 99)
+
+        with pytest.raises(FileVersionError):
+            load_document(file_path)
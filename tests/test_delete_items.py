@@ -208,3 +208,71 @@ class TestDeleteItemsEdgeCases:
 
         assert deleted == 2
         assert canvas_model.count() == 0
+
+
+class TestDeleteItemsBulk:
+    """Test the single-pass bulk removal path."""
+
+    def test_bulk_delete_emits_one_notification(self, canvas_model, qtbot):
+        """Bulk deletes report all removed rows in one itemsRemoved signal."""
+        for i in range(6):
+            canvas_model.addItem(make_rectangle(name=f"R{i}"))
+        removed_single = []
+        canvas_model.itemRemoved.connect(removed_single.append)
+
+        with qtbot.waitSignal(canvas_model.itemsRemoved) as blocker:
+            canvas_model.deleteItems([5, 0, 1, 3])
+
+        assert blocker.args == [[0, 1, 3, 5]]
+        assert removed_single == []
+        assert [item.name for item in canvas_model.getItems()] == ["R2", "R4"]
+
+    def test_bulk_delete_removes_contiguous_runs(self, canvas_model):
+        """Each contiguous run of rows is removed with one rowsRemoved."""
+        for i in range(6):
+            canvas_model.addItem(make_rectangle(name=f"R{i}"))
+        ranges = []
+        canvas_model.rowsRemoved.connect(
+            lambda _parent, first, last: ranges.append((first, last))
+        )
+
+        canvas_model.deleteItems([0, 1, 3, 4, 5])
+
+        assert ranges == [(3, 5), (0, 1)]
+
+    def test_undo_restores_order_and_objects(self, canvas_model):
+        """Undo reinserts the same item objects at their original rows."""
+        for i in range(6):
+            canvas_model.addItem(make_rectangle(name=f"R{i}"))
+        before = list(canvas_model.getItems())
+
+        canvas_model.deleteItems([1, 2, 4])
+        canvas_model.undo()
+
+        assert canvas_model.getItems() == before
+
+    def test_spatial_index_tracks_bulk_delete(self, canvas_model):
+        """Removed rows leave the spatial index and come back on undo."""
+        for i in range(4):
+            canvas_model.addItem(make_rectangle(x=i * 20, y=0, name=f"R{i}"))
+        kept = canvas_model.getItems()[3]
+        canvas_model.deleteItems([0, 1, 2])
+
+        assert len(canvas_model._spatial_index) == 1
+        assert id(kept) in canvas_model._spatial_index
+
+        canvas_model.undo()
+        assert len(canvas_model._spatial_index) == 4
+
+    def test_locked_children_survive_container_delete(self, canvas_model):
+        """Locked descendants are kept when their container is deleted."""
+        canvas_model.addItem(make_group(name="G", group_id="g1"))
+        canvas_model.addItem(make_rectangle(name="A", parent_id="g1"))
+        canvas_model.addItem(make_rectangle(name="B", parent_id="g1"))
+        canvas_model.addItem(make_rectangle(name="Other"))
+        canvas_model.updateItem(2, {"locked": True})
+
+        deleted = canvas_model.deleteItems([0])
+
+        assert deleted == 2
+        assert [item.name for item in canvas_model.getItems()] == ["B", "Other"]
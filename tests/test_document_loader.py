@@ -0,0 +1,189 @@
+# Copyright (C) 2026 The Culture List, Inc.
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""Tests for background document loading."""
+
+from pathlib import Path
+
+import pytest
+
+from lucent.canvas_model import CanvasModel
+from lucent.document_loader import DocumentLoader
+from lucent.document_manager import DocumentManager
+from lucent.file_io import open_document, save_document
+from lucent.history_manager import HistoryManager
+from test_helpers import make_ellipse, make_rectangle
+
+VIEWPORT = {"zoomLevel": 2.0, "offsetX": 10.0, "offsetY": -5.0}
+
+
+@pytest.fixture
+def canvas_model(qapp):
+    return CanvasModel(HistoryManager())
+
+
+def _write(path: Path, count: int, **kwargs) -> str:
+    items = [make_rectangle(x=i, name=f"R{i}") for i in range(count)]
+    save_document(path, items, VIEWPORT, {"name": "Doc"}, **kwargs)
+    return str(path)
+
+
+def _names(model):
+    return [item.name for item in model.getItems()]
+
+
+class TestDocumentLoader:
+    """DocumentLoader fills the model in batches from a worker thread."""
+
+    def test_loads_all_items_and_header(self, qtbot, canvas_model, tmp_path):
+        path = _write(tmp_path / "doc.lucent", 50)
+        loader = DocumentLoader(canvas_model, batch_size=8)
+
+        with qtbot.waitSignal(loader.finished) as blocker:
+            loader.start(path)
+
+        assert _names(canvas_model) == [f"R{i}" for i in range(50)]
+        assert blocker.args[0]["viewport"] == VIEWPORT
+        assert blocker.args[0]["meta"]["name"] == "Doc"
+        assert loader.active is False
+        assert loader.progress == 1.0
+
+    def test_batches_arrive_as_row_insertions(self, qtbot, canvas_model, tmp_path):
+        path = _write(tmp_path / "doc.lucent", 20)
+        loader = DocumentLoader(canvas_model, batch_size=5)
+        inserted = []
+        canvas_model.rowsInserted.connect(
+            lambda _parent, first, last: inserted.append(last - first + 1)
+        )
+
+        with qtbot.waitSignal(loader.finished):
+            loader.start(path)
+
+        assert inserted == [5, 5, 5, 5]
+        assert canvas_model._history.can_undo is False
+
+    def test_progress_increases(self, qtbot, canvas_model, tmp_path):
+        path = _write(tmp_path / "doc.lucent", 2000, compression="none")
+        loader = DocumentLoader(canvas_model, batch_size=100)
+        progress = []
+        loader.progressChanged.connect(progress.append)
+
+        with qtbot.waitSignal(loader.finished):
+            loader.start(path)
+
+        assert progress == sorted(progress)
+        assert len(progress) > 2
+        assert progress[-1] == 1.0
+
+    def test_invalid_items_are_skipped(self, qtbot, canvas_model, tmp_path, capsys):
+        path = tmp_path / "doc.lucent"
+        items = [make_rectangle(name="A"), {"type": "bogus"}, make_ellipse(name="B")]
+        save_document(path, items, VIEWPORT, {})
+        loader = DocumentLoader(canvas_model)
+
+        with qtbot.waitSignal(loader.finished):
+            loader.start(str(path))
+
+        assert _names(canvas_model) == ["A", "B"]
+        assert "Warning" in capsys.readouterr().out
+
+    def test_truncated_file_fails_and_restores(self, qtbot, canvas_model, tmp_path):
+        canvas_model.addItem(make_rectangle(name="Before"))
+        path = tmp_path / "bad.lucent"
+        _write(path, 500)
+        path.write_bytes(path.read_bytes()[:-40])
+        loader = DocumentLoader(canvas_model)
+
+        with qtbot.waitSignal(loader.failed) as blocker:
+            loader.start(str(path))
+
+        assert blocker.args[0]
+        assert _names(canvas_model) == ["Before"]
+
+    def test_cancel_restores_previous_items(self, qtbot, canvas_model, tmp_path):
+        canvas_model.addItem(make_rectangle(name=""))
+        path = _write(tmp_path / "doc.lucent", 2000)
+        loader = DocumentLoader(canvas_model, batch_size=10)
+        loader.progressChanged.connect(lambda _value: loader.cancel())
+
+        with qtbot.waitSignal(loader.cancelled):
+            loader.start(path)
+        loader.wait()
+        qtbot.wait(20)
+
+        assert loader.active is False
+        assert _names(canvas_model) == ["Rectangle 1"]
+        canvas_model.addItem(make_rectangle(name=""))
+        assert _names(canvas_model)[-1] == "Rectangle 2"
+
+
+class TestStreamProgress:
+    """DocumentStream.progress tracks bytes consumed from the file."""
+
+    def test_container_progress(self, tmp_path):
+        path = _write(tmp_path / "doc.lucent", 3000, compression="none")
+        seen = []
+
+        with open_document(path) as document:
+            for _item in document.items():
+                seen.append(document.progress)
+
+        assert seen == sorted(seen)
+        assert seen[0] < 0.5
+        assert seen[-1] == 1.0
+
+
+class TestOpenDocumentAsync:
+    """DocumentManager.openDocumentAsync opens files in the background."""
+
+    @pytest.fixture
+    def manager(self, canvas_model):
+        manager = DocumentManager(canvas_model)
+        manager.startTracking()
+        return manager
+
+    def test_open_async(self, qtbot, manager, canvas_model, tmp_path):
+        path = _write(tmp_path / "doc.lucent", 30)
+        loading = []
+        manager.loadingChanged.connect(lambda: loading.append(manager.loading))
+
+        with qtbot.waitSignal(manager.openFinished) as blocker:
+            assert manager.openDocumentAsync(path) is True
+
+        assert blocker.args == [True]
+        assert loading == [True, False]
+        assert len(canvas_model.getItems()) == 30
+        assert manager.filePath == path
+        assert manager.dirty is False
+        assert manager.getViewport() == VIEWPORT
+        assert manager._journal.active is True
+
+    def test_missing_file_does_not_start(self, manager, tmp_path):
+        assert manager.openDocumentAsync(str(tmp_path / "none.lucent")) is False
+        assert manager.loading is False
+
+    def test_cancel_keeps_previous_document(
+        self, qtbot, manager, canvas_model, tmp_path
+    ):
+        first = _write(tmp_path / "first.lucent", 3)
+        manager.openDocument(first)
+        second = _write(tmp_path / "second.lucent", 2000)
+        manager._loader.progressChanged.connect(lambda _value: manager.cancelOpen())
+
+        with qtbot.waitSignal(manager.openFinished) as blocker:
+            manager.openDocumentAsync(second)
+        manager._loader.wait()
+
+        assert blocker.args == [False]
+        assert manager.filePath == first
+        assert len(canvas_model.getItems()) == 3
+        assert manager._journal.path.startswith(first)
+        canvas_model.addItem(make_rectangle())
+        assert manager.dirty is True
+
+    def test_save_refused_while_loading(self, qtbot, manager, tmp_path):
+        path = _write(tmp_path / "doc.lucent", 10)
+
+        with qtbot.waitSignal(manager.openFinished):
+            manager.openDocumentAsync(path)
+            assert manager.saveDocumentAs(str(tmp_path / "other.lucent")) is False
@@ -10,7 +10,8 @@ from pathlib import Path
 from lucent.document_manager import DocumentManager
 from lucent.canvas_model import CanvasModel
 from lucent.history_manager import HistoryManager
-from lucent.file_io import LUCENT_VERSION
+from lucent.file_io import LUCENT_VERSION, load_document
+from lucent.journal import autosave_path_for
 from lucent.unit_settings import UnitSettings
 from test_helpers import make_artboard, make_rectangle
 
@@ -181,10 +182,8 @@ class TestSaveDocument:
 
         doc_manager.saveDocumentAs(str(file_path))
 
-        with open(file_path, "r") as f:
-            data = json.load(f)
+        data = load_document(file_path)
 
-        assert "version" in data
         assert "items" in data
         assert len(data["items"]) == 1
         assert data["items"][0]["name"] == "Test Rect"
@@ -326,6 +325,22 @@ class TestExportArtboard:
         assert captured["document_dpi"] == 250
         assert captured["target_dpi"] == 200
 
+    def test_open_truncated_file_keeps_current_document(
+        self, doc_manager: DocumentManager, canvas_model: CanvasModel, tmp_path: Path
+    ) -> None:
+        """A file that fails mid-stream leaves the open document intact."""
+        current = tmp_path / "current.lucent"
+        canvas_model.addItem(make_rectangle(name="Current"))
+        doc_manager.saveDocumentAs(str(current))
+        broken = tmp_path / "broken.lucent"
+        broken.write_text('{"version": 1, "items": [{"type": "rectangle"}, {"ty')
+
+        assert doc_manager.openDocument(str(broken)) is False
+
+        assert canvas_model.getItems()[0].name == "Current"
+        assert doc_manager.filePath == str(current)
+        assert doc_manager._journal.path.startswith(str(current))
+
     def test_open_nonexistent_file_returns_false(
         self, doc_manager: DocumentManager
     ) -> None:
@@ -361,3 +376,145 @@ class TestDocumentTitle:
 
         doc_manager.saveDocumentAs(str(second_path))
         assert doc_manager.documentTitle == "second"
+
+
+class TestAutosave:
+    """Tests for background autosave."""
+
+    def test_autosave_writes_sidecar_and_keeps_dirty(
+        self, qtbot, doc_manager: DocumentManager, canvas_model: CanvasModel, tmp_path
+    ) -> None:
+        file_path = tmp_path / "auto.lucent"
+        canvas_model.addItem(make_rectangle(name="First"))
+        doc_manager.saveDocumentAs(str(file_path))
+        saved = file_path.read_bytes()
+        canvas_model.addItem(make_rectangle(name="Second"))
+
+        with qtbot.waitSignal(doc_manager.autosaved) as blocker:
+            assert doc_manager.autosave() is True
+
+        assert blocker.args == [True]
+        assert doc_manager.dirty is True
+        assert file_path.read_bytes() == saved
+        autosave = load_document(autosave_path_for(str(file_path)))
+        assert [item["name"] for item in autosave["items"]] == ["First", "Second"]
+        # Nothing new to autosave until the next edit
+        assert doc_manager.autosave() is False
+
+    def test_edit_during_autosave_keeps_dirty(
+        self, qtbot, doc_manager: DocumentManager, canvas_model: CanvasModel, tmp_path
+    ) -> None:
+        file_path = tmp_path / "auto.lucent"
+        doc_manager.saveDocumentAs(str(file_path))
+        canvas_model.addItem(make_rectangle(name="Saved"))
+
+        with qtbot.waitSignal(doc_manager.autosaved):
+            doc_manager.autosave()
+            # Edits after the snapshot are not part of the autosave
+            canvas_model.addItem(make_rectangle(name="Later"))
+            canvas_model.updateItem(0, {"name": "Renamed"})
+
+        assert doc_manager.dirty is True
+        autosave = load_document(autosave_path_for(str(file_path)))
+        assert [item["name"] for item in autosave["items"]] == ["Saved"]
+
+    def test_journal_keeps_edits_after_snapshot(
+        self, qtbot, doc_manager: DocumentManager, canvas_model: CanvasModel, tmp_path
+    ) -> None:
+        file_path = tmp_path / "auto.lucent"
+        doc_manager.saveDocumentAs(str(file_path))
+        canvas_model.addItem(make_rectangle(name="Saved"))
+
+        with qtbot.waitSignal(doc_manager.autosaved):
+            doc_manager.autosave()
+            canvas_model.addItem(make_rectangle(name="Later"))
+        doc_manager._journal.flush()
+
+        recovered_model = CanvasModel(HistoryManager())
+        recovered = DocumentManager(recovered_model)
+        recovered.startTracking()
+        recovered.openDocument(str(file_path))
+        assert [item.name for item in recovered_model.getItems()] == [
+            "Saved",
+            "Later",
+        ]
+        assert recovered.dirty is True
+
+    def test_stale_autosave_is_discarded(
+        self, qtbot, doc_manager: DocumentManager, canvas_model: CanvasModel, tmp_path
+    ) -> None:
+        file_path = tmp_path / "auto.lucent"
+        doc_manager.saveDocumentAs(str(file_path))
+        canvas_model.addItem(make_rectangle(name="Autosaved"))
+        with qtbot.waitSignal(doc_manager.autosaved):
+            doc_manager.autosave()
+        doc_manager._journal.stop()
+
+        # The document is saved again elsewhere after the autosave was taken
+        other_model = CanvasModel(HistoryManager())
+        other = DocumentManager(other_model)
+        other_model.addItem(make_rectangle(name="Elsewhere"))
+        other.saveDocumentAs(str(file_path))
+        other.closeDocument()
+
+        recovered_model = CanvasModel(HistoryManager())
+        recovered = DocumentManager(recovered_model)
+        recovered.startTracking()
+        recovered.openDocument(str(file_path))
+
+        assert [item.name for item in recovered_model.getItems()] == ["Elsewhere"]
+        assert recovered.dirty is False
+        assert not Path(autosave_path_for(str(file_path))).exists()
+
+    def test_save_and_close_delete_autosave(
+        self, qtbot, doc_manager: DocumentManager, canvas_model: CanvasModel, tmp_path
+    ) -> None:
+        file_path = tmp_path / "auto.lucent"
+        autosave_path = Path(autosave_path_for(str(file_path)))
+        doc_manager.saveDocumentAs(str(file_path))
+
+        for finish in (doc_manager.saveDocument, doc_manager.closeDocument):
+            canvas_model.addItem(make_rectangle())
+            with qtbot.waitSignal(doc_manager.autosaved):
+                doc_manager.autosave()
+            assert autosave_path.exists()
+
+            finish()
+
+            assert not autosave_path.exists()
+
+    def test_autosave_skips_clean_or_untitled(
+        self, doc_manager: DocumentManager, canvas_model: CanvasModel, tmp_path
+    ) -> None:
+        canvas_model.addItem(make_rectangle())
+        assert doc_manager.autosave() is False
+
+        doc_manager.saveDocumentAs(str(tmp_path / "clean.lucent"))
+        assert doc_manager.autosave() is False
+
+    def test_save_waits_for_pending_autosave(
+        self, doc_manager: DocumentManager, canvas_model: CanvasModel, tmp_path
+    ) -> None:
+        file_path = tmp_path / "auto.lucent"
+        doc_manager.saveDocumentAs(str(file_path))
+        canvas_model.addItem(make_rectangle(name="Autosaved"))
+        doc_manager.autosave()
+        canvas_model.addItem(make_rectangle(name="Saved"))
+
+        doc_manager.saveDocument()
+
+        names = [item["name"] for item in load_document(file_path)["items"]]
+        assert names == ["Autosaved", "Saved"]
+        assert doc_manager.dirty is False
+
+    def test_autosave_interval_property(self, doc_manager: DocumentManager) -> None:
+        changes = []
+        doc_manager.autosaveIntervalChanged.connect(lambda: changes.append(True))
+
+        doc_manager.autosaveInterval = 5
+        assert doc_manager._autosave_timer.interval() == 5000
+        assert doc_manager._autosave_timer.isActive()
+
+        doc_manager.autosaveInterval = 0
+        assert not doc_manager._autosave_timer.isActive()
+        assert len(changes) == 2
@@ -0,0 +1,108 @@
+# Copyright (C) 2026 The Culture List, Inc.
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""Tests for the CanvasModel beginDrag/updateDrag/endDrag session API."""
+
+from test_helpers import make_rectangle, make_group, make_artboard
+
+
+# Uses canvas_model fixture from conftest.py
+
+
+def _translation(canvas_model, index):
+    transform = canvas_model.getItems()[index].transform
+    return transform.translate_x, transform.translate_y
+
+
+class TestDragSession:
+    """Drag sessions translate live items and record one undo step."""
+
+    def test_drag_translates_in_place(self, canvas_model):
+        canvas_model.addItem(make_rectangle(x=0, y=0))
+        item = canvas_model.getItems()[0]
+
+        canvas_model.beginDrag([0])
+        canvas_model.updateDrag(5, 2)
+        canvas_model.updateDrag(5, 3)
+
+        assert canvas_model.getItems()[0] is item
+        assert _translation(canvas_model, 0) == (10, 5)
+        assert canvas_model.isDragging()
+
+    def test_update_drag_emits_no_item_modifications(self, canvas_model):
+        canvas_model.addItem(make_rectangle())
+        modified = []
+        canvas_model.itemModified.connect(lambda *args: modified.append(args))
+        canvas_model.itemsModified.connect(lambda *args: modified.append(args))
+        moves = []
+        canvas_model.dragMoved.connect(lambda dx, dy: moves.append((dx, dy)))
+
+        canvas_model.beginDrag([0])
+        canvas_model.updateDrag(1, 1)
+        canvas_model.updateDrag(2, 0)
+
+        assert modified == []
+        assert moves == [(1, 1), (2, 0)]
+
+    def test_end_drag_records_single_undo_step(self, canvas_model):
+        canvas_model.addItem(make_rectangle(name="A"))
+        canvas_model.addItem(make_rectangle(name="B"))
+        depth = len(canvas_model._history._undo_stack)
+
+        canvas_model.beginDrag([0, 1])
+        for _ in range(10):
+            canvas_model.updateDrag(1, 2)
+        canvas_model.endDrag()
+
+        assert not canvas_model.isDragging()
+        assert len(canvas_model._history._undo_stack) == depth + 1
+        assert canvas_model._history.undoDescriptions[-1] == "Move Items"
+
+        canvas_model.undo()
+        assert _translation(canvas_model, 0) == (0, 0)
+        assert _translation(canvas_model, 1) == (0, 0)
+        canvas_model.redo()
+        assert _translation(canvas_model, 1) == (10, 20)
+
+    def test_end_drag_without_motion_records_nothing(self, canvas_model):
+        canvas_model.addItem(make_rectangle())
+        depth = len(canvas_model._history._undo_stack)
+
+        canvas_model.beginDrag([0])
+        canvas_model.endDrag()
+
+        assert len(canvas_model._history._undo_stack) == depth
+
+    def test_end_drag_updates_spatial_index(self, canvas_model):
+        canvas_model.addItem(make_rectangle(x=0, y=0, width=10, height=10))
+
+        canvas_model.beginDrag([0])
+        canvas_model.updateDrag(500, 500)
+        canvas_model.endDrag()
+
+        items = canvas_model.getRenderItemsInBounds(495, 495, 20, 20)
+        assert canvas_model.getItems()[0] in items
+
+    def test_drag_group_moves_children_not_locked(self, canvas_model):
+        canvas_model.addItem(make_group(name="G", group_id="g1"))
+        canvas_model.addItem(make_rectangle(name="A", parent_id="g1"))
+        canvas_model.addItem(make_rectangle(name="B", locked=True))
+
+        canvas_model.beginDrag([0, 2])
+        canvas_model.updateDrag(7, 0)
+        canvas_model.endDrag()
+
+        assert _translation(canvas_model, 1) == (7, 0)
+        assert _translation(canvas_model, 2) == (0, 0)
+
+    def test_drag_artboard_moves_position(self, canvas_model):
+        canvas_model.addItem(make_artboard(x=0, y=0, artboard_id="a1"))
+        canvas_model.addItem(make_rectangle(parent_id="a1"))
+
+        canvas_model.beginDrag([0])
+        canvas_model.updateDrag(3, 4)
+        canvas_model.endDrag()
+
+        assert canvas_model.getItems()[0].x == 3
+        assert canvas_model.getItems()[0].y == 4
+        assert _translation(canvas_model, 1) == (3, 4)
@@ -0,0 +1,125 @@
+# Copyright (C) 2026 The Culture List, Inc.
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""Tests for the lucent-export command."""
+
+from pathlib import Path
+
+import pytest
+from PySide6.QtGui import QColor, QImage
+
+from lucent.export_cli import EXIT_FAILED, EXIT_OK, document_jobs, main
+from lucent.file_io import save_document
+from test_helpers import make_artboard, make_artboard_with_children, make_rectangle
+
+
+def _write(path: Path, dpi: int = 72) -> str:
+    items = make_artboard_with_children(
+        [make_rectangle(width=10, height=10, fill_color="#ff0000", fill_opacity=1.0)],
+        width=10,
+        height=10,
+        name="Home",
+        artboard_id="home",
+    )
+    items.append(make_artboard(x=50, width=20, height=10, name="About"))
+    save_document(path, items, {}, {"documentDPI": dpi})
+    return str(path)
+
+
+class TestDocumentJobs:
+    """document_jobs turns a document's artboards into export jobs."""
+
+    def test_jobs_per_artboard_format_and_scale(self, tmp_path):
+        path = _write(tmp_path / "doc.lucent", dpi=300)
+
+        jobs = document_jobs(
+            Path(path), tmp_path, [], ["png", "svg"], [1, 2], padding=2
+        )
+
+        assert [Path(job.path).name for job in jobs] == [
+            "Home.png",
+            "Home@2x.png",
+            "Home.svg",
+            "About.png",
+            "About@2x.png",
+            "About.svg",
+        ]
+        assert jobs[0].bounds == (-2, -2, 14, 14)
+        assert [item["type"] for item in jobs[0].items] == ["rectangle"]
+        assert jobs[1].options.target_dpi == 600
+        assert jobs[3].items == ()
+
+    def test_selects_by_name_or_id(self, tmp_path):
+        path = Path(_write(tmp_path / "doc.lucent"))
+
+        assert len(document_jobs(path, tmp_path, ["home"], ["png"], [1])) == 1
+        assert len(document_jobs(path, tmp_path, ["About"], ["png"], [1])) == 1
+        with pytest.raises(LookupError):
+            document_jobs(path, tmp_path, ["Missing"], ["png"], [1])
+
+
+class TestMain:
+    """main() exports documents and reports the outcome in its exit status."""
+
+    def test_exports_in_process(self, qapp, tmp_path, capsys):
+        path = _write(tmp_path / "doc.lucent")
+        out = tmp_path / "out"
+
+        status = main([path, "-o", str(out), "-s", "1,2x", "-a", "Home", "-j", "1"])
+
+        assert status == EXIT_OK
+        assert sorted(p.name for p in out.iterdir()) == ["Home.png", "Home@2x.png"]
+        assert QImage(str(out / "Home@2x.png")).pixelColor(10, 10) == QColor("#ff0000")
+        assert str(out / "Home.png") in capsys.readouterr().out
+
+    def test_exports_in_parallel(self, tmp_path):
+        paths = [_write(tmp_path / name) for name in ("a.lucent", "b.lucent")]
+        out = tmp_path / "out"
+
+        status = main([*paths, "-o", str(out), "-f", "png,pdf", "-j", "2", "-q"])
+
+        assert status == EXIT_OK
+        assert sorted(p.name for p in (out / "b").iterdir()) == [
+            "About.pdf",
+            "About.png",
+            "Home.pdf",
+            "Home.png",
+        ]
+
+    def test_same_named_documents_get_separate_directories(self, qapp, tmp_path):
+        (tmp_path / "a").mkdir()
+        (tmp_path / "b").mkdir()
+        paths = [_write(tmp_path / d / "logo.lucent") for d in ("a", "b")]
+        out = tmp_path / "out"
+
+        status = main([*paths, "-o", str(out), "-j", "1", "-q"])
+
+        assert status == EXIT_OK
+        assert sorted(p.name for p in out.iterdir()) == ["logo", "logo 2"]
+        assert sorted(p.name for p in (out / "logo 2").iterdir()) == [
+            "About.png",
+            "Home.png",
+        ]
+
+    def test_unreadable_document_fails(self, qapp, tmp_path, capsys):
+        good = _write(tmp_path / "good.lucent")
+        bad = tmp_path / "bad.lucent"
+        bad.write_text("not a document")
+
+        status = main([str(bad), good, "-o", str(tmp_path / "out"), "-j", "1"])
+
+        assert status == EXIT_FAILED
+        assert "Error exporting" in capsys.readouterr().err
+        assert (tmp_path / "out" / "good" / "Home.png").exists()
+
+    def test_no_matching_artboard_fails(self, tmp_path):
+        path = _write(tmp_path / "doc.lucent")
+
+        assert main([path, "-a", "Missing", "-o", str(tmp_path), "-q"]) == EXIT_FAILED
+
+    def test_invalid_arguments(self, tmp_path, capsys):
+        with pytest.raises(SystemExit) as exc_info:
+            main([str(tmp_path / "doc.lucent"), "-f", "gif"])
+
+        assert exc_info.value.code == 2
+        assert "unknown export format" in capsys.readouterr().err
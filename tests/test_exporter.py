@@ -16,6 +16,7 @@ from lucent.exporter import (
     export_svg,
 )
 from lucent.geometry import RectGeometry
+from lucent.png_writer import PngWriter
 
 
 class _ExplodingItem:
@@ -67,17 +68,58 @@ def test_export_png_handles_paint_errors(tmp_path):
     assert (tmp_path / "out.png").exists()
 
 
-def test_export_png_returns_false_on_save_exception(tmp_path, monkeypatch):
-    def raise_save(self, *args, **kwargs):
-        raise RuntimeError("save failed")
-
-    monkeypatch.setattr(QImage, "save", raise_save, raising=True)
+def test_export_png_returns_false_on_write_error(tmp_path):
     options = ExportOptions()
     bounds = QRectF(0, 0, 10, 10)
-    result = export_png([], bounds, tmp_path / "out.png", options)
+    result = export_png([], bounds, tmp_path / "missing" / "out.png", options)
     assert result is False
 
 
+def test_failed_export_png_keeps_existing_file(tmp_path, monkeypatch):
+    path = tmp_path / "out.png"
+    path.write_bytes(b"previous export")
+    write_rows = PngWriter.write_rows
+    calls = []
+
+    def failing_write_rows(self, *args):
+        calls.append(args)
+        if len(calls) == 2:
+            raise OSError("disk full")
+        write_rows(self, *args)
+
+    monkeypatch.setattr(PngWriter, "write_rows", failing_write_rows)
+    items = [_make_rectangle_item(x=0, y=0, width=10, height=10)]
+    options = ExportOptions()
+
+    assert export_png(items, QRectF(0, 0, 10, 10), path, options, 10 * 4 * 2) is False
+    assert path.read_bytes() == b"previous export"
+    assert [p.name for p in tmp_path.iterdir()] == ["out.png"]
+
+
+def test_export_png_bands_match_single_band(tmp_path):
+    items = [
+        _make_rectangle_item(x=3, y=2, width=30, height=41),
+        RectangleItem(
+            geometry=RectGeometry(x=10, y=10, width=20, height=20),
+            appearances=[Fill("#ff0000", 0.5, True)],
+        ),
+    ]
+    bounds = QRectF(0, 0, 40, 50)
+    options = ExportOptions(document_dpi=72, target_dpi=216, background=None)
+
+    assert export_png(items, bounds, tmp_path / "one.png", options)
+    # 120 pixels wide: 7 rows per band, the last band partly filled
+    assert export_png(items, bounds, tmp_path / "bands.png", options, 120 * 4 * 7)
+
+    whole = QImage(str(tmp_path / "one.png"))
+    banded = QImage(str(tmp_path / "bands.png"))
+    assert (banded.width(), banded.height()) == (120, 150)
+    assert banded == whole
+    assert banded.pixelColor(60, 60).alpha() == 255
+    assert banded.pixelColor(119, 149).alpha() == 0
+    assert banded.dotsPerMeterX() == round(216 / 0.0254)
+
+
 def test_export_jpg_writes_file(tmp_path):
     formats = {bytes(fmt).lower() for fmt in QImageWriter.supportedImageFormats()}
     if b"jpg" not in formats and b"jpeg" not in formats:
@@ -6,14 +6,19 @@
 Written first following TDD Red/Green methodology.
 """
 
+import io
 import json
 import pytest
 from pathlib import Path
 
+from lucent.container import ContainerReader
 from lucent.file_io import (
     LUCENT_VERSION,
     save_document,
     load_document,
+    open_document,
+    write_atomic,
+    _JsonDocumentParser,
     FileVersionError,
 )
 from test_helpers import (
@@ -41,8 +46,7 @@ class TestSaveDocument:
         )
 
         assert file_path.exists()
-        data = json.loads(file_path.read_text())
-        assert "version" in data
+        data = load_document(file_path)
         assert "items" in data
         assert "viewport" in data
         assert "meta" in data
@@ -59,8 +63,8 @@ class TestSaveDocument:
             meta={"name": "Test"},
         )
 
-        data = json.loads(file_path.read_text())
-        assert data["version"] == LUCENT_VERSION
+        with ContainerReader(file_path) as reader:
+            assert reader.version == LUCENT_VERSION
 
     def test_save_document_with_items(self, tmp_path: Path) -> None:
         """Save document with items, verify they are serialized."""
@@ -85,7 +89,7 @@ class TestSaveDocument:
             meta={"name": "My Drawing"},
         )
 
-        data = json.loads(file_path.read_text())
+        data = load_document(file_path)
         assert len(data["items"]) == 1
         assert data["items"][0]["type"] == "rectangle"
         assert data["items"][0]["name"] == "Rect 1"
@@ -103,7 +107,7 @@ class TestSaveDocument:
             meta={"name": "Test"},
         )
 
-        data = json.loads(file_path.read_text())
+        data = load_document(file_path)
         assert data["viewport"]["zoomLevel"] == 2.5
         assert data["viewport"]["offsetX"] == 123.5
         assert data["viewport"]["offsetY"] == -456.7
@@ -124,7 +128,7 @@ class TestSaveDocument:
             meta=meta,
         )
 
-        data = json.loads(file_path.read_text())
+        data = load_document(file_path)
         assert data["meta"]["name"] == "My Artwork"
         assert data["meta"]["created"] == "2026-01-05T12:00:00Z"
         assert data["meta"]["modified"] == "2026-01-05T14:30:00Z"
@@ -143,6 +147,44 @@ class TestSaveDocument:
         assert Path(file_path).exists()
 
 
+class TestWriteAtomic:
+    """Tests for atomic file replacement."""
+
+    def test_replaces_existing_file(self, tmp_path: Path) -> None:
+        file_path = tmp_path / "doc.lucent"
+        file_path.write_text("old")
+
+        write_atomic(file_path, b"new")
+
+        assert file_path.read_bytes() == b"new"
+        assert [p.name for p in tmp_path.iterdir()] == ["doc.lucent"]
+
+    def test_keeps_original_permissions(self, tmp_path: Path) -> None:
+        file_path = tmp_path / "doc.lucent"
+        file_path.write_text("old")
+        file_path.chmod(0o640)
+
+        write_atomic(file_path, b"new")
+
+        assert file_path.stat().st_mode & 0o777 == 0o640
+
+    def test_failed_write_leaves_original(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        file_path = tmp_path / "doc.lucent"
+        file_path.write_text("old")
+
+        def fail(src: str, dst: object) -> None:
+            raise OSError("disk full")
+
+        monkeypatch.setattr("lucent.file_io.os.replace", fail)
+        with pytest.raises(OSError):
+            write_atomic(file_path, b"new")
+
+        assert file_path.read_text() == "old"
+        assert [p.name for p in tmp_path.iterdir()] == ["doc.lucent"]
+
+
 class TestLoadDocument:
     """Tests for load_document function."""
 
@@ -236,7 +278,7 @@ class TestDocumentDPI:
             meta={"name": "Test", "documentDPI": 144},
         )
 
-        data = json.loads(file_path.read_text())
+        data = load_document(file_path)
         assert data["meta"]["documentDPI"] == 144
 
     def test_load_returns_document_dpi(self, tmp_path: Path) -> None:
@@ -436,3 +478,58 @@ class TestRoundTrip:
         # Verify path points
         path_item = next(i for i in result["items"] if i["type"] == "path")
         assert len(path_item["geometry"]["points"]) == 2
+
+
+class TestStreamingJson:
+    """Version 1 JSON documents are parsed incrementally."""
+
+    def _parse(self, text: str, chunk_size: int = 5):
+        parser = _JsonDocumentParser(io.BytesIO(text.encode("utf-8")), chunk_size)
+        parser.read_header()
+        items = list(parser.items())
+        return parser.fields, items
+
+    def test_items_stream_across_small_chunks(self) -> None:
+        items = [make_rectangle(name=f"Réct {i}", x=i * 1234.5) for i in range(20)]
+        text = json.dumps(
+            {"version": 1, "meta": {"name": "M"}, "items": items}, indent=2
+        )
+
+        fields, parsed = self._parse(text)
+
+        assert parsed == items
+        assert fields == {"version": 1, "meta": {"name": "M"}}
+
+    def test_fields_after_items_are_read(self) -> None:
+        text = '{"items": [{"a": 1}], "version": 12345, "meta": {"name": "M"}}'
+
+        fields, parsed = self._parse(text, chunk_size=3)
+
+        assert parsed == [{"a": 1}]
+        assert fields == {"version": 12345, "meta": {"name": "M"}}
+
+    def test_missing_items_yields_nothing(self) -> None:
+        fields, parsed = self._parse('{"version": 1}')
+
+        assert parsed == []
+        assert fields == {"version": 1}
+
+    def test_truncated_items_raise(self) -> None:
+        with pytest.raises(ValueError):
+            self._parse('{"version": 1, "items": [{"a": 1}, {"b":')
+
+    def test_open_document_exposes_header_before_items(self, tmp_path: Path) -> None:
+        file_path = tmp_path / "v1.lucent"
+        file_path.write_text(
+            json.dumps(
+                {
+                    "version": 1,
+                    "meta": {"name": "Streamed", "documentDPI": 96},
+                    "items": [make_rectangle()],
+                }
+            )
+        )
+
+        with open_document(file_path) as document:
+            assert document.meta["name"] == "Streamed"
+            assert len(list(document.items())) == 1
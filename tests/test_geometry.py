@@ -11,6 +11,7 @@ from lucent.geometry import (
     Geometry,
     RectGeometry,
     EllipseGeometry,
+    PathGeometry,
     TextGeometry,
 )
 
@@ -651,6 +652,75 @@ class TestPathGeometry:
         assert path.points[0]["x"] == 0
         assert path.points[0]["handleOut"]["x"] == 30
 
+    def test_points_are_stored_in_flat_arrays(self):
+        """Anchors and handles live in typed arrays, not per-point dicts."""
+        from array import array
+
+        from lucent.geometry import PathGeometry
+
+        points = [
+            {"x": 0, "y": 0},
+            {"x": 10, "y": 5, "handleIn": {"x": 8, "y": 4}},
+            {"x": 20, "y": 0},
+        ]
+        path = PathGeometry(points=points)
+
+        assert isinstance(path._anchors, array)
+        assert list(path._anchors) == [0, 0, 10, 5, 20, 0]
+        assert path._handles_out is None
+        assert path.point_count == 3
+        assert path.points == [
+            {"x": 0.0, "y": 0.0},
+            {"x": 10.0, "y": 5.0, "handleIn": {"x": 8.0, "y": 4.0}},
+            {"x": 20.0, "y": 0.0},
+        ]
+
+    def test_points_returns_copy(self):
+        """Mutating the returned point dicts does not change the geometry."""
+        from lucent.geometry import PathGeometry
+
+        path = PathGeometry(points=[{"x": 0, "y": 0}, {"x": 10, "y": 10}])
+        path.points[0]["x"] = 99
+
+        assert path.points[0]["x"] == 0
+
+    def test_points_setter_replaces_arrays(self):
+        """Assigning points rebuilds anchors and drops stale handles."""
+        from lucent.geometry import PathGeometry
+
+        path = PathGeometry(
+            points=[
+                {"x": 0, "y": 0, "handleOut": {"x": 5, "y": 5}},
+                {"x": 10, "y": 10},
+            ]
+        )
+        path.points = [{"x": 1, "y": 2}, {"x": 3, "y": 4}, {"x": 5, "y": 6}]
+
+        assert path._handles_out is None
+        assert path.points == [
+            {"x": 1.0, "y": 2.0},
+            {"x": 3.0, "y": 4.0},
+            {"x": 5.0, "y": 6.0},
+        ]
+
+
+class TestGeometrySlots:
+    """Geometry instances use __slots__ instead of a per-instance __dict__."""
+
+    @pytest.mark.parametrize(
+        "geometry",
+        [
+            RectGeometry(0, 0, 10, 10),
+            EllipseGeometry(0, 0, 5, 5),
+            PathGeometry(points=[{"x": 0, "y": 0}, {"x": 1, "y": 1}]),
+            TextGeometry(0, 0, 10, 10),
+        ],
+    )
+    def test_no_instance_dict(self, geometry):
+        assert not hasattr(geometry, "__dict__")
+        with pytest.raises(AttributeError):
+            geometry.unexpected = 1
+
 
 class TestTextGeometry:
     """Tests for TextGeometry class."""
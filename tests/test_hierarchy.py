@@ -4,9 +4,11 @@
 """Unit tests for hierarchy module - pure logic for parent-child relationships."""
 
 from lucent.hierarchy import (
+    get_children_map,
     get_container_by_id,
     get_direct_children_indices,
     get_descendant_indices,
+    get_effective_lock_flags,
     is_descendant_of,
     is_effectively_visible,
     is_effectively_locked,
@@ -123,6 +125,18 @@ class TestGetDescendantIndices:
         result = get_descendant_indices(items, "layer-1", is_container)
         assert set(result) == {1, 2, 3}
 
+    def test_children_map_gives_same_result(self):
+        items = [
+            MockItem(item_id="layer-1", is_container=True),
+            MockItem(item_id="group-1", parent_id="layer-1", is_container=True),
+            MockItem(parent_id="group-1"),
+            MockItem(parent_id="layer-1"),
+        ]
+        children = get_children_map(items)
+        assert children == {"layer-1": [1, 3], "group-1": [2]}
+        result = get_descendant_indices(items, "layer-1", is_container, children)
+        assert result == get_descendant_indices(items, "layer-1", is_container)
+
 
 class TestIsDescendantOf:
     """Tests for is_descendant_of function."""
@@ -243,3 +257,34 @@ class TestIsEffectivelyLocked:
             MockItem(locked=False, parent_id="group-1"),
         ]
         assert is_effectively_locked(items, 2, is_container) is True
+
+
+class TestGetEffectiveLockFlags:
+    """Tests for get_effective_lock_flags function."""
+
+    def test_matches_is_effectively_locked(self):
+        from lucent.canvas_items import ArtboardItem
+
+        class ContainerArtboard(ArtboardItem):
+            _is_container = True
+
+        artboard = ContainerArtboard(x=0, y=0, width=10, height=10, artboard_id="ab-1")
+        artboard.locked = True
+        items = [
+            MockItem(item_id="layer-1", locked=True, is_container=True),
+            MockItem(
+                item_id="group-1", locked=False, parent_id="layer-1", is_container=True
+            ),
+            MockItem(locked=False, parent_id="group-1"),
+            MockItem(item_id="group-2", is_container=True),
+            MockItem(locked=True, parent_id="group-2"),
+            MockItem(locked=False, parent_id="group-2"),
+            artboard,
+            MockItem(locked=False, parent_id="ab-1"),
+            MockItem(locked=False, parent_id="missing"),
+        ]
+        expected = [
+            is_effectively_locked(items, i, is_container) for i in range(len(items))
+        ]
+        assert get_effective_lock_flags(items, is_container) == expected
+        assert expected == [True, True, True, False, True, False, True, False, False]
@@ -3,7 +3,7 @@
 
 """Tests for HistoryManager undo/redo orchestration."""
 
-from lucent.commands import Command
+from lucent.commands import Command, MergeableCommand
 from lucent.history_manager import HistoryManager
 
 
@@ -213,3 +213,221 @@ def test_redo_descriptions_property():
     # Redo stack is LIFO, so most recently undone is last
     descriptions = history.redoDescriptions
     assert descriptions == ["Dummy second", "Dummy first"]
+
+
+def test_clear_drops_undo_and_redo():
+    history = HistoryManager()
+    state = []
+    history.execute(DummyCommand(state, "a"))
+    history.execute(DummyCommand(state, "b"))
+    history.undo()
+    changes = []
+    history.undoStackChanged.connect(lambda: changes.append("undo"))
+    history.redoStackChanged.connect(lambda: changes.append("redo"))
+
+    history.clear()
+
+    assert not history.can_undo
+    assert not history.can_redo
+    assert changes == ["undo", "redo"]
+
+
+class SizedCommand(DummyCommand):
+    """Dummy command reporting a fixed size estimate."""
+
+    def __init__(self, state: list, token: str, size: int):
+        super().__init__(state, token)
+        self.size = size
+
+    def size_estimate(self) -> int:
+        return self.size
+
+
+def test_commands_report_size_estimate():
+    small = DummyCommand([], "a")
+    large = DummyCommand([], "b")
+    large.payload = {"points": [{"x": float(i), "y": 0.0} for i in range(100)]}
+
+    assert small.size_estimate() > 0
+    assert large.size_estimate() > small.size_estimate() + 100 * 64
+
+
+def test_memory_usage_tracks_both_stacks():
+    history = HistoryManager()
+    state: list = []
+    history.execute(SizedCommand(state, "a", 100))
+    history.execute(SizedCommand(state, "b", 50))
+    assert history.memoryUsage == 150
+
+    history.undo()
+    assert history.memoryUsage == 150
+
+    history.execute(SizedCommand(state, "c", 10))
+    assert history.memoryUsage == 110
+
+    history.clear()
+    assert history.memoryUsage == 0
+
+
+def test_depth_limit_drops_oldest_entries():
+    history = HistoryManager(max_depth=3)
+    state: list = []
+    for token in "abcde":
+        history.execute(DummyCommand(state, token))
+
+    assert history.undoDescriptions == ["Dummy c", "Dummy d", "Dummy e"]
+
+
+def test_memory_budget_drops_oldest_entries():
+    history = HistoryManager(memory_budget=250)
+    state: list = []
+    for token in "abcd":
+        history.execute(SizedCommand(state, token, 100))
+
+    assert history.undoDescriptions == ["Dummy c", "Dummy d"]
+    assert history.memoryUsage == 200
+
+
+def test_budget_keeps_most_recent_entry():
+    history = HistoryManager(memory_budget=10)
+    state: list = []
+    history.execute(SizedCommand(state, "a", 100))
+    history.execute(SizedCommand(state, "b", 100))
+
+    assert history.undoDescriptions == ["Dummy b"]
+    assert history.memoryUsage == 100
+
+
+def test_lowering_limits_trims_existing_history():
+    history = HistoryManager()
+    state: list = []
+    for token in "abcd":
+        history.execute(SizedCommand(state, token, 100))
+    usage_changes = []
+    history.memoryUsageChanged.connect(lambda: usage_changes.append(True))
+
+    history.memoryBudget = 300
+    assert history.undoDescriptions == ["Dummy b", "Dummy c", "Dummy d"]
+    history.maxDepth = 1
+    assert history.undoDescriptions == ["Dummy d"]
+    assert history.memoryUsage == 100
+    assert len(usage_changes) == 2
+
+
+def test_zero_limits_disable_trimming():
+    history = HistoryManager(max_depth=0, memory_budget=0)
+    state: list = []
+    for i in range(600):
+        history.execute(SizedCommand(state, str(i), 1_000_000))
+
+    assert len(history.undoDescriptions) == 600
+
+
+class CounterCommand(MergeableCommand):
+    """Command adding to a shared counter; merges with same-target commands."""
+
+    def __init__(self, state: dict, target: str, amount: int):
+        self.state = state
+        self.target = target
+        self.amount = amount
+
+    @property
+    def description(self) -> str:
+        return f"Add to {self.target}"
+
+    def execute(self) -> None:
+        self.state[self.target] = self.state.get(self.target, 0) + self.amount
+
+    def undo(self) -> None:
+        self.state[self.target] -= self.amount
+
+    def merge_key(self):
+        return self.target
+
+    def _absorb(self, other) -> None:
+        self.amount += other.amount
+
+
+def test_consecutive_commands_on_same_target_coalesce():
+    history = HistoryManager(merge_window=60)
+    state: dict = {}
+    for _ in range(5):
+        history.execute(CounterCommand(state, "x", 1))
+
+    assert history.undoDescriptions == ["Add to x"]
+    assert state["x"] == 5
+    history.undo()
+    assert state["x"] == 0
+    history.redo()
+    assert state["x"] == 5
+
+
+def test_different_targets_do_not_coalesce():
+    history = HistoryManager(merge_window=60)
+    state: dict = {}
+    history.execute(CounterCommand(state, "x", 1))
+    history.execute(CounterCommand(state, "y", 1))
+    history.execute(CounterCommand(state, "x", 1))
+
+    assert len(history.undoDescriptions) == 3
+
+
+def test_commands_outside_window_do_not_coalesce():
+    history = HistoryManager(merge_window=0)
+    state: dict = {}
+    history.execute(CounterCommand(state, "x", 1))
+    history.execute(CounterCommand(state, "x", 1))
+
+    assert len(history.undoDescriptions) == 2
+
+
+def test_undo_breaks_coalescing_run():
+    history = HistoryManager(merge_window=60)
+    state: dict = {}
+    history.execute(CounterCommand(state, "x", 1))
+    history.execute(CounterCommand(state, "x", 2))
+    history.undo()
+    history.redo()
+    history.execute(CounterCommand(state, "x", 4))
+
+    assert len(history.undoDescriptions) == 2
+    history.undo()
+    assert state["x"] == 3
+
+
+def test_plain_commands_never_coalesce():
+    history = HistoryManager(merge_window=60)
+    state: list = []
+    history.execute(DummyCommand(state, "a"))
+    history.execute(DummyCommand(state, "a"))
+
+    assert len(history.undoDescriptions) == 2
+
+
+def _counter_transaction(history, state, *, plain: bool = False):
+    history.begin_transaction("Bump")
+    history.execute(CounterCommand(state, "x", 1))
+    if plain:
+        history.execute(DummyCommand([], "a"))
+    history.end_transaction()
+
+
+def test_transactions_of_mergeable_commands_coalesce():
+    history = HistoryManager(merge_window=60)
+    state: dict = {}
+    _counter_transaction(history, state)
+    _counter_transaction(history, state)
+
+    assert history.undoDescriptions == ["Bump"]
+    history.undo()
+    assert state["x"] == 0
+
+
+def test_transactions_with_plain_commands_never_coalesce():
+    history = HistoryManager(merge_window=60)
+    state: dict = {}
+    _counter_transaction(history, state, plain=True)
+    _counter_transaction(history, state, plain=True)
+
+    assert len(history.undoDescriptions) == 2
+    assert state["x"] == 2
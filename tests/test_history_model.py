@@ -0,0 +1,134 @@
+# Copyright (C) 2026 The Culture List, Inc.
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""Tests for the HistoryListModel exposed by HistoryManager."""
+
+from PySide6.QtCore import QAbstractListModel
+
+from lucent.history_manager import HistoryManager
+from lucent.history_model import HistoryListModel
+from test_history_manager import DummyCommand
+
+
+def _rows(model):
+    return [
+        (
+            model.data(model.index(row, 0), HistoryListModel.DescriptionRole),
+            model.data(model.index(row, 0), HistoryListModel.UndoneRole),
+            model.data(model.index(row, 0), HistoryListModel.CurrentRole),
+        )
+        for row in range(model.rowCount())
+    ]
+
+
+def _history(count, **kwargs):
+    history = HistoryManager(merge_window=0, **kwargs)
+    state: list = []
+    for token in "abcdefgh"[:count]:
+        history.execute(DummyCommand(state, token))
+    return history, state
+
+
+def test_model_is_exposed_as_list_model(qapp):
+    history = HistoryManager()
+
+    assert isinstance(history.historyModel, QAbstractListModel)
+    names = history.historyModel.roleNames().values()
+    assert {bytes(name.data()) for name in names} == {
+        b"description",
+        b"undone",
+        b"current",
+    }
+
+
+def test_push_inserts_single_rows(qapp):
+    history = HistoryManager(merge_window=0)
+    model = history.historyModel
+    inserted = []
+    model.rowsInserted.connect(lambda _p, first, last: inserted.append((first, last)))
+    model.modelReset.connect(lambda: inserted.append("reset"))
+
+    state: list = []
+    history.execute(DummyCommand(state, "a"))
+    history.execute(DummyCommand(state, "b"))
+
+    assert inserted == [(0, 0), (1, 1)]
+    assert _rows(model) == [("Dummy a", False, False), ("Dummy b", False, True)]
+
+
+def test_undo_flips_row_state_without_removing(qapp):
+    history, _ = _history(3)
+    model = history.historyModel
+    removed = []
+    model.rowsRemoved.connect(lambda *args: removed.append(args))
+
+    history.undo()
+
+    assert removed == []
+    assert _rows(model) == [
+        ("Dummy a", False, False),
+        ("Dummy b", False, True),
+        ("Dummy c", True, False),
+    ]
+    assert history.redoDescriptions == ["Dummy c"]
+
+
+def test_new_command_removes_undone_rows(qapp):
+    history, state = _history(3)
+    model = history.historyModel
+    history.undo()
+    history.undo()
+    removed = []
+    model.rowsRemoved.connect(lambda _p, first, last: removed.append((first, last)))
+
+    history.execute(DummyCommand(state, "z"))
+
+    assert removed == [(1, 2)]
+    assert [row[0] for row in _rows(model)] == ["Dummy a", "Dummy z"]
+
+
+def test_trimmed_entries_are_removed_from_front(qapp):
+    history, state = _history(3, max_depth=3)
+    model = history.historyModel
+    removed = []
+    model.rowsRemoved.connect(lambda _p, first, last: removed.append((first, last)))
+
+    history.execute(DummyCommand(state, "d"))
+
+    assert removed == [(0, 0)]
+    assert [row[0] for row in _rows(model)] == ["Dummy b", "Dummy c", "Dummy d"]
+
+
+def test_jump_to_runs_minimal_undo_redo(qapp):
+    history, state = _history(5)
+    notifications = []
+    history.undoStackChanged.connect(lambda: notifications.append("undo"))
+    state.clear()
+
+    assert history.jumpTo(2) is True
+    assert state == ["undo:e", "undo:d", "undo:c"]
+    assert notifications == ["undo"]
+    assert history.undoDescriptions == ["Dummy a", "Dummy b"]
+
+    state.clear()
+    assert history.jumpTo(4) is True
+    assert state == ["do:c", "do:d"]
+    assert _rows(history.historyModel)[3] == ("Dummy d", False, True)
+
+
+def test_jump_to_bounds(qapp):
+    history, state = _history(2)
+
+    assert history.jumpTo(3) is False
+    assert history.jumpTo(-1) is False
+    assert history.jumpTo(0) is True
+    assert history.canUndo is False
+    assert history.redoDescriptions == ["Dummy b", "Dummy a"]
+
+
+def test_clear_resets_model(qapp):
+    history, _ = _history(2)
+
+    history.clear()
+
+    assert history.historyModel.rowCount() == 0
@@ -24,7 +24,12 @@ from lucent.appearances import Fill, Stroke
 from lucent.transforms import Transform
 from lucent.item_schema import (
     ItemSchemaError,
+    ABSENT,
     ItemType,
+    apply_data_patch,
+    build_item,
+    compose_data_patches,
+    diff_item_data,
     parse_item,
     parse_item_data,
     validate_rectangle,
@@ -34,6 +39,9 @@ from lucent.item_schema import (
     validate_path,
     validate_text,
     item_to_dict,
+    item_type_of,
+    parse_item_patch,
+    apply_item_patch,
 )
 
 
@@ -819,3 +827,204 @@ class TestTransformSerialization:
         bounds = item.geometry.get_bounds()
         assert item.transform.pivot_x == bounds.x() + bounds.width() * 0.5
         assert item.transform.pivot_y == bounds.y() + bounds.height() * 0.5
+
+
+class TestItemPatch:
+    """Tests for partial validation and in-place patching."""
+
+    def _rect(self, **extra):
+        data = {
+            "type": "rectangle",
+            "name": "R",
+            "geometry": {"x": 0, "y": 0, "width": 10, "height": 10},
+        }
+        data.update(extra)
+        return parse_item(data)
+
+    def test_item_type_of(self):
+        assert item_type_of(self._rect()) is ItemType.RECTANGLE
+        assert item_type_of(parse_item({"type": "group"})) is ItemType.GROUP
+
+    def test_parse_patch_validates_only_given_keys(self):
+        patch = parse_item_patch(
+            ItemType.RECTANGLE,
+            {"geometry": {"x": 1, "y": 2, "width": -5, "height": 3}, "bounds": {}},
+        )
+        assert list(patch.changes) == ["geometry"]
+        assert patch.changes["geometry"]["width"] == 0.0
+
+    def test_parse_patch_drops_fields_of_other_types(self):
+        patch = parse_item_patch(ItemType.GROUP, {"type": "rectangle", "fontSize": 9})
+        assert patch.changes == {}
+
+    def test_parse_patch_rejects_invalid_numbers(self):
+        with pytest.raises(ItemSchemaError):
+            parse_item_patch(ItemType.TEXT, {"fontSize": "big"})
+
+    def test_apply_patch_mutates_in_place_and_returns_delta(self):
+        item = self._rect()
+        patch = parse_item_patch(ItemType.RECTANGLE, {"name": "S", "visible": True})
+
+        before, after = apply_item_patch(item, patch.changes)
+
+        assert item.name == "S"
+        assert before == {"name": "R"}
+        assert after == {"name": "S"}
+
+    def test_apply_patch_matches_full_reparse(self):
+        item = self._rect(transform={"rotate": 30})
+        props = {
+            "geometry": {"x": 5, "y": 5, "width": 20, "height": 40},
+            "appearances": [{"type": "fill", "color": "#ff0000", "opacity": 0.5}],
+        }
+        expected = dict(item_to_dict(item), **props)
+
+        apply_item_patch(item, parse_item_patch(ItemType.RECTANGLE, props).changes)
+
+        assert item_to_dict(item) == item_to_dict(parse_item(expected))
+
+    def test_implicit_pivot_follows_geometry(self):
+        item = self._rect()
+        patch = parse_item_patch(
+            ItemType.RECTANGLE,
+            {"geometry": {"x": 100, "y": 0, "width": 10, "height": 10}},
+        )
+
+        before, after = apply_item_patch(item, patch.changes)
+
+        assert item.transform.pivot_x == 105
+        assert "transform" not in item_to_dict(item)
+        apply_item_patch(item, before)
+        assert item.transform.pivot_x == 5
+
+
+class TestBuildItem:
+    """Trusted construction from already-validated data."""
+
+    PAYLOADS = [
+        {
+            "type": "rectangle",
+            "name": "R",
+            "geometry": {"x": 1, "y": 2, "width": 30, "height": 40},
+            "appearances": [
+                {"type": "fill", "color": "#ff0000", "opacity": 0.5},
+                {"type": "stroke", "color": "#000000", "width": 2, "cap": "round"},
+            ],
+            "transform": {"translateX": 5, "rotate": 45},
+        },
+        {
+            "type": "ellipse",
+            "name": "E",
+            "parentId": "g1",
+            "geometry": {"centerX": 10, "centerY": 10, "radiusX": 5, "radiusY": 3},
+        },
+        {
+            "type": "path",
+            "name": "P",
+            "geometry": {
+                "points": [
+                    {"x": 0, "y": 0, "handleOut": {"x": 5, "y": 0}},
+                    {"x": 10, "y": 10},
+                ],
+                "closed": True,
+            },
+        },
+        {"type": "artboard", "name": "A", "id": "ab", "x": 0, "y": 0, "width": 50},
+        {"type": "group", "name": "G", "id": "g1", "locked": True},
+        {
+            "type": "text",
+            "name": "T",
+            "text": "Hi",
+            "fontSize": 24,
+            "geometry": {"x": 1, "y": 2, "width": 80, "height": 20},
+        },
+    ]
+
+    @pytest.mark.parametrize("payload", PAYLOADS, ids=lambda p: p["type"])
+    def test_matches_parse_item(self, payload):
+        parsed = parse_item_data(payload)
+
+        built = build_item(parsed.data)
+
+        assert item_to_dict(built) == item_to_dict(parse_item(payload))
+
+    def test_does_not_revalidate(self, monkeypatch):
+        import lucent.item_schema as item_schema
+
+        data = parse_item_data(self.PAYLOADS[0]).data
+        for item_type in item_schema._VALIDATORS:
+            monkeypatch.setitem(
+                item_schema._VALIDATORS,
+                item_type,
+                lambda _data: pytest.fail("validator called"),
+            )
+
+        assert isinstance(build_item(data), RectangleItem)
+
+    def test_rejects_unknown_type(self):
+        with pytest.raises(ItemSchemaError):
+            build_item({"type": "hexagon"})
+
+    def test_parse_type_accepts_mixed_case(self):
+        parsed = parse_item_data({"type": "Rectangle", "geometry": {}})
+
+        assert parsed.type is ItemType.RECTANGLE
+
+
+class TestDataPatch:
+    """Minimal path-based diffs between validated item dicts."""
+
+    def test_diff_records_changed_leaves_only(self):
+        old = {"name": "A", "geometry": {"x": 0.0, "y": 0.0}, "visible": True}
+        new = {"name": "A", "geometry": {"x": 5.0, "y": 0.0}, "visible": False}
+
+        before, after = diff_item_data(old, new)
+
+        assert sorted(after) == [(("geometry", "x"), 5.0), (("visible",), False)]
+        assert sorted(before) == [(("geometry", "x"), 0.0), (("visible",), True)]
+
+    def test_diff_marks_missing_keys_absent(self):
+        before, after = diff_item_data({"a": 1}, {"a": 1, "transform": {"r": 2}})
+
+        assert before == [(("transform",), ABSENT)]
+        assert after == [(("transform",), {"r": 2})]
+
+    def test_resized_list_is_recorded_whole(self):
+        old = {"points": [{"x": 0}, {"x": 1}]}
+        new = {"points": [{"x": 0}, {"x": 1}, {"x": 2}]}
+
+        _, after = diff_item_data(old, new)
+
+        assert after == [(("points",), new["points"])]
+
+    def test_apply_round_trips_and_copies_patched_paths(self):
+        old = {
+            "name": "P",
+            "geometry": {"points": [{"x": 0.0}, {"x": 1.0}], "closed": False},
+        }
+        new = {
+            "name": "P",
+            "geometry": {"points": [{"x": 0.0}, {"x": 9.0}], "closed": False},
+            "transform": {"rotate": 5.0},
+        }
+        before, after = diff_item_data(old, new)
+
+        patched = apply_data_patch(old, after)
+        assert patched == new
+        assert old["geometry"]["points"][1] == {"x": 1.0}
+        assert patched["geometry"]["points"][0] is old["geometry"]["points"][0]
+        assert apply_data_patch(patched, before) == old
+
+    def test_compose_matches_sequential_application(self):
+        start = {"name": "A"}
+        first = [(("transform",), {"translateX": 1.0, "translateY": 0.0})]
+        second = [(("transform", "translateX"), 2.0)]
+        third = [(("transform", "translateX"), 3.0)]
+
+        composed = compose_data_patches(compose_data_patches(first, second), third)
+
+        assert composed == [first[0], third[0]]
+        expected = apply_data_patch(
+            apply_data_patch(apply_data_patch(start, first), second), third
+        )
+        assert apply_data_patch(start, composed) == expected
@@ -0,0 +1,312 @@
+# Copyright (C) 2026 The Culture List, Inc.
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""Tests for the crash-recovery edit journal."""
+
+from pathlib import Path
+
+import pytest
+
+from lucent.canvas_model import CanvasModel
+from lucent.document_manager import DocumentManager
+from lucent.history_manager import HistoryManager
+from lucent.item_schema import item_to_dict
+from lucent.journal import (
+    EditJournal,
+    journal_path_for,
+    read_journal,
+    replay_journal,
+)
+from test_helpers import make_artboard, make_ellipse, make_rectangle
+
+
+def _snapshot(model):
+    return [item_to_dict(item) for item in model.getItems()]
+
+
+@pytest.fixture
+def canvas_model(qapp):
+    return CanvasModel(HistoryManager(merge_window=0))
+
+
+@pytest.fixture
+def journal(canvas_model, tmp_path):
+    journal = EditJournal(canvas_model)
+    journal.start(str(tmp_path / "doc.lucent.journal"))
+    yield journal
+    journal.stop()
+
+
+def _replayed(journal, base):
+    journal.flush()
+    return replay_journal(base, read_journal(journal.path))
+
+
+class TestReplay:
+    """Journaled edits replay to the model's final state."""
+
+    def test_insert_update_remove(self, canvas_model, journal):
+        canvas_model.addItem(make_rectangle(name="A"))
+        canvas_model.addItem(make_ellipse(name="B"))
+        canvas_model.addItem(make_rectangle(name="C"))
+        canvas_model.updateItem(1, {"name": "Renamed"})
+        canvas_model.removeItem(0)
+
+        assert _replayed(journal, []) == _snapshot(canvas_model)
+
+    def test_undo_and_redo_are_recorded(self, canvas_model, journal):
+        canvas_model.addItem(make_rectangle(name="A"))
+        canvas_model.addItem(make_rectangle(name="B"))
+        canvas_model.updateItem(0, {"name": "Changed"})
+        canvas_model.removeItem(1)
+        history = canvas_model._history
+        history.undo()
+        history.undo()
+        history.redo()
+
+        assert _replayed(journal, []) == _snapshot(canvas_model)
+
+    def test_moves_and_translation(self, canvas_model, journal):
+        for name in "ABCD":
+            canvas_model.addItem(make_rectangle(name=name))
+        canvas_model.moveItem(0, 3)
+        canvas_model.moveItem(3, 1)
+        canvas_model.translateItems([0, 2], 5.0, -3.0)
+
+        assert _replayed(journal, []) == _snapshot(canvas_model)
+
+    def test_grouping_and_reset(self, canvas_model, journal):
+        canvas_model.addItem(make_artboard(artboard_id="ab1"))
+        canvas_model.addItem(make_rectangle(name="A"))
+        canvas_model.addItem(make_rectangle(name="B"))
+        canvas_model.groupItems([1, 2])
+        canvas_model.loadItems([make_rectangle(name="Fresh")])
+        canvas_model.addItem(make_ellipse(name="After"))
+
+        assert _replayed(journal, []) == _snapshot(canvas_model)
+
+    def test_replays_on_top_of_base_items(self, canvas_model, tmp_path):
+        canvas_model.loadItems([make_rectangle(name="Saved")])
+        base = _snapshot(canvas_model)
+        journal = EditJournal(canvas_model)
+        journal.start(str(tmp_path / "j"))
+
+        canvas_model.addItem(make_ellipse(name="New"))
+        canvas_model.updateItem(0, {"name": "Edited"})
+
+        assert _replayed(journal, base) == _snapshot(canvas_model)
+        journal.stop()
+
+
+class TestCompactRecords:
+    """Changes are journaled as the fields that changed, not whole items."""
+
+    def _records(self, journal):
+        journal.flush()
+        return read_journal(journal.path)
+
+    def test_update_records_changed_fields(self, canvas_model, journal):
+        canvas_model.addItem(make_rectangle(name="A"))
+        canvas_model.updateItem(0, {"name": "B"})
+
+        insert, patch = self._records(journal)
+
+        assert insert["op"] == "insert"
+        assert patch == {"op": "patch", "at": 0, "changes": [[["name"], "B"]]}
+
+    def test_moves_record_translation_only(self, canvas_model, journal):
+        canvas_model.addItem(make_rectangle(name="A"))
+        canvas_model.translateItems([0], 10, 0)
+        canvas_model.beginDrag([0])
+        canvas_model.updateDrag(5, 5)
+        canvas_model.updateDrag(5, 0)
+        canvas_model.endDrag()
+
+        first, drag = self._records(journal)[1:]
+
+        # Identity transforms are not serialized, so the first move adds one
+        assert [path for path, _ in first["changes"]] == [["transform"]]
+        assert sorted(drag["changes"]) == [
+            [["transform", "translateX"], 20.0],
+            [["transform", "translateY"], 5.0],
+        ]
+        assert _replayed(journal, []) == _snapshot(canvas_model)
+
+    def test_each_edit_serializes_the_row_once(
+        self, canvas_model, journal, monkeypatch
+    ):
+        canvas_model.addItem(make_rectangle(name="A"))
+        serialized = []
+
+        def counting_item_to_dict(item):
+            serialized.append(item.name)
+            return item_to_dict(item)
+
+        monkeypatch.setattr("lucent.journal.item_to_dict", counting_item_to_dict)
+        for dx in range(1, 4):
+            canvas_model.translateItems([0], dx, 0)
+
+        assert serialized == ["A", "A", "A"]
+        assert _replayed(journal, []) == _snapshot(canvas_model)
+
+    def test_reset_records_difference(self, canvas_model, journal):
+        canvas_model.addItem(make_rectangle(name="A"))
+        canvas_model.addItem(make_rectangle(name="B"))
+        base = _snapshot(canvas_model)
+        journal.flush()
+        start = len(read_journal(journal.path))
+
+        canvas_model.loadItems([make_rectangle(name="A")])
+
+        records = self._records(journal)[start:]
+        assert records == [{"op": "remove", "at": 1, "count": 1}]
+        assert replay_journal(base, records) == _snapshot(canvas_model)
+
+    def test_removed_fields_replay(self):
+        records = [
+            {
+                "op": "patch",
+                "at": 0,
+                "changes": [[["geometry", "x"], 5]],
+                "removed": [["parentId"]],
+            }
+        ]
+        base = [{"name": "A", "parentId": "g", "geometry": {"x": 0, "y": 1}}]
+
+        assert replay_journal(base, records) == [
+            {"name": "A", "geometry": {"x": 5, "y": 1}}
+        ]
+
+
+class TestJournalFile:
+    """On-disk behavior of the journal."""
+
+    def test_records_are_buffered_until_flush(self, canvas_model, journal):
+        canvas_model.addItem(make_rectangle())
+
+        assert read_journal(journal.path) == []
+        journal.flush()
+        assert [r["op"] for r in read_journal(journal.path)] == ["insert"]
+
+    def test_truncated_tail_is_ignored(self, canvas_model, journal):
+        canvas_model.addItem(make_rectangle(name="A"))
+        canvas_model.addItem(make_rectangle(name="B"))
+        journal.flush()
+        with open(journal.path, "ab") as f:
+            f.write(b'{"op":"insert","at":2,"ite')
+
+        records = read_journal(journal.path)
+
+        assert len(records) == 2
+        assert [d["name"] for d in replay_journal([], records)] == ["A", "B"]
+
+    def test_missing_or_foreign_file_reads_empty(self, tmp_path):
+        foreign = tmp_path / "foreign"
+        foreign.write_text('{"journal": 99}\n{"op":"reset","items":[]}\n')
+
+        assert read_journal(str(tmp_path / "missing")) == []
+        assert read_journal(str(foreign)) == []
+
+    def test_invalid_record_stops_replay(self, capsys):
+        records = [
+            {"op": "insert", "at": 0, "items": [{"name": "A"}]},
+            {"op": "remove", "at": 5, "count": 1},
+            {"op": "insert", "at": 0, "items": [{"name": "B"}]},
+        ]
+
+        assert replay_journal([], records) == [{"name": "A"}]
+        assert "Warning" in capsys.readouterr().out
+
+    def test_stop_with_discard_deletes_file(self, canvas_model, tmp_path):
+        journal = EditJournal(canvas_model)
+        path = tmp_path / "j"
+        journal.start(str(path))
+
+        journal.stop(discard=True)
+
+        assert not path.exists()
+        assert journal.active is False
+
+
+class TestDocumentRecovery:
+    """DocumentManager replays a leftover journal when opening a file."""
+
+    def _crash_session(self, tmp_path: Path) -> tuple:
+        model = CanvasModel(HistoryManager())
+        manager = DocumentManager(model)
+        manager.startTracking()
+        model.addItem(make_rectangle(name="Saved"))
+        file_path = str(tmp_path / "doc.lucent")
+        manager.saveDocumentAs(file_path)
+
+        model.addItem(make_ellipse(name="Unsaved"))
+        model.updateItem(0, {"name": "Edited"})
+        manager._journal.flush()
+        # Simulate a crash: the journal is never stopped or discarded
+        return file_path, _snapshot(model)
+
+    def test_open_recovers_unsaved_edits(self, qapp, tmp_path):
+        file_path, expected = self._crash_session(tmp_path)
+        model = CanvasModel(HistoryManager())
+        manager = DocumentManager(model)
+        manager.startTracking()
+        recovered = []
+        manager.sessionRecovered.connect(recovered.append)
+
+        assert manager.openDocument(file_path) is True
+
+        assert _snapshot(model) == expected
+        assert manager.dirty is True
+        assert recovered == [2]
+
+    def test_recovered_session_keeps_journaling(self, qapp, tmp_path):
+        file_path, _ = self._crash_session(tmp_path)
+        model = CanvasModel(HistoryManager())
+        manager = DocumentManager(model)
+        manager.startTracking()
+        manager.openDocument(file_path)
+        model.removeItem(1)
+        manager._journal.flush()
+
+        records = read_journal(journal_path_for(file_path))
+
+        assert [r["op"] for r in records][-1] == "remove"
+
+    def test_save_truncates_journal(self, qapp, tmp_path):
+        file_path, expected = self._crash_session(tmp_path)
+        model = CanvasModel(HistoryManager())
+        manager = DocumentManager(model)
+        manager.startTracking()
+        manager.openDocument(file_path)
+
+        manager.saveDocument()
+
+        assert read_journal(journal_path_for(file_path)) == []
+        reopened = DocumentManager(CanvasModel(HistoryManager()))
+        reopened.startTracking()
+        reopened.openDocument(file_path)
+        assert reopened.dirty is False
+        assert _snapshot(reopened._canvas_model) == expected
+
+    def test_close_and_new_document_delete_journal(self, qapp, tmp_path):
+        file_path, _ = self._crash_session(tmp_path)
+        model = CanvasModel(HistoryManager())
+        manager = DocumentManager(model)
+        manager.startTracking()
+        manager.openDocument(file_path)
+
+        manager.closeDocument()
+        assert not Path(journal_path_for(file_path)).exists()
+
+        manager.openDocument(file_path)
+        manager.newDocument()
+        assert not Path(journal_path_for(file_path)).exists()
+
+    def test_untitled_documents_are_not_journaled(self, qapp, tmp_path):
+        model = CanvasModel(HistoryManager())
+        manager = DocumentManager(model)
+        manager.startTracking()
+
+        model.addItem(make_rectangle())
+
+        assert manager._journal.active is False
@@ -324,6 +324,7 @@ class TestLayerPanelModelBehaviors:
             b"parentId",
             b"modelVisible",
             b"modelLocked",
+            b"deferredCount",
         ]
         for role in expected_roles:
             assert role in role_names.values(), f"Missing role: {role}"
@@ -0,0 +1,231 @@
+# Copyright (C) 2026 The Culture List, Inc.
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""Tests for lazily loaded artboard contents."""
+
+from pathlib import Path
+
+import pytest
+
+from lucent.canvas_model import CanvasModel
+from lucent.container import ContainerReader
+from lucent.document_manager import DocumentManager
+from lucent.file_io import load_document, open_document, save_document
+from lucent.history_manager import HistoryManager
+from lucent.journal import journal_path_for, read_journal
+from test_helpers import (
+    make_artboard,
+    make_artboard_with_children,
+    make_ellipse,
+    make_group,
+    make_rectangle,
+)
+
+VIEWPORT = {"zoomLevel": 1.0, "offsetX": 0, "offsetY": 0}
+
+
+def _board(index: int, children: int = 2) -> list:
+    return make_artboard_with_children(
+        [
+            make_rectangle(x=index * 200 + i, name=f"B{index}-{i}")
+            for i in range(children)
+        ],
+        x=index * 200,
+        width=100,
+        height=100,
+        name=f"Board {index}",
+        artboard_id=f"ab{index}",
+    )
+
+
+def _document(boards: int = 3) -> list:
+    items = []
+    for index in range(boards):
+        items.extend(_board(index))
+    items.append(make_ellipse(name="Loose"))
+    return items
+
+
+def _names(model):
+    return [item.name for item in model.getItems()]
+
+
+@pytest.fixture
+def saved(tmp_path: Path) -> str:
+    path = tmp_path / "doc.lucent"
+    save_document(path, _document(), VIEWPORT, {"name": "Doc"})
+    return str(path)
+
+
+class TestFileFormat:
+    """Artboard contents are stored in sections of their own."""
+
+    def test_contents_are_split_into_sections(self, saved):
+        with ContainerReader(saved) as reader:
+            index = reader.read_json("deferred")
+            assert len(list(reader.iter_items())) == 4
+
+        assert set(index) == {"ab0", "ab1", "ab2"}
+        assert index["ab1"]["count"] == 2
+        assert index["ab1"]["counts"] == {"rectangle": 2}
+
+    def test_full_load_keeps_stacking_order(self, tmp_path: Path):
+        items = _board(0) + [make_rectangle(name="Between")]
+        items += [make_rectangle(name="Stray", parent_id="ab0")]
+        items += [make_group(group_id="g", parent_id="ab0")]
+        items += _board(1)
+        items.insert(2, make_group(name="G", group_id="g1", parent_id="ab0"))
+        items.insert(3, make_rectangle(name="In group", parent_id="g1"))
+        path = tmp_path / "order.lucent"
+
+        save_document(path, items, VIEWPORT, {})
+
+        assert load_document(path)["items"] == items
+
+    def test_lazy_stream_skips_contents(self, saved):
+        with open_document(saved) as document:
+            assert document.deferred_count == 3
+            names = [item.get("name") for item in document.items(lazy=True)]
+            deferred = document.deferred_artboards()
+
+        assert names == ["Board 0", "Board 1", "Board 2", "Loose"]
+        assert [d["name"] for d in deferred["ab2"].items()] == ["B2-0", "B2-1"]
+
+
+class TestModel:
+    """CanvasModel holds deferred contents until they are needed."""
+
+    @pytest.fixture
+    def lazy_model(self, canvas_model, saved):
+        with open_document(saved) as document:
+            canvas_model.loadItems(document.items(lazy=True))
+            canvas_model.setDeferredArtboards(document.deferred_artboards())
+        return canvas_model
+
+    def test_placeholder_role(self, lazy_model):
+        index = lazy_model.index(1, 0)
+
+        assert lazy_model.data(index, CanvasModel.DeferredCountRole) == 2
+        lazy_model.loadArtboard("ab1")
+        assert lazy_model.data(index, CanvasModel.DeferredCountRole) == 0
+
+    def test_load_appends_and_keeps_history(self, lazy_model):
+        lazy_model.addItem(make_rectangle(name="New"))
+
+        assert lazy_model.loadArtboard("ab0") == 2
+        assert lazy_model.loadArtboard("ab0") == 0
+
+        assert _names(lazy_model)[-3:] == ["New", "B0-0", "B0-1"]
+        assert lazy_model.isArtboardDeferred("ab0") is False
+        lazy_model._history.undo()
+        assert "New" not in _names(lazy_model)
+        assert _names(lazy_model)[-2:] == ["B0-0", "B0-1"]
+
+    def test_load_in_rect(self, lazy_model):
+        loaded = lazy_model.loadArtboardsInRect(150, 0, 200, 50)
+
+        assert loaded == 2
+        assert lazy_model.isArtboardDeferred("ab0") is True
+        assert lazy_model.isArtboardDeferred("ab1") is False
+
+    def test_acting_on_artboard_loads_it(self, lazy_model):
+        lazy_model.translateItems([2], 10.0, 0.0)
+
+        assert lazy_model.isArtboardDeferred("ab2") is False
+        moved = [i for i in lazy_model.getItems() if i.name == "B2-0"][0]
+        assert moved.get_bounds().x() == 410
+
+    def test_removing_artboard_removes_contents_with_undo(self, lazy_model):
+        lazy_model.removeItem(0)
+
+        assert "B0-0" not in _names(lazy_model)
+        lazy_model._history.undo()
+        assert {"Board 0", "B0-0", "B0-1"} <= set(_names(lazy_model))
+        assert lazy_model.isArtboardDeferred("ab0") is False
+
+    def test_contents_wait_for_missing_artboard(self, lazy_model, saved):
+        with open_document(saved) as document:
+            deferred = document.deferred_artboards()
+        lazy_model.loadItems([make_artboard(artboard_id="other")])
+        lazy_model.setDeferredArtboards(deferred)
+
+        assert lazy_model.loadArtboard("ab0") == 0
+        assert lazy_model.isArtboardDeferred("ab0") is True
+
+
+class TestDocumentManager:
+    """Large multi-artboard documents open lazily."""
+
+    @pytest.fixture
+    def manager(self, canvas_model):
+        manager = DocumentManager(canvas_model)
+        manager._lazy_artboard_threshold = 2
+        manager.startTracking()
+        return manager
+
+    def test_open_is_lazy_and_clean(self, manager, canvas_model, saved):
+        assert manager.openDocument(saved)
+
+        assert _names(canvas_model) == ["Board 0", "Board 1", "Board 2", "Loose"]
+        canvas_model.loadArtboard("ab1")
+        assert manager.dirty is False
+
+    def test_small_documents_open_eagerly(self, canvas_model, saved):
+        manager = DocumentManager(canvas_model)
+        manager.startTracking()
+
+        manager.openDocument(saved)
+
+        assert len(canvas_model.getItems()) == 10
+        assert canvas_model.deferredArtboards() == {}
+
+    def test_save_writes_unloaded_contents_back(
+        self, manager, canvas_model, saved, tmp_path
+    ):
+        manager.openDocument(saved)
+        canvas_model.loadArtboard("ab1")
+        canvas_model.updateItem(0, {"name": "Renamed"})
+        copy = str(tmp_path / "copy.lucent")
+
+        assert manager.saveDocumentAs(copy)
+
+        names = [item["name"] for item in load_document(copy)["items"]]
+        assert sorted(names) == sorted(
+            ["Renamed", "B0-0", "B0-1", "Board 1", "B1-0", "B1-1"]
+            + ["Board 2", "B2-0", "B2-1", "Loose"]
+        )
+        assert names[:3] == ["Renamed", "B0-0", "B0-1"]
+
+    def test_export_loads_artboard(self, manager, canvas_model, saved, tmp_path):
+        manager.openDocument(saved)
+
+        assert manager.exportArtboard("ab2", str(tmp_path / "ab2.png"), 72, 0, "")
+
+        assert canvas_model.isArtboardDeferred("ab2") is False
+
+    def test_journal_recovers_loaded_artboards(self, manager, canvas_model, saved):
+        manager.openDocument(saved)
+        canvas_model.loadArtboard("ab2")
+        canvas_model.updateItem(len(canvas_model.getItems()) - 1, {"name": "Edited"})
+        manager._journal.flush()
+        ops = [r["op"] for r in read_journal(journal_path_for(saved))]
+        expected = _names(canvas_model)
+
+        model = CanvasModel(HistoryManager())
+        recovered = DocumentManager(model)
+        recovered._lazy_artboard_threshold = 2
+        recovered.startTracking()
+        recovered.openDocument(saved)
+
+        assert "load" in ops
+        assert _names(model) == expected
+        assert model.isArtboardDeferred("ab2") is False
+        assert model.isArtboardDeferred("ab0") is True
+        assert recovered.dirty is True
+
+    def test_async_open_is_lazy(self, qtbot, manager, canvas_model, saved):
+        with qtbot.waitSignal(manager.openFinished):
+            manager.openDocumentAsync(saved)
+
+        assert len(canvas_model.getItems()) == 4
+        assert canvas_model.loadArtboard("ab0") == 2
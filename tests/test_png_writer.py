@@ -0,0 +1,89 @@
+# Copyright (C) 2026 The Culture List, Inc.
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""Tests for the incremental PNG encoder."""
+
+import random
+
+import pytest
+from PySide6.QtGui import QColor, QImage
+
+from lucent.png_writer import PngWriter
+
+
+def _rgba_rows(width: int, rows: int, pixel: bytes, stride: int = 0) -> bytes:
+    stride = stride or width * 4
+    row = pixel * width + b"\xee" * (stride - width * 4)
+    return row * rows
+
+
+class TestPngWriter:
+    """PngWriter encodes RGBA rows as they are written."""
+
+    def test_round_trip_in_bands(self, qapp, tmp_path):
+        path = tmp_path / "out.png"
+
+        with PngWriter(path, 3, 5, dpi=300) as writer:
+            writer.write_rows(_rgba_rows(3, 2, b"\xff\x00\x00\xff"), 12, 2)
+            writer.write_rows(_rgba_rows(3, 3, b"\x00\x00\xff\x80", stride=16), 16, 3)
+
+        image = QImage(str(path))
+        assert (image.width(), image.height()) == (3, 5)
+        assert image.pixelColor(2, 1) == QColor(255, 0, 0, 255)
+        assert image.pixelColor(0, 4) == QColor(0, 0, 255, 128)
+        assert image.dotsPerMeterX() == round(300 / 0.0254)
+
+    def test_rows_are_split_into_idat_chunks(self, qapp, tmp_path, monkeypatch):
+        monkeypatch.setattr("lucent.png_writer.IDAT_CHUNK_SIZE", 64)
+        path = tmp_path / "out.png"
+        noise = random.Random(0).randbytes(256 * 4 * 256)
+
+        with PngWriter(path, 256, 256) as writer:
+            writer.write_rows(noise, 256 * 4, 256)
+
+        assert path.read_bytes().count(b"IDAT") > 1
+        assert QImage(str(path)).pixelColor(1, 0).red() == noise[4]
+
+    def test_too_many_rows(self, tmp_path):
+        with PngWriter(tmp_path / "out.png", 1, 1) as writer:
+            with pytest.raises(ValueError):
+                writer.write_rows(b"\x00" * 8, 4, 2)
+            writer.write_rows(b"\x00" * 4, 4, 1)
+
+    def test_missing_rows_on_close(self, tmp_path):
+        writer = PngWriter(tmp_path / "out.png", 1, 2)
+        writer.write_rows(b"\x00" * 4, 4, 1)
+
+        with pytest.raises(ValueError):
+            writer.close()
+        writer.close()
+        assert list(tmp_path.iterdir()) == []
+
+    def test_file_replaced_only_when_complete(self, tmp_path):
+        path = tmp_path / "out.png"
+        path.write_bytes(b"previous")
+
+        with PngWriter(path, 1, 2) as writer:
+            writer.write_rows(b"\x00" * 4, 4, 1)
+            assert path.read_bytes() == b"previous"
+            writer.write_rows(b"\x00" * 4, 4, 1)
+
+        assert path.read_bytes().startswith(b"\x89PNG")
+        assert [p.name for p in tmp_path.iterdir()] == ["out.png"]
+
+    def test_error_leaves_existing_file(self, tmp_path):
+        path = tmp_path / "out.png"
+        path.write_bytes(b"previous")
+
+        with pytest.raises(RuntimeError):
+            with PngWriter(path, 1, 2) as writer:
+                writer.write_rows(b"\x00" * 4, 4, 1)
+                raise RuntimeError("render failed")
+
+        assert path.read_bytes() == b"previous"
+        assert [p.name for p in tmp_path.iterdir()] == ["out.png"]
+
+    def test_invalid_size(self, tmp_path):
+        with pytest.raises(ValueError):
+            PngWriter(tmp_path / "out.png", 0, 10)
+        assert not (tmp_path / "out.png").exists()
@@ -0,0 +1,172 @@
+# Copyright (C) 2026 The Culture List, Inc.
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""Tests for embedded document previews."""
+
+import json
+from pathlib import Path
+
+from PySide6.QtGui import QColor, QImage
+
+from lucent.container import ContainerReader
+from lucent.document_manager import DocumentManager
+from lucent.file_io import (
+    DocumentPreview,
+    load_document,
+    read_preview,
+    save_document,
+)
+from lucent.item_schema import parse_item
+from lucent.preview import (
+    THUMBNAIL_SIZE,
+    build_preview,
+    document_stats,
+    render_thumbnail,
+)
+from test_helpers import (
+    make_artboard,
+    make_artboard_with_children,
+    make_ellipse,
+    make_group,
+    make_rectangle,
+)
+
+VIEWPORT = {"zoomLevel": 1.0, "offsetX": 0, "offsetY": 0}
+
+
+def _items(data):
+    return [parse_item(d) for d in data]
+
+
+def _image(png: bytes) -> QImage:
+    image = QImage()
+    assert image.loadFromData(png, "PNG")
+    return image
+
+
+class TestDocumentStats:
+    """document_stats summarizes items without rendering."""
+
+    def test_counts_bounds_and_artboards(self, qapp):
+        items = _items(
+            make_artboard_with_children(
+                [make_rectangle(x=10, y=10), make_ellipse(center_x=50, center_y=50)],
+                width=200,
+                height=100,
+                name="Home",
+                artboard_id="home",
+            )
+            + [make_rectangle(x=300, y=0, width=20, height=20)]
+        )
+
+        stats = document_stats(items)
+
+        assert stats["itemCount"] == 4
+        assert stats["counts"] == {"artboard": 1, "rectangle": 2, "ellipse": 1}
+        assert stats["bounds"] == {"x": 0, "y": 0, "width": 320, "height": 100}
+        assert stats["artboards"] == [
+            {
+                "id": "home",
+                "name": "Home",
+                "x": 0,
+                "y": 0,
+                "width": 200,
+                "height": 100,
+                "itemCount": 2,
+            }
+        ]
+
+    def test_empty_document(self, qapp):
+        stats = document_stats([])
+
+        assert stats["itemCount"] == 0
+        assert stats["bounds"] is None
+        assert render_thumbnail([]) == b""
+
+
+class TestThumbnail:
+    """Thumbnails show the first artboard, or all content."""
+
+    def test_first_artboard_fits_thumbnail(self, qapp):
+        items = _items(
+            [
+                make_artboard(width=1000, height=500, background_color="#ff0000"),
+                make_artboard(x=2000, width=100, height=100),
+            ]
+        )
+
+        image = _image(render_thumbnail(items))
+
+        assert (image.width(), image.height()) == (THUMBNAIL_SIZE, THUMBNAIL_SIZE // 2)
+        assert image.pixelColor(5, 5) == QColor("#ff0000")
+
+    def test_hidden_groups_are_not_drawn(self, qapp):
+        data = [
+            make_artboard(width=100, height=100, artboard_id="ab"),
+            make_group(group_id="g", parent_id="ab", visible=False),
+            make_rectangle(
+                width=100, height=100, fill_color="#0000ff", fill_opacity=1.0
+            ),
+        ]
+        data[2]["parentId"] = "g"
+        image = _image(render_thumbnail(_items(data)))
+
+        assert image.pixelColor(50, 50) == QColor("#ffffff")
+
+        data[1]["visible"] = True
+        image = _image(render_thumbnail(_items(data)))
+
+        assert image.pixelColor(50, 50) == QColor("#0000ff")
+
+    def test_content_without_artboards_is_not_upscaled(self, qapp):
+        items = _items([make_rectangle(x=5, y=5, width=40, height=20)])
+
+        image = _image(render_thumbnail(items))
+
+        assert image.width() <= 42 and image.height() <= 22
+
+
+class TestReadPreview:
+    """read_preview reads the preview sections of a saved file."""
+
+    def test_round_trip(self, qapp, tmp_path: Path):
+        items = _items([make_artboard(width=64, height=64, name="A")])
+        preview = build_preview(items)
+        file_path = tmp_path / "doc.lucent"
+
+        save_document(file_path, [], VIEWPORT, {}, preview=preview)
+
+        assert read_preview(file_path) == preview
+        with ContainerReader(file_path) as reader:
+            assert reader._toc["thumbnail"]["codec"] == "none"
+
+    def test_files_without_preview(self, tmp_path: Path):
+        bare = tmp_path / "bare.lucent"
+        save_document(bare, [], VIEWPORT, {})
+        legacy = tmp_path / "v1.lucent"
+        legacy.write_text(json.dumps({"version": 1, "items": [], "viewport": {}}))
+
+        assert read_preview(bare) is None
+        assert read_preview(legacy) is None
+
+    def test_preview_does_not_change_items(self, tmp_path: Path):
+        file_path = tmp_path / "doc.lucent"
+        items = [make_rectangle(name="R")]
+        preview = DocumentPreview(thumbnail=b"png", stats={"itemCount": 1})
+
+        save_document(file_path, items, VIEWPORT, {}, preview=preview)
+
+        assert load_document(file_path)["items"] == items
+
+    def test_document_manager_saves_preview(self, canvas_model, tmp_path: Path):
+        manager = DocumentManager(canvas_model)
+        manager.startTracking()
+        canvas_model.addItem(make_artboard(width=50, height=50, name="Board"))
+        file_path = tmp_path / "doc.lucent"
+
+        assert manager.saveDocumentAs(str(file_path))
+
+        preview = read_preview(file_path)
+        assert preview is not None
+        assert preview.stats["artboards"][0]["name"] == "Board"
+        assert _image(preview.thumbnail).width() == 50
@@ -188,3 +188,49 @@ class TestSpatialIndex:
 
         # Query outside the big item should return empty
         assert index.query(Rect(-800, -800, 100, 100)) == set()
+
+    def test_update_moves_item_across_subdivided_nodes(self):
+        """Updating after subdivision leaves no stale entries behind."""
+        index = SpatialIndex(max_items_per_node=2, max_depth=6)
+        for i in range(20):
+            index.insert(f"item{i}", Rect(i * 50, i * 50, 10, 10))
+
+        index.update("item3", Rect(-500, -500, 10, 10))
+        index.update("item4", Rect(200, 200, 10, 10))  # unchanged bounds
+
+        assert index.query(Rect(140, 140, 20, 20)) == set()
+        assert index.query(Rect(-510, -510, 30, 30)) == {"item3"}
+        assert index.query(Rect(195, 195, 20, 20)) == {"item4"}
+
+    def test_insert_many_matches_individual_inserts(self):
+        """Bulk loading answers queries like one-by-one insertion."""
+        rects = [
+            (f"item{i}", Rect((i % 17) * 40, (i // 17) * 40, 25, 25))
+            for i in range(300)
+        ]
+        single = SpatialIndex(max_items_per_node=4, max_depth=8)
+        for item_id, rect in rects:
+            single.insert(item_id, rect)
+        bulk = SpatialIndex(max_items_per_node=4, max_depth=8)
+        bulk.insert_many(rects)
+
+        assert len(bulk) == 300
+        for query in (
+            Rect(0, 0, 100, 100),
+            Rect(300, 200, 50, 400),
+            Rect(-10, -10, 5, 5),
+        ):
+            assert bulk.query(query) == single.query(query)
+
+    def test_insert_many_replaces_existing_entries(self):
+        """Bulk loading an existing id moves it instead of duplicating it."""
+        index = SpatialIndex()
+        index.insert("item1", Rect(0, 0, 10, 10))
+
+        index.insert_many(
+            [("item1", Rect(500, 500, 10, 10)), ("item2", Rect(0, 0, 5, 5))]
+        )
+
+        assert len(index) == 2
+        assert index.query(Rect(0, 0, 20, 20)) == {"item2"}
+        assert index.query(Rect(495, 495, 20, 20)) == {"item1"}
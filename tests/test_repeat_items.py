@@ -0,0 +1,165 @@
+# Copyright (C) 2026 The Culture List, Inc.
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""Tests for CanvasModel.repeatItems() and bulk duplicateItems()."""
+
+from test_helpers import (
+    make_rectangle,
+    make_group,
+    make_artboard,
+)
+
+
+# Uses canvas_model fixture from conftest.py
+
+
+def _box(canvas_model, index):
+    bounds = canvas_model.getBoundingBox(index)
+    return (round(bounds["x"], 6), round(bounds["y"], 6))
+
+
+class TestRepeatItemsLinear:
+    """Test straight step-and-repeat rows."""
+
+    def test_repeat_creates_offset_copies(self, canvas_model):
+        """Each copy is offset by one more step than the previous."""
+        canvas_model.addItem(make_rectangle(x=0, y=0, width=10, height=10))
+
+        new_indices = canvas_model.repeatItems([0], 3, 20, 5, 0)
+
+        assert new_indices == [1, 2, 3]
+        assert [_box(canvas_model, i) for i in range(4)] == [
+            (0, 0),
+            (20, 5),
+            (40, 10),
+            (60, 15),
+        ]
+
+    def test_repeat_is_single_insert_and_undo_step(self, canvas_model, qtbot):
+        """All copies land with one row insertion and undo in one step."""
+        canvas_model.addItem(make_rectangle(width=10, height=10))
+        inserted = []
+        canvas_model.rowsInserted.connect(
+            lambda _parent, first, last: inserted.append((first, last))
+        )
+
+        with qtbot.waitSignal(canvas_model.itemsInserted) as blocker:
+            canvas_model.repeatItems([0], 50, 12, 0, 0)
+
+        assert blocker.args == [1, 50]
+        assert inserted == [(1, 50)]
+        assert len(canvas_model._spatial_index) == 51
+
+        canvas_model.undo()
+        assert canvas_model.count() == 1
+        assert len(canvas_model._spatial_index) == 1
+
+    def test_repeat_rows_build_a_grid(self, canvas_model):
+        """Repeating a repeated row fills a grid."""
+        canvas_model.addItem(make_rectangle(x=0, y=0, width=10, height=10))
+        canvas_model.repeatItems([0], 2, 20, 0, 0)
+
+        canvas_model.repeatItems([0, 1, 2], 2, 0, 20, 0)
+
+        assert canvas_model.count() == 9
+        boxes = {_box(canvas_model, i) for i in range(9)}
+        assert boxes == {(x, y) for x in (0, 20, 40) for y in (0, 20, 40)}
+
+    def test_invalid_requests_do_nothing(self, canvas_model):
+        """Zero counts, empty or locked selections create nothing."""
+        canvas_model.addItem(make_rectangle())
+        canvas_model.addItem(make_rectangle())
+        canvas_model.updateItem(1, {"locked": True})
+
+        assert canvas_model.repeatItems([0], 0, 10, 10, 0) == []
+        assert canvas_model.repeatItems([], 3, 10, 10, 0) == []
+        assert canvas_model.repeatItems([1], 3, 10, 10, 0) == []
+        assert canvas_model.count() == 2
+
+
+class TestRepeatItemsRadial:
+    """Test rotated step-and-repeat."""
+
+    def test_rotation_and_offset_walk_a_circle(self, canvas_model):
+        """Four quarter-turn steps return to the start position."""
+        canvas_model.addItem(make_rectangle(x=0, y=0, width=10, height=10))
+
+        canvas_model.repeatItems([0], 4, 30, 0, 90)
+
+        boxes = [_box(canvas_model, i) for i in range(5)]
+        assert boxes == [(0, 0), (30, 0), (30, 30), (0, 30), (0, 0)]
+        rotations = [canvas_model.getItems()[i].transform.rotate for i in range(5)]
+        assert rotations == [0, 90, 180, 270, 0]
+
+
+class TestRepeatItemsContainers:
+    """Test repeating containers with their descendants."""
+
+    def test_group_copies_get_fresh_ids(self, canvas_model):
+        """Each copied group owns its own copied children."""
+        canvas_model.addItem(make_rectangle(name="A", parent_id="g1"))
+        canvas_model.addItem(make_rectangle(name="B", parent_id="g1"))
+        canvas_model.addItem(make_group(name="G", group_id="g1"))
+
+        new_indices = canvas_model.repeatItems([2], 2, 50, 0, 0)
+
+        items = canvas_model.getItems()
+        assert canvas_model.count() == 9
+        group_ids = {items[i].id for i in new_indices}
+        assert len(group_ids) == 2 and "g1" not in group_ids
+        for group_id in group_ids:
+            children = [i for i in items if getattr(i, "parent_id", None) == group_id]
+            assert len(children) == 2
+
+    def test_artboard_copies_move_with_children(self, canvas_model):
+        """Artboard copies shift their own position and their children."""
+        canvas_model.addItem(
+            make_artboard(x=0, y=0, width=100, height=100, artboard_id="ab1")
+        )
+        canvas_model.addItem(
+            make_rectangle(x=10, y=10, width=10, height=10, parent_id="ab1")
+        )
+
+        new_indices = canvas_model.repeatItems([0], 1, 200, 0, 0)
+
+        board = canvas_model.getItems()[new_indices[0]]
+        assert (board.x, board.y) == (200, 0)
+        assert _box(canvas_model, 3) == (210, 10)
+
+
+class TestDuplicateItemsBulk:
+    """Test duplicating several items at once."""
+
+    def test_duplicate_items_single_insert(self, canvas_model):
+        """Several duplicates are appended with one row insertion."""
+        canvas_model.addItem(make_rectangle(name="A"))
+        canvas_model.addItem(make_rectangle(name="B"))
+        inserted = []
+        canvas_model.rowsInserted.connect(
+            lambda _parent, first, last: inserted.append((first, last))
+        )
+
+        new_indices = canvas_model.duplicateItems([0, 1])
+
+        assert new_indices == [2, 3]
+        assert inserted == [(2, 3)]
+        assert [i.name for i in canvas_model.getItems()] == [
+            "A",
+            "B",
+            "A Copy",
+            "B Copy",
+        ]
+
+        canvas_model.undo()
+        assert canvas_model.count() == 2
+
+    def test_duplicate_group_returns_group_index(self, canvas_model):
+        """Duplicating a group reports the copied group's row."""
+        canvas_model.addItem(make_group(name="G", group_id="g1"))
+        canvas_model.addItem(make_rectangle(name="A", parent_id="g1"))
+
+        new_indices = canvas_model.duplicateItems([0])
+
+        items = canvas_model.getItems()
+        assert len(new_indices) == 1
+        assert items[new_indices[0]].name == "G Copy"
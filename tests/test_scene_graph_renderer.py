@@ -111,6 +111,23 @@ class TestSceneGraphRendererSignalHandling:
         # Option C simplifies by doing full rebuild on any change
         assert renderer._needs_full_rebuild is True
 
+    def test_items_modified_invalidates_textures(self, qapp, canvas_model):
+        """itemsModified drops cached textures for the batch and rebuilds once."""
+        from lucent.scene_graph_renderer import SceneGraphRenderer
+        from test_helpers import make_rectangle
+
+        canvas_model.addItem(make_rectangle())
+        item = canvas_model.getItems()[0]
+        renderer = SceneGraphRenderer()
+        renderer.setModel(canvas_model)
+        renderer._texture_cache.get_or_create(item, str(id(item)))
+        renderer._needs_full_rebuild = False
+
+        canvas_model.itemsModified.emit([0])
+
+        assert str(id(item)) not in renderer._texture_cache._cache
+        assert renderer._needs_full_rebuild is True
+
     def test_item_added_triggers_rebuild(self, qapp, canvas_model):
         """itemAdded signal triggers full rebuild."""
         from lucent.scene_graph_renderer import SceneGraphRenderer
@@ -1000,3 +1017,108 @@ class TestSceneGraphRendererPreviewPath:
 
         assert hasattr(renderer, "_preview_cache")
         assert renderer._preview_cache is not renderer._texture_cache
+
+
+class TestSceneGraphRendererDrag:
+    """Tests for GPU-only updates during a model drag session."""
+
+    def test_drag_moves_update_drag_nodes_without_rebuild(self, qapp, canvas_model):
+        """dragMoved only retargets drag translation nodes."""
+        from lucent.scene_graph_renderer import SceneGraphRenderer
+        from PySide6.QtQuick import QSGNode, QSGTransformNode
+        from test_helpers import make_rectangle
+
+        canvas_model.addItem(make_rectangle())
+        renderer = SceneGraphRenderer()
+        renderer.setModel(canvas_model)
+
+        canvas_model.beginDrag([0])
+        assert renderer._drag_indices == {0}
+        renderer.updatePaintNode(QSGNode(), None)
+
+        drag_node = QSGTransformNode()
+        renderer._drag_nodes.append(drag_node)
+        canvas_model.updateDrag(4, 0)
+        canvas_model.updateDrag(1, 2)
+
+        assert renderer._needs_full_rebuild is False
+        renderer.updatePaintNode(QSGNode(), None)
+        assert drag_node.matrix().column(3).x() == 5
+        assert drag_node.matrix().column(3).y() == 2
+
+    def test_rebuild_resets_drag_offset(self, qapp, canvas_model):
+        """A rebuild renders live positions, so the pending offset resets."""
+        from lucent.scene_graph_renderer import SceneGraphRenderer
+        from PySide6.QtQuick import QSGNode
+        from test_helpers import make_rectangle
+
+        canvas_model.addItem(make_rectangle())
+        renderer = SceneGraphRenderer()
+        renderer.setModel(canvas_model)
+        canvas_model.beginDrag([0])
+        canvas_model.updateDrag(3, 3)
+
+        renderer._rebuild_nodes(QSGNode())
+
+        assert (renderer._drag_dx, renderer._drag_dy) == (0.0, 0.0)
+
+    def test_end_drag_requests_rebuild(self, qapp, canvas_model):
+        """Finishing a drag clears drag state and rebuilds once."""
+        from lucent.scene_graph_renderer import SceneGraphRenderer
+        from test_helpers import make_rectangle
+
+        canvas_model.addItem(make_rectangle())
+        renderer = SceneGraphRenderer()
+        renderer.setModel(canvas_model)
+        canvas_model.beginDrag([0])
+        canvas_model.updateDrag(3, 3)
+        renderer._needs_full_rebuild = False
+
+        canvas_model.endDrag()
+
+        assert renderer._drag_indices == set()
+        assert renderer._needs_full_rebuild is True
+
+
+class TestSceneGraphRendererRowMoves:
+    """Tests for reordering existing nodes when model rows move."""
+
+    def test_items_moved_reorders_nodes_without_rebuild(self, qapp, canvas_model):
+        """itemsMoved re-appends existing nodes in the new row order."""
+        from lucent.scene_graph_renderer import SceneGraphRenderer
+        from PySide6.QtQuick import QSGNode
+        from test_helpers import make_rectangle
+
+        for name in ("A", "B", "C"):
+            canvas_model.addItem(make_rectangle(name=name))
+        renderer = SceneGraphRenderer()
+        renderer.setModel(canvas_model)
+        nodes = [QSGNode() for _ in range(3)]
+        renderer._item_row_nodes = list(nodes)
+        renderer._background_row_nodes = [None, None, None]
+        renderer._needs_full_rebuild = False
+
+        canvas_model.moveItem(2, 0)
+
+        assert renderer._needs_full_rebuild is False
+        assert renderer._item_row_nodes == [nodes[2], nodes[0], nodes[1]]
+        root = QSGNode()
+        renderer.updatePaintNode(root, None)
+        assert root.childCount() == 3
+        assert root.firstChild() is nodes[2]
+        assert root.lastChild() is nodes[1]
+
+    def test_items_moved_with_stale_nodes_rebuilds(self, qapp, canvas_model):
+        """A move falls back to a rebuild when node bookkeeping is out of date."""
+        from lucent.scene_graph_renderer import SceneGraphRenderer
+        from test_helpers import make_rectangle
+
+        canvas_model.addItem(make_rectangle())
+        canvas_model.addItem(make_rectangle())
+        renderer = SceneGraphRenderer()
+        renderer.setModel(canvas_model)
+        renderer._needs_full_rebuild = False
+
+        canvas_model.moveItem(1, 0)
+
+        assert renderer._needs_full_rebuild is True
@@ -102,6 +102,18 @@ class TestTransform:
         result = qtransform.map(point)
         assert abs(result.x() - 10) < 0.001
 
+    def test_translated_returns_new_transform(self):
+        """translated() offsets a copy and leaves the original unchanged."""
+        transform = Transform(translate_x=1, rotate=30, scale_x=2, pivot_x=5)
+        moved = transform.translated(10, -4)
+        assert moved is not transform
+        assert moved.to_dict() == {
+            **transform.to_dict(),
+            "translateX": 11.0,
+            "translateY": -4.0,
+        }
+        assert transform.translate_x == 1
+
     def test_to_dict(self):
         """Test serialization to dictionary."""
         transform = Transform(